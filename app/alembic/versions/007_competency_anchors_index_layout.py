@@ -0,0 +1,54 @@
+"""competency_anchors 필터·적재용 인덱스 보강 (source_type btree, embedding NULL partial)
+
+Revision ID: 007_anchor_index_layout
+Revises: 006_competency_anchors
+Create Date: 2026-10-17
+
+- HNSW(embedding, vector_cosine_ops): 006에서 생성. 벌크 적재 중 삭제했다가 복구하지 못한 DB를 위해 IF NOT EXISTS로 재확인.
+- source_type btree: ONET/NCS 필터 검색 (search_competency_anchors_with_filter).
+- (id) WHERE embedding IS NULL partial: fill_embeddings_for_anchors가 NULL 행을 chunk마다 찾을 때 Full Scan 방지.
+  임베딩이 다 채워지면 인덱스가 비므로 검색·쓰기 부담 거의 없음.
+- 약 11만 행 테이블이라 CONCURRENTLY(autocommit)로 생성해 적재·검색 중에도 잠금 최소화.
+- HNSW 재구축(벌크 적재 후)은 competency_anchor_repository.build_anchor_vector_index 사용.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "007_anchor_index_layout"
+down_revision: Union[str, None] = "006_competency_anchors"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+HNSW_M = 24
+HNSW_EF_CONSTRUCTION = 128
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # 1. HNSW (006과 동일 정의, 없을 때만)
+        op.execute(
+            f"""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_competency_anchors_embedding_hnsw
+            ON competency_anchors
+            USING hnsw (embedding vector_cosine_ops)
+            WITH (m = {HNSW_M}, ef_construction = {HNSW_EF_CONSTRUCTION})
+            """
+        )
+        # 2. source_type 필터 (ONET / NCS)
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_competency_anchors_source_type "
+            "ON competency_anchors USING btree (source_type)"
+        )
+        # 3. embedding NULL 행 탐색 (fill_embeddings_for_anchors)
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_competency_anchors_embedding_pending "
+            "ON competency_anchors (id) WHERE embedding IS NULL"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_competency_anchors_embedding_pending")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_competency_anchors_source_type")
@@ -3,6 +3,7 @@
 LangGraph 기반 에이전트 API 엔드포인트를 제공합니다.
 - BP: POST /agent/upload(멀티파트) → file_ids 반환.
 - POST /agent/chat(stream): JSON만 (message, file_ids 등).
+- 시멘틱 분류·run_agent는 model 실행기에서 실행 (이벤트 루프 비차단, 대기열 초과 시 503).
 """
 
 import json
@@ -14,6 +15,7 @@ from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from core.config import get_settings  # type: ignore
+from api.shared.executors import run_in  # type: ignore
 from api.shared.upload_store import (  # type: ignore
     load_upload_files_as_base64,
     save_upload_file,
@@ -149,7 +151,7 @@ async def agent_chat(request: Request):
                 is_rule_policy_related,
             )
             if is_classifier_available() and is_rule_policy_related(message):
-                semantic_action = classify(message)
+                semantic_action = await run_in("model", classify, message)
                 msg_preview = (message[:80] + "…") if len(message) > 80 else message
                 logger.info("[시멘틱 분류] 질문: %s → %s", msg_preview, semantic_action)
                 if semantic_action == "BLOCK":
@@ -161,6 +163,8 @@ async def agent_chat(request: Request):
                         semantic_action=semantic_action,
                         context_preview=None,
                     )
+        except HTTPException:
+            raise
         except Exception:
             pass
 
@@ -181,7 +185,9 @@ async def agent_chat(request: Request):
                 elif msg.role == "system":
                     chat_history.append(SystemMessage(content=msg.content))
 
-        response_text, context_used = run_agent(
+        response_text, context_used = await run_in(
+            "orchestration",  # run_agent는 /internal/exaone/generate(model 풀)를 다시 호출 → 같은 풀 금지
+            run_agent,
             user_text=message,
             provider=provider,
             system_prompt=payload.get("system_prompt"),
@@ -201,6 +207,8 @@ async def agent_chat(request: Request):
             semantic_action=semantic_action,
             context_preview=context_preview,
         )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"에이전트 실행 오류: {str(e)}")
 
@@ -228,7 +236,7 @@ async def agent_chat_stream(request: Request):
                 is_rule_policy_related,
             )
             if is_classifier_available() and is_rule_policy_related(message):
-                action = classify(message)
+                action = await run_in("model", classify, message)
                 msg_preview = (message[:80] + "…") if len(message) > 80 else message
                 logger.info("[시멘틱 분류] 질문: %s → %s", msg_preview, action)
                 if action == "BLOCK":
@@ -242,6 +250,8 @@ async def agent_chat_stream(request: Request):
                         headers={"Cache-Control": "no-cache", "Connection": "keep-alive"},
                     )
                 stream_semantic_action = action
+        except HTTPException:
+            raise
         except Exception:
             pass
 
@@ -290,6 +300,8 @@ async def agent_chat_stream(request: Request):
             media_type="text/event-stream",
             headers={"Cache-Control": "no-cache", "Connection": "keep-alive"},
         )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"스트리밍 오류: {str(e)}")
 
@@ -319,6 +331,7 @@ async def list_tools():
 @router.get("/health")
 async def agent_health():
     from domain.hub.llm import get_provider_name, list_providers, supports_tool_calling  # type: ignore
+    from domain.hub.orchestrators.graph_orchestrator import get_checkpointer  # type: ignore
     try:
         provider = get_provider_name()
         return {
@@ -327,6 +340,7 @@ async def agent_health():
             "supports_tool_calling": supports_tool_calling(provider),
             "available_providers": list_providers(),
             "checkpointer_enabled": True,
+            "checkpointer": get_checkpointer().stats(),
         }
     except Exception as e:
         return {"status": "error", "error": str(e)}
@@ -2,28 +2,52 @@
 
 - 신입/지원자: 입사 시 인적자본 공시 지표에 기여할 잠재력 분석 + 면접 시 확인 질문 가이드.
 - 비동기: POST /check → job_id, GET /check/result/{job_id} 폴링.
+- /check 작업은 embedding 실행기, /status 쿼리는 db 실행기에서 실행 (대기열 초과 시 503).
+  JOB_QUEUE_PATH 설정 시 /check는 영속 작업 큐에 넣고 워커(job_worker.py)가 실행.
+- 프로세스 내 작업 결과는 BoundedJobRegistry에 보관 (개수 상한·완료 후 TTL·결과 크기 상한, /status에 지표).
+- 검색 쿼리는 고정 문장이라 임베딩·top-k를 canned_queries 레지스트리에서 재사용 (적재 세대가 바뀔 때만 재검색).
 """
 
 import logging
 import uuid
 from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, BackgroundTasks, HTTPException
+from fastapi import APIRouter, HTTPException
 from langchain_core.messages import HumanMessage, SystemMessage
 from pydantic import BaseModel, Field
 
+from api.shared.executors import run_in, submit_background  # type: ignore
+from api.shared.job_queue import JOB_DISCLOSURE_CHECK, get_job_queue  # type: ignore
+from api.shared.job_registry import BoundedJobRegistry  # type: ignore
+from core.config import get_settings  # type: ignore
 from core.database import SessionLocal  # type: ignore
 from domain.hub.repositories.disclosure_repository import (  # type: ignore
     get_disclosure_doc_count,
+    get_disclosure_ingest_generation,
     search_disclosures,
 )
+from domain.hub.service.canned_queries import get_canned_query_registry  # type: ignore
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/disclosure", tags=["Disclosure (공시 기여도 예측)"])
 
-# 비동기 공시 확인 작업 결과 저장 (job_id -> { status, result?, error? })
-_check_jobs: Dict[str, Dict[str, Any]] = {}
+# 비동기 공시 확인 작업 결과 저장 (job_id -> { status, result?, error? }), 첫 사용 시 생성
+_check_jobs: Optional[BoundedJobRegistry] = None
+
+# 실패 메시지 최대 길이
+_ERROR_MAX_CHARS = 1000
+
+
+def _get_check_jobs() -> BoundedJobRegistry:
+    global _check_jobs
+    if _check_jobs is None:
+        settings = get_settings()
+        _check_jobs = BoundedJobRegistry(
+            max_entries=settings.disclosure_check_jobs_max,
+            ttl_seconds=settings.disclosure_check_job_ttl_seconds,
+        )
+    return _check_jobs
 
 
 class DisclosureStatusResponse(BaseModel):
@@ -31,6 +55,14 @@ class DisclosureStatusResponse(BaseModel):
 
     ingested: bool = Field(..., description="학습(적재) 완료 여부")
     document_count: int = Field(..., description="벡터로 저장된 문서(청크) 개수")
+    check_jobs: Dict[str, int] = Field(
+        default_factory=dict,
+        description="프로세스 내 /check 작업 레지스트리 지표 (resident, pending, evicted, expired 등)",
+    )
+    canned_queries: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="고정 쿼리 임베딩·top-k 캐시 지표 (vectors, encoded, topk_hits, topk_misses 등)",
+    )
 
 
 class DisclosureCheckRequest(BaseModel):
@@ -58,8 +90,8 @@ def _run_disclosure_check(payload: DisclosureCheckRequest) -> DisclosureCheckRes
     """RAG(disclosures) + LLM으로 공시 기여도 예측 및 면접/확인 가이드 생성."""
     db = SessionLocal()
     try:
-        count = get_disclosure_doc_count(db)
-        if count == 0:
+        generation = get_disclosure_ingest_generation(db)
+        if generation[0] == 0:
             return DisclosureCheckResponse(
                 suitable=False,
                 message="ISO 30414 공시 문서가 아직 적재되지 않았습니다. 먼저 disclosure 적재를 실행해 주세요.",
@@ -82,16 +114,18 @@ def _run_disclosure_check(payload: DisclosureCheckRequest) -> DisclosureCheckRes
         else:
             employee_summary += " (연간 교육시간 미기입)"
 
-        query = (
-            "ISO 30414 human capital reporting requirements. "
-            "What indicators and categories are required for internal and external reporting?"
-        )
         try:
-            from domain.shared.embedding import get_embedding_model  # type: ignore
-
-            embeddings = get_embedding_model(use_fp16=True)
-            query_vec = embeddings.embed_query(query)
-            contents = search_disclosures(db, query_vec, k=5)
+            from domain.shared.embedding import get_embedding_model, get_embedding_model_version  # type: ignore
+            from domain.shared.query_batcher import get_query_embedder  # type: ignore
+
+            contents = get_canned_query_registry().search(
+                "iso30414_reporting",
+                k=5,
+                generation=generation,
+                search_fn=lambda vec, k: search_disclosures(db, vec, k=k),
+                embedder_factory=lambda: get_query_embedder() or get_embedding_model(use_fp16=True),
+                version=get_embedding_model_version(),
+            )
             context = "\n\n".join(c[:1500] for c in contents)
         except Exception as e:
             logger.exception("Disclosure 검색 실패: %s", e)
@@ -162,13 +196,19 @@ def _run_disclosure_check(payload: DisclosureCheckRequest) -> DisclosureCheckRes
 @router.get("/status", response_model=DisclosureStatusResponse)
 async def get_disclosure_status() -> DisclosureStatusResponse:
     """ISO 30414 문서가 disclosures 테이블에 적재되었는지 조회."""
+    count = await run_in("db", _count_disclosure_docs)
+    return DisclosureStatusResponse(
+        ingested=count > 0,
+        document_count=count,
+        check_jobs=_get_check_jobs().stats(),
+        canned_queries=get_canned_query_registry().stats(),
+    )
+
+
+def _count_disclosure_docs() -> int:
     db = SessionLocal()
     try:
-        count = get_disclosure_doc_count(db)
-        return DisclosureStatusResponse(
-            ingested=count > 0,
-            document_count=count,
-        )
+        return get_disclosure_doc_count(db)
     finally:
         db.close()
 
@@ -183,6 +223,7 @@ class DisclosureCheckResultResponse(BaseModel):
     """공시 기여도 예측 결과 조회 (폴링)."""
 
     status: str = Field(..., description="pending | completed | failed")
+    attempts: Optional[int] = Field(None, description="작업 큐 사용 시 실행 시도 횟수")
     result: Optional[DisclosureCheckResponse] = Field(
         None,
         description="완료 시 기여도 예측(suitable, message, suggestions=면접·확인 가이드)",
@@ -190,39 +231,70 @@ class DisclosureCheckResultResponse(BaseModel):
     error: Optional[str] = Field(None, description="실패 시 오류 메시지")
 
 
+def _truncate(text: str, max_chars: int) -> str:
+    return text if len(text) <= max_chars else text[: max(0, max_chars - 1)] + "…"
+
+
+def _cap_result(result: DisclosureCheckResponse, max_chars: int) -> DisclosureCheckResponse:
+    """message + suggestions 합계를 max_chars 이내로 (message 먼저, 남는 만큼 suggestions 앞에서부터)."""
+    message = _truncate(result.message, max_chars)
+    budget = max_chars - len(message)
+    suggestions: List[str] = []
+    for suggestion in result.suggestions:
+        if budget <= 0:
+            break
+        suggestion = _truncate(suggestion, budget)
+        suggestions.append(suggestion)
+        budget -= len(suggestion)
+    return DisclosureCheckResponse(suitable=result.suitable, message=message, suggestions=suggestions)
+
+
 def _run_check_background(job_id: str, payload: DisclosureCheckRequest) -> None:
-    """백그라운드에서 공시 확인 실행 후 _check_jobs 갱신."""
+    """백그라운드에서 공시 확인 실행 후 레지스트리 갱신 (그 사이 제거된 작업이면 결과 버림)."""
+    jobs = _get_check_jobs()
     try:
-        result = _run_disclosure_check(payload)
-        _check_jobs[job_id] = {"status": "completed", "result": result, "error": None}
-        logger.info("[DisclosureCheck] job_id=%s completed", job_id)
+        result = _cap_result(_run_disclosure_check(payload), get_settings().disclosure_check_result_max_chars)
+        stored = jobs.set_result(job_id, "completed", result=result)
+        logger.info("[DisclosureCheck] job_id=%s completed (stored=%s)", job_id, stored)
     except Exception as e:
         logger.exception("[DisclosureCheck] job_id=%s failed: %s", job_id, e)
-        _check_jobs[job_id] = {
-            "status": "failed",
-            "result": None,
-            "error": str(e),
-        }
+        jobs.set_result(job_id, "failed", error=_truncate(str(e), _ERROR_MAX_CHARS))
 
 
 @router.post("/check", response_model=DisclosureCheckJobResponse)
-async def post_disclosure_check(
-    body: DisclosureCheckRequest,
-    background_tasks: BackgroundTasks,
-) -> DisclosureCheckJobResponse:
-    """공시 기여도 예측을 비동기로 시작. job_id로 결과 폴링."""
+async def post_disclosure_check(body: DisclosureCheckRequest) -> DisclosureCheckJobResponse:
+    """공시 기여도 예측을 비동기로 시작. job_id로 결과 폴링. embedding 실행기가 가득 차면 503."""
+    queue = get_job_queue()
+    if queue is not None:
+        job_id = queue.enqueue(JOB_DISCLOSURE_CHECK, body.model_dump(), job_id=str(uuid.uuid4()))
+        return DisclosureCheckJobResponse(job_id=job_id)
+
     job_id = str(uuid.uuid4())
-    _check_jobs[job_id] = {"status": "pending", "result": None, "error": None}
-    background_tasks.add_task(_run_check_background, job_id, body)
+    jobs = _get_check_jobs()
+    jobs.create(job_id)
+    try:
+        submit_background("embedding", _run_check_background, job_id, body)
+    except HTTPException:
+        jobs.discard(job_id)
+        raise
     return DisclosureCheckJobResponse(job_id=job_id)
 
 
 @router.get("/check/result/{job_id}", response_model=DisclosureCheckResultResponse)
 async def get_disclosure_check_result(job_id: str) -> DisclosureCheckResultResponse:
     """비동기 공시 확인 결과 조회 (폴링)."""
-    if job_id not in _check_jobs:
-        raise HTTPException(status_code=404, detail="Job not found")
-    entry = _check_jobs[job_id]
+    queue = get_job_queue()
+    job = queue.get(job_id) if queue is not None else None
+    if job is not None:
+        return DisclosureCheckResultResponse(
+            status=job["status"] if job["status"] in ("completed", "failed") else "pending",
+            result=job["result"],
+            error=job["error"] if job["status"] == "failed" else None,
+            attempts=job["attempts"],
+        )
+    entry = _get_check_jobs().get(job_id)
+    if entry is None:
+        raise HTTPException(status_code=404, detail="Job not found (만료되었거나 없는 작업)")
     return DisclosureCheckResultResponse(
         status=entry["status"],
         result=entry.get("result"),
@@ -1,10 +1,12 @@
 """이메일 라우터.
 
 이메일 전송 및 스팸 필터링 관련 API 엔드포인트를 제공합니다.
+스팸 파이프라인(Llama·ExaOne)은 model 실행기에서 실행 (대기열 초과 시 503).
 """
 
 from typing import Any, Dict
 
+from api.shared.executors import run_in  # type: ignore
 from domain.hub.orchestrators import run_spam_detection  # type: ignore
 from domain.models import EmailRequest, EmailResponse  # type: ignore
 from fastapi import APIRouter, HTTPException
@@ -25,7 +27,7 @@ async def send_mail(email: EmailRequest):
 async def spam_mail_filter(email: EmailRequest):
     try:
         email_metadata = email.email_metadata.model_dump()
-        result = run_spam_detection(email_metadata)
+        result = await run_in("orchestration", run_spam_detection, email_metadata)
         routing_path = result.get("routing_path", "")
         routing_strategy = result.get("routing_strategy", "policy")
         from domain.models import ExaoneResult  # type: ignore
@@ -51,5 +53,7 @@ async def spam_mail_filter(email: EmailRequest):
             exaone_result=exaone_result,
             routing_path=routing_path,
         )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"스팸 필터링 중 오류가 발생했습니다: {str(e)}")
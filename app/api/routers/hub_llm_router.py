@@ -3,6 +3,9 @@ Hub MCP - Llama·ExaOne HTTP 라우터.
 
 역할: Llama Discriminator·ExaOne Solver HTTP 엔드포인트.
 spokes가 HTTP로 호출. domain.hub.llm으로 실제 처리.
+classify·classify_spam·analyze_email·결정적 generate(temperature=0) 결과는 어댑터의 응답 캐시로 재사용
+(적중률은 /internal/llama/health, /internal/exaone/health의 cache).
+모델 호출은 api.shared.executors의 model 실행기에서 실행 (이벤트 루프 비차단, 대기열 초과 시 503).
 표준 흐름: /internal/chat/call, /internal/spam/call → Hub가 도메인 MCP에 call_tool 위임.
 """
 
@@ -12,6 +15,8 @@ from typing import Any, Dict, List, Optional
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
 
+from api.shared.executors import run_in  # type: ignore
+
 router = APIRouter(tags=["Hub LLM (Llama + ExaOne)"])
 logger = logging.getLogger(__name__)
 
@@ -45,8 +50,10 @@ async def llama_classify_endpoint(request: ClassifyRequest) -> ClassifyResponse:
     try:
         from domain.hub.llm import classify  # type: ignore
 
-        result = classify(request.text.strip()) if request.text else "POLICY_BASED"
+        result = await run_in("model", classify, request.text.strip()) if request.text else "POLICY_BASED"
         return ClassifyResponse(result=result)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -57,15 +64,19 @@ async def llama_classify_spam_endpoint(request: ClassifySpamRequest) -> Classify
     try:
         from domain.hub.llm import classify_spam  # type: ignore
 
-        result = classify_spam(request.email_metadata)
+        result = await run_in("model", classify_spam, request.email_metadata)
         return ClassifySpamResponse(result=result)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @_llama.get("/health")
 async def llama_health():
-    return {"status": "ok", "service": "Llama Discriminator"}
+    from domain.hub.llm import get_cache_stats  # type: ignore
+
+    return {"status": "ok", "service": "Llama Discriminator", "cache": get_cache_stats()}
 
 
 # ---------------------------------------------------------------------------
@@ -78,6 +89,7 @@ _exaone = APIRouter(prefix="/internal/exaone", tags=["ExaOne Solver"])
 class GenerateRequest(BaseModel):
     prompt: str = Field(..., description="입력 프롬프트")
     max_tokens: int = Field(default=512, description="최대 생성 토큰 수")
+    temperature: float = Field(default=0.7, ge=0.0, description="생성 온도 (0이면 greedy, 응답 캐시 대상)")
 
 
 class GenerateResponse(BaseModel):
@@ -105,8 +117,16 @@ async def exaone_generate_endpoint(request: GenerateRequest) -> GenerateResponse
     try:
         from domain.hub.llm import generate_text  # type: ignore
 
-        result = generate_text(prompt=request.prompt.strip(), max_tokens=request.max_tokens)
+        result = await run_in(
+            "model",
+            generate_text,
+            prompt=request.prompt.strip(),
+            max_tokens=request.max_tokens,
+            temperature=request.temperature,
+        )
         return GenerateResponse(result=result)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -117,7 +137,9 @@ async def exaone_analyze_email_endpoint(request: AnalyzeEmailRequest) -> Analyze
     try:
         from domain.hub.llm import analyze_email  # type: ignore
 
-        result = analyze_email(
+        result = await run_in(
+            "model",
+            analyze_email,
             subject=request.subject,
             sender=request.sender,
             body=request.body or None,
@@ -128,13 +150,17 @@ async def exaone_analyze_email_endpoint(request: AnalyzeEmailRequest) -> Analyze
             policy_context=request.policy_context or None,
         )
         return AnalyzeEmailResponse(result=result)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @_exaone.get("/health")
 async def exaone_health():
-    return {"status": "ok", "service": "ExaOne Solver"}
+    from domain.hub.llm import get_cache_stats  # type: ignore
+
+    return {"status": "ok", "service": "ExaOne Solver", "cache": get_cache_stats()}
 
 
 # ---------------------------------------------------------------------------
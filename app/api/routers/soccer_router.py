@@ -2,11 +2,14 @@
 
 import json
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
-from fastapi import APIRouter, BackgroundTasks, File, HTTPException, UploadFile
+from fastapi import APIRouter, File, HTTPException, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
 
+from core.config import get_settings  # type: ignore
+
 from domain.hub.mcp.utils import get_soccer_mcp_url, result_to_str  # type: ignore
 from domain.hub.orchestrators.soccer_orchestrator import (  # type: ignore
     SoccerUploadEntityTypes,
@@ -36,60 +39,150 @@ router = APIRouter(tags=["soccer"])
 _internal = APIRouter(prefix="/internal/soccer", tags=["Soccer Proxy"])
 
 
+# 업로드 스트리밍 파싱: 한 번에 읽는 바이트 수, 한 줄 최대 바이트 (초과 행은 파싱 오류로 건너뜀)
+UPLOAD_READ_CHUNK_BYTES = 1024 * 1024
+UPLOAD_MAX_LINE_BYTES = 1024 * 1024
+# 응답에 담는 행 단위 파싱 오류 최대 개수 (개수는 parse_error_count로 전체 집계)
+UPLOAD_MAX_REPORTED_ERRORS = 100
+PREVIEW_ROWS = 5
+
+
+async def _iter_jsonl_lines(file: UploadFile) -> AsyncIterator[Tuple[int, Optional[bytes], Optional[str]]]:
+    """
+    업로드를 UPLOAD_READ_CHUNK_BYTES씩 읽어 (행 번호, 행 바이트, 오류) 를 순서대로 yield.
+    버퍼에는 아직 끝나지 않은 한 줄만 남으므로 메모리는 파일 크기와 무관 (줄 길이 상한 UPLOAD_MAX_LINE_BYTES).
+    """
+    buffer = b""
+    line_no = 0
+    skipping = False  # 너무 긴 행: 다음 줄바꿈까지 버림
+    while True:
+        chunk = await file.read(UPLOAD_READ_CHUNK_BYTES)
+        if not chunk:
+            break
+        buffer += chunk
+        lines = buffer.split(b"\n")
+        buffer = lines.pop()
+        for line in lines:
+            line_no += 1
+            # 청크 경계에 걸친 긴 행은 버퍼 검사를 피해 한 번에 완성될 수 있으므로 행 길이도 확인
+            if skipping or len(line) > UPLOAD_MAX_LINE_BYTES:
+                skipping = False
+                yield line_no, None, f"행 길이 초과 (> {UPLOAD_MAX_LINE_BYTES} bytes)"
+                continue
+            yield line_no, line, None
+        if len(buffer) > UPLOAD_MAX_LINE_BYTES:
+            buffer = b""
+            skipping = True
+    if skipping:
+        yield line_no + 1, None, f"행 길이 초과 (> {UPLOAD_MAX_LINE_BYTES} bytes)"
+    elif buffer.strip():
+        yield line_no + 1, buffer, None
+
+
+def _merge_batch_result(total: Dict[str, Any], batch: Dict[str, Any]) -> None:
+    """배치별 오케스트레이터 결과의 숫자 항목(processed, db, vector, total)을 합산."""
+    for key in ("processed", "db", "vector", "total"):
+        value = batch.get(key)
+        if isinstance(value, (int, float)):
+            total[key] = total.get(key, 0) + value
+    if batch.get("failed_chunks") or batch.get("errors"):
+        total.setdefault("errors", []).extend(batch.get("errors") or [])
+
+
 async def _process_jsonl_upload(
     file: UploadFile,
     data_type: str,
     message_ok: str,
 ) -> Dict[str, Any]:
-    """JSONL 파싱 + 미리보기 + in-process 오케스트레이터 호출."""
+    """
+    JSONL 스트리밍 파싱 + 미리보기 + in-process 오케스트레이터 호출.
+
+    soccer_upload_batch_rows 행이 모일 때마다 오케스트레이터(동기)를 스레드풀에서 실행하므로
+    최대 메모리는 배치 크기에만 비례. JSON 파싱 실패 행은 건너뛰고 parse_errors로 보고.
+    """
     if not file.filename or not file.filename.endswith(".jsonl"):
         raise HTTPException(status_code=400, detail="JSONL 파일만 업로드 가능합니다.")
-
-    content = await file.read()
-    lines = content.decode("utf-8").strip().split("\n")
-    preview_data: List[Dict[str, Any]] = []
-    all_data: List[Dict[str, Any]] = []
-
-    for i, line in enumerate(lines, 1):
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            data = json.loads(line)
-            all_data.append(data)
-            if i <= 5:
-                preview_data.append({"row": i, "data": data})
-        except json.JSONDecodeError as e:
-            logger.warning("행 %d 파싱 실패: %s", i, str(e))
-            if i <= 5:
-                preview_data.append({"row": i, "error": f"JSON 파싱 오류: {str(e)}", "raw": line[:100]})
-
     if data_type not in SoccerUploadEntityTypes:
         raise HTTPException(status_code=400, detail=f"지원하지 않는 data_type: {data_type}")
 
+    batch_rows = get_settings().soccer_upload_batch_rows
+    preview_data: List[Dict[str, Any]] = []
+    parse_errors: List[Dict[str, Any]] = []
+    parse_error_count = 0
+    total_rows = 0
+    batches = 0
+    success = True
+    decided_strategy = SpamPolicy.RULE.value
+    strategy_result: Dict[str, Any] = {}
+    batch: List[Dict[str, Any]] = []
+
+    async def flush() -> None:
+        nonlocal batches, success, decided_strategy, batch
+        if not batch:
+            return
+        batches += 1
+        raw = await run_in_threadpool(_inprocess_process, data_type, batch, preview_data if batches == 1 else [])
+        result = raw if isinstance(raw, dict) else json.loads(str(raw))
+        success = success and bool(result.get("success", False))
+        decided_strategy = result.get("decided_strategy", decided_strategy)
+        _merge_batch_result(strategy_result, result.get("result") or {})
+        if result.get("error"):
+            strategy_result.setdefault("errors", []).append({"batch": batches, "error": result["error"]})
+        logger.info("[업로드 배치 %d] %s: %d행, 누적 처리 %s", batches, data_type, len(batch), strategy_result.get("processed", 0))
+        batch = []
+
     try:
         logger.info("[업로드 시작] %s 파일: %s", data_type, file.filename)
-        raw = _inprocess_process(data_type, all_data, preview_data)
-        result = raw if isinstance(raw, dict) else json.loads(str(raw))
-        strategy_result = result.get("result", {})
-        decided_strategy = result.get("decided_strategy", SpamPolicy.RULE.value)
+        async for i, line, read_error in _iter_jsonl_lines(file):
+            error = read_error
+            data: Any = None
+            if line is not None:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    data = json.loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                    error = f"JSON 파싱 오류: {str(e)}"
+            if error is not None:
+                parse_error_count += 1
+                logger.warning("행 %d 파싱 실패: %s", i, error)
+                if len(parse_errors) < UPLOAD_MAX_REPORTED_ERRORS:
+                    parse_errors.append({"row": i, "error": error})
+                if i <= PREVIEW_ROWS:
+                    raw_text = (line or b"")[:100].decode("utf-8", errors="replace")
+                    preview_data.append({"row": i, "error": error, "raw": raw_text})
+                continue
+            total_rows += 1
+            batch.append(data)
+            if i <= PREVIEW_ROWS:
+                preview_data.append({"row": i, "data": data})
+            if len(batch) >= batch_rows:
+                await flush()
+        await flush()
+
         logger.info(
-            "[업로드 완료] %s: 전략=%s, 처리됨=%s/%s개",
+            "[업로드 완료] %s: 전략=%s, 처리됨=%s/%s개, 배치 %d개, 파싱 오류 %d행",
             data_type,
             decided_strategy,
             strategy_result.get("processed", 0),
             strategy_result.get("total", 0),
+            batches,
+            parse_error_count,
         )
         return {
-            "success": result.get("success", False),
+            "success": success and batches > 0,
             "message": message_ok,
             "data_type": data_type,
             "filename": file.filename,
-            "total_rows": len(all_data),
+            "total_rows": total_rows,
             "preview_rows": len(preview_data),
             "preview": preview_data,
             "strategy": decided_strategy,
             "results": strategy_result,
+            "batches": batches,
+            "parse_error_count": parse_error_count,
+            "parse_errors": parse_errors,
         }
     except HTTPException:
         raise
@@ -164,27 +257,55 @@ def _run_embedding_sync_background(job_id: str, entities: Optional[List[str]]) -
 @router.post("/soccer/embedding")
 async def embedding_job_add(
     request: EmbeddingJobRequest,
-    background_tasks: BackgroundTasks,
 ) -> Dict[str, Any]:
-    """버튼 클릭 시 즉시 백그라운드에서 임베딩 동기화 실행. job_id 반환 후 폴링으로 상태 확인."""
-    from api.shared.redis import create_embedding_job_inline, is_redis_token_valid  # type: ignore
+    """
+    버튼 클릭 시 임베딩 동기화 시작. job_id 반환 후 폴링으로 상태 확인.
+    JOB_QUEUE_PATH 설정 시 영속 작업 큐에 넣고 워커(job_worker.py)가 실행,
+    아니면 embedding 실행기에서 실행 (가득 차면 503).
+    """
+    from api.shared.executors import submit_background  # type: ignore
+    from api.shared.job_queue import JOB_SOCCER_EMBEDDING, get_job_queue  # type: ignore
+    from api.shared.redis import (  # type: ignore
+        create_embedding_job_inline,
+        is_redis_token_valid,
+        set_embedding_job_status,
+    )
+
+    entities = request.entities or ["players", "teams", "schedules", "stadiums"]
+    queue = get_job_queue()
+    if queue is not None:
+        job_id = queue.enqueue(JOB_SOCCER_EMBEDDING, {"entities": entities})
+        set_embedding_job_status(job_id, "waiting")  # Redis 없으면 큐 상태만 사용
+        return {"job_id": job_id, "status": "waiting"}
 
     if not is_redis_token_valid():
         raise HTTPException(status_code=503, detail="Redis 연결 불가(UPSTASH_REDIS_REST_URL/TOKEN 확인)")
-    entities = request.entities or ["players", "teams", "schedules", "stadiums"]
     job_id = create_embedding_job_inline(entities)
     if job_id is None:
         raise HTTPException(status_code=500, detail="job 등록 실패")
-    background_tasks.add_task(_run_embedding_sync_background, job_id, entities)
+    try:
+        submit_background("embedding", _run_embedding_sync_background, job_id, entities)
+    except HTTPException as e:
+        set_embedding_job_status(job_id, "failed", {"error": e.detail})
+        raise
     return {"job_id": job_id, "status": "processing"}
 
 
 @router.get("/soccer/embedding/status/{job_id}")
 async def embedding_job_status(job_id: str) -> Dict[str, Any]:
-    """job 상태 조회. waiting | processing | completed | failed."""
+    """job 상태 조회. waiting | processing | completed | failed. 작업 큐 사용 시 queue(시도 횟수·진행률) 포함."""
+    from api.shared.job_queue import get_job_queue, job_status_view  # type: ignore
     from api.shared.redis import get_embedding_job_status  # type: ignore
 
     data = get_embedding_job_status(job_id)
+    queue = get_job_queue()
+    job = queue.get(job_id) if queue is not None else None
+    if job is not None:
+        view = job_status_view(job)
+        if data is None:
+            data = {"job_id": job_id, "result": job["result"] or job["progress"]}
+        data["status"] = view["status"]  # 재시도 대기·임대 만료 실패는 큐 상태가 기준
+        data["queue"] = view
     if data is None:
         raise HTTPException(status_code=404, detail="job을 찾을 수 없음")
     return data
@@ -1,46 +1,67 @@
 """
-Soccer 임베딩 동기화 (백그라운드 태스크용).
+Soccer 임베딩 동기화 (백그라운드 태스크 / 작업 큐 워커용).
 
-버튼 클릭 시 BackgroundTasks에서 호출.
+API 프로세스 내 실행기(executors) 또는 영속 큐 워커(job_worker.py)에서 호출.
 run_embedding_sync_task(job_id, entities) → LangGraph 오케스트레이터 → 베이스 테이블(players 등)의 embedding 컬럼 채움.
 FlagEmbedding BGE-m3 사용 (domain.shared.embedding). 단일 테이블 가이드.
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from api.shared.job_queue import JobContext  # type: ignore
 
 logger = logging.getLogger(__name__)
 
 
-def run_embedding_sync_task(job_id: str, entities: Optional[List[str]] = None) -> None:
+def run_embedding_sync_task(
+    job_id: str,
+    entities: Optional[List[str]] = None,
+    ctx: Optional["JobContext"] = None,
+) -> Dict[str, Any]:
     """
-    임베딩 동기화 실행. Redis 상태를 completed/failed로 갱신.
-    BackgroundTasks에서 호출.
+    임베딩 동기화 실행. Redis 상태를 processing(엔티티별 진행률)/completed/failed로 갱신.
+
+    ctx(작업 큐 워커)가 있으면 엔티티별 결과를 큐 진행률에도 저장하고, 재시도 시 이미 끝난
+    엔티티는 건너뜀 (나머지 엔티티도 embedding이 NULL인 행만 처리하므로 이어서 채워짐).
+    이때 실패는 예외로 다시 던져 큐가 재시도하도록 함.
     """
     from api.shared.redis import set_embedding_job_status  # type: ignore
     from core.database import SessionLocal  # type: ignore
     from domain.hub.orchestrators.soccer_orchestrator import run_embedding_sync_orchestrate  # type: ignore
 
-    set_embedding_job_status(job_id, "processing")
+    done: Dict[str, Any] = dict((ctx.progress.get("results") or {}) if ctx is not None else {})
+    remaining = [e for e in (entities or ["players", "teams", "schedules", "stadiums"]) if e not in done]
+    set_embedding_job_status(job_id, "processing", result={"progress": done} if done else None)
+
+    def on_entity_done(table_key: str, one_result: Dict[str, Any]) -> None:
+        done[table_key] = one_result
+        set_embedding_job_status(job_id, "processing", result={"progress": dict(done)})
+        if ctx is not None:
+            ctx.report_progress({"results": done})
 
     db = SessionLocal()
     try:
-        from domain.shared.embedding import get_embedding_model  # type: ignore
+        if remaining:
+            from domain.shared.embedding import get_embedding_model  # type: ignore
 
-        embeddings_model = get_embedding_model(use_fp16=True)
-        result = run_embedding_sync_orchestrate(db, embeddings_model, entities=entities)
-        set_embedding_job_status(
-            job_id,
-            "completed",
-            result=result.get("results"),
-        )
-        logger.info("[embedding_sync] job_id=%s 완료 results=%s", job_id, result.get("results"))
+            embeddings_model = get_embedding_model(use_fp16=True)
+            run_embedding_sync_orchestrate(db, embeddings_model, entities=remaining, on_entity_done=on_entity_done)
+        set_embedding_job_status(job_id, "completed", result=done)
+        logger.info("[embedding_sync] job_id=%s 완료 results=%s", job_id, done)
+        return done
     except Exception as e:
+        if ctx is not None and ctx.lease_lost:
+            raise  # 다른 워커가 이어받음 → Redis 상태는 그쪽에서 갱신
         logger.exception("[embedding_sync] job_id=%s 실패: %s", job_id, e)
         set_embedding_job_status(
             job_id,
             "failed",
-            result={"error": str(e)},
+            result={"error": str(e), "progress": done},
         )
+        if ctx is not None:
+            raise
+        return done
     finally:
         db.close()
@@ -0,0 +1,175 @@
+"""
+워크로드별 바운디드 실행기 - async 핸들러의 블로킹 작업(모델·임베딩·DB)을 이벤트 루프 밖에서 실행.
+
+async def 핸들러에서 generate_text·classify·run_agent·run_spam_detection을 그대로 호출하면
+생성 하나가 이벤트 루프 전체(/health 포함)를 멈춤. 워크로드 종류마다 전용 스레드 풀을 두고,
+실행 중 + 대기 작업 수가 상한을 넘으면 큐에 쌓지 않고 바로 503 (Retry-After)으로 거절.
+
+- model        : GPU 모델 leaf 호출만 (ExaOne 생성, Llama 분류)
+- orchestration: 에이전트 그래프·스팸 파이프라인. 내부에서 이 허브의 /internal/* 모델 엔드포인트를
+                 HTTP로 다시 호출하므로 model 풀을 쓰면 바깥 작업이 워커를 다 잡고 안쪽 호출이
+                 그 뒤에서 기다리는 교착이 생김 → 반드시 별도 풀
+- embedding: CPU/GPU 임베딩 배치 (공시 확인, soccer 임베딩 동기화)
+- db       : 짧은 동기 DB 쿼리
+
+사용:
+    result = await run_in("orchestration", run_spam_detection, email_metadata)   # 가득 차면 HTTPException(503)
+    submit_background("embedding", job_fn, job_id)                       # 응답 전 거절 여부 결정
+"""
+
+import asyncio
+import contextvars
+import functools
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from fastapi import HTTPException
+
+logger = logging.getLogger(__name__)
+
+WORKLOADS: Tuple[str, ...] = ("model", "orchestration", "embedding", "db")
+# 503 응답의 Retry-After(초)
+RETRY_AFTER_SECONDS = 5
+
+
+class WorkloadQueueFull(RuntimeError):
+    """실행기 큐 상한 초과 (호출 측에서 503으로 변환)."""
+
+    def __init__(self, workload: str, limit: int) -> None:
+        super().__init__(f"{workload} 작업 대기열이 가득 찼습니다 (최대 {limit}건).")
+        self.workload = workload
+        self.limit = limit
+
+
+class WorkloadExecutor:
+    """스레드 풀 + 대기 깊이 상한 (실행 중 max_workers + 대기 max_queue)."""
+
+    def __init__(self, name: str, max_workers: int, max_queue: int) -> None:
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"{name}-worker")
+        self._lock = threading.Lock()
+        self._pending = 0
+        self.submitted = 0
+        self.rejected = 0
+        self.completed = 0
+
+    @property
+    def capacity(self) -> int:
+        return self.max_workers + self.max_queue
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """자리가 있으면 풀에 제출, 없으면 WorkloadQueueFull. contextvars는 호출 시점 것을 유지."""
+        with self._lock:
+            if self._pending >= self.capacity:
+                self.rejected += 1
+                raise WorkloadQueueFull(self.name, self.capacity)
+            self._pending += 1
+            self.submitted += 1
+        ctx = contextvars.copy_context()
+        try:
+            future = self._pool.submit(ctx.run, functools.partial(fn, *args, **kwargs))
+        except BaseException:
+            self._release(None)
+            raise
+        future.add_done_callback(self._release)
+        return future
+
+    async def run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """submit 후 결과를 await (이벤트 루프는 막지 않음)."""
+        return await asyncio.wrap_future(self.submit(fn, *args, **kwargs))
+
+    def _release(self, _future: Optional[Future]) -> None:
+        with self._lock:
+            self._pending -= 1
+            if _future is not None:
+                self.completed += 1
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "pending": self._pending,
+                "queued": max(0, self._pending - self.max_workers),
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "rejected": self.rejected,
+            }
+
+
+_executors: Dict[str, WorkloadExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def get_executor(workload: str) -> WorkloadExecutor:
+    """워크로드 실행기 싱글톤 (lazy, core.config EXECUTOR_* 설정)."""
+    executor = _executors.get(workload)
+    if executor is not None:
+        return executor
+    if workload not in WORKLOADS:
+        raise ValueError(f"알 수 없는 워크로드: {workload} (가능: {', '.join(WORKLOADS)})")
+    with _executors_lock:
+        executor = _executors.get(workload)
+        if executor is None:
+            from core.config import get_settings  # type: ignore
+
+            settings = get_settings()
+            executor = WorkloadExecutor(
+                workload,
+                max_workers=getattr(settings, f"executor_{workload}_workers"),
+                max_queue=getattr(settings, f"executor_{workload}_queue"),
+            )
+            _executors[workload] = executor
+    return executor
+
+
+def _busy(e: WorkloadQueueFull) -> HTTPException:
+    logger.warning("[executor] %s", e)
+    return HTTPException(
+        status_code=503,
+        detail=str(e),
+        headers={"Retry-After": str(RETRY_AFTER_SECONDS)},
+    )
+
+
+async def run_in(workload: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """워크로드 실행기에서 fn 실행 후 결과 반환. 대기열이 가득 차면 HTTPException(503)."""
+    try:
+        return await get_executor(workload).run(fn, *args, **kwargs)
+    except WorkloadQueueFull as e:
+        raise _busy(e) from e
+
+
+def submit_background(workload: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+    """응답과 무관하게 실행할 작업 제출 (결과는 fn이 직접 기록). 대기열이 가득 차면 HTTPException(503)."""
+    try:
+        future = get_executor(workload).submit(fn, *args, **kwargs)
+    except WorkloadQueueFull as e:
+        raise _busy(e) from e
+    future.add_done_callback(functools.partial(_log_failure, workload, getattr(fn, "__name__", repr(fn))))
+    return future
+
+
+def _log_failure(workload: str, name: str, future: Future) -> None:
+    if not future.cancelled() and future.exception() is not None:
+        logger.error("[executor] %s 백그라운드 작업 실패: %s", workload, name, exc_info=future.exception())
+
+
+def executor_stats() -> Dict[str, Any]:
+    """생성된 실행기별 상태 (health 엔드포인트용)."""
+    return {name: executor.stats() for name, executor in list(_executors.items())}
+
+
+def shutdown_executors() -> None:
+    """서버 종료 시 대기 작업 취소 (실행 중 작업은 스레드가 끝날 때까지 진행)."""
+    with _executors_lock:
+        for executor in _executors.values():
+            executor.shutdown()
+        _executors.clear()
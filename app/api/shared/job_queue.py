@@ -0,0 +1,339 @@
+"""
+SQLite 기반 영속 작업 큐 + 워커 루프 (임베딩 동기화·공시 확인 작업용).
+
+BackgroundTasks로 API 프로세스 안에서 돌던 긴 작업을 별도 워커 프로세스(app/job_worker.py)로 분리.
+API는 enqueue만 하고, 상태는 같은 SQLite 파일(job_queue_path)에서 읽음. 재시작해도 작업이 남음.
+
+- 임대(lease): claim 시 lease_owner·lease_expires_at 기록, 실행 중 하트비트로 연장.
+  워커가 죽으면 하트비트가 끊겨 임대가 만료되고, 다른 워커가 다시 claim (attempts + 1).
+- 진행률: report_progress로 JSON 저장. 재시도 시 JobContext.progress로 넘어와 이어서 실행.
+- 재시도: 핸들러 예외 또는 임대 만료 시 attempts < max_attempts면 backoff 후 다시 queued, 아니면 failed.
+- claim은 BEGIN IMMEDIATE로 직렬화 → 여러 워커 프로세스가 같은 작업을 동시에 잡지 않음.
+
+상태: queued | running | completed | failed
+"""
+
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+JOB_SOCCER_EMBEDDING = "soccer_embedding"
+JOB_DISCLOSURE_CHECK = "disclosure_check"
+
+# 재시도 대기: min(RETRY_BACKOFF_SECONDS * 2^(attempts-1), RETRY_BACKOFF_MAX_SECONDS)
+RETRY_BACKOFF_SECONDS = 5.0
+RETRY_BACKOFF_MAX_SECONDS = 300.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    available_at REAL NOT NULL,
+    lease_owner TEXT,
+    lease_expires_at REAL,
+    progress TEXT,
+    result TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_jobs_claim ON jobs (status, available_at, created_at);
+"""
+
+
+class LeaseLost(RuntimeError):
+    """임대가 만료되어 다른 워커가 작업을 가져감 (결과를 기록하지 않고 중단)."""
+
+
+@dataclass
+class JobContext:
+    """핸들러에 넘기는 작업 정보. progress는 이전 시도까지 저장된 진행률 (재개용)."""
+
+    id: str
+    kind: str
+    payload: Dict[str, Any]
+    attempt: int
+    progress: Dict[str, Any] = field(default_factory=dict)
+    _queue: Optional["SQLiteJobQueue"] = None
+    _owner: str = ""
+    _lost: threading.Event = field(default_factory=threading.Event)
+
+    @property
+    def lease_lost(self) -> bool:
+        return self._lost.is_set()
+
+    def report_progress(self, progress: Dict[str, Any]) -> None:
+        """진행률 저장 (임대도 함께 연장). 임대를 잃었으면 LeaseLost."""
+        self.progress = dict(progress)
+        if self._queue is not None and not self._queue.set_progress(self.id, self._owner, self.progress):
+            self._lost.set()
+        if self._lost.is_set():
+            raise LeaseLost(f"작업 {self.id} 임대 상실")
+
+
+class SQLiteJobQueue:
+    """작업 큐 (프로세스 간 공유 SQLite 파일)."""
+
+    def __init__(self, path: str, lease_seconds: float = 60.0, max_attempts: int = 3) -> None:
+        self.path = Path(path)
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._conn().executescript(_SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # isolation_level=None: 트랜잭션은 BEGIN으로 직접 관리
+            conn = sqlite3.connect(str(self.path), timeout=30.0, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA busy_timeout=30000")
+            self._local.conn = conn
+        return conn
+
+    # ------------------------------------------------------------------
+    # API 측
+    # ------------------------------------------------------------------
+
+    def enqueue(
+        self,
+        kind: str,
+        payload: Dict[str, Any],
+        job_id: Optional[str] = None,
+        max_attempts: Optional[int] = None,
+    ) -> str:
+        job_id = job_id or uuid.uuid4().hex
+        now = time.time()
+        self._conn().execute(
+            "INSERT INTO jobs (id, kind, payload, status, attempts, max_attempts, available_at, created_at, updated_at)"
+            " VALUES (?, ?, ?, 'queued', 0, ?, ?, ?, ?)",
+            (job_id, kind, json.dumps(payload, ensure_ascii=False), max_attempts or self.max_attempts, now, now, now),
+        )
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        row = self._conn().execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        job = dict(row)
+        for key in ("payload", "progress", "result"):
+            job[key] = json.loads(job[key]) if job[key] else None
+        return job
+
+    def stats(self) -> Dict[str, int]:
+        rows = self._conn().execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        return {status: count for status, count in rows}
+
+    # ------------------------------------------------------------------
+    # 워커 측
+    # ------------------------------------------------------------------
+
+    def claim(self, owner: str, kinds: Iterable[str]) -> Optional[JobContext]:
+        """실행 가능한 가장 오래된 작업(queued, 또는 임대 만료된 running)을 임대."""
+        kinds = list(kinds)
+        marks = ",".join("?" * len(kinds))
+        now = time.time()
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # 임대 만료 + 시도 소진 → failed (워커가 계속 죽는 작업)
+            conn.execute(
+                f"UPDATE jobs SET status = 'failed', lease_owner = NULL, updated_at = ?,"
+                f" error = '임대 만료 (워커 중단) 후 재시도 한도 초과'"
+                f" WHERE status = 'running' AND lease_expires_at < ? AND attempts >= max_attempts AND kind IN ({marks})",
+                (now, now, *kinds),
+            )
+            row = conn.execute(
+                f"SELECT * FROM jobs WHERE kind IN ({marks}) AND ("
+                f" (status = 'queued' AND available_at <= ?)"
+                f" OR (status = 'running' AND lease_expires_at < ?))"
+                f" ORDER BY created_at LIMIT 1",
+                (*kinds, now, now),
+            ).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+            if row["status"] == "running":
+                logger.warning("[job_queue] 임대 만료 작업 회수 id=%s 이전 owner=%s", row["id"], row["lease_owner"])
+            conn.execute(
+                "UPDATE jobs SET status = 'running', attempts = attempts + 1, lease_owner = ?,"
+                " lease_expires_at = ?, updated_at = ? WHERE id = ?",
+                (owner, now + self.lease_seconds, now, row["id"]),
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return JobContext(
+            id=row["id"],
+            kind=row["kind"],
+            payload=json.loads(row["payload"]),
+            attempt=row["attempts"] + 1,
+            progress=json.loads(row["progress"]) if row["progress"] else {},
+            _queue=self,
+            _owner=owner,
+        )
+
+    def _update_owned(self, job_id: str, owner: str, sql: str, params: tuple) -> bool:
+        cur = self._conn().execute(
+            f"UPDATE jobs SET {sql}, updated_at = ? WHERE id = ? AND lease_owner = ? AND status = 'running'",
+            (*params, time.time(), job_id, owner),
+        )
+        return cur.rowcount == 1
+
+    def heartbeat(self, job_id: str, owner: str) -> bool:
+        return self._update_owned(job_id, owner, "lease_expires_at = ?", (time.time() + self.lease_seconds,))
+
+    def set_progress(self, job_id: str, owner: str, progress: Dict[str, Any]) -> bool:
+        return self._update_owned(
+            job_id,
+            owner,
+            "progress = ?, lease_expires_at = ?",
+            (json.dumps(progress, ensure_ascii=False), time.time() + self.lease_seconds),
+        )
+
+    def complete(self, job_id: str, owner: str, result: Any) -> bool:
+        return self._update_owned(
+            job_id,
+            owner,
+            "status = 'completed', result = ?, error = NULL, lease_owner = NULL, lease_expires_at = NULL",
+            (json.dumps(result, ensure_ascii=False, default=str),),
+        )
+
+    def fail(self, job_id: str, owner: str, error: str) -> bool:
+        """시도 실패. 남은 시도가 있으면 backoff 후 queued, 없으면 failed."""
+        row = self._conn().execute("SELECT attempts, max_attempts FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return False
+        if row["attempts"] < row["max_attempts"]:
+            delay = min(RETRY_BACKOFF_SECONDS * 2 ** (row["attempts"] - 1), RETRY_BACKOFF_MAX_SECONDS)
+            return self._update_owned(
+                job_id,
+                owner,
+                "status = 'queued', error = ?, available_at = ?, lease_owner = NULL, lease_expires_at = NULL",
+                (error, time.time() + delay),
+            )
+        return self._update_owned(
+            job_id,
+            owner,
+            "status = 'failed', error = ?, lease_owner = NULL, lease_expires_at = NULL",
+            (error,),
+        )
+
+
+JobHandler = Callable[[JobContext], Any]
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+
+def _heartbeat_loop(queue: SQLiteJobQueue, ctx: JobContext, done: threading.Event) -> None:
+    interval = max(0.5, queue.lease_seconds / 3)
+    while not done.wait(interval):
+        if not queue.heartbeat(ctx.id, ctx._owner):
+            logger.warning("[job_queue] 임대 상실 id=%s owner=%s", ctx.id, ctx._owner)
+            ctx._lost.set()
+            return
+
+
+def run_one(queue: SQLiteJobQueue, handlers: Dict[str, JobHandler], owner: str) -> bool:
+    """작업 1건 claim·실행. 실행할 작업이 없으면 False."""
+    ctx = queue.claim(owner, handlers.keys())
+    if ctx is None:
+        return False
+    logger.info("[job_queue] 시작 id=%s kind=%s attempt=%s", ctx.id, ctx.kind, ctx.attempt)
+    done = threading.Event()
+    beat = threading.Thread(target=_heartbeat_loop, args=(queue, ctx, done), daemon=True)
+    beat.start()
+    try:
+        result = handlers[ctx.kind](ctx)
+        if ctx._lost.is_set() or not queue.complete(ctx.id, owner, result):
+            logger.warning("[job_queue] 임대 상실로 결과 폐기 id=%s", ctx.id)
+        else:
+            logger.info("[job_queue] 완료 id=%s", ctx.id)
+    except LeaseLost:
+        logger.warning("[job_queue] 임대 상실로 중단 id=%s", ctx.id)
+    except Exception as e:
+        logger.exception("[job_queue] 실패 id=%s: %s", ctx.id, e)
+        queue.fail(ctx.id, owner, str(e))
+    finally:
+        done.set()
+        beat.join()
+    return True
+
+
+def run_worker(
+    queue: SQLiteJobQueue,
+    handlers: Dict[str, JobHandler],
+    *,
+    owner: Optional[str] = None,
+    poll_interval: float = 1.0,
+    stop: Optional[threading.Event] = None,
+    max_jobs: Optional[int] = None,
+) -> int:
+    """stop이 set되거나 max_jobs건을 처리할 때까지 작업 실행. 처리한 작업 수 반환."""
+    owner = owner or default_worker_id()
+    stop = stop or threading.Event()
+    processed = 0
+    logger.info("[job_queue] 워커 시작 owner=%s kinds=%s queue=%s", owner, sorted(handlers), queue.path)
+    while not stop.is_set() and (max_jobs is None or processed < max_jobs):
+        if run_one(queue, handlers, owner):
+            processed += 1
+        else:
+            stop.wait(poll_interval)
+    return processed
+
+
+# 큐 상태 → 기존 엔드포인트 상태 어휘 (waiting | processing | completed | failed)
+_PUBLIC_STATUS = {"queued": "waiting", "running": "processing"}
+
+
+def job_status_view(job: Dict[str, Any]) -> Dict[str, Any]:
+    """상태 조회 응답용 요약 (payload·임대 정보 제외)."""
+    return {
+        "status": _PUBLIC_STATUS.get(job["status"], job["status"]),
+        "attempts": job["attempts"],
+        "max_attempts": job["max_attempts"],
+        "progress": job["progress"],
+        "error": job["error"],
+    }
+
+
+_queue: Optional[SQLiteJobQueue] = None
+_queue_lock = threading.Lock()
+
+
+def get_job_queue() -> Optional[SQLiteJobQueue]:
+    """설정(job_queue_path)이 있으면 큐 싱글톤, 없으면 None (API 프로세스 내 실행)."""
+    global _queue
+    if _queue is None:
+        from core.config import get_settings  # type: ignore
+
+        settings = get_settings()
+        if not settings.job_queue_path:
+            return None
+        with _queue_lock:
+            if _queue is None:
+                _queue = SQLiteJobQueue(
+                    settings.job_queue_path,
+                    lease_seconds=settings.job_lease_seconds,
+                    max_attempts=settings.job_max_attempts,
+                )
+    return _queue
@@ -0,0 +1,111 @@
+"""
+상한이 있는 인메모리 작업 레지스트리 (POST → job_id → GET 폴링 방식의 API 프로세스 내 작업용).
+
+모듈 전역 dict에 결과를 계속 쌓으면 폴링이 끝난 작업도 영원히 남아 메모리가 샘.
+- max_entries: 초과 시 LRU 제거 (완료·실패 작업 먼저, 그래도 넘치면 가장 오래 안 쓰인 작업)
+- ttl_seconds: 완료·실패 후 이 시간이 지나면 만료 (조회 시 + 주기적 정리)
+- 스레드 안전: 실행기 스레드(set_result)와 이벤트 루프(create/get)가 동시에 접근
+- stats(): 상주 작업 수·제거 수 (상태 엔드포인트용)
+
+결과 크기 상한은 호출 측에서 저장 전에 적용 (결과 타입마다 자를 필드가 다름).
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+PENDING = "pending"
+
+# 만료 정리 전체 스캔 최소 간격(초)
+_SWEEP_INTERVAL_SECONDS = 1.0
+
+
+class BoundedJobRegistry:
+    """job_id → {status, result, error} (LRU 순서 OrderedDict, 끝이 최근 사용)."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._last_sweep = 0.0
+        self.created = 0
+        self.evicted = 0
+        self.expired = 0
+
+    def create(self, job_id: str) -> None:
+        with self._lock:
+            self._sweep(time.monotonic())
+            self._jobs[job_id] = {"status": PENDING, "result": None, "error": None, "finished_at": None}
+            self._jobs.move_to_end(job_id)
+            self.created += 1
+            while len(self._jobs) > self.max_entries:
+                self._evict_one()
+
+    def set_result(self, job_id: str, status: str, result: Any = None, error: Optional[str] = None) -> bool:
+        """완료·실패 기록. 이미 제거된 작업이면 False (결과 버림)."""
+        with self._lock:
+            entry = self._jobs.get(job_id)
+            if entry is None:
+                return False
+            entry.update(status=status, result=result, error=error, finished_at=time.monotonic())
+            return True
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """조회 (최근 사용으로 갱신). 없거나 만료됐으면 None."""
+        with self._lock:
+            now = time.monotonic()
+            self._sweep(now)
+            entry = self._jobs.get(job_id)
+            if entry is None:
+                return None
+            if self._is_expired(entry, now):
+                del self._jobs[job_id]
+                self.expired += 1
+                return None
+            self._jobs.move_to_end(job_id)
+            return {k: entry[k] for k in ("status", "result", "error")}
+
+    def discard(self, job_id: str) -> None:
+        with self._lock:
+            self._jobs.pop(job_id, None)
+
+    def __contains__(self, job_id: str) -> bool:
+        return self.get(job_id) is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._jobs)
+
+    def _is_expired(self, entry: Dict[str, Any], now: float) -> bool:
+        finished_at = entry["finished_at"]
+        return finished_at is not None and now - finished_at > self.ttl_seconds
+
+    def _sweep(self, now: float) -> None:
+        if now - self._last_sweep < _SWEEP_INTERVAL_SECONDS:
+            return
+        self._last_sweep = now
+        for job_id in [k for k, v in self._jobs.items() if self._is_expired(v, now)]:
+            del self._jobs[job_id]
+            self.expired += 1
+
+    def _evict_one(self) -> None:
+        victim = next((k for k, v in self._jobs.items() if v["status"] != PENDING), None)
+        if victim is None:
+            victim = next(iter(self._jobs))
+        del self._jobs[victim]
+        self.evicted += 1
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            pending = sum(1 for v in self._jobs.values() if v["status"] == PENDING)
+            return {
+                "resident": len(self._jobs),
+                "pending": pending,
+                "finished": len(self._jobs) - pending,
+                "max_entries": self.max_entries,
+                "created": self.created,
+                "evicted": self.evicted,
+                "expired": self.expired,
+            }
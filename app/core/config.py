@@ -41,6 +41,26 @@ class Settings(BaseSettings):
         le=5000,
         description="DB 배치 저장 시 청크 크기 (성능·메모리 균형)",
     )
+    soccer_upload_batch_rows: int = Field(
+        default=2000,
+        ge=1,
+        le=50000,
+        description="soccer JSONL 업로드: 스트리밍 파싱 후 오케스트레이터에 넘기는 배치 행 수 (메모리 상한)",
+    )
+    db_bulk_upsert: bool = Field(
+        default=True,
+        description="soccer 배치 저장: True면 COPY + ON CONFLICT upsert, False면 행마다 merge",
+    )
+    soccer_embedding_sync_parallel: bool = Field(
+        default=False,
+        description="soccer 임베딩 동기화: True면 엔티티 4종을 동시에 처리하고 인코더 배치를 공유 (파이프라인 모드)",
+    )
+    soccer_embedding_sync_encode_batch: int = Field(
+        default=128,
+        ge=1,
+        le=2048,
+        description="파이프라인 모드 공유 인코더의 최대 배치 텍스트 수 (엔티티 청크를 섞어서 채움)",
+    )
 
     sslmode: str = Field(
         default="require",
@@ -123,6 +143,20 @@ class Settings(BaseSettings):
         description="RAG·임베딩 공용 모델 (Soccer·Disclosure, FlagEmbedding BGE-m3)",
     )
 
+    embedding_query_batch_size: int = Field(
+        default=32,
+        ge=1,
+        le=512,
+        description="쿼리 임베딩 마이크로 배치 최대 크기 (동시 embed_query를 한 번에 인코딩)",
+    )
+
+    embedding_query_max_wait_ms: float = Field(
+        default=5.0,
+        ge=0.0,
+        le=100.0,
+        description="쿼리 임베딩 마이크로 배치 최대 대기 시간(ms). 0이면 대기 없이 큐에 쌓인 것만 묶음",
+    )
+
     # ===================
     # 서버 설정
     # ===================
@@ -141,6 +175,115 @@ class Settings(BaseSettings):
         description="스트리밍 디버그 로깅 활성화",
     )
 
+    # ===================
+    # 워크로드별 실행기 (async 핸들러의 블로킹 작업, 대기열 초과 시 503)
+    # ===================
+    executor_model_workers: int = Field(
+        default=2,
+        ge=1,
+        description="GPU 모델 leaf 호출(ExaOne 생성·Llama 분류) 동시 실행 수",
+    )
+    executor_model_queue: int = Field(
+        default=16,
+        ge=0,
+        description="GPU 모델 호출 대기열 상한 (초과 시 503)",
+    )
+    executor_orchestration_workers: int = Field(
+        default=8,
+        ge=1,
+        description="에이전트 그래프·스팸 파이프라인 동시 실행 수 (내부 HTTP로 model 풀을 호출하므로 별도 풀)",
+    )
+    executor_orchestration_queue: int = Field(
+        default=32,
+        ge=0,
+        description="오케스트레이션 대기열 상한 (초과 시 503)",
+    )
+    executor_embedding_workers: int = Field(
+        default=2,
+        ge=1,
+        description="임베딩 작업(공시 확인·soccer 임베딩 동기화) 동시 실행 수",
+    )
+    executor_embedding_queue: int = Field(
+        default=32,
+        ge=0,
+        description="임베딩 작업 대기열 상한 (초과 시 503)",
+    )
+    executor_db_workers: int = Field(
+        default=8,
+        ge=1,
+        description="짧은 동기 DB 쿼리 동시 실행 수",
+    )
+    executor_db_queue: int = Field(
+        default=64,
+        ge=0,
+        description="DB 쿼리 대기열 상한 (초과 시 503)",
+    )
+
+    # ===================
+    # 영속 작업 큐 (soccer 임베딩 동기화·공시 확인, 워커: python job_worker.py)
+    # ===================
+    job_queue_path: Optional[str] = Field(
+        default=None,
+        description="작업 큐 SQLite 파일 경로. 설정 시 API는 enqueue만 하고 워커 프로세스가 실행 (없으면 API 내 실행기)",
+    )
+    job_lease_seconds: float = Field(
+        default=60.0,
+        gt=0,
+        description="작업 임대 시간(초). 하트비트가 이 시간 동안 없으면 다른 워커가 이어받음",
+    )
+    job_max_attempts: int = Field(
+        default=3,
+        ge=1,
+        description="작업당 최대 실행 시도 횟수 (예외·워커 중단 포함)",
+    )
+    job_poll_interval: float = Field(
+        default=1.0,
+        gt=0,
+        description="워커가 빈 큐를 다시 확인하는 간격(초)",
+    )
+
+    # ===================
+    # 공시 확인 (프로세스 내 /disclosure/check 작업 레지스트리·고정 쿼리 임베딩 캐시)
+    # ===================
+    disclosure_check_jobs_max: int = Field(
+        default=1000,
+        ge=1,
+        description="메모리에 유지할 최대 작업 수 (초과 시 완료 작업부터 LRU 제거)",
+    )
+    disclosure_check_job_ttl_seconds: float = Field(
+        default=3600.0,
+        gt=0,
+        description="완료·실패 후 결과 보관 시간(초)",
+    )
+    disclosure_check_result_max_chars: int = Field(
+        default=4000,
+        ge=1,
+        description="작업 결과(message + suggestions) 최대 글자 수 (초과분 잘라서 저장)",
+    )
+    disclosure_canned_query_path: Optional[str] = Field(
+        default=None,
+        description="고정 쿼리 임베딩 저장 파일 (없으면 app/artifacts/canned_query_embeddings.json)",
+    )
+
+    # ===================
+    # LangGraph 체크포인터 (채팅·스팸 그래프 공용, BoundedMemorySaver)
+    # ===================
+    checkpoint_max_threads: int = Field(
+        default=1000,
+        ge=1,
+        description="메모리에 유지할 최대 스레드 수 (초과 시 LRU 제거)",
+    )
+    checkpoint_max_history: int = Field(
+        default=20,
+        ge=1,
+        description="스레드별 보관 체크포인트 수 (오래된 것부터 정리)",
+    )
+    checkpoint_ttl_seconds: float = Field(
+        default=3600.0,
+        ge=0.0,
+        description="마지막 접근 후 스레드 유지 시간(초). 0이면 TTL 없음",
+    )
+
     # ===================
     # EXAONE 최적화 설정
     # ===================
@@ -153,6 +296,101 @@ class Settings(BaseSettings):
         default=True,
         description="4-bit 양자화 사용 여부",
     )
+    exaone_device: str = Field(
+        default="cuda",
+        description="EXAONE 추론 디바이스: cuda(GPU 필수) | cpu | auto(CUDA 없으면 CPU)",
+    )
+    exaone_cpu_dtype: str = Field(
+        default="bfloat16",
+        description="CPU 백엔드 로드 dtype (bfloat16 | float32). bf16 미지원 CPU면 float32. int8 사용 시 무시(float32)",
+    )
+    exaone_cpu_int8: bool = Field(
+        default=True,
+        description="CPU 백엔드: nn.Linear 동적 int8 양자화 (가중치 메모리 1/4, GEMM 가속)",
+    )
+    exaone_cpu_threads: int = Field(
+        default=0,
+        ge=0,
+        description="CPU 백엔드 torch 스레드 수 (0이면 사용 가능한 물리 코어 수)",
+    )
+    exaone_prefix_cache: bool = Field(
+        default=True,
+        description="ExaOne 프롬프트 접두사 KV 캐시 (도구 프롬프트·analyze_email·soccer 요약 템플릿 prefill 재사용)",
+    )
+    exaone_prefix_cache_mb: float = Field(
+        default=512.0,
+        gt=0.0,
+        description="접두사 KV 캐시 메모리 상한(MB). 초과 시 LRU 제거",
+    )
+    exaone_continuous_batching: bool = Field(
+        default=False,
+        description="ExaOne 연속 배칭 스케줄러 사용 (동시 요청을 토큰 단위로 한 디코드 배치에 합류)",
+    )
+    exaone_max_batch_size: int = Field(
+        default=8,
+        ge=1,
+        le=128,
+        description="연속 배칭: 동시에 디코딩하는 최대 시퀀스 수",
+    )
+    exaone_kv_cache_budget_mb: float = Field(
+        default=2048.0,
+        gt=0.0,
+        description="연속 배칭: 배치 KV 캐시 메모리 예산(MB). 시퀀스 수 × 최장(프롬프트+max_new_tokens) 기준으로 합류 제한",
+    )
+
+    # ===================
+    # 시멘틱 분류기 (Llama 3.2 어댑터)
+    # ===================
+    semantic_classifier_mode: str = Field(
+        default="score",
+        description="score: 라벨 토큰 logit 1회 forward로 분류, generate: 텍스트 생성 후 파싱 (score 실패 시 자동 폴백)",
+    )
+    semantic_classifier_batch_size: int = Field(
+        default=8,
+        ge=1,
+        le=128,
+        description="classify_batch/score_labels 한 번의 forward에 넣는 최대 문장 수",
+    )
+    semantic_classifier_temperature: float = Field(
+        default=1.0,
+        gt=0.0,
+        description="라벨 확률 온도 (softmax(logit / T)). 기본 1.0은 보정 없이 모델 분포 그대로, 검증셋으로 맞춘 값이 있을 때만 변경",
+    )
+
+    # ===================
+    # 스팸 분류기 (LLaMAClassifier, 시퀀스 분류)
+    # ===================
+    spam_classifier_batch_tokens: int = Field(
+        default=8192,
+        ge=512,
+        description="predict_batch 배치당 토큰 예산 (건수 × 배치 최장 길이). 길이순 정렬 후 동적 패딩",
+    )
+
+    # ===================
+    # Hub LLM 응답 캐시·요청 병합 (classify·classify_spam·analyze_email·결정적 generate)
+    # ===================
+    llm_response_cache: bool = Field(
+        default=True,
+        description="같은 입력·모델 버전·생성 파라미터의 결과 재사용 (샘플링 생성은 자동 우회)",
+    )
+    llm_response_cache_size: int = Field(
+        default=4096,
+        ge=1,
+        description="프로세스 내 LRU 최대 건수",
+    )
+    llm_response_cache_path: Optional[str] = Field(
+        default=None,
+        description="디스크 계층 SQLite 파일 경로 (비어 있으면 메모리만). 재시작·워커 간 공유",
+    )
+    llm_response_cache_disk_max_entries: int = Field(
+        default=100_000,
+        ge=1,
+        description="디스크 계층 최대 건수 (초과 시 오래된 것부터 삭제)",
+    )
+    llm_request_coalescing: bool = Field(
+        default=True,
+        description="같은 키(정규화 입력·모델 버전·파라미터)로 진행 중인 계산이 있으면 새로 돌리지 않고 결과 공유 (single-flight)",
+    )
 
     # ===================
     # API 키
@@ -210,6 +448,30 @@ class Settings(BaseSettings):
         default="http://127.0.0.1:8000",
         description="Hub MCP Base URL (Llama·ExaOne 엔드포인트 호스트)",
     )
+    hub_http_max_connections: int = Field(
+        default=100,
+        ge=1,
+        description="Hub HTTP 클라이언트 대상별 최대 동시 연결 수 (http_client.HttpClientManager)",
+    )
+    hub_http_max_keepalive_connections: int = Field(
+        default=20,
+        ge=0,
+        description="Hub HTTP 클라이언트 대상별 keep-alive 유지 연결 수",
+    )
+    hub_http_keepalive_expiry: float = Field(
+        default=30.0,
+        ge=0.0,
+        description="유휴 keep-alive 연결 유지 시간(초)",
+    )
+    hub_http_connect_timeout: float = Field(
+        default=5.0,
+        gt=0.0,
+        description="Hub HTTP 연결 타임아웃(초). 응답 타임아웃은 호출별 timeout 인자",
+    )
+    hub_http2: bool = Field(
+        default=False,
+        description="Hub HTTP/2 사용 (h2 패키지 필요, 없으면 HTTP/1.1)",
+    )
 
     # ===================
     # 도메인 MCP URL (Central → MCP → Spoke, call_tool)
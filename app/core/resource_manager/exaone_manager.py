@@ -30,13 +30,19 @@ class _ExaoneWrapper:
         prompt: str,
         max_new_tokens: int = 256,
         temperature: float = 0.3,
+        do_sample: bool = True,
     ) -> str:
-        """프롬프트로 텍스트 생성."""
+        """프롬프트로 텍스트 생성 (생성 파라미터는 LangChain 래퍼 호출에 그대로 전달)."""
         from langchain_core.messages import HumanMessage  # type: ignore
 
         llm = self._get_llm()
         messages = [HumanMessage(content=prompt)]
-        out = llm.invoke(messages)
+        out = llm.invoke(
+            messages,
+            max_new_tokens=max_new_tokens,
+            temperature=temperature,
+            do_sample=do_sample,
+        )
         content = getattr(out, "content", None) or str(out)
         return content if isinstance(content, str) else str(content)
 
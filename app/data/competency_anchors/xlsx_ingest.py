@@ -3,9 +3,14 @@ O*NET xlsx 4종 → competency_anchors 테이블 적재.
 
 - INGEST_STRATEGY.md §2: embedding_content = [category] [section_title]: content, Batch 100~500.
 - unique_id 생성: source_stem | task_id | element_id 등으로 Upsert 가능하도록.
+- embedding NULL 행이 DROP_INDEX_MIN_ROWS 이상이면 채우기 전 HNSW 삭제 → 채운 뒤 CONCURRENTLY 재생성
+  (행마다 그래프 삽입하는 비용 제거). 그보다 적으면 인덱스를 유지한 채 채우고, 0행이면 채우기·삭제 모두 생략.
 실행 (app 디렉터리):
-  python -m data.competency_anchors.xlsx_ingest          # 전체: 추출 → Upsert → embedding 채우기
+  python -m data.competency_anchors.xlsx_ingest          # 전체: 추출 → Upsert → embedding 채우기 → HNSW 재생성
   python -m data.competency_anchors.xlsx_ingest --fill-only  # embedding만: NULL인 행만 이어서 채우기
+  python -m data.competency_anchors.xlsx_ingest --build-index  # HNSW만 생성 (중단 후 복구용)
+  --keep-index: HNSW를 유지한 채 적재 (적재 중에도 검색 품질 유지가 필요할 때)
+  --drop-index-min-rows N: HNSW를 삭제할 최소 NULL 행 수 (기본 DROP_INDEX_MIN_ROWS)
 """
 import sys
 from pathlib import Path
@@ -53,9 +58,46 @@ def _prepare_rows(rows: list[dict[str, Any]], source_stem: str) -> list[dict[str
 
 # INGEST_STRATEGY §2: INSERT 100~500. embedding 없이 먼저 적재하므로 500 사용
 INSERT_BATCH_ROWS = 500
+# 채울 행이 이보다 적으면 HNSW 증분 삽입이 전체 재생성(수십만 행 그래프 빌드)보다 싸므로 인덱스 유지
+DROP_INDEX_MIN_ROWS = 20000
 
 
-def run_ingest() -> int:
+def _count_missing_embeddings() -> int:
+    """embedding이 NULL인 행 수."""
+    from domain.hub.repositories.competency_anchor_repository import count_anchors_missing_embedding  # type: ignore
+    from core.database import SessionLocal  # type: ignore
+
+    db = SessionLocal()
+    try:
+        return count_anchors_missing_embedding(db)
+    finally:
+        db.close()
+
+
+def _drop_vector_index(keep_index: bool, pending: int, min_rows: int) -> None:
+    """keep_index가 아니고 채울 행(pending)이 min_rows 이상일 때만 embedding 채우기 전 HNSW 삭제."""
+    if keep_index:
+        return
+    if pending < min_rows:
+        print(f"[index] NULL {pending}행 < {min_rows}행 → HNSW 유지한 채 채우기")
+        return
+    from domain.hub.repositories.competency_anchor_repository import drop_anchor_vector_index  # type: ignore
+
+    if drop_anchor_vector_index():
+        print(f"[index] NULL {pending}행 → HNSW 삭제 (적재 후 재생성)")
+
+
+def run_build_index() -> bool:
+    """HNSW CONCURRENTLY 생성 (maintenance_work_mem 상향). 이미 있으면 생략."""
+    from domain.hub.repositories.competency_anchor_repository import build_anchor_vector_index  # type: ignore
+
+    print("[index] HNSW CONCURRENTLY 생성 중 ...")
+    built = build_anchor_vector_index()
+    print("[index] HNSW 생성 완료." if built else "[index] HNSW 이미 존재, 생략.")
+    return built
+
+
+def run_ingest(keep_index: bool = False, drop_index_min_rows: int = DROP_INDEX_MIN_ROWS) -> int:
     """원래 전략: xlsx 추출 → embedding 없이 먼저 Upsert → fill_embeddings_for_anchors로 NULL 채우기 (시간 오래 걸림, 안정적)."""
     from domain.shared.strategies import ExcelStrategyFactory  # type: ignore
     from domain.hub.repositories.competency_anchor_repository import (
@@ -94,8 +136,15 @@ def run_ingest() -> int:
         db.close()
 
     # 2) embedding NULL인 행만 chunk 단위로 가져와 임베딩 후 bulk_update (3시간대, 안정적)
+    pending = _count_missing_embeddings()
+    if pending == 0:
+        # 재적재로 내용이 그대로면 채울 행이 없음 → 모델 로드·인덱스 삭제 생략 (인덱스가 없을 때만 생성)
+        print("[ingest] embedding NULL 행 없음, 채우기 생략.")
+        run_build_index()
+        return 0
     print("[ingest] FlagEmbedding BGE-m3 로드 중 ...")
     embeddings = get_embedding_model(use_fp16=True, batch_size=128)
+    _drop_vector_index(keep_index, pending, drop_index_min_rows)
     db2 = SessionLocal()
     try:
         filled = fill_embeddings_for_anchors(
@@ -105,39 +154,61 @@ def run_ingest() -> int:
             fetch_chunk=2000,
         )
         print(f"[ingest] embedding 채우기 완료: {filled}행.")
-        return filled
     finally:
         db2.close()
+    # 3) 적재 후 HNSW 재생성 (keep_index여도 없으면 생성)
+    run_build_index()
+    return filled
 
 
-def run_fill_only() -> int:
+def run_fill_only(keep_index: bool = False, drop_index_min_rows: int = DROP_INDEX_MIN_ROWS) -> int:
     """embedding이 NULL인 행만 채움. 중단 후 재실행 시 사용."""
     from domain.hub.repositories.competency_anchor_repository import fill_embeddings_for_anchors  # type: ignore
     from core.database import SessionLocal  # type: ignore
     from domain.shared.embedding import get_embedding_model  # type: ignore
 
-    print("[fill-only] FlagEmbedding BGE-m3 로드 중 ...")
+    pending = _count_missing_embeddings()
+    if pending == 0:
+        # 삭제 후 채우기는 끝났는데 재생성 전에 중단된 경우를 위해 인덱스가 없을 때만 생성
+        print("[fill-only] embedding NULL 행 없음, 채우기 생략.")
+        run_build_index()
+        return 0
+    print(f"[fill-only] NULL {pending}행. FlagEmbedding BGE-m3 로드 중 ...")
     embeddings = get_embedding_model(use_fp16=True, batch_size=128)
+    _drop_vector_index(keep_index, pending, drop_index_min_rows)
     db = SessionLocal()
     try:
         n = fill_embeddings_for_anchors(db, embeddings, batch_size=128, fetch_chunk=2000)
         print(f"[fill-only] embedding 채우기 완료: {n}행.")
-        return n
     finally:
         db.close()
+    run_build_index()
+    return n
 
 
 def main() -> None:
     import argparse
     parser = argparse.ArgumentParser(description="competency_anchors xlsx 적재 또는 embedding만 채우기")
     parser.add_argument("--fill-only", action="store_true", help="추출/Upsert 생략, embedding NULL인 행만 채우기")
+    parser.add_argument("--build-index", action="store_true", help="적재 생략, HNSW 인덱스만 생성")
+    parser.add_argument("--keep-index", action="store_true", help="적재 중 HNSW 삭제하지 않음")
+    parser.add_argument(
+        "--drop-index-min-rows",
+        type=int,
+        default=DROP_INDEX_MIN_ROWS,
+        help="embedding NULL 행이 이 수 이상일 때만 HNSW 삭제 후 재생성",
+    )
     args = parser.parse_args()
 
     try:
+        if args.build_index:
+            run_build_index()
+            print("정상 종료.")
+            return
         if args.fill_only:
-            n = run_fill_only()
+            n = run_fill_only(keep_index=args.keep_index, drop_index_min_rows=args.drop_index_min_rows)
         else:
-            n = run_ingest()
+            n = run_ingest(keep_index=args.keep_index, drop_index_min_rows=args.drop_index_min_rows)
         print(f"정상 종료. embedding 채워진 행 수: {n}")
     except Exception as e:
         print(f"오류: {e}", file=sys.stderr)
@@ -0,0 +1,87 @@
+"""HNSW 인덱스 사용 검증 (로컬/Neon Postgres, EXPLAIN).
+
+disclosures·competency_anchors 벡터 검색 SQL(vector_search.build_vector_search_sql)을 EXPLAIN 해서
+HNSW 인덱스(idx_*_embedding_hnsw)가 선택되는지 확인.
+1) 기본 플랜에서 인덱스 사용 → [OK]
+2) 기본 플랜은 Seq Scan이지만 enable_seqscan=off에서 인덱스 사용 → [OK] (행 수가 적어 플래너가 Seq Scan 선택)
+3) enable_seqscan=off에서도 인덱스 미사용 → [FAIL] (연산자·opclass 불일치)
+실행: app 디렉터리에서 python -m data.disclosure.hnsw_verify
+"""
+import random
+import sys
+from pathlib import Path
+from typing import List, Tuple
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+APP_ROOT = SCRIPT_DIR.parent.parent
+if str(APP_ROOT) not in sys.path:
+    sys.path.insert(0, str(APP_ROOT))
+
+# (테이블, HNSW 인덱스 이름)
+TARGETS: List[Tuple[str, str]] = [
+    ("disclosures", "idx_disclosures_embedding_hnsw"),
+    ("competency_anchors", "idx_competency_anchors_embedding_hnsw"),
+]
+
+
+def _random_unit_vector(dim: int) -> List[float]:
+    """EXPLAIN용 임의 단위 벡터 (값 자체는 플랜에 영향 없음)."""
+    vec = [random.gauss(0.0, 1.0) for _ in range(dim)]
+    norm = sum(x * x for x in vec) ** 0.5 or 1.0
+    return [x / norm for x in vec]
+
+
+def verify_one(db, table: str, index_name: str) -> Tuple[bool, str]:
+    """(통과 여부, 메시지) 반환."""
+    from sqlalchemy import text as sql_text  # type: ignore[import-untyped]
+
+    from domain.hub.repositories.vector_search import (  # type: ignore
+        build_vector_search_sql,
+        explain_vector_search,
+        plan_uses_index,
+    )
+    from domain.shared.embedding import BGE_M3_DENSE_DIM  # type: ignore
+
+    sql = build_vector_search_sql(table, ["id"])
+    vec = _random_unit_vector(BGE_M3_DENSE_DIM)
+    plan = explain_vector_search(db, sql, vec, {"k": 5})
+    if plan_uses_index(plan, index_name):
+        return True, "기본 플랜에서 HNSW 사용"
+    db.execute(sql_text("SET LOCAL enable_seqscan = off"))
+    forced_plan = explain_vector_search(db, sql, vec, {"k": 5})
+    db.rollback()
+    if plan_uses_index(forced_plan, index_name):
+        return True, "행 수가 적어 기본 플랜은 Seq Scan, enable_seqscan=off에서 HNSW 사용"
+    return False, "enable_seqscan=off에서도 HNSW 미사용 (연산자/opclass 확인)\n" + forced_plan
+
+
+def main() -> None:
+    from core.database import SessionLocal  # type: ignore
+
+    failed = 0
+    db = SessionLocal()
+    try:
+        for table, index_name in TARGETS:
+            try:
+                ok, message = verify_one(db, table, index_name)
+            except Exception as e:
+                db.rollback()
+                ok, message = False, str(e)
+            if ok:
+                print(f"[OK]   {table} ({index_name}) — {message}")
+            else:
+                failed += 1
+                print(f"[FAIL] {table} ({index_name}) — {message}")
+    finally:
+        db.close()
+
+    print("=" * 60)
+    if failed:
+        print(f"결론: {failed}개 테이블에서 HNSW 인덱스가 선택되지 않습니다.")
+        sys.exit(1)
+    print(f"결론: {len(TARGETS)}개 테이블 모두 HNSW 인덱스 사용.")
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""soccer 배치 저장 벤치마크: merge(행마다) vs COPY + ON CONFLICT (bulk upsert).
+
+data/soccer/*.jsonl(stadiums → teams → players → schedules, FK 순서)을 한 트랜잭션에서 저장하고
+엔터티별 rows/sec를 출력한 뒤 ROLLBACK (DB 내용은 바뀌지 않음).
+두 경로의 최종 테이블 스냅샷도 비교해 행 단위 결과가 같은지 확인.
+NULL 왕복도 확인: 입력에서 null인 칸은 두 경로 모두 NULL, 빈 문자열은 ''로 저장돼야 함
+(players back_no/height/weight, schedules 점수 등 + NULL·빈 문자열·따옴표·줄바꿈을 섞은 stadium 합성 행).
+
+실행: app 디렉터리에서 python -m data.soccer.upsert_bench [--repeat 3] [--chunk-size 500]
+  --repeat N: 같은 데이터를 N번 저장 (2회차부터는 UPDATE 경로 측정)
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+APP_ROOT = SCRIPT_DIR.parent.parent
+if str(APP_ROOT) not in sys.path:
+    sys.path.insert(0, str(APP_ROOT))
+
+# FK 순서 (teams.stadium_id는 FK 아님, schedules → stadiums/teams, players → teams)
+ENTITIES: List[str] = ["stadiums", "teams", "players", "schedules"]
+
+
+# NULL과 빈 문자열, CSV 특수문자를 섞은 합성 행 (id·코드는 실제 데이터와 겹치지 않게)
+EDGE_ROWS: Dict[str, List[Dict[str, Any]]] = {
+    "stadiums": [
+        {
+            "id": 990000001,
+            "stadium_code": "ZZ901",
+            "statdium_name": "",
+            "hometeam_id": None,
+            "hometeam_code": "",
+            "seat_count": None,
+            "address": 'a "quoted", comma\nnewline',
+            "ddd": None,
+            "tel": "",
+        },
+    ],
+}
+
+
+def _load_jsonl(name: str) -> List[Dict[str, Any]]:
+    path = SCRIPT_DIR / f"{name}.jsonl"
+    with path.open(encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()] + EDGE_ROWS.get(name, [])
+
+
+def _expected_cells(rows: List[Dict[str, Any]]) -> Dict[Tuple[Any, str], Any]:
+    """입력의 (id, 컬럼) → 값 중 None·빈 문자열만 (같은 id는 나중 행이 덮어씀)."""
+    cells: Dict[Tuple[Any, str], Any] = {}
+    for row in rows:
+        for col, value in row.items():
+            if value is None or value == "":
+                cells[(row["id"], col)] = value
+            else:
+                cells.pop((row["id"], col), None)
+    return cells
+
+
+def _null_mismatches(
+    rows: List[Dict[str, Any]], columns: List[str], snapshot: List[Tuple[Any, ...]]
+) -> List[str]:
+    """입력 null → DB NULL, 입력 '' → DB '' 인지. 어긋난 칸 설명 목록."""
+    by_id = {r[columns.index("id")]: r for r in snapshot}
+    out: List[str] = []
+    for (row_id, col), value in _expected_cells(rows).items():
+        if col not in columns or row_id not in by_id:
+            continue
+        stored = by_id[row_id][columns.index(col)]
+        if stored != value:
+            out.append(f"id={row_id} {col}: 입력 {value!r} → DB {stored!r}")
+    return out
+
+
+def _repositories() -> Dict[str, Any]:
+    from domain.hub.repositories.soccer_repository import (  # type: ignore
+        PlayerRepository,
+        ScheduleRepository,
+        StadiumRepository,
+        TeamRepository,
+    )
+
+    return {
+        "stadiums": StadiumRepository(),
+        "teams": TeamRepository(),
+        "players": PlayerRepository(),
+        "schedules": ScheduleRepository(),
+    }
+
+
+def _snapshot(db, table: str) -> Tuple[List[str], List[Tuple[Any, ...]]]:
+    """embedding 제외 전체 컬럼을 id 순으로 → (컬럼명, 행)."""
+    from sqlalchemy import text as sql_text  # type: ignore[import-untyped]
+
+    cols = db.execute(
+        sql_text(
+            "SELECT column_name FROM information_schema.columns "
+            "WHERE table_name = :t AND column_name <> 'embedding' ORDER BY ordinal_position"
+        ),
+        {"t": table},
+    ).scalars().all()
+    rows = db.execute(sql_text(f"SELECT {', '.join(cols)} FROM {table} ORDER BY id")).all()
+    return list(cols), [tuple(r) for r in rows]
+
+
+def run_mode(
+    bulk: bool, data: Dict[str, List[Dict[str, Any]]], repeat: int, chunk_size: int
+) -> Tuple[Dict[str, float], Dict[str, Tuple[List[str], List[Tuple[Any, ...]]]]]:
+    """한 모드로 저장 → (엔터티별 rows/sec, (컬럼명, 테이블 스냅샷)). 끝나면 ROLLBACK."""
+    from core.database import SessionLocal  # type: ignore
+
+    repos = _repositories()
+    rates: Dict[str, float] = {}
+    snapshots: Dict[str, Tuple[List[str], List[Tuple[Any, ...]]]] = {}
+    db = SessionLocal()
+    try:
+        for name in ENTITIES:
+            rows = data[name]
+            start = time.perf_counter()
+            for _ in range(repeat):
+                repos[name].save_batch(rows, db, chunk_size=chunk_size, bulk=bulk)
+            db.flush()
+            elapsed = time.perf_counter() - start
+            rates[name] = (len(rows) * repeat) / elapsed if elapsed > 0 else float("inf")
+        for name in ENTITIES:
+            snapshots[name] = _snapshot(db, name)
+    finally:
+        db.rollback()
+        db.close()
+    return rates, snapshots
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="soccer merge vs bulk upsert 벤치마크")
+    parser.add_argument("--repeat", type=int, default=3, help="같은 데이터 반복 저장 횟수")
+    parser.add_argument("--chunk-size", type=int, default=500, help="save_batch chunk_size")
+    args = parser.parse_args()
+
+    data = {name: _load_jsonl(name) for name in ENTITIES}
+    try:
+        merge_rates, merge_snap = run_mode(False, data, args.repeat, args.chunk_size)
+        bulk_rates, bulk_snap = run_mode(True, data, args.repeat, args.chunk_size)
+    except Exception as e:
+        print(f"오류: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"{'entity':<10} {'rows':>6} {'merge rows/s':>14} {'bulk rows/s':>14} {'speedup':>8}  same  nulls")
+    all_same = True
+    null_errors: List[str] = []
+    for name in ENTITIES:
+        same = merge_snap[name] == bulk_snap[name]
+        all_same = all_same and same
+        checked = len(_expected_cells(data[name]))
+        errors = [
+            f"{label} {name} {e}"
+            for label, snap in (("merge", merge_snap), ("bulk", bulk_snap))
+            for e in _null_mismatches(data[name], *snap[name])
+        ]
+        null_errors.extend(errors)
+        speedup = bulk_rates[name] / merge_rates[name] if merge_rates[name] else 0.0
+        print(
+            f"{name:<10} {len(data[name]) * args.repeat:>6} {merge_rates[name]:>14.0f} "
+            f"{bulk_rates[name]:>14.0f} {speedup:>7.1f}x  {'OK' if same else 'DIFF':<4}  "
+            f"{checked} cells {'OK' if not errors else f'{len(errors)} DIFF'}"
+        )
+    for e in null_errors[:20]:
+        print(f"  {e}", file=sys.stderr)
+    if not all_same or null_errors:
+        print("[FAIL] merge와 bulk upsert 결과가 다르거나 NULL/빈 문자열이 보존되지 않습니다.", file=sys.stderr)
+        sys.exit(1)
+    print("[OK] 두 경로의 저장 결과 동일, NULL·빈 문자열 보존 (ROLLBACK 완료).")
+
+
+if __name__ == "__main__":
+    main()
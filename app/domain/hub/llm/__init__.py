@@ -3,14 +3,17 @@ Hub LLM Adapters - Llama/ExaOne 유일 진입점.
 
 목표 구조: 내부 서비스·MCP 도구는 이 어댑터를 통해서만 Llama/ExaOne에 접근합니다.
 - Llama Adapter: 시멘틱 분류(classify), 스팸 분류(classify_spam)
-- ExaOne Adapter: 텍스트 생성(generate_text), LLM 인스턴스(get_llm), 이메일 분석(analyze_email)
+- ExaOne Adapter: 텍스트 생성(generate_text), LLM 인스턴스(get_llm), 이메일 분석(analyze_email),
+  고정 프롬프트 접두사 KV 캐시 등록(register_prompt_prefix)
 - Provider 메타: get_provider_name, list_providers, supports_tool_calling (exaone_provider)
+- 응답 캐시 통계: get_cache_stats (response_cache, 어댑터 결과 재사용)
 """
 
 from .exaone_adapter import (
     analyze_email,
     generate_text,
     get_llm,
+    register_prompt_prefix,
 )
 from .llama_adapter import (
     classify,
@@ -22,6 +25,7 @@ from .exaone_provider import (
     list_providers,
     supports_tool_calling,
 )
+from .response_cache import get_cache_stats
 
 __all__ = [
     # Llama
@@ -32,8 +36,11 @@ __all__ = [
     "generate_text",
     "get_llm",
     "analyze_email",
+    "register_prompt_prefix",
     # Provider 메타
     "get_provider_name",
     "list_providers",
     "supports_tool_calling",
+    # 응답 캐시
+    "get_cache_stats",
 ]
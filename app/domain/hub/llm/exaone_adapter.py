@@ -3,12 +3,59 @@ ExaOne Adapter - Hub의 ExaOne 진입점.
 
 ExaOne 모델(텍스트 생성, 채팅, 이메일 분석) 접근은 이 어댑터를 통해서만 수행합니다.
 내부적으로 exaone_provider 및 ExaoneManager를 사용합니다.
+analyze_email과 결정적(temperature <= 0) generate_text 결과는 response_cache로 재사용하고,
+같은 입력의 동시 호출은 계산 1회를 공유합니다 (single_flight).
 """
 
 import json
 import re
 from typing import Any, Dict, List, Optional
 
+# ---------------------------------------------------------------------------
+# 응답 캐시 키용 모델 버전
+# ---------------------------------------------------------------------------
+
+_model_version: Optional[str] = None
+
+# 모델 버전에 반영할 파일 (샤드 가중치는 glob으로 추가, llama_adapter._gate_version과 동일한 방식)
+_MODEL_VERSION_FILES = (
+    "config.json",
+    "generation_config.json",
+    "tokenizer.json",
+    "tokenizer_config.json",
+    "model.safetensors.index.json",
+)
+_MODEL_WEIGHT_PATTERNS = ("*.safetensors", "*.bin")
+
+
+def _get_model_version() -> str:
+    """EXAONE 모델 디렉터리(설정·가중치 mtime·크기) + 양자화·디바이스 설정. 프로세스당 1회 계산."""
+    global _model_version
+    if _model_version is None:
+        from core.config import settings  # type: ignore
+        from domain.hub.llm.response_cache import file_fingerprint  # type: ignore
+        from domain.models.bases.exaone_model import resolve_model_dir  # type: ignore
+
+        # ExaoneLLM이 실제로 로드하는 디렉터리와 같은 경로 해석
+        model_dir = resolve_model_dir()
+        names = list(_MODEL_VERSION_FILES)
+        if model_dir is not None and model_dir.is_dir():
+            for pattern in _MODEL_WEIGHT_PATTERNS:
+                names.extend(sorted(p.name for p in model_dir.glob(pattern)))
+        weights = file_fingerprint(model_dir, names)
+        device = settings.exaone_device
+        if device == "auto":
+            import torch
+
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+        backend = f"4bit={settings.exaone_use_4bit}"
+        if device == "cpu":
+            # CPU 백엔드(int8/bf16)는 GPU와 출력이 다를 수 있음 → 디스크 캐시 공유 시 키 분리
+            backend = f"cpu|{settings.exaone_cpu_dtype}|int8={settings.exaone_cpu_int8}"
+        _model_version = f"{weights}|{backend}"
+    return _model_version
+
+
 # ---------------------------------------------------------------------------
 # 텍스트 생성 (프롬프트 → 문자열)
 # ---------------------------------------------------------------------------
@@ -24,20 +71,33 @@ def generate_text(
     Args:
         prompt: 입력 프롬프트.
         max_tokens: 최대 생성 토큰 수.
-        temperature: 생성 온도.
+        temperature: 생성 온도. 0 이하면 greedy 디코딩(결정적, 응답 캐시 대상).
 
     Returns:
         생성된 문자열.
     """
     try:
         from domain.hub.llm.exaone_provider import get_llm  # type: ignore
+        from domain.hub.llm.response_cache import get_response_cache, normalize_text  # type: ignore
         from langchain_core.messages import HumanMessage  # type: ignore
 
-        llm = get_llm(provider="exaone", max_tokens=max_tokens, temperature=temperature)
-        messages = [HumanMessage(content=prompt.strip())]
-        response = llm.invoke(messages)
-        content = getattr(response, "content", None) or str(response)
-        return content if isinstance(content, str) else str(content)
+        prompt = normalize_text(prompt)
+        params = {
+            "max_new_tokens": max_tokens,
+            "temperature": temperature,
+            "do_sample": temperature > 0,
+        }
+
+        def _run() -> str:
+            llm = get_llm(provider="exaone", max_tokens=max_tokens, temperature=temperature)
+            response = llm.invoke([HumanMessage(content=prompt)], **params)
+            content = getattr(response, "content", None) or str(response)
+            return content if isinstance(content, str) else str(content)
+
+        # 샘플링(temperature > 0)이면 get_or_compute가 자동 우회
+        return get_response_cache().get_or_compute(
+            "exaone.generate", prompt, _run, version=_get_model_version(), params=params
+        )
     except Exception as e:
         return f"[ExaOne 오류] {e}"
 
@@ -68,10 +128,55 @@ def get_llm(
     )
 
 
+# ---------------------------------------------------------------------------
+# 고정 프롬프트 접두사 KV 캐시 등록
+# ---------------------------------------------------------------------------
+
+def register_prompt_prefix(prefix: str, role: str = "user") -> bool:
+    """고정 프롬프트 앞부분을 ExaOne 접두사 KV 캐시에 등록 (실패해도 생성에는 영향 없음).
+
+    매번 캐시에 위임: 이미 있으면 LRU 갱신만(prefill 없음), LRU로 밀려났으면 다시 prefill해 등록.
+
+    Args:
+        prefix: 매 요청 프롬프트가 이 문자열로 시작하는 고정 부분.
+        role: 채팅 템플릿 role (generate_text·analyze_email은 user).
+
+    Returns:
+        등록(또는 이미 등록) 여부.
+    """
+    try:
+        from domain.hub.llm.exaone_provider import get_llm as _get_llm  # type: ignore
+
+        register = getattr(_get_llm(provider="exaone"), "register_prefix", None)
+        return bool(register is not None and register(prefix, role=role))
+    except Exception:
+        return False
+
+
 # ---------------------------------------------------------------------------
 # 이메일 스팸/위험 분석 (정책 기반)
 # ---------------------------------------------------------------------------
 
+# 고정 지시문을 앞에 두어 요청 간 공통 접두사로 (접두사 KV 캐시 재사용), 이메일 내용은 뒤에
+_ANALYZE_EMAIL_PREFIX = """이메일 스팸 분석:
+
+판단 기준:
+- 스팸: 피싱, 사기, 광고성 링크, 개인정보 요청
+- 정상: 일반 업무, 개인 소통, 일정 안내
+
+confidence 기준:
+- high: 명확한 스팸 또는 명확한 정상
+- medium: 일부 의심 요소 있음
+- low: 판단 어려움
+
+JSON만 답변:
+{"is_spam": false, "confidence": "high", "risk_codes": [], "analysis": "분석내용"}
+
+분석할 이메일:
+"""
+# greedy 디코딩: 같은 이메일이면 같은 판정 (중복 메일·재시도 시 응답 캐시 적중)
+_ANALYZE_EMAIL_PARAMS: Dict[str, Any] = {"max_new_tokens": 256, "do_sample": False}
+
 
 def analyze_email(
     subject: str,
@@ -99,10 +204,7 @@ def analyze_email(
         {"raw_output": str, "parsed": dict, "risk_codes": list}
     """
     try:
-        from core.resource_manager.exaone_manager import ExaoneManager  # type: ignore
-
-        exaone_manager = ExaoneManager()
-        exaone_model = exaone_manager.get_base_model()
+        from domain.hub.llm.response_cache import get_response_cache  # type: ignore
 
         email_text = f"제목: {subject}\n발신자: {sender}"
         if body:
@@ -113,23 +215,24 @@ def analyze_email(
             email_text += f"\n첨부파일: {', '.join(attachments)}"
         policy_info = f"\n정책: {policy_context}" if policy_context else ""
 
-        prompt = f"""이메일 스팸 분석:
-{email_text}{policy_info}
-
-판단 기준:
-- 스팸: 피싱, 사기, 광고성 링크, 개인정보 요청
-- 정상: 일반 업무, 개인 소통, 일정 안내
+        prompt = f"{_ANALYZE_EMAIL_PREFIX}{email_text}{policy_info}"
 
-confidence 기준:
-- high: 명확한 스팸 또는 명확한 정상
-- medium: 일부 의심 요소 있음
-- low: 판단 어려움
+        def _run() -> str:
+            from core.resource_manager.exaone_manager import ExaoneManager  # type: ignore
 
-JSON만 답변:
-{{"is_spam": false, "confidence": "high", "risk_codes": [], "analysis": "분석내용"}}"""
+            exaone_model = ExaoneManager().get_base_model()
+            register_prompt_prefix(_ANALYZE_EMAIL_PREFIX)
+            response = exaone_model.invoke(prompt, **_ANALYZE_EMAIL_PARAMS)
+            return response if isinstance(response, str) else str(response)
 
-        response = exaone_model.invoke(prompt, max_new_tokens=256, temperature=0.3)
-        raw_output = response if isinstance(response, str) else str(response)
+        # 모델 출력(raw_output)만 캐시, 파싱은 매번 (파싱 로직 변경이 캐시에 묶이지 않도록)
+        raw_output = get_response_cache().get_or_compute(
+            "exaone.analyze_email",
+            prompt,
+            _run,
+            version=_get_model_version(),
+            params=_ANALYZE_EMAIL_PARAMS,
+        )
 
         try:
             json_match = re.search(r"\{[\s\S]*\}", raw_output)
@@ -3,9 +3,12 @@ Llama Adapter - Hub의 Llama 진입점.
 
 Llama 모델(시멘틱 분류, 스팸 분류) 접근은 이 어댑터를 통해서만 수행합니다.
 내부적으로 domain.hub.llm.llama_classifier(LLaMAGate) 및 hub.service.semantic_classifier를 사용합니다.
+두 분류 모두 결정적이므로 결과는 response_cache(입력 해시 + 모델/어댑터 버전)로 재사용하고,
+같은 입력의 동시 호출은 계산 1회를 공유합니다 (single_flight).
 """
 
-from typing import Any, Dict, Literal
+from pathlib import Path
+from typing import Any, Dict, Literal, Optional
 
 # ---------------------------------------------------------------------------
 # 시멘틱 분류 (BLOCK / RULE_BASED / POLICY_BASED)
@@ -22,9 +25,24 @@ def classify(text: str) -> Literal["BLOCK", "RULE_BASED", "POLICY_BASED"]:
         "BLOCK" | "RULE_BASED" | "POLICY_BASED"
     """
     try:
-        from domain.hub.service.semantic_classifier import classify as _classify  # type: ignore
-
-        return _classify(text.strip()) if text else "POLICY_BASED"
+        from domain.hub.llm.response_cache import get_response_cache, normalize_text  # type: ignore
+        from domain.hub.service.semantic_classifier import (  # type: ignore
+            classify as _classify,
+            get_model_version,
+            is_classifier_available as _available,
+        )
+
+        text = normalize_text(text)
+        if not text:
+            return "POLICY_BASED"
+        # strict: 모델 로드·추론 실패는 예외 → 캐시에 저장되지 않고 아래 except에서만 POLICY_BASED 폴백
+        return get_response_cache().get_or_compute(
+            "llama.classify",
+            text,
+            lambda: _classify(text, strict=True),
+            version=get_model_version(),
+            cacheable=_available(),
+        )
     except Exception:
         return "POLICY_BASED"
 
@@ -56,6 +74,33 @@ def _get_llama_gate():
     return _llama_gate
 
 
+# 스팸 게이트 버전에 반영할 파일 (샤드 가중치는 glob으로 추가)
+_GATE_VERSION_FILES = ("config.json", "adapter_config.json", "tokenizer.json")
+_GATE_WEIGHT_PATTERNS = ("*.safetensors", "*.bin")
+
+
+def _gate_version(gate: Any) -> Optional[str]:
+    """
+    응답 캐시 키용 게이트 버전: model_path·adapter_path의 설정·가중치 파일 mtime·크기.
+    재학습으로 가중치가 바뀌면 키도 바뀜. 경로를 알 수 없으면 None (캐시하지 않음).
+    """
+    from domain.hub.llm.response_cache import file_fingerprint  # type: ignore
+
+    parts = []
+    for attr in ("model_path", "adapter_path"):
+        value = getattr(gate, attr, None)
+        if not value:
+            continue
+        base = Path(value)
+        if not base.is_dir():
+            return None
+        names = list(_GATE_VERSION_FILES)
+        for pattern in _GATE_WEIGHT_PATTERNS:
+            names.extend(sorted(p.name for p in base.glob(pattern)))
+        parts.append(file_fingerprint(base, names))
+    return "|".join(parts) if parts else None
+
+
 def classify_spam(email_metadata: Dict[str, Any]) -> Dict[str, Any]:
     """이메일 메타데이터를 Llama로 스팸 분류합니다.
 
@@ -66,8 +111,17 @@ def classify_spam(email_metadata: Dict[str, Any]) -> Dict[str, Any]:
         {"spam_prob": float, "confidence": str, "label": str}
     """
     try:
+        from domain.hub.llm.response_cache import get_response_cache  # type: ignore
+
         gate = _get_llama_gate()
-        return gate.classify_spam(email_metadata)
+        version = _gate_version(gate)
+        return get_response_cache().get_or_compute(
+            "llama.classify_spam",
+            email_metadata,
+            lambda: gate.classify_spam(email_metadata),
+            version=version or "",
+            cacheable=version is not None,
+        )
     except Exception:
         return {
             "spam_prob": 0.5,
@@ -0,0 +1,293 @@
+"""
+Hub LLM 응답 캐시 - 같은 입력·같은 모델·같은 생성 파라미터면 이전 결과 재사용.
+
+중복 이메일·재시도된 채팅 턴이 classify / classify_spam / analyze_email / generate를
+그대로 다시 계산하지 않도록 어댑터 안에서 결과를 내용 주소(content-addressed)로 보관합니다.
+
+- 키: sha256(namespace + 모델/어댑터 버전 + 정규화 입력 + 생성 파라미터).
+  정규화는 모델이 실제로 보는 입력을 바꾸지 않는 범위(JSON 정렬 직렬화, 어댑터가 하는 strip)만.
+- 1차: 프로세스 내 LRU (llm_response_cache_size 건).
+- 2차(선택): SQLite 파일 (llm_response_cache_path). 재시작·다중 워커 간 공유, 최대 건수 초과 시 오래된 것부터 삭제.
+- 샘플링 생성(do_sample=True 이고 temperature > 0)은 결과가 매번 달라야 하므로 자동 우회.
+- compute()가 예외를 내면 저장하지 않음 (어댑터의 오류 폴백 값이 캐시에 남지 않도록).
+- 값은 JSON 문자열로 보관 → 적중 시 매번 새 객체 (호출자가 dict를 수정해도 캐시 오염 없음).
+- 미스 시 계산은 SingleFlight로 병합: 같은 키의 동시 호출은 계산 1회를 공유 (캐시를 꺼도 동작).
+
+통계: get_response_cache().stats() → hits(메모리/디스크), misses, bypassed, hit_rate, coalesced.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional
+
+from domain.hub.llm.single_flight import SingleFlight  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """키용 텍스트 정규화 (NFC + 앞뒤 공백 제거). 모델 입력에도 같은 값을 넘길 때만 사용."""
+    return unicodedata.normalize("NFC", (text or "").strip())
+
+
+def is_deterministic(params: Mapping[str, Any]) -> bool:
+    """생성 파라미터가 결정적(greedy)인지. do_sample=False 또는 temperature <= 0."""
+    if params.get("do_sample") is False:
+        return True
+    temperature = params.get("temperature")
+    return temperature is not None and float(temperature) <= 0.0
+
+
+def file_fingerprint(base: Optional[Path], names: Iterable[str]) -> str:
+    """모델/어댑터 디렉터리 버전 문자열 (경로 + 주요 파일 mtime·크기). 파일이 바뀌면 키도 바뀜."""
+    if base is None:
+        return "none"
+    parts = [str(base)]
+    for name in names:
+        path = base / name
+        try:
+            st = path.stat()
+            parts.append(f"{name}:{st.st_mtime_ns}:{st.st_size}")
+        except OSError:
+            continue
+    return "|".join(parts)
+
+
+def make_key(namespace: str, version: str, inputs: Any, params: Optional[Mapping[str, Any]] = None) -> str:
+    payload = json.dumps(
+        {"ns": namespace, "v": version, "in": inputs, "p": dict(params or {})},
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class _DiskTier:
+    """SQLite 2차 캐시 (key → JSON 값). 여러 프로세스가 같은 파일을 써도 안전하도록 WAL."""
+
+    def __init__(self, path: str, max_entries: int) -> None:
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=5.0, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_response_cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+        self._puts = 0
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM llm_response_cache WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, key: str, value: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_response_cache (key, value, created_at) VALUES (?, ?, ?)",
+                (key, value, time.time()),
+            )
+            self._puts += 1
+            # 매 put마다 COUNT 하지 않고 주기적으로만 정리
+            if self._puts % 256 == 0:
+                self._trim_locked()
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_response_cache")
+            self._conn.commit()
+
+    def _trim_locked(self) -> None:
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM llm_response_cache").fetchone()
+        excess = count - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM llm_response_cache WHERE key IN ("
+                "SELECT key FROM llm_response_cache ORDER BY created_at LIMIT ?)",
+                (excess,),
+            )
+
+
+class ResponseCache:
+    """메모리 LRU + 선택적 SQLite 디스크 계층 + 미스 시 single-flight 병합."""
+
+    def __init__(
+        self,
+        max_entries: int = 4096,
+        disk_path: Optional[str] = None,
+        disk_max_entries: int = 100_000,
+        enabled: bool = True,
+        coalesce: bool = True,
+    ) -> None:
+        self.enabled = enabled
+        self._flight: Optional[SingleFlight] = SingleFlight() if coalesce else None
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._disk: Optional[_DiskTier] = None
+        if enabled and disk_path:
+            try:
+                self._disk = _DiskTier(disk_path, disk_max_entries)
+            except Exception as e:
+                logger.warning("[LLM cache] 디스크 캐시 비활성화 (%s): %s", disk_path, e)
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self.stores = 0
+
+    def get_or_compute(
+        self,
+        namespace: str,
+        inputs: Any,
+        compute: Callable[[], Any],
+        *,
+        version: str = "",
+        params: Optional[Mapping[str, Any]] = None,
+        cacheable: bool = True,
+    ) -> Any:
+        """
+        캐시 적중이면 저장된 결과, 아니면 compute() 결과를 저장 후 반환.
+        같은 키로 계산 중인 호출이 있으면 compute()를 다시 돌리지 않고 그 결과(또는 예외)를 공유.
+        cacheable=False 또는 샘플링 파라미터면 캐시·병합 없이 compute()만 호출.
+        """
+        sampled = bool(params) and not is_deterministic(params)
+        if not cacheable or sampled or (not self.enabled and self._flight is None):
+            with self._lock:
+                self.bypassed += 1
+            return compute()
+
+        key = make_key(namespace, version, inputs, params)
+        if self.enabled:
+            cached = self._get(key)
+            if cached is not _MISSING:
+                return cached
+        if self._flight is None:
+            return self._compute_and_store(key, compute)
+        return self._flight.do(key, lambda: self._compute_and_store(key, compute))
+
+    def _compute_and_store(self, key: str, compute: Callable[[], Any]) -> Any:
+        if self.enabled:
+            # 조회와 single-flight 합류 사이에 앞선 leader가 저장을 마쳤을 수 있음
+            with self._lock:
+                encoded = self._memory.get(key)
+            if encoded is not None:
+                return json.loads(encoded)
+        value = compute()
+        if not self.enabled:
+            return value
+        try:
+            encoded = json.dumps(value, ensure_ascii=False)
+        except (TypeError, ValueError):
+            return value
+        self._put_memory(key, encoded)
+        if self._disk is not None:
+            try:
+                self._disk.put(key, encoded)
+            except Exception as e:
+                logger.warning("[LLM cache] 디스크 저장 실패: %s", e)
+        with self._lock:
+            self.stores += 1
+        return value
+
+    def _get(self, key: str) -> Any:
+        with self._lock:
+            encoded = self._memory.get(key)
+            if encoded is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return json.loads(encoded)
+        if self._disk is not None:
+            try:
+                encoded = self._disk.get(key)
+            except Exception as e:
+                logger.warning("[LLM cache] 디스크 조회 실패: %s", e)
+                encoded = None
+            if encoded is not None:
+                self._put_memory(key, encoded)
+                with self._lock:
+                    self.disk_hits += 1
+                return json.loads(encoded)
+        with self._lock:
+            self.misses += 1
+        return _MISSING
+
+    def _put_memory(self, key: str, encoded: str) -> None:
+        with self._lock:
+            self._memory[key] = encoded
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+        if self._disk is not None:
+            self._disk.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            hits = self.memory_hits + self.disk_hits
+            lookups = hits + self.misses
+            flight = self._flight.stats() if self._flight is not None else {}
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._memory),
+                "max_entries": self.max_entries,
+                "disk": str(self._disk.path) if self._disk is not None else None,
+                "hits": hits,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "bypassed": self.bypassed,
+                "stores": self.stores,
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+                "coalescing": self._flight is not None,
+                "coalesced": flight.get("coalesced", 0),
+                "executions": flight.get("executions", 0),
+                "inflight": flight.get("inflight", 0),
+            }
+
+
+_cache: Optional[ResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """설정 기반 ResponseCache 싱글톤 (lazy)."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                from core.config import settings  # type: ignore
+
+                _cache = ResponseCache(
+                    max_entries=settings.llm_response_cache_size,
+                    disk_path=settings.llm_response_cache_path,
+                    disk_max_entries=settings.llm_response_cache_disk_max_entries,
+                    enabled=settings.llm_response_cache,
+                    coalesce=settings.llm_request_coalescing,
+                )
+    return _cache
+
+
+def get_cache_stats() -> Dict[str, Any]:
+    """Hub LLM 응답 캐시 통계 (health 엔드포인트용)."""
+    return get_response_cache().stats()
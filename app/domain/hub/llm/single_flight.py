@@ -0,0 +1,83 @@
+"""
+Single-flight 요청 병합 - 같은 키의 동시 호출은 계산 1회를 공유.
+
+같은 뉴스레터가 여러 사용자에게 동시에 들어오면 classify_spam / analyze_email이 같은 입력으로
+동시에 여러 번 돌게 됨. 먼저 들어온 호출(leader)만 계산하고, 계산 중에 같은 키로 들어온 호출
+(follower)은 그 결과(또는 예외)를 그대로 받음. 계산이 끝나면 키를 비워 다음 호출은 새로 계산
+(결과 보관은 response_cache 담당).
+
+- follower에게는 결과 deepcopy를 넘김 (한 호출자가 dict를 수정해도 다른 호출자에 영향 없음).
+- leader 예외는 같은 키의 follower 모두에게 다시 raise.
+- 스레드 기반 (어댑터는 동기 함수, 핸들러가 스레드 풀에서 호출).
+"""
+
+import copy
+import threading
+from typing import Any, Callable, Dict, Optional
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "followers")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.followers = 0
+
+
+class SingleFlight:
+    """키별 진행 중 계산 공유."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self.executions = 0
+        self.coalesced = 0
+        self.errors = 0
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """key로 진행 중인 계산이 있으면 기다려 결과 공유, 없으면 fn() 실행."""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+                self.executions += 1
+                leader = True
+            else:
+                call.followers += 1
+                self.coalesced += 1
+                leader = False
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            with self._lock:
+                self.errors += 1
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+                followers = call.followers
+            if followers and call.error is None:
+                # leader 호출자가 반환값을 수정해도 follower 결과는 그대로이도록 스냅샷
+                call.result = copy.deepcopy(call.result)
+            call.done.set()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "executions": self.executions,
+                "coalesced": self.coalesced,
+                "errors": self.errors,
+                "inflight": len(self._calls),
+            }
@@ -4,37 +4,227 @@ Hub MCP HTTP 클라이언트.
 spokes(chat, spam, soccer)가 hub를 HTTP로 호출할 때 사용.
 hub = Llama·ExaOne 등 호출 수신 (receiver), spokes = 호출하는 쪽 (caller).
 Chat/Spam: Llama·ExaOne 내부 API. Soccer: /internal/soccer/* (Hub가 Soccer MCP 위임).
+
+연결 재사용: 호출마다 httpx.Client를 열지 않고 HttpClientManager가 대상(base URL)별로
+keep-alive 풀을 가진 장수명 Client/AsyncClient를 공유. 타임아웃은 호출별(timeout 인자)로 지정.
+- 동기: llama_classify, exaone_generate, chat_call, ... (LangGraph 노드·스레드)
+- 비동기: allama_classify, aexaone_generate, achat_call, ... (async 핸들러)
+- 종료: FastAPI lifespan에서 await close_http_clients().
 """
 
+import asyncio
 import json
-from typing import Any, Dict, Optional
+import logging
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
 
 import httpx
 
 from core.config import get_settings  # type: ignore
 
+logger = logging.getLogger(__name__)
+
 
 def _get_hub_base_url() -> str:
     """Hub MCP Base URL (trailing slash 제거)."""
     return get_settings().hub_service_url.rstrip("/")
 
 
+# ---------------------------------------------------------------------------
+# 공유 클라이언트 풀
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class TargetConfig:
+    """대상(base URL)별 풀 설정. None이면 core.config 기본값."""
+
+    max_connections: Optional[int] = None
+    max_keepalive_connections: Optional[int] = None
+    keepalive_expiry: Optional[float] = None
+    connect_timeout: Optional[float] = None
+    http2: Optional[bool] = None
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # type: ignore  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class HttpClientManager:
+    """대상별 장수명 httpx.Client / AsyncClient. 동기 Client는 스레드 간 공유, AsyncClient는 이벤트 루프별."""
+
+    # 다른 루프의 AsyncClient를 그 루프에서 닫을 때 기다리는 최대 시간(초)
+    CROSS_LOOP_CLOSE_TIMEOUT = 5.0
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._targets: Dict[str, TargetConfig] = {}
+        self._clients: Dict[str, httpx.Client] = {}
+        # 루프 → {base URL → AsyncClient}. 약한 참조 키라 루프가 수거되면 항목도 사라짐 (id 재사용 충돌 없음)
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, httpx.AsyncClient]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def configure_target(self, base_url: str, config: TargetConfig) -> None:
+        """대상별 한도·타임아웃 지정. 이미 열린 클라이언트는 다음 생성부터 적용."""
+        with self._lock:
+            self._targets[base_url.rstrip("/")] = config
+
+    def _client_kwargs(self, base_url: str) -> Dict[str, Any]:
+        settings = get_settings()
+        cfg = self._targets.get(base_url, TargetConfig())
+        http2 = settings.hub_http2 if cfg.http2 is None else cfg.http2
+        if http2 and not _http2_available():
+            logger.warning("[HttpClientManager] h2 패키지가 없어 HTTP/1.1 사용 (%s)", base_url)
+            http2 = False
+        limits = httpx.Limits(
+            max_connections=cfg.max_connections or settings.hub_http_max_connections,
+            max_keepalive_connections=cfg.max_keepalive_connections or settings.hub_http_max_keepalive_connections,
+            keepalive_expiry=cfg.keepalive_expiry or settings.hub_http_keepalive_expiry,
+        )
+        return {"limits": limits, "http2": http2, "timeout": self.timeout(base_url, 60.0)}
+
+    def timeout(self, base_url: str, seconds: float) -> httpx.Timeout:
+        """호출별 timeout(read/write/pool) + 대상별 connect 타임아웃."""
+        cfg = self._targets.get(base_url.rstrip("/"), TargetConfig())
+        connect = cfg.connect_timeout or get_settings().hub_http_connect_timeout
+        return httpx.Timeout(seconds, connect=min(connect, seconds))
+
+    def get(self, base_url: str) -> httpx.Client:
+        """동기 Client (대상별 1개)."""
+        base_url = base_url.rstrip("/")
+        client = self._clients.get(base_url)
+        if client is not None and not client.is_closed:
+            return client
+        with self._lock:
+            client = self._clients.get(base_url)
+            if client is None or client.is_closed:
+                client = httpx.Client(**self._client_kwargs(base_url))
+                self._clients[base_url] = client
+            return client
+
+    def aget(self, base_url: str) -> httpx.AsyncClient:
+        """비동기 Client (대상·실행 중인 이벤트 루프별 1개). async 함수 안에서 호출."""
+        base_url = base_url.rstrip("/")
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop, {}).get(base_url)
+        if client is not None and not client.is_closed:
+            return client
+        with self._lock:
+            self._prune_closed_loops_locked()
+            clients = self._async_clients.setdefault(loop, {})
+            client = clients.get(base_url)
+            if client is None or client.is_closed:
+                client = httpx.AsyncClient(**self._client_kwargs(base_url))
+                clients[base_url] = client
+            return client
+
+    def _prune_closed_loops_locked(self) -> None:
+        """닫힌 루프의 AsyncClient는 더 이상 닫을 수 없으므로 경고 후 참조만 정리."""
+        for loop in [lp for lp in self._async_clients.keys() if lp.is_closed()]:
+            leaked = self._async_clients.pop(loop)
+            open_count = sum(1 for c in leaked.values() if not c.is_closed)
+            if open_count:
+                logger.warning("[HttpClientManager] 닫힌 이벤트 루프의 AsyncClient %d개를 닫지 못하고 정리", open_count)
+
+    def close(self) -> None:
+        """동기 Client 모두 종료."""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            client.close()
+
+    async def aclose(self) -> None:
+        """
+        동기 Client + 모든 AsyncClient 종료. 현재 루프의 것은 바로 await,
+        다른 실행 중인 루프의 것은 그 루프에 aclose()를 예약해 완료를 기다림 (AsyncClient는 만든 루프에서만 닫을 수 있음).
+        실행 중이 아니거나 닫힌 루프의 것은 닫을 수 없으므로 경고 로그.
+        """
+        self.close()
+        current = asyncio.get_running_loop()
+        with self._lock:
+            entries = [(loop, list(clients.values())) for loop, clients in self._async_clients.items()]
+            self._async_clients.clear()
+        cross_loop: List["asyncio.Future[Any]"] = []
+        for loop, clients in entries:
+            clients = [c for c in clients if not c.is_closed]
+            if not clients:
+                continue
+            if loop is current:
+                for client in clients:
+                    await client.aclose()
+            elif loop.is_running() and not loop.is_closed():
+                for client in clients:
+                    cross_loop.append(asyncio.wrap_future(asyncio.run_coroutine_threadsafe(client.aclose(), loop)))
+            else:
+                logger.warning(
+                    "[HttpClientManager] 실행 중이 아닌 이벤트 루프의 AsyncClient %d개를 닫지 못하고 정리", len(clients)
+                )
+        if cross_loop:
+            done, pending = await asyncio.wait(cross_loop, timeout=self.CROSS_LOOP_CLOSE_TIMEOUT)
+            failed = len(pending) + sum(1 for f in done if f.exception() is not None)
+            if failed:
+                logger.warning("[HttpClientManager] 다른 이벤트 루프의 AsyncClient %d개 종료 실패/시간 초과", failed)
+
+
+_manager = HttpClientManager()
+
+
+def get_http_client_manager() -> HttpClientManager:
+    """프로세스 공용 HttpClientManager."""
+    return _manager
+
+
+async def close_http_clients() -> None:
+    """FastAPI lifespan 종료 시 호출: 풀 연결 정리."""
+    await _manager.aclose()
+
+
+def _post_json(path: str, payload: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+    """공유 동기 Client로 hub POST → JSON. 실패 시 예외 (호출 측에서 기본값 처리)."""
+    base = _get_hub_base_url()
+    resp = _manager.get(base).post(f"{base}{path}", json=payload, timeout=_manager.timeout(base, timeout))
+    resp.raise_for_status()
+    return resp.json()
+
+
+async def _apost_json(path: str, payload: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+    """공유 AsyncClient로 hub POST → JSON."""
+    base = _get_hub_base_url()
+    resp = await _manager.aget(base).post(f"{base}{path}", json=payload, timeout=_manager.timeout(base, timeout))
+    resp.raise_for_status()
+    return resp.json()
+
+
 # ---------------------------------------------------------------------------
 # Llama HTTP 클라이언트
 # ---------------------------------------------------------------------------
 
+_LLAMA_SPAM_DEFAULT: Dict[str, Any] = {"spam_prob": 0.5, "confidence": "low", "label": "UNCERTAIN"}
+
 
 def llama_classify(text: str, *, timeout: float = 30.0) -> str:
     """Llama 시멘틱 분류. HTTP POST hub/internal/llama/classify."""
-    base = _get_hub_base_url()
-    url = f"{base}/internal/llama/classify"
-    payload = {"text": text}
     try:
-        with httpx.Client(timeout=timeout) as client:
-            resp = client.post(url, json=payload)
-            resp.raise_for_status()
-            data = resp.json()
-            return data.get("result", "POLICY_BASED")
+        data = _post_json("/internal/llama/classify", {"text": text}, timeout)
+        return data.get("result", "POLICY_BASED")
+    except Exception as e:
+        print(f"[WARNING] Llama classify HTTP 실패, 기본값 사용: {e}")
+        return "POLICY_BASED"
+
+
+async def allama_classify(text: str, *, timeout: float = 30.0) -> str:
+    """llama_classify 비동기 버전."""
+    try:
+        data = await _apost_json("/internal/llama/classify", {"text": text}, timeout)
+        return data.get("result", "POLICY_BASED")
     except Exception as e:
         print(f"[WARNING] Llama classify HTTP 실패, 기본값 사용: {e}")
         return "POLICY_BASED"
@@ -42,37 +232,78 @@ def llama_classify(text: str, *, timeout: float = 30.0) -> str:
 
 def llama_classify_spam(email_metadata: Dict[str, Any], *, timeout: float = 60.0) -> Dict[str, Any]:
     """Llama 스팸 분류. HTTP POST hub/internal/llama/classify_spam."""
-    base = _get_hub_base_url()
-    url = f"{base}/internal/llama/classify_spam"
-    payload = {"email_metadata": email_metadata}
-    default = {"spam_prob": 0.5, "confidence": "low", "label": "UNCERTAIN"}
     try:
-        with httpx.Client(timeout=timeout) as client:
-            resp = client.post(url, json=payload)
-            resp.raise_for_status()
-            data = resp.json()
-            return data.get("result", default)
+        data = _post_json("/internal/llama/classify_spam", {"email_metadata": email_metadata}, timeout)
+        return data.get("result", dict(_LLAMA_SPAM_DEFAULT))
+    except Exception as e:
+        print(f"[WARNING] Llama classify_spam HTTP 실패, 기본값 사용: {e}")
+        return dict(_LLAMA_SPAM_DEFAULT)
+
+
+async def allama_classify_spam(email_metadata: Dict[str, Any], *, timeout: float = 60.0) -> Dict[str, Any]:
+    """llama_classify_spam 비동기 버전."""
+    try:
+        data = await _apost_json("/internal/llama/classify_spam", {"email_metadata": email_metadata}, timeout)
+        return data.get("result", dict(_LLAMA_SPAM_DEFAULT))
     except Exception as e:
         print(f"[WARNING] Llama classify_spam HTTP 실패, 기본값 사용: {e}")
-        return default
+        return dict(_LLAMA_SPAM_DEFAULT)
 
 
 # ---------------------------------------------------------------------------
 # ExaOne HTTP 클라이언트
 # ---------------------------------------------------------------------------
 
+_ANALYZE_EMAIL_DEFAULT: Dict[str, Any] = {
+    "raw_output": "HTTP 오류",
+    "parsed": {
+        "is_spam": False,
+        "confidence": "low",
+        "risk_level": "low",
+        "risk_codes": [],
+        "analysis": "분석 실패",
+        "recommendation": "수동 검토 필요",
+    },
+    "risk_codes": [],
+}
+
+
+def _analyze_email_payload(
+    subject: str,
+    sender: str,
+    body: str,
+    recipient: str,
+    date: str,
+    attachments: Optional[list],
+    headers: Optional[Dict[str, Any]],
+    policy_context: str,
+) -> Dict[str, Any]:
+    return {
+        "subject": subject,
+        "sender": sender,
+        "body": body,
+        "recipient": recipient,
+        "date": date,
+        "attachments": attachments or [],
+        "headers": headers or {},
+        "policy_context": policy_context,
+    }
+
 
 def exaone_generate(prompt: str, max_tokens: int = 512, *, timeout: float = 120.0) -> str:
     """ExaOne 텍스트 생성. HTTP POST hub/internal/exaone/generate."""
-    base = _get_hub_base_url()
-    url = f"{base}/internal/exaone/generate"
-    payload = {"prompt": prompt, "max_tokens": max_tokens}
     try:
-        with httpx.Client(timeout=timeout) as client:
-            resp = client.post(url, json=payload)
-            resp.raise_for_status()
-            data = resp.json()
-            return data.get("result", f"[ExaOne 오류] 빈 응답")
+        data = _post_json("/internal/exaone/generate", {"prompt": prompt, "max_tokens": max_tokens}, timeout)
+        return data.get("result", "[ExaOne 오류] 빈 응답")
+    except Exception as e:
+        return f"[ExaOne HTTP 오류] {e}"
+
+
+async def aexaone_generate(prompt: str, max_tokens: int = 512, *, timeout: float = 120.0) -> str:
+    """exaone_generate 비동기 버전."""
+    try:
+        data = await _apost_json("/internal/exaone/generate", {"prompt": prompt, "max_tokens": max_tokens}, timeout)
+        return data.get("result", "[ExaOne 오류] 빈 응답")
     except Exception as e:
         return f"[ExaOne HTTP 오류] {e}"
 
@@ -90,39 +321,33 @@ def exaone_analyze_email(
     timeout: float = 120.0,
 ) -> str:
     """ExaOne 이메일 분석. HTTP POST hub/internal/exaone/analyze_email."""
-    base = _get_hub_base_url()
-    url = f"{base}/internal/exaone/analyze_email"
-    payload = {
-        "subject": subject,
-        "sender": sender,
-        "body": body,
-        "recipient": recipient,
-        "date": date,
-        "attachments": attachments or [],
-        "headers": headers or {},
-        "policy_context": policy_context,
-    }
-    default_result = {
-        "raw_output": "HTTP 오류",
-        "parsed": {
-            "is_spam": False,
-            "confidence": "low",
-            "risk_level": "low",
-            "risk_codes": [],
-            "analysis": "분석 실패",
-            "recommendation": "수동 검토 필요",
-        },
-        "risk_codes": [],
-    }
+    payload = _analyze_email_payload(subject, sender, body, recipient, date, attachments, headers, policy_context)
     try:
-        with httpx.Client(timeout=timeout) as client:
-            resp = client.post(url, json=payload)
-            resp.raise_for_status()
-            data = resp.json()
-            result = data.get("result", default_result)
-            return json.dumps(result, ensure_ascii=False)
-    except Exception as e:
-        return json.dumps(default_result, ensure_ascii=False)
+        data = _post_json("/internal/exaone/analyze_email", payload, timeout)
+        return json.dumps(data.get("result", _ANALYZE_EMAIL_DEFAULT), ensure_ascii=False)
+    except Exception:
+        return json.dumps(_ANALYZE_EMAIL_DEFAULT, ensure_ascii=False)
+
+
+async def aexaone_analyze_email(
+    subject: str,
+    sender: str,
+    body: str = "",
+    recipient: str = "",
+    date: str = "",
+    attachments: Optional[list] = None,
+    headers: Optional[Dict[str, Any]] = None,
+    policy_context: str = "",
+    *,
+    timeout: float = 120.0,
+) -> str:
+    """exaone_analyze_email 비동기 버전."""
+    payload = _analyze_email_payload(subject, sender, body, recipient, date, attachments, headers, policy_context)
+    try:
+        data = await _apost_json("/internal/exaone/analyze_email", payload, timeout)
+        return json.dumps(data.get("result", _ANALYZE_EMAIL_DEFAULT), ensure_ascii=False)
+    except Exception:
+        return json.dumps(_ANALYZE_EMAIL_DEFAULT, ensure_ascii=False)
 
 
 # ---------------------------------------------------------------------------
@@ -132,15 +357,19 @@ def exaone_analyze_email(
 
 def chat_call(tool: str, arguments: Optional[Dict[str, Any]] = None, *, timeout: float = 60.0) -> Any:
     """Chat 도구 호출. HTTP POST hub/internal/chat/call → Hub가 Chat MCP call_tool 위임."""
-    base = _get_hub_base_url()
-    url = f"{base}/internal/chat/call"
-    payload = {"tool": tool, "arguments": arguments or {}}
     try:
-        with httpx.Client(timeout=timeout) as client:
-            resp = client.post(url, json=payload)
-            resp.raise_for_status()
-            data = resp.json()
-            return data.get("result")
+        data = _post_json("/internal/chat/call", {"tool": tool, "arguments": arguments or {}}, timeout)
+        return data.get("result")
+    except Exception as e:
+        print(f"[WARNING] Chat call HTTP 실패: {e}")
+        return None
+
+
+async def achat_call(tool: str, arguments: Optional[Dict[str, Any]] = None, *, timeout: float = 60.0) -> Any:
+    """chat_call 비동기 버전."""
+    try:
+        data = await _apost_json("/internal/chat/call", {"tool": tool, "arguments": arguments or {}}, timeout)
+        return data.get("result")
     except Exception as e:
         print(f"[WARNING] Chat call HTTP 실패: {e}")
         return None
@@ -148,15 +377,19 @@ def chat_call(tool: str, arguments: Optional[Dict[str, Any]] = None, *, timeout:
 
 def spam_call(tool: str, arguments: Optional[Dict[str, Any]] = None, *, timeout: float = 60.0) -> Any:
     """Spam 도구 호출. HTTP POST hub/internal/spam/call → Hub가 Spam MCP call_tool 위임."""
-    base = _get_hub_base_url()
-    url = f"{base}/internal/spam/call"
-    payload = {"tool": tool, "arguments": arguments or {}}
     try:
-        with httpx.Client(timeout=timeout) as client:
-            resp = client.post(url, json=payload)
-            resp.raise_for_status()
-            data = resp.json()
-            return data.get("result")
+        data = _post_json("/internal/spam/call", {"tool": tool, "arguments": arguments or {}}, timeout)
+        return data.get("result")
+    except Exception as e:
+        print(f"[WARNING] Spam call HTTP 실패: {e}")
+        return None
+
+
+async def aspam_call(tool: str, arguments: Optional[Dict[str, Any]] = None, *, timeout: float = 60.0) -> Any:
+    """spam_call 비동기 버전."""
+    try:
+        data = await _apost_json("/internal/spam/call", {"tool": tool, "arguments": arguments or {}}, timeout)
+        return data.get("result")
     except Exception as e:
         print(f"[WARNING] Spam call HTTP 실패: {e}")
         return None
@@ -169,15 +402,19 @@ def spam_call(tool: str, arguments: Optional[Dict[str, Any]] = None, *, timeout:
 
 def soccer_route(question: str, *, timeout: float = 30.0) -> str:
     """Soccer 라우팅. HTTP POST hub/internal/soccer/route."""
-    base = _get_hub_base_url()
-    url = f"{base}/internal/soccer/route"
-    payload = {"question": question}
     try:
-        with httpx.Client(timeout=timeout) as client:
-            resp = client.post(url, json=payload)
-            resp.raise_for_status()
-            data = resp.json()
-            return data.get("result", "")
+        data = _post_json("/internal/soccer/route", {"question": question}, timeout)
+        return data.get("result", "")
+    except Exception as e:
+        print(f"[WARNING] Soccer route HTTP 실패: {e}")
+        return ""
+
+
+async def asoccer_route(question: str, *, timeout: float = 30.0) -> str:
+    """soccer_route 비동기 버전."""
+    try:
+        data = await _apost_json("/internal/soccer/route", {"question": question}, timeout)
+        return data.get("result", "")
     except Exception as e:
         print(f"[WARNING] Soccer route HTTP 실패: {e}")
         return ""
@@ -191,19 +428,25 @@ def soccer_call(
     timeout: float = 60.0,
 ) -> Any:
     """Soccer MCP → Spoke call_tool 프록시. HTTP POST hub/internal/soccer/call."""
-    base = _get_hub_base_url()
-    url = f"{base}/internal/soccer/call"
-    payload = {
-        "orchestrator": orchestrator,
-        "tool": tool,
-        "arguments": arguments or {},
-    }
+    payload = {"orchestrator": orchestrator, "tool": tool, "arguments": arguments or {}}
     try:
-        with httpx.Client(timeout=timeout) as client:
-            resp = client.post(url, json=payload)
-            resp.raise_for_status()
-            data = resp.json()
-            return data.get("result")
+        return _post_json("/internal/soccer/call", payload, timeout).get("result")
+    except Exception as e:
+        print(f"[WARNING] Soccer call HTTP 실패: {e}")
+        return None
+
+
+async def asoccer_call(
+    orchestrator: str,
+    tool: str,
+    arguments: Optional[Dict[str, Any]] = None,
+    *,
+    timeout: float = 60.0,
+) -> Any:
+    """soccer_call 비동기 버전."""
+    payload = {"orchestrator": orchestrator, "tool": tool, "arguments": arguments or {}}
+    try:
+        return (await _apost_json("/internal/soccer/call", payload, timeout)).get("result")
     except Exception as e:
         print(f"[WARNING] Soccer call HTTP 실패: {e}")
         return None
@@ -217,19 +460,25 @@ def soccer_route_and_call(
     timeout: float = 60.0,
 ) -> Any:
     """라우팅 후 Soccer MCP → Spoke call_tool. HTTP POST hub/internal/soccer/route_and_call."""
-    base = _get_hub_base_url()
-    url = f"{base}/internal/soccer/route_and_call"
-    payload = {
-        "question": question,
-        "tool": tool,
-        "arguments": arguments or {},
-    }
+    payload = {"question": question, "tool": tool, "arguments": arguments or {}}
+    try:
+        return _post_json("/internal/soccer/route_and_call", payload, timeout).get("result")
+    except Exception as e:
+        print(f"[WARNING] Soccer route_and_call HTTP 실패: {e}")
+        return None
+
+
+async def asoccer_route_and_call(
+    question: str,
+    tool: str,
+    arguments: Optional[Dict[str, Any]] = None,
+    *,
+    timeout: float = 60.0,
+) -> Any:
+    """soccer_route_and_call 비동기 버전."""
+    payload = {"question": question, "tool": tool, "arguments": arguments or {}}
     try:
-        with httpx.Client(timeout=timeout) as client:
-            resp = client.post(url, json=payload)
-            resp.raise_for_status()
-            data = resp.json()
-            return data.get("result")
+        return (await _apost_json("/internal/soccer/route_and_call", payload, timeout)).get("result")
     except Exception as e:
         print(f"[WARNING] Soccer route_and_call HTTP 실패: {e}")
         return None
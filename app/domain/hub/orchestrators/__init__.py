@@ -26,10 +26,15 @@ from .graph_orchestrator import (
     TOOL_MAP,
     TOOLS,
     build_agent_graph,
+    get_agent_graph,
     get_checkpointer,
     get_default_graph,
     get_thread_config,
+    invalidate_agent_graphs,
+    register_tool,
     should_use_tools,
+    unregister_tool,
+    warm_agent_graphs,
 )
 from .disclosure_orchestrator import (
     build_disclosure_ingest_graph,
@@ -74,7 +79,12 @@ __all__ = [
     "get_spam_detection_graph",
     # graph builder
     "build_agent_graph",
+    "get_agent_graph",
     "get_default_graph",
+    "warm_agent_graphs",
+    "invalidate_agent_graphs",
+    "register_tool",
+    "unregister_tool",
     "get_checkpointer",
     "get_thread_config",
     "should_use_tools",
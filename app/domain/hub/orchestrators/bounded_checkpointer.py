@@ -0,0 +1,238 @@
+"""
+상한 있는 인메모리 체크포인터 — 프로세스 전역 MemorySaver 대체.
+
+채팅 그래프(thread_id = 대화)와 스팸 그래프(메일마다 새 thread_id)가 같은 체크포인터를 쓰므로
+MemorySaver는 요청마다 스레드가 쌓여 재시작 전까지 메모리가 계속 증가함.
+
+BoundedMemorySaver (LangGraph InMemorySaver 서브클래스, 동기·비동기 인터페이스 그대로):
+- max_threads: 스레드 수 상한. 초과 시 가장 오래 안 쓴 스레드부터 제거 (LRU).
+- max_history: 스레드·네임스페이스별 보관 체크포인트 수. 오래된 체크포인트와 그 writes·blob 정리.
+- ttl_seconds: 마지막 접근 후 이 시간이 지난 스레드 제거 (put/stats 시점에 정리).
+- stats(): 스레드 수, 상주 바이트(직렬화 크기 합), LRU/TTL 제거 수, 정리된 체크포인트 수.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, Optional, Sequence, Set, Tuple
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import ChannelVersions, Checkpoint, CheckpointMetadata, CheckpointTuple
+from langgraph.checkpoint.memory import InMemorySaver
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_THREADS = 1000
+DEFAULT_MAX_HISTORY = 20
+DEFAULT_TTL_SECONDS = 3600.0
+
+
+def _thread_id(config: Optional[RunnableConfig]) -> Optional[str]:
+    if not config:
+        return None
+    return (config.get("configurable") or {}).get("thread_id")
+
+
+class BoundedMemorySaver(InMemorySaver):
+    """스레드 수·스레드별 이력·유휴 TTL 상한이 있는 InMemorySaver."""
+
+    def __init__(
+        self,
+        *,
+        max_threads: int = DEFAULT_MAX_THREADS,
+        max_history: int = DEFAULT_MAX_HISTORY,
+        ttl_seconds: Optional[float] = DEFAULT_TTL_SECONDS,
+        **kwargs: Any,
+    ) -> None:
+        if max_threads < 1 or max_history < 1:
+            raise ValueError("max_threads, max_history는 1 이상이어야 합니다.")
+        super().__init__(**kwargs)
+        self.max_threads = max_threads
+        self.max_history = max_history
+        self.ttl_seconds = ttl_seconds if ttl_seconds and ttl_seconds > 0 else None
+        self._lock = threading.RLock()
+        # thread_id -> 마지막 접근 시각 (오래된 순)
+        self._access: "OrderedDict[str, float]" = OrderedDict()
+        # thread_id -> blob 키 (delete 시 전체 blobs 스캔 방지)
+        self._blob_keys: Dict[str, Set[Tuple[Any, ...]]] = {}
+        self._thread_bytes: Dict[str, int] = {}
+        self.evictions_lru = 0
+        self.evictions_ttl = 0
+        self.pruned_checkpoints = 0
+
+    # --- BaseCheckpointSaver 인터페이스 ---
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        with self._lock:
+            tid = _thread_id(config)
+            # 없는 스레드 조회가 storage(defaultdict)에 빈 항목을 만들지 않도록
+            if tid is not None and tid not in self.storage:
+                return None
+            if tid is not None and tid in self._access:
+                if self._expired(tid, time.monotonic()):
+                    self._drop_thread(tid)
+                    self.evictions_ttl += 1
+                    return None
+                self._touch(tid)
+            return super().get_tuple(config)
+
+    def list(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointTuple]:
+        # 제너레이터를 잠금 밖에서 소비하면 동시 삭제와 충돌하므로 결과를 미리 모음
+        with self._lock:
+            tid = _thread_id(config)
+            if tid is not None and tid not in self.storage:
+                return iter(())
+            if tid is not None and tid in self._access:
+                self._touch(tid)
+            items = list(super().list(config, filter=filter, before=before, limit=limit))
+        return iter(items)
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        with self._lock:
+            out = super().put(config, checkpoint, metadata, new_versions)
+            tid = config["configurable"]["thread_id"]
+            ns = config["configurable"].get("checkpoint_ns", "")
+            keys = self._blob_keys.setdefault(tid, set())
+            for channel, version in new_versions.items():
+                key = (tid, ns, channel, version)
+                if key in self.blobs:
+                    keys.add(key)
+            self._touch(tid)
+            self._prune_history(tid, ns)
+            self._thread_bytes[tid] = self._measure(tid)
+            self._enforce_limits(keep=tid)
+            return out
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        with self._lock:
+            super().put_writes(config, writes, task_id, task_path)
+            tid = config["configurable"]["thread_id"]
+            if tid in self._access:
+                self._touch(tid)
+                self._thread_bytes[tid] = self._measure(tid)
+
+    def delete_thread(self, thread_id: str) -> None:
+        with self._lock:
+            self._drop_thread(thread_id)
+
+    # --- 공개 보조 API ---
+
+    def has_thread(self, thread_id: str) -> bool:
+        """스레드에 저장된 체크포인트가 있는지."""
+        with self._lock:
+            return thread_id in self.storage
+
+    def evict_expired(self) -> int:
+        """TTL 지난 스레드 제거. 제거 수 반환."""
+        with self._lock:
+            return self._evict_expired(time.monotonic())
+
+    def stats(self) -> Dict[str, Any]:
+        """상주 스레드 수·바이트, 제거/정리 카운터."""
+        with self._lock:
+            self._evict_expired(time.monotonic())
+            return {
+                "threads": len(self._access),
+                "resident_bytes": sum(self._thread_bytes.values()),
+                "evictions_lru": self.evictions_lru,
+                "evictions_ttl": self.evictions_ttl,
+                "pruned_checkpoints": self.pruned_checkpoints,
+                "max_threads": self.max_threads,
+                "max_history": self.max_history,
+                "ttl_seconds": self.ttl_seconds,
+            }
+
+    # --- 내부 ---
+
+    def _touch(self, tid: str) -> None:
+        self._access[tid] = time.monotonic()
+        self._access.move_to_end(tid)
+
+    def _expired(self, tid: str, now: float) -> bool:
+        return self.ttl_seconds is not None and now - self._access.get(tid, now) > self.ttl_seconds
+
+    def _evict_expired(self, now: float) -> int:
+        removed = 0
+        # 오래된 순이므로 만료되지 않은 스레드를 만나면 중단
+        while self._access:
+            tid = next(iter(self._access))
+            if not self._expired(tid, now):
+                break
+            self._drop_thread(tid)
+            self.evictions_ttl += 1
+            removed += 1
+        return removed
+
+    def _enforce_limits(self, keep: str) -> None:
+        self._evict_expired(time.monotonic())
+        while len(self._access) > self.max_threads:
+            tid = next(iter(self._access))
+            if tid == keep:
+                break
+            self._drop_thread(tid)
+            self.evictions_lru += 1
+
+    def _prune_history(self, tid: str, ns: str) -> None:
+        """tid/ns의 체크포인트를 최신 max_history개만 남기고, 남은 체크포인트가 참조하지 않는 blob 삭제."""
+        checkpoints = self.storage[tid][ns]
+        if len(checkpoints) <= self.max_history:
+            return
+        # checkpoint id는 시간순 정렬 가능한 uuid6
+        ordered = sorted(checkpoints.keys())
+        for cid in ordered[: len(ordered) - self.max_history]:
+            del checkpoints[cid]
+            self.writes.pop((tid, ns, cid), None)
+            self.pruned_checkpoints += 1
+        referenced: Set[Tuple[Any, ...]] = set()
+        for saved, _metadata, _parent in checkpoints.values():
+            checkpoint = self.serde.loads_typed(saved)
+            for channel, version in checkpoint.get("channel_versions", {}).items():
+                referenced.add((tid, ns, channel, version))
+        keys = self._blob_keys.get(tid, set())
+        for key in [k for k in keys if k[1] == ns and k not in referenced]:
+            self.blobs.pop(key, None)
+            keys.discard(key)
+
+    def _measure(self, tid: str) -> int:
+        """스레드의 직렬화 바이트 합 (체크포인트·메타데이터·blob·writes)."""
+        total = 0
+        for ns, checkpoints in self.storage.get(tid, {}).items():
+            for cid, (saved, metadata, _parent) in checkpoints.items():
+                total += len(saved[1]) + len(metadata[1])
+                for write in self.writes.get((tid, ns, cid), {}).values():
+                    total += len(write[2][1])
+        for key in self._blob_keys.get(tid, ()):
+            blob = self.blobs.get(key)
+            if blob is not None:
+                total += len(blob[1])
+        return total
+
+    def _drop_thread(self, tid: str) -> None:
+        namespaces = self.storage.pop(tid, {})
+        for ns, checkpoints in namespaces.items():
+            for cid in checkpoints:
+                self.writes.pop((tid, ns, cid), None)
+        for key in self._blob_keys.pop(tid, set()):
+            self.blobs.pop(key, None)
+        self._access.pop(tid, None)
+        self._thread_bytes.pop(tid, None)
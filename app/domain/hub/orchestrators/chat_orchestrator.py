@@ -5,6 +5,7 @@ run_agent, run_agent_stream, get_thread_history, clear_thread_history
 """
 
 import logging
+import time
 from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple, Union
 
 from core.config import settings  # type: ignore
@@ -12,9 +13,8 @@ from domain.models import ChatState
 from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
 
 from .graph_orchestrator import (
-    build_agent_graph,
+    get_agent_graph,
     get_checkpointer,
-    get_default_graph,
     get_thread_config,
 )
 
@@ -52,7 +52,7 @@ def run_agent(
         (에이전트 응답 문자열, RAG에서 사용한 컨텍스트)
     """
     use_checkpointer = bool(thread_id)
-    graph = get_default_graph() if use_checkpointer else build_agent_graph(use_checkpointer=False)
+    graph = get_agent_graph(provider=provider, use_checkpointer=use_checkpointer)
 
     # 이미지만 첨부한 경우: 이미지에서 검색용 문장 추출 → RAG 쿼리로 사용
     if images and (not (user_text or "").strip() or (user_text or "").strip() == "[이미지 첨부]"):
@@ -106,12 +106,49 @@ async def run_agent_stream(
 ) -> AsyncGenerator[Union[str, Dict[str, Any]], None]:
     """에이전트를 스트리밍 모드로 실행합니다. RAG는 항상 사용.
 
+    모델 토큰은 생성되는 대로 전달되며, 요청별 첫 토큰까지 시간(TTFT)을 기록합니다.
+
     Yields:
         str: 응답 텍스트 청크
-        dict: 스트림 종료 시 {"context_preview": "..."} (RAG 참고 문서 미리보기)
+        dict: 스트림 종료 시 {"context_preview": "...", "ttft_ms": float | None}
     """
+    start = time.perf_counter()
+    ttft_ms: Optional[float] = None
+    async for chunk in _run_agent_stream_events(
+        user_text=user_text,
+        provider=provider,
+        system_prompt=system_prompt,
+        chat_history=chat_history,
+        thread_id=thread_id,
+        semantic_action=semantic_action,
+        images=images,
+    ):
+        if isinstance(chunk, dict):
+            total_ms = (time.perf_counter() - start) * 1000.0
+            logger.info(
+                "[stream] TTFT=%s, 전체=%.0fms (thread_id=%s)",
+                f"{ttft_ms:.0f}ms" if ttft_ms is not None else "-",
+                total_ms,
+                thread_id,
+            )
+            chunk = {**chunk, "ttft_ms": round(ttft_ms, 1) if ttft_ms is not None else None}
+        elif chunk and ttft_ms is None:
+            ttft_ms = (time.perf_counter() - start) * 1000.0
+        yield chunk
+
+
+async def _run_agent_stream_events(
+    user_text: str,
+    provider: Optional[str] = None,
+    system_prompt: Optional[str] = None,
+    chat_history: Optional[List[BaseMessage]] = None,
+    thread_id: Optional[str] = None,
+    semantic_action: Optional[str] = None,
+    images: Optional[List[str]] = None,
+) -> AsyncGenerator[Union[str, Dict[str, Any]], None]:
+    """그래프 astream_events → 텍스트 청크. 마지막에 {"context_preview": "..."} (RAG 참고 문서 미리보기)."""
     use_checkpointer = bool(thread_id)
-    graph = get_default_graph() if use_checkpointer else build_agent_graph(use_checkpointer=False)
+    graph = get_agent_graph(provider=provider, use_checkpointer=use_checkpointer)
 
     # 이미지만 첨부한 경우: 이미지에서 검색용 문장 추출 → RAG 쿼리로 사용
     if images and (not (user_text or "").strip() or (user_text or "").strip() == "[이미지 첨부]"):
@@ -279,11 +316,10 @@ def get_thread_history(thread_id: str) -> List[BaseMessage]:
     checkpointer = get_checkpointer()
     config = get_thread_config(thread_id)
     try:
-        checkpoint = checkpointer.get(config)
-        if checkpoint:
-            channel_values = checkpoint.get("channel_values", {})
-            messages = channel_values.get("messages", [])
-            return messages
+        checkpoint_tuple = checkpointer.get_tuple(config)
+        if checkpoint_tuple:
+            channel_values = checkpoint_tuple.checkpoint.get("channel_values", {})
+            return list(channel_values.get("messages", []))
     except Exception as e:
         logger.warning("대화 기록 조회 실패: %s", e)
     return []
@@ -296,16 +332,15 @@ def clear_thread_history(thread_id: str) -> bool:
         thread_id: 대화 스레드 ID
 
     Returns:
-        삭제 성공 여부
+        삭제 성공 여부 (저장된 기록이 없으면 False)
     """
     checkpointer = get_checkpointer()
     config = get_thread_config(thread_id)
     try:
-        if hasattr(checkpointer, "storage"):
-            thread_key = config.get("configurable", {}).get("thread_id")
-            if thread_key and thread_key in checkpointer.storage:
-                del checkpointer.storage[thread_key]
-                return True
+        if checkpointer.get_tuple(config) is None:
+            return False
+        checkpointer.delete_thread(thread_id)
+        return True
     except Exception as e:
         logger.warning("대화 기록 삭제 실패: %s", e)
     return False
@@ -6,7 +6,11 @@ Graph Orchestrator — 채팅 그래프 빌더
 
 import logging
 import sys
-from typing import Any, Dict, List, Literal, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple
 
 from langchain_core.messages import (
     AIMessage,
@@ -15,10 +19,12 @@ from langchain_core.messages import (
     SystemMessage,
     ToolMessage,
 )
+from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import tool
-from langgraph.checkpoint.memory import MemorySaver
 from langgraph.graph import END, StateGraph
 
+from core.config import get_settings  # type: ignore
+from domain.hub.orchestrators.bounded_checkpointer import BoundedMemorySaver  # type: ignore
 from domain.models import ChatState
 
 logger = logging.getLogger(__name__)
@@ -113,6 +119,37 @@ TOOLS = [
     define,
 ]
 TOOL_MAP: Dict[str, Any] = {t.name: t for t in TOOLS}
+# 도구 등록이 바뀔 때마다 증가 → 컴파일 그래프·bind_tools 캐시 키에 포함 (기존 항목 무효화)
+_tools_version = 0
+_tools_lock = threading.Lock()
+
+
+def register_tool(new_tool: Any) -> None:
+    """도구 추가(같은 이름이면 교체). 캐시된 컴파일 그래프·도구 바인딩 LLM 무효화."""
+    global _tools_version
+    with _tools_lock:
+        for i, t in enumerate(TOOLS):
+            if t.name == new_tool.name:
+                TOOLS[i] = new_tool
+                break
+        else:
+            TOOLS.append(new_tool)
+        TOOL_MAP[new_tool.name] = new_tool
+        _tools_version += 1
+    invalidate_agent_graphs()
+
+
+def unregister_tool(name: str) -> bool:
+    """도구 제거. 제거했으면 캐시 무효화 후 True."""
+    global _tools_version
+    with _tools_lock:
+        if name not in TOOL_MAP:
+            return False
+        TOOLS[:] = [t for t in TOOLS if t.name != name]
+        del TOOL_MAP[name]
+        _tools_version += 1
+    invalidate_agent_graphs()
+    return True
 
 
 # --- 2. 노드 (model, rag, tool) ---
@@ -139,8 +176,51 @@ def _get_llm_provider():
     return LLMProvider
 
 
-def model_node(state: ChatState) -> ChatState:
-    """모델 노드. LLM 호출·Tool Calling, 스트리밍 지원. 이미지 있으면 Gemini 멀티모달 사용."""
+# (provider, LLM 인스턴스 id, 도구 버전) → llm.bind_tools(TOOLS) 결과. LLM은 LLMProvider가 캐시하므로 재사용 가능
+_bound_llms: Dict[Tuple[str, int, int], Any] = {}
+
+
+def _bind_tools_cached(llm: Any, provider: str) -> Any:
+    """요청마다 bind_tools 하지 않도록 도구 바인딩 결과 캐시 (도구 등록 변경 시 무효화)."""
+    key = (provider, id(llm), _tools_version)
+    bound = _bound_llms.get(key)
+    if bound is None:
+        bound = llm.bind_tools(TOOLS)
+        _bound_llms[key] = bound
+    return bound
+
+
+def _stream_response(runnable: Any, messages: List[BaseMessage], config: Optional[RunnableConfig]) -> AIMessage:
+    """
+    LLM 스트리밍 → AIMessage. config(그래프 콜백)를 넘겨 청크마다 on_chat_model_stream 이벤트가
+    생성 도중에 나가도록 함 (run_agent_stream → SSE). 첫 토큰까지 시간(TTFT) 로그.
+    """
+    start = time.perf_counter()
+    ttft_ms: Optional[float] = None
+    parts: List[str] = []
+    tool_calls: List[Any] = []
+    for chunk in runnable.stream(messages, config=config):
+        content = getattr(chunk, "content", None)
+        if content:
+            if ttft_ms is None:
+                ttft_ms = (time.perf_counter() - start) * 1000.0
+            parts.append(content)
+        if getattr(chunk, "tool_calls", None):
+            tool_calls.extend(chunk.tool_calls)
+    logger.info(
+        "[model] TTFT=%s, 전체=%.0fms, 청크=%s",
+        f"{ttft_ms:.0f}ms" if ttft_ms is not None else "-",
+        (time.perf_counter() - start) * 1000.0,
+        len(parts),
+    )
+    full_content = "".join(parts)
+    if tool_calls:
+        return AIMessage(content=full_content, tool_calls=tool_calls)
+    return AIMessage(content=full_content)
+
+
+def model_node(state: ChatState, config: Optional[RunnableConfig] = None) -> ChatState:
+    """모델 노드. LLM 호출·Tool Calling, 토큰 스트리밍(콜백 전파). 이미지 있으면 Gemini 멀티모달 사용."""
     images: Optional[List[str]] = state.get("images") or []
     if images:
         # 멀티모달: RAG 컨텍스트 + 사용자 메시지 + 이미지를 Gemini에 전달
@@ -185,67 +265,99 @@ def model_node(state: ChatState) -> ChatState:
                 )
             ] + messages
 
-    if _supports_tool_calling(provider):
-        llm_with_tools = llm.bind_tools(TOOLS)
-        chunks = []
-        tool_calls = []
-        for chunk in llm_with_tools.stream(messages):
-            chunks.append(chunk)
-            if hasattr(chunk, "tool_calls") and chunk.tool_calls:
-                tool_calls.extend(chunk.tool_calls)
-        if chunks:
-            full_content = "".join(
-                chunk.content for chunk in chunks
-                if hasattr(chunk, "content") and chunk.content
-            )
-            response = (
-                AIMessage(content=full_content, tool_calls=tool_calls)
-                if tool_calls
-                else AIMessage(content=full_content)
-            )
-        else:
-            response = AIMessage(content="")
-    else:
-        chunks = []
-        for chunk in llm.stream(messages):
-            chunks.append(chunk)
-        if chunks:
-            full_content = "".join(
-                chunk.content for chunk in chunks
-                if hasattr(chunk, "content") and chunk.content
-            )
-            response = AIMessage(content=full_content)
-        else:
-            response = AIMessage(content="")
+    runnable = _bind_tools_cached(llm, provider) if _supports_tool_calling(provider) else llm
+    response = _stream_response(runnable, messages, config)
 
     return {"messages": [response], "model_provider": provider}
 
 
+# tool_node 동시 실행: 도구별 타임아웃(초, 없으면 기본값)과 공유 워커 수.
+# 타임아웃은 결과 대기만 끊고 실행 중인 스레드는 멈추지 못함 → 도구는 자체 I/O 타임아웃을 둬야 하며,
+# 타임아웃이 나면 그 풀은 폐기하고(_retire_tool_pool) 다음 호출부터 새 풀을 써서 멈춘 워커가 자리를 막지 않게 함.
+TOOL_DEFAULT_TIMEOUT = 30.0
+TOOL_TIMEOUTS: Dict[str, float] = {
+    "analyze_with_exaone": 120.0,
+    "get_current_time": 5.0,
+    "calculate": 10.0,
+}
+TOOL_MAX_WORKERS = 8
+
+_tool_pool: Optional[ThreadPoolExecutor] = None
+_tool_pool_lock = threading.Lock()
+
+
+def _get_tool_pool() -> ThreadPoolExecutor:
+    """도구 동시 실행용 스레드풀 (싱글톤)."""
+    global _tool_pool
+    if _tool_pool is None:
+        with _tool_pool_lock:
+            if _tool_pool is None:
+                _tool_pool = ThreadPoolExecutor(max_workers=TOOL_MAX_WORKERS, thread_name_prefix="tool-call")
+    return _tool_pool
+
+
+def _retire_tool_pool(pool: ThreadPoolExecutor) -> None:
+    """타임아웃이 난 풀을 교체. 멈춘 워커는 끝날 때까지 남지만 새 호출은 새 풀로 감 (대기 중 작업은 그대로 실행)."""
+    global _tool_pool
+    with _tool_pool_lock:
+        if _tool_pool is not pool:
+            return
+        _tool_pool = None
+    pool.shutdown(wait=False)
+
+
+def _invoke_tool(name: str, args: Dict[str, Any]) -> str:
+    """도구 1건 실행. 오류는 문자열로 반환 (기존 동작 유지)."""
+    if name not in TOOL_MAP:
+        return f"알 수 없는 도구: {name}"
+    try:
+        return str(TOOL_MAP[name].invoke(args))
+    except Exception as e:
+        return f"도구 실행 오류: {str(e)}"
+
+
 def tool_node(state: ChatState) -> ChatState:
-    """도구 노드. tool_calls 실행 후 ToolMessage 반환."""
+    """
+    도구 노드. tool_calls 실행 후 ToolMessage 반환.
+    1건이든 여러 건이든 스레드풀에서 동시에 실행해 같은 도구별 TOOL_TIMEOUTS를 적용, 결과는 원래 호출 순서대로.
+    타임아웃은 대기만 끊으므로 도구는 자체 타임아웃을 둬야 함 (타임아웃 후 풀은 교체).
+    """
     messages = state.get("messages", [])
     last_message = messages[-1] if messages else None
     results: List[BaseMessage] = []
 
     tool_calls = getattr(last_message, "tool_calls", None) if last_message else None
-    if tool_calls:
-        for call in tool_calls:
-            name = call["name"]
-            args = call.get("args", {})
-            if name in TOOL_MAP:
-                try:
-                    output = TOOL_MAP[name].invoke(args)
-                except Exception as e:
-                    output = f"도구 실행 오류: {str(e)}"
-            else:
-                output = f"알 수 없는 도구: {name}"
-            results.append(
-                ToolMessage(
-                    content=str(output),
-                    tool_call_id=call["id"],
-                    name=name,
-                )
+    if not tool_calls:
+        return {"messages": results}
+
+    # 단일 호출도 인라인으로 돌리면 타임아웃이 없으므로 같은 풀·같은 제한으로 실행
+    pool = _get_tool_pool()
+    start = time.monotonic()
+    futures = [pool.submit(_invoke_tool, call["name"], call.get("args", {})) for call in tool_calls]
+    outputs: List[str] = []
+    timed_out = False
+    for call, fut in zip(tool_calls, futures):
+        limit = TOOL_TIMEOUTS.get(call["name"], TOOL_DEFAULT_TIMEOUT)
+        try:
+            # 모두 동시에 시작했으므로 남은 시간만 대기
+            outputs.append(fut.result(timeout=max(limit - (time.monotonic() - start), 0.0)))
+        except FutureTimeoutError:
+            fut.cancel()
+            timed_out = True
+            logger.warning("[tools] %s 타임아웃 (%.1fs)", call["name"], limit)
+            outputs.append(f"도구 실행 오류: 시간 초과 ({limit:.0f}초)")
+    if timed_out:
+        # 아직 실행 중인 도구가 워커를 붙잡고 있으므로 이후 호출은 새 풀에서
+        _retire_tool_pool(pool)
+
+    for call, output in zip(tool_calls, outputs):
+        results.append(
+            ToolMessage(
+                content=output,
+                tool_call_id=call["id"],
+                name=call["name"],
             )
+        )
 
     return {"messages": results}
 
@@ -257,6 +369,49 @@ RAG_DISTANCE_THRESHOLD = 0.8
 RAG_DISCLOSURE_NO_KEYWORD_MAX_DISTANCE = 0.75
 # competency_anchors fallback: 최소거리 1건 넣을 때의 상한. 이보다 크면 무관한 질문으로 보고 fallback 안 함
 RAG_ANCHOR_FALLBACK_MAX_DISTANCE = 0.9
+# disclosures·competency_anchors 벡터 검색 프로파일 (vector_search.SEARCH_PROFILES: fast/balanced/high_recall)
+RAG_SEARCH_PROFILE = "balanced"
+# 저장소별 검색 타임아웃(초). 초과한 저장소는 결과 없이 진행 (부분 결과 허용)
+RAG_STORE_TIMEOUTS: Dict[str, float] = {"main": 5.0, "disclosure": 5.0, "anchors": 5.0}
+# main·disclosure·anchors 동시 검색용 스레드 수 (동시 채팅 턴까지 고려)
+RAG_FANOUT_WORKERS = 12
+
+_rag_pool: Optional[ThreadPoolExecutor] = None
+_rag_pool_lock = threading.Lock()
+
+
+def _get_rag_pool() -> ThreadPoolExecutor:
+    """RAG 저장소 병렬 검색용 스레드풀 (싱글톤)."""
+    global _rag_pool
+    if _rag_pool is None:
+        with _rag_pool_lock:
+            if _rag_pool is None:
+                _rag_pool = ThreadPoolExecutor(max_workers=RAG_FANOUT_WORKERS, thread_name_prefix="rag-fanout")
+    return _rag_pool
+
+
+def _run_retrievals(tasks: Dict[str, Callable[[], Any]]) -> Dict[str, Any]:
+    """
+    저장소 검색을 동시에 실행하고 이름별 결과 반환. 실패·타임아웃(RAG_STORE_TIMEOUTS)은 None.
+    전체 대기 시간 ≈ 가장 느린 저장소 (합이 아님).
+    """
+    pool = _get_rag_pool()
+    start = time.monotonic()
+    futures = {name: pool.submit(fn) for name, fn in tasks.items()}
+    results: Dict[str, Any] = {}
+    for name, fut in futures.items():
+        remaining = RAG_STORE_TIMEOUTS.get(name, 5.0) - (time.monotonic() - start)
+        try:
+            results[name] = fut.result(timeout=max(remaining, 0.0))
+        except FutureTimeoutError:
+            fut.cancel()
+            logger.warning("[RAG] %s 검색 타임아웃 (%.1fs) → 결과 없이 진행", name, RAG_STORE_TIMEOUTS.get(name, 5.0))
+            results[name] = None
+        except Exception as e:
+            logger.warning("[RAG] %s 검색 실패: %s", name, e, exc_info=True)
+            results[name] = None
+    return results
+
 
 def _infer_disclosure_standard_filter(query: str) -> Optional[Dict[str, Any]]:
     """
@@ -308,15 +463,26 @@ def _infer_disclosure_standard_types(query: str) -> Optional[List[str]]:
 
 
 def _retrieve_with_threshold(
-    store: Any, query: str, k: int = 5, filter_dict: Optional[Dict[str, Any]] = None
+    store: Any,
+    query: str,
+    k: int = 5,
+    filter_dict: Optional[Dict[str, Any]] = None,
+    query_vec: Optional[List[float]] = None,
 ) -> List[Any]:
-    """유사도(거리) 임계값 이하인 문서만 반환. filter_dict 있으면 메타데이터 필터 적용(disclosure 표준별)."""
+    """
+    유사도(거리) 임계값 이하인 문서만 반환. filter_dict 있으면 메타데이터 필터 적용(disclosure 표준별).
+    query_vec(같은 BGE-m3 벡터)이 있으면 저장소가 다시 임베딩하지 않도록 벡터로 검색.
+    """
     kwargs: Dict[str, Any] = {"query": query, "k": k}
     if filter_dict:
         kwargs["filter"] = filter_dict
     try:
         # (Document, score) 반환. pgvector 코사인 거리: 작을수록 유사
-        pairs = store.similarity_search_with_score(**kwargs)
+        if query_vec is not None and hasattr(store, "similarity_search_with_score_by_vector"):
+            by_vector = {k_: v for k_, v in kwargs.items() if k_ != "query"}
+            pairs = store.similarity_search_with_score_by_vector(embedding=query_vec, **by_vector)
+        else:
+            pairs = store.similarity_search_with_score(**kwargs)
     except Exception:
         kwargs.pop("filter", None)
         return store.similarity_search(**kwargs)
@@ -357,8 +523,171 @@ def _build_context_with_sources(docs: List[Any]) -> str:
     return "\n\n".join(parts)
 
 
+def _embed_rag_query(user_query: str, fastapi_server: Any) -> Optional[List[float]]:
+    """
+    질의 임베딩 1회 (main·disclosure·anchors 공용, 모두 BGE-m3 벡터 공간).
+    동시 요청은 query_batcher가 한 배치로 묶어 인코딩. 실패 시 1회 재시도 후 local_embeddings.
+    """
+    query_vec = None
+    try:
+        from domain.shared.query_batcher import get_query_embedder  # type: ignore
+        bge = get_query_embedder()
+        if bge is not None and hasattr(bge, "embed_query"):
+            for attempt in range(2):
+                try:
+                    query_vec = bge.embed_query(user_query)
+                    break
+                except Exception as _e1:
+                    if attempt == 0:
+                        logger.warning("[RAG] disclosure embed_query 1회 실패, 재시도: %s", _e1)
+                    else:
+                        raise
+    except Exception as _e:
+        logger.warning("[RAG] disclosure 쿼리 임베딩 실패: %s", _e)
+    if query_vec is None:
+        emb = getattr(fastapi_server, "local_embeddings", None)
+        if emb is not None and hasattr(emb, "embed_query"):
+            query_vec = emb.embed_query(user_query)
+    return query_vec
+
+
+def _search_disclosure_pairs(query_vec: List[float], standard_types: Optional[List[str]]) -> List[Tuple[Any, float]]:
+    """disclosures 테이블 검색 (표준 판별 시 해당 standard_type만). 스레드별 세션 사용."""
+    from core.database import SessionLocal  # type: ignore
+    from domain.hub.repositories.disclosure_repository import (  # type: ignore
+        search_disclosures_with_filter,
+    )
+
+    db = SessionLocal()
+    try:
+        return search_disclosures_with_filter(
+            db, query_vec, k=10, standard_types=standard_types, profile=RAG_SEARCH_PROFILE
+        )
+    finally:
+        db.close()
+
+
+def _search_anchor_pairs(query_vec: List[float]) -> List[Tuple[Any, float]]:
+    """competency_anchors 테이블 검색 (동일 BGE-m3 벡터 공간, category/level 필터 없이 k건)."""
+    from core.database import SessionLocal  # type: ignore
+    from domain.hub.repositories.competency_anchor_repository import (  # type: ignore
+        search_competency_anchors_with_filter,
+    )
+
+    db = SessionLocal()
+    try:
+        return search_competency_anchors_with_filter(db, query_vec, k=5, profile=RAG_SEARCH_PROFILE)
+    finally:
+        db.close()
+
+
+def _select_disclosure_docs(
+    pairs: List[Tuple[Any, float]], standard_types: Optional[List[str]]
+) -> List[Any]:
+    """disclosure 후보에서 임계값 통과 문서 선택 (통과 0건이면 최소거리 1건, 키워드 없고 멀면 제외)."""
+    disclosure_count_before_threshold = len(pairs)
+    disclosure_passed = 0
+    min_distance = None
+    closest_doc = None
+    passed_docs: List[Any] = []
+    selected: List[Any] = []
+    for doc, distance in pairs:
+        if min_distance is None or distance < min_distance:
+            min_distance = distance
+            closest_doc = doc
+        if distance <= RAG_DISTANCE_THRESHOLD:
+            passed_docs.append(doc)
+            disclosure_passed += 1
+    # 표준 키워드 없을 때: 최소거리가 크면 무관한 질문으로 보고 disclosure 결과 사용 안 함
+    if (
+        standard_types is None
+        and min_distance is not None
+        and min_distance > RAG_DISCLOSURE_NO_KEYWORD_MAX_DISTANCE
+    ):
+        passed_docs = []
+        disclosure_passed = 0
+        logger.info(
+            "[RAG] disclosure: 키워드 없음, 최소거리=%.4f > %.2f → 무관한 질문으로 판단, disclosure 제외",
+            min_distance,
+            RAG_DISCLOSURE_NO_KEYWORD_MAX_DISTANCE,
+        )
+    else:
+        selected.extend(passed_docs)
+        # 후보가 있으나 임계값 통과 0건이면 최소거리 문서 1건 포함 (DB 관련 내용 있으므로 출처 표시)
+        if (
+            disclosure_count_before_threshold > 0
+            and disclosure_passed == 0
+            and closest_doc is not None
+        ):
+            selected.append(closest_doc)
+            disclosure_passed = 1
+            logger.info(
+                "[RAG] disclosure: 임계값 미통과 → 최소거리 1건 포함 (출처 표시), 거리=%.4f",
+                min_distance or 0,
+            )
+    extra = ""
+    if disclosure_count_before_threshold > 0 and disclosure_passed == 0 and min_distance is not None and closest_doc is None:
+        extra = f", 최소거리={min_distance:.4f}"
+    level = logger.warning if disclosure_count_before_threshold > 0 and disclosure_passed == 0 else logger.info
+    level(
+        "[RAG] disclosure: standard_types=%s, 후보=%s, 임계값 통과=%s (threshold=%.2f)%s",
+        standard_types,
+        disclosure_count_before_threshold,
+        disclosure_passed,
+        RAG_DISTANCE_THRESHOLD,
+        extra,
+    )
+    return selected
+
+
+def _select_anchor_docs(anchor_pairs: List[Tuple[Any, float]]) -> List[Any]:
+    """anchor 후보에서 임계값 통과 문서 선택 (통과 0건이면 상한 이하일 때만 최소거리 1건)."""
+    selected: List[Any] = []
+    anchor_passed = 0
+    min_anchor_distance = None
+    closest_anchor_doc = None
+    for doc, distance in anchor_pairs:
+        if min_anchor_distance is None or distance < min_anchor_distance:
+            min_anchor_distance = distance
+            closest_anchor_doc = doc
+        if distance <= RAG_DISTANCE_THRESHOLD:
+            selected.append(doc)
+            anchor_passed += 1
+    # 후보가 있으나 임계값 통과 0건이면, 최소거리가 상한 이하일 때만 최소거리 1건 포함 (무관한 질문 시 능력/직무 출처 방지)
+    if (
+        anchor_pairs
+        and anchor_passed == 0
+        and closest_anchor_doc is not None
+        and (min_anchor_distance is not None and min_anchor_distance <= RAG_ANCHOR_FALLBACK_MAX_DISTANCE)
+    ):
+        selected.append(closest_anchor_doc)
+        anchor_passed = 1
+        logger.info(
+            "[RAG] competency_anchors: 임계값 미통과 → 최소거리 1건 포함 (거리=%.4f <= %.2f)",
+            min_anchor_distance or 0,
+            RAG_ANCHOR_FALLBACK_MAX_DISTANCE,
+        )
+    elif anchor_pairs and anchor_passed == 0 and min_anchor_distance is not None and min_anchor_distance > RAG_ANCHOR_FALLBACK_MAX_DISTANCE:
+        logger.info(
+            "[RAG] competency_anchors: 최소거리=%.4f > %.2f → 무관한 질문으로 판단, fallback 제외",
+            min_anchor_distance,
+            RAG_ANCHOR_FALLBACK_MAX_DISTANCE,
+        )
+    if anchor_pairs:
+        logger.info(
+            "[RAG] competency_anchors: 후보=%s, 임계값 통과=%s (threshold=%.2f)",
+            len(anchor_pairs),
+            anchor_passed,
+            RAG_DISTANCE_THRESHOLD,
+        )
+    return selected
+
+
 def rag_node(state: ChatState) -> ChatState:
-    """RAG 노드. PGVector 유사도 검색 후, 거리 임계값 이하인 문서만 컨텍스트로 사용."""
+    """
+    RAG 노드. 질의를 한 번 임베딩한 뒤 main(PGVector)·disclosures·competency_anchors를 동시에 검색하고,
+    거리 임계값 이하인 문서만 main → disclosure → anchor 순서로 컨텍스트에 사용.
+    """
     messages = state.get("messages", [])
 
     user_query: Optional[str] = None
@@ -378,149 +707,30 @@ def rag_node(state: ChatState) -> ChatState:
             import fastapi_server  # type: ignore
 
             fastapi_server.ensure_rag_initialized()
-            all_docs: list = []
-            main_count = 0
-            if fastapi_server.vector_store:
-                main_docs = _retrieve_with_threshold(fastapi_server.vector_store, user_query, k=5)
-                main_count = len(main_docs)
-                all_docs.extend(main_docs)
-            # disclosures 테이블 검색 (id, content, embedding, source, page, standard_type, section_title, metadata, unique_id)
-            # 표준 판별 시 해당 standard_type만 검색
-            disclosure_count_before_threshold = 0
-            try:
-                from core.database import SessionLocal  # type: ignore
-                from domain.hub.repositories.disclosure_repository import (  # type: ignore
-                    search_disclosures_with_filter,
-                )
-                from domain.hub.repositories.competency_anchor_repository import (  # type: ignore
-                    search_competency_anchors_with_filter,
-                )
-
-                # disclosure 테이블은 FlagEmbedding(BGE-m3)으로 적재됨 → 쿼리도 동일 모델(fp16)로 같은 벡터 공간
-                query_vec = None
-                try:
-                    from domain.shared.embedding import get_disclosure_embedding_model  # type: ignore
-                    bge = get_disclosure_embedding_model()
-                    if bge is not None and hasattr(bge, "embed_query"):
-                        for attempt in range(2):
-                            try:
-                                query_vec = bge.embed_query(user_query)
-                                break
-                            except Exception as _e1:
-                                if attempt == 0:
-                                    logger.warning("[RAG] disclosure embed_query 1회 실패, 재시도: %s", _e1)
-                                else:
-                                    raise
-                except Exception as _e:
-                    logger.warning("[RAG] disclosure 쿼리 임베딩 실패: %s", _e)
-                if query_vec is None:
-                    emb = getattr(fastapi_server, "local_embeddings", None)
-                    if emb is not None and hasattr(emb, "embed_query"):
-                        query_vec = emb.embed_query(user_query)
-                if query_vec is not None:
-                    db = SessionLocal()
-                    try:
-                        standard_types = _infer_disclosure_standard_types(user_query)
-                        pairs = search_disclosures_with_filter(
-                            db, query_vec, k=10, standard_types=standard_types
-                        )
-                        disclosure_count_before_threshold = len(pairs)
-                        disclosure_passed = 0
-                        min_distance = None
-                        closest_doc = None
-                        passed_docs: List[Any] = []
-                        for doc, distance in pairs:
-                            if min_distance is None or distance < min_distance:
-                                min_distance = distance
-                                closest_doc = doc
-                            if distance <= RAG_DISTANCE_THRESHOLD:
-                                passed_docs.append(doc)
-                                disclosure_passed += 1
-                        # 표준 키워드 없을 때: 최소거리가 크면 무관한 질문으로 보고 disclosure 결과 사용 안 함
-                        if (
-                            standard_types is None
-                            and min_distance is not None
-                            and min_distance > RAG_DISCLOSURE_NO_KEYWORD_MAX_DISTANCE
-                        ):
-                            passed_docs = []
-                            disclosure_passed = 0
-                            logger.info(
-                                "[RAG] disclosure: 키워드 없음, 최소거리=%.4f > %.2f → 무관한 질문으로 판단, disclosure 제외",
-                                min_distance,
-                                RAG_DISCLOSURE_NO_KEYWORD_MAX_DISTANCE,
-                            )
-                        else:
-                            for doc in passed_docs:
-                                all_docs.append(doc)
-                            # 후보가 있으나 임계값 통과 0건이면 최소거리 문서 1건 포함 (DB 관련 내용 있으므로 출처 표시)
-                            if (
-                                disclosure_count_before_threshold > 0
-                                and disclosure_passed == 0
-                                and closest_doc is not None
-                            ):
-                                all_docs.append(closest_doc)
-                                disclosure_passed = 1
-                                logger.info(
-                                    "[RAG] disclosure: 임계값 미통과 → 최소거리 1건 포함 (출처 표시), 거리=%.4f",
-                                    min_distance or 0,
-                                )
-                        extra = ""
-                        if disclosure_count_before_threshold > 0 and disclosure_passed == 0 and min_distance is not None and closest_doc is None:
-                            extra = f", 최소거리={min_distance:.4f}"
-                        level = logger.warning if disclosure_count_before_threshold > 0 and disclosure_passed == 0 else logger.info
-                        level(
-                            "[RAG] disclosure: standard_types=%s, 후보=%s, 임계값 통과=%s (threshold=%.2f)%s",
-                            standard_types,
-                            disclosure_count_before_threshold,
-                            disclosure_passed,
-                            RAG_DISTANCE_THRESHOLD,
-                            extra,
-                        )
-                        # competency_anchors 테이블 검색 (동일 BGE-m3 벡터 공간, category/level 필터 없이 k건)
-                        anchor_pairs = search_competency_anchors_with_filter(db, query_vec, k=5)
-                        anchor_passed = 0
-                        min_anchor_distance = None
-                        closest_anchor_doc = None
-                        for doc, distance in anchor_pairs:
-                            if min_anchor_distance is None or distance < min_anchor_distance:
-                                min_anchor_distance = distance
-                                closest_anchor_doc = doc
-                            if distance <= RAG_DISTANCE_THRESHOLD:
-                                all_docs.append(doc)
-                                anchor_passed += 1
-                        # 후보가 있으나 임계값 통과 0건이면, 최소거리가 상한 이하일 때만 최소거리 1건 포함 (무관한 질문 시 능력/직무 출처 방지)
-                        if (
-                            anchor_pairs
-                            and anchor_passed == 0
-                            and closest_anchor_doc is not None
-                            and (min_anchor_distance is not None and min_anchor_distance <= RAG_ANCHOR_FALLBACK_MAX_DISTANCE)
-                        ):
-                            all_docs.append(closest_anchor_doc)
-                            anchor_passed = 1
-                            logger.info(
-                                "[RAG] competency_anchors: 임계값 미통과 → 최소거리 1건 포함 (거리=%.4f <= %.2f)",
-                                min_anchor_distance or 0,
-                                RAG_ANCHOR_FALLBACK_MAX_DISTANCE,
-                            )
-                        elif anchor_pairs and anchor_passed == 0 and min_anchor_distance is not None and min_anchor_distance > RAG_ANCHOR_FALLBACK_MAX_DISTANCE:
-                            logger.info(
-                                "[RAG] competency_anchors: 최소거리=%.4f > %.2f → 무관한 질문으로 판단, fallback 제외",
-                                min_anchor_distance,
-                                RAG_ANCHOR_FALLBACK_MAX_DISTANCE,
-                            )
-                        if anchor_pairs:
-                            logger.info(
-                                "[RAG] competency_anchors: 후보=%s, 임계값 통과=%s (threshold=%.2f)",
-                                len(anchor_pairs),
-                                anchor_passed,
-                                RAG_DISTANCE_THRESHOLD,
-                            )
-                    finally:
-                        db.close()
-                else:
-                    logger.warning("RAG disclosure: embed_query 사용 가능한 모델 없음, disclosure 검색 생략")
-            except Exception as e:
-                logger.warning("RAG disclosure(테이블) 검색 실패: %s", e, exc_info=True)
+            query_vec = _embed_rag_query(user_query, fastapi_server)
+            standard_types = _infer_disclosure_standard_types(user_query)
+
+            tasks: Dict[str, Callable[[], Any]] = {}
+            main_store = fastapi_server.vector_store
+            if main_store:
+                tasks["main"] = lambda: _retrieve_with_threshold(main_store, user_query, k=5, query_vec=query_vec)
+            if query_vec is not None:
+                tasks["disclosure"] = lambda: _search_disclosure_pairs(query_vec, standard_types)
+                tasks["anchors"] = lambda: _search_anchor_pairs(query_vec)
+            else:
+                logger.warning("RAG disclosure: embed_query 사용 가능한 모델 없음, disclosure 검색 생략")
+            results = _run_retrievals(tasks) if tasks else {}
+
+            # 조립 순서는 순차 실행 때와 동일: main → disclosure → anchors
+            main_docs = results.get("main") or []
+            disclosure_pairs = results.get("disclosure") or []
+            all_docs: list = list(main_docs)
+            main_count = len(main_docs)
+            disclosure_count_before_threshold = len(disclosure_pairs)
+            if "disclosure" in tasks:
+                all_docs.extend(_select_disclosure_docs(disclosure_pairs, standard_types))
+            if "anchors" in tasks:
+                all_docs.extend(_select_anchor_docs(results.get("anchors") or []))
             if all_docs:
                 context = _build_context_with_sources(all_docs)
                 logger.info(
@@ -543,14 +753,19 @@ def rag_node(state: ChatState) -> ChatState:
 
 # --- 3. 체크포인터 ---
 
-_checkpointer: Optional[MemorySaver] = None
+_checkpointer: Optional[BoundedMemorySaver] = None
 
 
-def get_checkpointer() -> MemorySaver:
-    """체크포인터 인스턴스 반환 (싱글톤)."""
+def get_checkpointer() -> BoundedMemorySaver:
+    """체크포인터 인스턴스 반환 (싱글톤). 스레드 수·이력·TTL 상한은 core.config CHECKPOINT_*."""
     global _checkpointer
     if _checkpointer is None:
-        _checkpointer = MemorySaver()
+        settings = get_settings()
+        _checkpointer = BoundedMemorySaver(
+            max_threads=settings.checkpoint_max_threads,
+            max_history=settings.checkpoint_max_history,
+            ttl_seconds=settings.checkpoint_ttl_seconds,
+        )
     return _checkpointer
 
 
@@ -576,11 +791,14 @@ def should_use_tools(state: ChatState) -> Literal["tools", "__end__"]:
 
 
 # --- 5. 그래프 빌더 ---
-_default_graph = None
+# 컴파일 그래프 캐시: (provider, 도구 버전, 체크포인터 사용 여부) → CompiledStateGraph.
+# 컴파일된 그래프는 호출 간 상태를 공유하지 않으므로(상태는 invoke별·체크포인터는 thread_id별) 동시 재사용 가능.
+_graph_cache: Dict[Tuple[str, int, bool], Any] = {}
+_graph_cache_lock = threading.Lock()
 
 
 def build_agent_graph(use_checkpointer: bool = True):
-    """에이전트 그래프 빌드. RAG는 항상 사용 (진입점: rag → model)."""
+    """에이전트 그래프 빌드. RAG는 항상 사용 (진입점: rag → model). 요청 경로에서는 get_agent_graph 사용."""
     graph = StateGraph(ChatState)
     graph.add_node("rag", rag_node)
     graph.add_node("model", model_node)
@@ -601,12 +819,42 @@ def build_agent_graph(use_checkpointer: bool = True):
     return graph.compile(checkpointer=checkpointer)
 
 
+def _default_provider() -> str:
+    return _get_llm_provider().get_provider_name()
+
+
+def get_agent_graph(provider: Optional[str] = None, use_checkpointer: bool = True):
+    """캐시된 컴파일 그래프 반환. 없으면 한 번만 빌드 (동시 요청은 잠금으로 중복 컴파일 방지)."""
+    key = ((provider or _default_provider()).lower(), _tools_version, use_checkpointer)
+    graph = _graph_cache.get(key)
+    if graph is not None:
+        return graph
+    with _graph_cache_lock:
+        graph = _graph_cache.get(key)
+        if graph is None:
+            graph = build_agent_graph(use_checkpointer=use_checkpointer)
+            _graph_cache[key] = graph
+            logger.info("[graph] 에이전트 그래프 컴파일·캐시: provider=%s, tools_v=%s, checkpointer=%s", *key)
+    return graph
+
+
 def get_default_graph():
-    """기본 에이전트 그래프 반환 (싱글톤)."""
-    global _default_graph
-    if _default_graph is None:
-        _default_graph = build_agent_graph(use_checkpointer=True)
-    return _default_graph
+    """기본 에이전트 그래프 반환 (체크포인터 사용, 캐시)."""
+    return get_agent_graph(use_checkpointer=True)
+
+
+def warm_agent_graphs(provider: Optional[str] = None) -> int:
+    """기본 provider의 체크포인터 유/무 그래프를 미리 컴파일 (FastAPI lifespan). 캐시 항목 수 반환."""
+    for use_checkpointer in (True, False):
+        get_agent_graph(provider=provider, use_checkpointer=use_checkpointer)
+    return len(_graph_cache)
+
+
+def invalidate_agent_graphs() -> None:
+    """컴파일 그래프·도구 바인딩 캐시 비우기 (도구 등록 변경 시 자동 호출)."""
+    with _graph_cache_lock:
+        _graph_cache.clear()
+        _bound_llms.clear()
 
 
 __all__ = [
@@ -616,7 +864,12 @@ __all__ = [
     "TOOLS",
     "TOOL_MAP",
     "build_agent_graph",
+    "get_agent_graph",
     "get_default_graph",
+    "invalidate_agent_graphs",
+    "register_tool",
+    "unregister_tool",
+    "warm_agent_graphs",
     "model_node",
     "rag_node",
     "tool_node",
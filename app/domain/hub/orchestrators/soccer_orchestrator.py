@@ -12,23 +12,26 @@ LangGraph를 사용하여 Policy 기반과 Rule 기반을 자동 판단하여 
 워크플로우:
   Validate → [에러 있음] → ErrorHandler → DetermineStrategy
   Validate → [에러 없음] → DetermineStrategy
-  DetermineStrategy → [Policy/Rule] → Process → Save → Finalize
+  DetermineStrategy → [Policy/Rule] → Process → Save → [실패 chunk 있음] → RetrySave → Save
+                                                  → Finalize
+
+Process 노드는 DB에 쓰지 않고 쓰기 계획(write_plan: chunk 목록)만 만듦. DB 쓰기는 Save 노드 한 곳에서,
+chunk마다 SAVEPOINT로 저장하므로 재시도 시 실패한 chunk(pending_chunks)만 다시 저장.
 """
 
 import json
 import logging
 import uuid
-from typing import Any, Dict, List, Optional, TypedDict
+from typing import Any, Callable, Dict, List, Optional, TypedDict
 
 from langgraph.graph import END, StateGraph
 
 from domain.models.states.soccer_state import EmbeddingSyncState, SoccerDataState  # type: ignore
 from domain.spokes.soccer.agents.soccer_agent import PlayerAgent  # type: ignore
-from domain.hub.service import (  # type: ignore
-    PlayerService,
-    ScheduleService,
-    StadiumService,
-    TeamService,
+from domain.spokes.soccer.services import (  # type: ignore
+    build_write_plan,
+    fill_embeddings_after_save,
+    save_write_plan_chunk,
 )
 
 logger = logging.getLogger(__name__)
@@ -59,54 +62,109 @@ def error_handler_node(state: SoccerDataState) -> SoccerDataState:
     return {"processing_path": path + " -> ErrorHandler"}
 
 
+SAVE_ENTITY_TYPES = ("players", "schedules", "stadiums", "teams")
+SAVE_MAX_RETRIES = 3
+
+
 def save_node(state: SoccerDataState) -> SoccerDataState:
-    """transformed_data를 data_type에 맞는 Service로 저장."""
-    transformed = state.get("transformed_data") or state.get("validated_data") or []
+    """write_plan의 pending_chunks만 저장 (그래프에서 DB에 쓰는 유일한 노드)."""
     db = state.get("db")
-    data_type = (state.get("data_type") or "").rstrip("s")  # "players" -> "player"
+    data_type = state.get("data_type") or ""
     path = state.get("processing_path", "Start")
     auto_commit = state.get("auto_commit", True)
-    if not db or not transformed:
-        return {"saved_count": 0, "save_failed": False, "processing_path": path + " -> Save"}
-    services = {
-        "player": PlayerService(),
-        "schedule": ScheduleService(),
-        "stadium": StadiumService(),
-        "team": TeamService(),
-    }
-    svc = services.get(data_type)
-    if not svc:
-        return {
-            "save_failed": True,
-            "processing_path": path + " -> Save",
-            "errors": (state.get("errors") or []) + [{"error": f"알 수 없는 data_type: {state.get('data_type')}"}],
-        }
-    try:
-        result = svc.process(data=transformed, db=db, vector_store=None, auto_commit=auto_commit)
-        saved = result.get("db", 0)
-        return {"saved_count": saved, "save_failed": False, "processing_path": path + " -> Save"}
-    except Exception as e:
-        logger.exception("Save 실패: %s", e)
+    plan = state.get("write_plan")
+    if plan is None:
+        # Process 노드 없이 들어온 경우 (하위 호환): 검증 데이터로 계획 생성
+        plan = build_write_plan(state.get("transformed_data") or state.get("validated_data") or [])
+    if not db or not plan:
+        return {"saved_count": 0, "save_failed": False, "pending_chunks": [], "processing_path": path + " -> Save"}
+    if data_type not in SAVE_ENTITY_TYPES:
         return {
             "save_failed": True,
+            "pending_chunks": [],
             "processing_path": path + " -> Save",
-            "errors": (state.get("errors") or []) + [{"error": str(e)}],
+            "errors": (state.get("errors") or []) + [{"error": f"알 수 없는 data_type: {data_type}"}],
         }
+    pending = state.get("pending_chunks")
+    if pending is None:
+        pending = list(range(len(plan)))
+    saved = state.get("saved_count") or 0
+    failed: List[int] = []
+    errors = list(state.get("errors") or [])
+    for idx in pending:
+        try:
+            saved += save_write_plan_chunk(data_type, plan[idx], db)
+        except Exception as e:
+            logger.warning("[Save] %s chunk %s/%s 실패: %s", data_type, idx + 1, len(plan), e)
+            failed.append(idx)
+            errors.append({"error": f"chunk {idx} 저장 실패: {e}"})
+    if not failed and auto_commit:
+        try:
+            db.commit()
+        except Exception as e:
+            logger.exception("Save commit 실패: %s", e)
+            db.rollback()
+            # 롤백으로 이번 트랜잭션의 모든 chunk가 취소됨 → 전체를 다시 저장 대상으로 (RetrySave)
+            return {
+                "saved_count": 0,
+                "save_failed": True,
+                "pending_chunks": list(range(len(plan))),
+                "write_plan": plan,
+                "processing_path": path + " -> Save(CommitError)",
+                "errors": errors + [{"error": f"commit 실패: {e}"}],
+            }
+        fill_embeddings_after_save(db, data_type)
+    return {
+        "saved_count": saved,
+        "save_failed": bool(failed),
+        "pending_chunks": failed,
+        "write_plan": plan,
+        "processing_path": path + " -> Save",
+        "errors": errors or None,
+    }
 
 
 def retry_save_node(state: SoccerDataState) -> SoccerDataState:
-    """재시도 횟수만 증가시키고 다시 Save로 보냄."""
+    """재시도 횟수만 증가시키고 다시 Save로 보냄 (Save는 pending_chunks만 저장)."""
     count = state.get("save_retry_count", 0) + 1
+    logger.info("[RetrySave] %s회차: 실패 chunk %s", count, state.get("pending_chunks"))
     return {"save_retry_count": count}
 
 
+def _route_after_save(state: SoccerDataState) -> str:
+    """실패 chunk가 남아 있고 재시도 한도 내면 RetrySave, 아니면 Finalize."""
+    save_failed = state.get("save_failed", False)
+    save_retry_count = state.get("save_retry_count", 0)
+    return "retry_save" if save_failed and save_retry_count < SAVE_MAX_RETRIES else "finalize"
+
+
+def _plan_writes(label: str, state: SoccerDataState) -> SoccerDataState:
+    """Rule 처리 공통: validated_data → write_plan (DB 접근 없음)."""
+    validated_data = state.get("validated_data") or []
+    processing_path = state.get("processing_path", "Start")
+    plan = build_write_plan(validated_data)
+    logger.info(f"[{label}:RuleProcess] 쓰기 계획 생성: {len(validated_data)}개 데이터, {len(plan)}개 chunk")
+    return {
+        "transformed_data": validated_data,
+        "write_plan": plan,
+        "pending_chunks": list(range(len(plan))),
+        "saved_count": 0,
+        "processing_path": processing_path + " -> RuleProcess",
+    }
+
+
 def finalize_node(state: SoccerDataState) -> SoccerDataState:
     """최종 result 구성 (호출 측에서 db commit 등에 사용)."""
     saved = state.get("saved_count") or 0
     path = state.get("processing_path", "Start")
     strategy = state.get("decided_strategy", "rule")
+    result: Dict[str, Any] = {"db": saved, "vector": 0, "processed": saved, "total": len(state.get("data") or [])}
+    failed_chunks = state.get("pending_chunks") or []
+    if failed_chunks:
+        result["failed_chunks"] = failed_chunks
+        result["errors"] = state.get("errors") or []
     return {
-        "result": {"db": saved, "vector": 0, "processed": saved, "total": len(state.get("data") or [])},
+        "result": result,
         "processing_path": path + " -> Finalize",
         "decided_strategy": strategy,
         "db": state.get("db"),
@@ -170,8 +228,9 @@ def _handle_graph_result(
 
     logger.info(f"[{orchestrator_name}] 처리 완료: {final_result}")
 
+    # 재시도 후에도 남은 chunk가 있으면 부분 저장 (성공한 chunk는 commit됨)
     return {
-        "success": True,
+        "success": not final_result.get("failed_chunks"),
         "result": final_result,
         "processing_path": processing_path,
         "decided_strategy": decided_strategy,
@@ -245,9 +304,12 @@ def _player_policy_process_node(state: SoccerDataState) -> SoccerDataState:
 
         logger.info(f"[Player:PolicyProcess] Policy 기반 처리 완료: {result}")
 
+        plan = build_write_plan(validated_data)
         return {
             "transformed_data": validated_data,
-            "saved_count": result.get("vector", 0),
+            "write_plan": plan,
+            "pending_chunks": list(range(len(plan))),
+            "saved_count": 0,
             "processing_path": processing_path + " -> PolicyProcess",
         }
     except Exception as e:
@@ -261,37 +323,8 @@ def _player_policy_process_node(state: SoccerDataState) -> SoccerDataState:
 
 
 def _player_rule_process_node(state: SoccerDataState) -> SoccerDataState:
-    """Player Rule 기반 처리 노드 — PlayerService 사용."""
-    validated_data = state.get("validated_data", [])
-    db = state.get("db")
-    processing_path = state.get("processing_path", "Start")
-
-    logger.info(f"[Player:RuleProcess] Rule 기반 처리 시작: {len(validated_data)}개 데이터")
-
-    try:
-        service = PlayerService()
-        result = service.process(
-            data=validated_data,
-            db=db,
-            vector_store=None,
-            auto_commit=state.get("auto_commit", True),
-        )
-
-        logger.info(f"[Player:RuleProcess] Rule 기반 처리 완료: {result}")
-
-        return {
-            "transformed_data": validated_data,
-            "saved_count": result.get("db", 0),
-            "processing_path": processing_path + " -> RuleProcess",
-        }
-    except Exception as e:
-        logger.error(f"[Player:RuleProcess] 처리 중 오류: {str(e)}")
-        errors = state.get("errors", [])
-        errors.append({"error": f"Rule 기반 처리 실패: {str(e)}"})
-        return {
-            "errors": errors,
-            "processing_path": processing_path + " -> RuleProcess(Error)",
-        }
+    """Player Rule 기반 처리 노드 — 쓰기 계획만 생성 (저장은 Save 노드)."""
+    return _plan_writes("Player", state)
 
 
 def _player_route_strategy(state: SoccerDataState) -> str:
@@ -333,14 +366,9 @@ def build_player_graph():
     g.add_edge("policy_process", "save")
     g.add_edge("rule_process", "save")
 
-    def route_after_save(state: SoccerDataState) -> str:
-        save_failed = state.get("save_failed", False)
-        save_retry_count = state.get("save_retry_count", 0)
-        return "retry_save" if save_failed and save_retry_count < 3 else "finalize"
-
     g.add_conditional_edges(
         "save",
-        route_after_save,
+        _route_after_save,
         {"retry_save": "retry_save", "finalize": "finalize"},
     )
     g.add_edge("retry_save", "save")
@@ -388,6 +416,8 @@ class PlayerOrchestrator:
             "validated_data": None,
             "transformed_data": None,
             "saved_count": None,
+            "write_plan": None,
+            "pending_chunks": None,
             "result": None,
             "errors": None,
             "processing_path": "Start",
@@ -425,37 +455,8 @@ def _stadium_determine_strategy_node(state: SoccerDataState) -> SoccerDataState:
 
 
 def _stadium_rule_process_node(state: SoccerDataState) -> SoccerDataState:
-    """Stadium Rule 기반 처리 노드 — StadiumService 사용."""
-    validated_data = state.get("validated_data", [])
-    db = state.get("db")
-    processing_path = state.get("processing_path", "Start")
-
-    logger.info(f"[Stadium:RuleProcess] Rule 기반 처리 시작: {len(validated_data)}개 데이터")
-
-    try:
-        service = StadiumService()
-        result = service.process(
-            data=validated_data,
-            db=db,
-            vector_store=None,
-            auto_commit=state.get("auto_commit", True),
-        )
-
-        logger.info(f"[Stadium:RuleProcess] Rule 기반 처리 완료: {result}")
-
-        return {
-            "transformed_data": validated_data,
-            "saved_count": result.get("db", 0),
-            "processing_path": processing_path + " -> RuleProcess",
-        }
-    except Exception as e:
-        logger.error(f"[Stadium:RuleProcess] 처리 중 오류: {str(e)}")
-        errors = state.get("errors", [])
-        errors.append({"error": f"Rule 기반 처리 실패: {str(e)}"})
-        return {
-            "errors": errors,
-            "processing_path": processing_path + " -> RuleProcess(Error)",
-        }
+    """Stadium Rule 기반 처리 노드 — 쓰기 계획만 생성 (저장은 Save 노드)."""
+    return _plan_writes("Stadium", state)
 
 
 def _stadium_route_strategy(state: SoccerDataState) -> str:
@@ -494,14 +495,9 @@ def build_stadium_graph():
     )
     g.add_edge("rule_process", "save")
 
-    def route_after_save(state: SoccerDataState) -> str:
-        save_failed = state.get("save_failed", False)
-        save_retry_count = state.get("save_retry_count", 0)
-        return "retry_save" if save_failed and save_retry_count < 3 else "finalize"
-
     g.add_conditional_edges(
         "save",
-        route_after_save,
+        _route_after_save,
         {"retry_save": "retry_save", "finalize": "finalize"},
     )
     g.add_edge("retry_save", "save")
@@ -549,6 +545,8 @@ class StadiumOrchestrator:
             "validated_data": None,
             "transformed_data": None,
             "saved_count": None,
+            "write_plan": None,
+            "pending_chunks": None,
             "result": None,
             "errors": None,
             "processing_path": "Start",
@@ -586,37 +584,8 @@ def _team_determine_strategy_node(state: SoccerDataState) -> SoccerDataState:
 
 
 def _team_rule_process_node(state: SoccerDataState) -> SoccerDataState:
-    """Team Rule 기반 처리 노드 — TeamService 사용."""
-    validated_data = state.get("validated_data", [])
-    db = state.get("db")
-    processing_path = state.get("processing_path", "Start")
-
-    logger.info(f"[Team:RuleProcess] Rule 기반 처리 시작: {len(validated_data)}개 데이터")
-
-    try:
-        service = TeamService()
-        result = service.process(
-            data=validated_data,
-            db=db,
-            vector_store=None,
-            auto_commit=state.get("auto_commit", True),
-        )
-
-        logger.info(f"[Team:RuleProcess] Rule 기반 처리 완료: {result}")
-
-        return {
-            "transformed_data": validated_data,
-            "saved_count": result.get("db", 0),
-            "processing_path": processing_path + " -> RuleProcess",
-        }
-    except Exception as e:
-        logger.error(f"[Team:RuleProcess] 처리 중 오류: {str(e)}")
-        errors = state.get("errors", [])
-        errors.append({"error": f"Rule 기반 처리 실패: {str(e)}"})
-        return {
-            "errors": errors,
-            "processing_path": processing_path + " -> RuleProcess(Error)",
-        }
+    """Team Rule 기반 처리 노드 — 쓰기 계획만 생성 (저장은 Save 노드)."""
+    return _plan_writes("Team", state)
 
 
 def _team_route_strategy(state: SoccerDataState) -> str:
@@ -655,14 +624,9 @@ def build_team_graph():
     )
     g.add_edge("rule_process", "save")
 
-    def route_after_save(state: SoccerDataState) -> str:
-        save_failed = state.get("save_failed", False)
-        save_retry_count = state.get("save_retry_count", 0)
-        return "retry_save" if save_failed and save_retry_count < 3 else "finalize"
-
     g.add_conditional_edges(
         "save",
-        route_after_save,
+        _route_after_save,
         {"retry_save": "retry_save", "finalize": "finalize"},
     )
     g.add_edge("retry_save", "save")
@@ -710,6 +674,8 @@ class TeamOrchestrator:
             "validated_data": None,
             "transformed_data": None,
             "saved_count": None,
+            "write_plan": None,
+            "pending_chunks": None,
             "result": None,
             "errors": None,
             "processing_path": "Start",
@@ -747,37 +713,8 @@ def _schedule_determine_strategy_node(state: SoccerDataState) -> SoccerDataState
 
 
 def _schedule_rule_process_node(state: SoccerDataState) -> SoccerDataState:
-    """Schedule Rule 기반 처리 노드 — ScheduleService 사용."""
-    validated_data = state.get("validated_data", [])
-    db = state.get("db")
-    processing_path = state.get("processing_path", "Start")
-
-    logger.info(f"[Schedule:RuleProcess] Rule 기반 처리 시작: {len(validated_data)}개 데이터")
-
-    try:
-        service = ScheduleService()
-        result = service.process(
-            data=validated_data,
-            db=db,
-            vector_store=None,
-            auto_commit=state.get("auto_commit", True),
-        )
-
-        logger.info(f"[Schedule:RuleProcess] Rule 기반 처리 완료: {result}")
-
-        return {
-            "transformed_data": validated_data,
-            "saved_count": result.get("db", 0),
-            "processing_path": processing_path + " -> RuleProcess",
-        }
-    except Exception as e:
-        logger.error(f"[Schedule:RuleProcess] 처리 중 오류: {str(e)}")
-        errors = state.get("errors", [])
-        errors.append({"error": f"Rule 기반 처리 실패: {str(e)}"})
-        return {
-            "errors": errors,
-            "processing_path": processing_path + " -> RuleProcess(Error)",
-        }
+    """Schedule Rule 기반 처리 노드 — 쓰기 계획만 생성 (저장은 Save 노드)."""
+    return _plan_writes("Schedule", state)
 
 
 def _schedule_route_strategy(state: SoccerDataState) -> str:
@@ -816,14 +753,9 @@ def build_schedule_graph():
     )
     g.add_edge("rule_process", "save")
 
-    def route_after_save(state: SoccerDataState) -> str:
-        save_failed = state.get("save_failed", False)
-        save_retry_count = state.get("save_retry_count", 0)
-        return "retry_save" if save_failed and save_retry_count < 3 else "finalize"
-
     g.add_conditional_edges(
         "save",
-        route_after_save,
+        _route_after_save,
         {"retry_save": "retry_save", "finalize": "finalize"},
     )
     g.add_edge("retry_save", "save")
@@ -871,6 +803,8 @@ class ScheduleOrchestrator:
             "validated_data": None,
             "transformed_data": None,
             "saved_count": None,
+            "write_plan": None,
+            "pending_chunks": None,
             "result": None,
             "errors": None,
             "processing_path": "Start",
@@ -1092,6 +1026,9 @@ def _embedding_sync_process_entity_node(state: EmbeddingSyncState) -> EmbeddingS
     logger.info("[EmbeddingSync] ProcessEntity table_key=%s index=%s", table_key, idx)
     one_result = run_embedding_sync_single_entity(db, embeddings_model, table_key, batch_size=batch_size)
     results[table_key] = one_result
+    on_entity_done = state.get("on_entity_done")
+    if on_entity_done is not None:
+        on_entity_done(table_key, one_result)
     return {
         "results": results,
         "current_entity_index": idx + 1,
@@ -1099,6 +1036,38 @@ def _embedding_sync_process_entity_node(state: EmbeddingSyncState) -> EmbeddingS
     }
 
 
+def _embedding_sync_process_parallel_node(state: EmbeddingSyncState) -> EmbeddingSyncState:
+    """모든 엔티티를 동시에 처리 (엔티티별 스레드·세션, 인코딩은 공유 인코더의 혼합 배치)."""
+    from core.config import get_settings  # type: ignore
+    from domain.spokes.soccer.services.embedding_service import fill_embeddings_pipelined  # type: ignore
+
+    entities = state.get("entities") or []
+    path = state.get("processing_path", "Start")
+    embeddings_model = state.get("embeddings_model")
+    session_factory = state.get("session_factory")
+    if session_factory is None:
+        from core.database import SessionLocal  # type: ignore
+
+        session_factory = SessionLocal
+    if not entities or not embeddings_model:
+        return {"processing_path": path + " -> ProcessParallel(skip)", "results": state.get("results") or {}}
+
+    logger.info("[EmbeddingSync] ProcessParallel entities=%s", entities)
+    results = fill_embeddings_pipelined(
+        session_factory,
+        embeddings_model,
+        entities,
+        chunk_size=state.get("batch_size", 32),
+        encode_batch_size=get_settings().soccer_embedding_sync_encode_batch,
+        on_entity_done=state.get("on_entity_done"),
+    )
+    return {
+        "results": {**(state.get("results") or {}), **results},
+        "current_entity_index": len(entities),
+        "processing_path": path + f" -> ProcessParallel({','.join(entities)})",
+    }
+
+
 def _embedding_sync_finalize_node(state: EmbeddingSyncState) -> EmbeddingSyncState:
     path = state.get("processing_path", "Start")
     results = state.get("results") or {}
@@ -1112,13 +1081,23 @@ def _embedding_sync_route_after_process(state: EmbeddingSyncState) -> str:
     return "process_entity" if idx < len(entities) else "finalize"
 
 
+def _embedding_sync_route_after_validate(state: EmbeddingSyncState) -> str:
+    return "process_parallel" if state.get("parallel") else "process_entity"
+
+
 def build_embedding_sync_graph():
     g = StateGraph(EmbeddingSyncState)
     g.add_node("validate", _embedding_sync_validate_node)
     g.add_node("process_entity", _embedding_sync_process_entity_node)
+    g.add_node("process_parallel", _embedding_sync_process_parallel_node)
     g.add_node("finalize", _embedding_sync_finalize_node)
     g.set_entry_point("validate")
-    g.add_edge("validate", "process_entity")
+    g.add_conditional_edges(
+        "validate",
+        _embedding_sync_route_after_validate,
+        {"process_entity": "process_entity", "process_parallel": "process_parallel"},
+    )
+    g.add_edge("process_parallel", "finalize")
     g.add_conditional_edges(
         "process_entity",
         _embedding_sync_route_after_process,
@@ -1142,12 +1121,21 @@ def run_embedding_sync_orchestrate(
     db,
     embeddings_model: Any,
     entities: Optional[List[str]] = None,
+    on_entity_done: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    parallel: Optional[bool] = None,
+    session_factory: Optional[Callable[[], Any]] = None,
 ) -> Dict[str, Any]:
     """
     임베딩 동기화를 LangGraph로 실행.
-    그래프: Validate → ProcessEntity(반복) → Finalize.
+    그래프: Validate → ProcessEntity(반복) → Finalize, parallel이면 Validate → ProcessParallel → Finalize.
+    on_entity_done(table_key, result): 엔티티 하나가 끝날 때마다 호출 (작업 진행률 기록용).
+    parallel: None이면 설정(SOCCER_EMBEDDING_SYNC_PARALLEL). session_factory: 파이프라인 모드 세션 생성 (기본 SessionLocal).
     """
-    logger.info("[EmbeddingSyncOrchestrate] 임베딩 동기화 시작 entities=%s", entities)
+    if parallel is None:
+        from core.config import get_settings  # type: ignore
+
+        parallel = get_settings().soccer_embedding_sync_parallel
+    logger.info("[EmbeddingSyncOrchestrate] 임베딩 동기화 시작 entities=%s parallel=%s", entities, parallel)
     try:
         initial_state: EmbeddingSyncState = {
             "entities": entities or list(EMBEDDING_SYNC_ENTITY_TYPES),
@@ -1158,6 +1146,9 @@ def run_embedding_sync_orchestrate(
             "current_entity_index": 0,
             "processing_path": "Start",
             "errors": None,
+            "on_entity_done": on_entity_done,
+            "parallel": parallel,
+            "session_factory": session_factory,
         }
         config = {"configurable": {"thread_id": f"embed_sync_{uuid.uuid4().hex[:8]}"}}
         graph = get_embedding_sync_graph()
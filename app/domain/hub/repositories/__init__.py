@@ -16,6 +16,11 @@ from .disclosure_repository import (  # type: ignore
     save_batch as disclosure_save_batch,
     search_disclosures,
 )
+from .vector_search import (  # type: ignore
+    DEFAULT_SEARCH_PROFILE,
+    SEARCH_PROFILES,
+    SearchProfile,
+)
 from .soccer_repository import (  # type: ignore
     PlayerRepository,
     ScheduleRepository,
@@ -24,6 +29,9 @@ from .soccer_repository import (  # type: ignore
 )
 
 __all__ = [
+    "DEFAULT_SEARCH_PROFILE",
+    "SEARCH_PROFILES",
+    "SearchProfile",
     "PlayerRepository",
     "ScheduleRepository",
     "StadiumRepository",
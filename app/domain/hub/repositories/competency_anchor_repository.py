@@ -2,11 +2,12 @@
 역량 anchor 저장·조회 — competency_anchors 단일 테이블.
 
 - save_batch_upsert: ON CONFLICT (unique_id) DO UPDATE (INGEST_STRATEGY.md §1).
-- category/level Optional 필터로 검색.
+- category/level/source_type Optional 필터로 검색.
+- drop/build_anchor_vector_index: 벌크 적재 시 HNSW를 내렸다가 적재 후 CONCURRENTLY 재생성.
 """
 
 import json
-from typing import Any, List, Optional, Tuple
+from typing import Any, List, Optional, Tuple, Union
 
 from langchain_core.documents import Document
 from tqdm import tqdm
@@ -15,6 +16,11 @@ from sqlalchemy.orm import Session  # type: ignore[import-untyped]
 from sqlalchemy.dialects.postgresql import insert as pg_insert  # type: ignore[import-untyped]
 
 from domain.models.bases.competency_anchor import CompetencyAnchor  # type: ignore
+from domain.hub.repositories.vector_search import (  # type: ignore
+    SearchProfile,
+    build_vector_search_sql,
+    run_vector_search,
+)
 
 # 배치: INSERT 100~500 권장 (전략 §2)
 DEFAULT_INSERT_BATCH = 200
@@ -24,6 +30,17 @@ FILL_EMBEDDINGS_BATCH = 128
 COMMIT_EVERY_EMBEDDING_ROWS = 1024
 # NULL 채울 때 한 번에 가져오는 행 수. 세션 부담·속도 저하 방지 (Gemini 제안 반영)
 FETCH_CHUNK_EMBEDDING = 2000
+# HNSW: 006/007 마이그레이션과 동일 정의 (벌크 적재 후 재생성 시 사용)
+ANCHOR_HNSW_INDEX = "idx_competency_anchors_embedding_hnsw"
+HNSW_M = 24
+HNSW_EF_CONSTRUCTION = 128
+# 11만 × 1024차원 그래프가 메모리에 들어가야 빌드가 디스크로 넘치지 않음 (Neon 기본 64MB → 느림)
+HNSW_BUILD_MAINTENANCE_WORK_MEM = "1GB"
+HNSW_BUILD_PARALLEL_WORKERS = 2
+# 벡터 검색 SELECT 컬럼 (distance는 vector_search가 마지막에 추가)
+ANCHOR_SEARCH_COLUMNS = (
+    "id", "content", "category", "level", "section_title", "source", "source_type", "unique_id",
+)
 
 
 def _build_embedding_content(row: dict[str, Any]) -> str:
@@ -139,6 +156,7 @@ def fill_embeddings_for_anchors(
         rows = (
             db.query(CompetencyAnchor)
             .filter(CompetencyAnchor.embedding.is_(None))
+            .order_by(CompetencyAnchor.id)
             .limit(fetch_chunk)
             .all()
         )
@@ -181,31 +199,29 @@ def search_competency_anchors_with_filter(
     k: int = 5,
     category: Optional[str] = None,
     level: Optional[int] = None,
+    profile: Union[str, SearchProfile, None] = None,
+    source_type: Optional[str] = None,
 ) -> List[Tuple[Document, float]]:
     """
     competency_anchors에서 벡터 유사도 검색.
-    category/level이 None이면 해당 조건 없음(전체 검색). 있으면 btree 인덱스 활용.
+    category/level/source_type이 None이면 해당 조건 없음(전체 검색). 있으면 btree 인덱스 활용.
+    profile: 검색 프로파일 이름 또는 SearchProfile (vector_search.SEARCH_PROFILES). None이면 balanced.
     반환: (Document, distance) 리스트. 코사인 거리(작을수록 유사).
     """
-    vec_str = "[" + ",".join(str(x) for x in query_embedding) + "]"
-    conditions = ["embedding IS NOT NULL"]
-    params: Any = {"vec": vec_str, "k": k}
+    conditions: List[str] = []
+    params: Any = {"k": k}
     if category is not None:
         conditions.append("category = :category")
         params["category"] = category
     if level is not None:
         conditions.append("level = :level")
         params["level"] = level
-    where = " AND ".join(conditions)
-    sql = (
-        f"SELECT id, content, category, level, section_title, source, source_type, unique_id, "
-        f"(embedding <-> CAST(:vec AS vector)) AS distance "
-        f"FROM competency_anchors WHERE {where} "
-        f"ORDER BY embedding <-> CAST(:vec AS vector) LIMIT :k"
-    )
-    r = db.execute(sql_text(sql), params)
+    if source_type is not None:
+        conditions.append("source_type = :source_type")
+        params["source_type"] = source_type
+    sql = build_vector_search_sql("competency_anchors", ANCHOR_SEARCH_COLUMNS, conditions)
     result: List[Tuple[Document, float]] = []
-    for row in r:
+    for row in run_vector_search(db, sql, query_embedding, params, profile=profile):
         (doc_id, content, cat, lv, section_title, source, source_type, unique_id, distance) = row
         doc = Document(
             page_content=content or "",
@@ -226,3 +242,76 @@ def search_competency_anchors_with_filter(
 def get_anchor_doc_count(db: Session) -> int:
     """embedding이 채워진 anchor 개수."""
     return db.query(CompetencyAnchor).filter(CompetencyAnchor.embedding.isnot(None)).count()
+
+
+def count_anchors_missing_embedding(db: Session) -> int:
+    """embedding이 NULL인 anchor 개수 (채울 행이 있는지·HNSW를 내릴 만큼 많은지 판단용)."""
+    return db.query(CompetencyAnchor).filter(CompetencyAnchor.embedding.is_(None)).count()
+
+
+def _index_state(conn: Any, index_name: str) -> Optional[bool]:
+    """인덱스 상태: None(없음), True(유효), False(CONCURRENTLY 실패로 남은 INVALID)."""
+    row = conn.execute(
+        sql_text(
+            "SELECT i.indisvalid FROM pg_class c JOIN pg_index i ON i.indexrelid = c.oid "
+            "WHERE c.relname = :name"
+        ),
+        {"name": index_name},
+    ).first()
+    return None if row is None else bool(row[0])
+
+
+def drop_anchor_vector_index(engine: Any = None) -> bool:
+    """
+    벌크 적재 전 HNSW 삭제 (CONCURRENTLY). 임베딩 UPDATE마다 그래프 삽입하는 비용 제거.
+    적재 후 build_anchor_vector_index로 재생성. 삭제했으면 True.
+    """
+    if engine is None:
+        from core.database import get_engine  # type: ignore
+
+        engine = get_engine()
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        if _index_state(conn, ANCHOR_HNSW_INDEX) is None:
+            return False
+        conn.execute(sql_text(f"DROP INDEX CONCURRENTLY IF EXISTS {ANCHOR_HNSW_INDEX}"))
+    return True
+
+
+def build_anchor_vector_index(
+    engine: Any = None,
+    maintenance_work_mem: str = HNSW_BUILD_MAINTENANCE_WORK_MEM,
+    parallel_workers: int = HNSW_BUILD_PARALLEL_WORKERS,
+) -> bool:
+    """
+    벌크 적재 후 HNSW 인덱스 CONCURRENTLY 생성 (검색·쓰기 잠금 없음) + ANALYZE.
+    maintenance_work_mem은 이 연결에서만 올렸다가 원복. 이미 유효한 인덱스가 있으면 False.
+    CONCURRENTLY 실패로 INVALID 인덱스가 남아 있으면 삭제 후 다시 생성.
+    """
+    if engine is None:
+        from core.database import get_engine  # type: ignore
+
+        engine = get_engine()
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        state = _index_state(conn, ANCHOR_HNSW_INDEX)
+        if state is True:
+            return False
+        if state is False:
+            conn.execute(sql_text(f"DROP INDEX CONCURRENTLY IF EXISTS {ANCHOR_HNSW_INDEX}"))
+        conn.execute(sql_text("SELECT set_config('maintenance_work_mem', :v, false)"), {"v": maintenance_work_mem})
+        conn.execute(
+            sql_text("SELECT set_config('max_parallel_maintenance_workers', :v, false)"),
+            {"v": str(parallel_workers)},
+        )
+        try:
+            conn.execute(
+                sql_text(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {ANCHOR_HNSW_INDEX} "
+                    f"ON competency_anchors USING hnsw (embedding vector_cosine_ops) "
+                    f"WITH (m = {HNSW_M}, ef_construction = {HNSW_EF_CONSTRUCTION})"
+                )
+            )
+            conn.execute(sql_text("ANALYZE competency_anchors"))
+        finally:
+            conn.execute(sql_text("RESET maintenance_work_mem"))
+            conn.execute(sql_text("RESET max_parallel_maintenance_workers"))
+    return True
@@ -5,17 +5,26 @@
 - embedding_content = [Standard] [Section]: Content 형태로 저장.
 """
 
-from typing import Any, List, Optional, Tuple
+from typing import Any, List, Optional, Tuple, Union
 
 from langchain_core.documents import Document
 from tqdm import tqdm
-from sqlalchemy import text as sql_text  # type: ignore[import-untyped]
+from sqlalchemy import func  # type: ignore[import-untyped]
 from sqlalchemy.orm import Session  # type: ignore[import-untyped]
 
 from domain.models.bases.disclosure import Disclosure  # type: ignore
+from domain.hub.repositories.vector_search import (  # type: ignore
+    SearchProfile,
+    build_vector_search_sql,
+    run_vector_search,
+)
 
 # 임베딩 채울 때: inference 128, commit 1024건마다 (4060 Ti 16GB 최종 세팅)
 COMMIT_EVERY_EMBEDDING_ROWS = 1024
+# 벡터 검색 SELECT 컬럼 (distance는 vector_search가 마지막에 추가)
+DISCLOSURE_SEARCH_COLUMNS = (
+    "id", "content", "source", "page", "standard_type", "section_title", "unique_id",
+)
 
 
 def _build_embedding_content(doc: Document) -> str:
@@ -116,17 +125,29 @@ def get_disclosure_doc_count(db: Session) -> int:
     return db.query(Disclosure).filter(Disclosure.embedding.isnot(None)).count()
 
 
-def search_disclosures(db: Session, query_embedding: List[float], k: int = 5) -> List[str]:
-    """벡터 유사도로 공시 청크 검색. content 문자열 리스트 반환."""
-    vec_str = "[" + ",".join(str(x) for x in query_embedding) + "]"
-    r = db.execute(
-        sql_text(
-            "SELECT content FROM disclosures "
-            "WHERE embedding IS NOT NULL ORDER BY embedding <-> CAST(:vec AS vector) LIMIT :k"
-        ),
-        {"vec": vec_str, "k": k},
+def get_disclosure_ingest_generation(db: Session) -> Tuple[int, int]:
+    """
+    적재 세대 (embedding이 채워진 행 수, 그중 최대 id). 적재·재적재·임베딩 채움이 있으면 바뀜.
+    검색 결과 캐시 무효화용. 행 수는 get_disclosure_doc_count와 같음.
+    """
+    count, max_id = (
+        db.query(func.count(Disclosure.id), func.max(Disclosure.id))
+        .filter(Disclosure.embedding.isnot(None))
+        .one()
     )
-    return [row[0] for row in r]
+    return int(count or 0), int(max_id or 0)
+
+
+def search_disclosures(
+    db: Session,
+    query_embedding: List[float],
+    k: int = 5,
+    profile: Union[str, SearchProfile, None] = None,
+) -> List[str]:
+    """벡터 유사도(코사인, HNSW)로 공시 청크 검색. content 문자열 리스트 반환."""
+    sql = build_vector_search_sql("disclosures", ["content"])
+    rows = run_vector_search(db, sql, query_embedding, {"k": k}, profile=profile)
+    return [row[0] for row in rows]
 
 
 def search_disclosures_with_filter(
@@ -134,34 +155,23 @@ def search_disclosures_with_filter(
     query_embedding: List[float],
     k: int = 5,
     standard_types: Optional[List[str]] = None,
+    profile: Union[str, SearchProfile, None] = None,
 ) -> List[Tuple[Document, float]]:
     """
     disclosures 테이블에서 벡터 유사도 검색. id, content, source, page, standard_type, section_title, unique_id 반환.
     standard_types가 있으면 해당 표준만 검색(예: ['IFRS_S1','IFRS_S2'], ['OECD'], ['ISO30414']).
+    profile: 검색 프로파일 이름("fast"/"balanced"/"high_recall") 또는 SearchProfile. None이면 balanced
+    (필터 결과가 k건 미만이 되지 않도록 iterative scan + 정확 검색 fallback).
     반환: (Document, distance) 리스트. 코사인 거리(작을수록 유사).
     """
-    vec_str = "[" + ",".join(str(x) for x in query_embedding) + "]"
+    conditions: List[str] = []
+    params: Any = {"k": k}
     if standard_types:
-        sql = (
-            "SELECT id, content, source, page, standard_type, section_title, unique_id, "
-            "(embedding <-> CAST(:vec AS vector)) AS distance "
-            "FROM disclosures "
-            "WHERE embedding IS NOT NULL AND standard_type = ANY(:standard_types) "
-            "ORDER BY embedding <-> CAST(:vec AS vector) LIMIT :k"
-        )
-        params: Any = {"vec": vec_str, "k": k, "standard_types": standard_types}
-    else:
-        sql = (
-            "SELECT id, content, source, page, standard_type, section_title, unique_id, "
-            "(embedding <-> CAST(:vec AS vector)) AS distance "
-            "FROM disclosures "
-            "WHERE embedding IS NOT NULL "
-            "ORDER BY embedding <-> CAST(:vec AS vector) LIMIT :k"
-        )
-        params = {"vec": vec_str, "k": k}
-    r = db.execute(sql_text(sql), params)
+        conditions.append("standard_type = ANY(:standard_types)")
+        params["standard_types"] = standard_types
+    sql = build_vector_search_sql("disclosures", DISCLOSURE_SEARCH_COLUMNS, conditions)
     result: List[Tuple[Document, float]] = []
-    for row in r:
+    for row in run_vector_search(db, sql, query_embedding, params, profile=profile):
         doc_id, content, source, page, standard_type, section_title, unique_id, distance = row
         doc = Document(
             page_content=content or "",
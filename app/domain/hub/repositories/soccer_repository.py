@@ -3,9 +3,16 @@ Soccer Repository — players, teams, stadiums, schedules 저장
 
 규칙 기반 처리에서 관계형 DB 저장을 담당. 클래스명은 soccer 도메인에 맞춰
 PlayerRepository, ScheduleRepository, StadiumRepository, TeamRepository 로 통일.
+
+- save_batch(bulk=False): 행마다 db.merge (PK SELECT + INSERT/UPDATE 왕복).
+- save_batch(bulk=True) / upsert_batch: chunk마다 임시 staging 테이블에 COPY →
+  INSERT ... ON CONFLICT (PK) DO UPDATE 한 번. merge와 같은 행 단위 의미:
+  입력에 있는 컬럼만 INSERT/UPDATE, 같은 PK가 여러 번 오면 나중 값이 덮어씀.
 """
 
-from typing import Any, Dict, List
+import io
+import json
+from typing import Any, Dict, List, Tuple
 
 from sqlalchemy.orm import Session
 
@@ -23,6 +30,116 @@ def _dict_to_model_attrs(model_class: type, item: Dict[str, Any]) -> Dict[str, A
     return {k: v for k, v in item.items() if k in cols}
 
 
+def _copy_value(value: Any) -> str:
+    """
+    COPY CSV 한 칸. None → 따옴표 없는 빈 칸(= NULL), 숫자 → 그대로, 나머지는 항상 따옴표
+    (빈 문자열은 "" → ''로 들어가 NULL과 구분). vector(list/ndarray) → '[..]', dict → JSON.
+    csv.writer는 None도 ""로 따옴표를 붙여 NULL이 ''가 되므로 직접 씀.
+    """
+    if value is None:
+        return ""
+    if hasattr(value, "tolist"):
+        value = value.tolist()
+    if isinstance(value, bool):
+        value = "true" if value else "false"
+    elif isinstance(value, (int, float)):
+        return repr(value)
+    elif isinstance(value, (list, tuple)):
+        value = "[" + ",".join(str(float(x)) for x in value) + "]"
+    elif isinstance(value, dict):
+        value = json.dumps(value, ensure_ascii=False)
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def _collapse_by_pk(
+    model_class: type, chunk: List[Dict[str, Any]]
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    chunk를 PK 기준으로 합침 (merge를 순서대로 적용한 결과와 동일: 나중 행의 컬럼이 덮어씀).
+    반환: (PK 있는 합쳐진 행, PK 없는 행 → merge 경로).
+    """
+    pk_cols = [c.key for c in model_class.__table__.primary_key.columns]  # type: ignore[union-attr]
+    merged: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+    without_pk: List[Dict[str, Any]] = []
+    for item in chunk:
+        attrs = _dict_to_model_attrs(model_class, item)
+        if not attrs:
+            continue
+        key = tuple(attrs.get(c) for c in pk_cols)
+        if any(v is None for v in key):
+            without_pk.append(attrs)
+            continue
+        if key in merged:
+            merged[key].update(attrs)
+        else:
+            merged[key] = dict(attrs)
+    return list(merged.values()), without_pk
+
+
+def _copy_upsert_group(db: Session, model_class: type, columns: List[str], rows: List[Dict[str, Any]]) -> List[Any]:
+    """같은 컬럼 집합의 행들: staging COPY → INSERT ... ON CONFLICT DO UPDATE RETURNING PK."""
+    table = model_class.__table__.name  # type: ignore[union-attr]
+    pk_cols = [c.key for c in model_class.__table__.primary_key.columns]  # type: ignore[union-attr]
+    stage = f"_stage_{table}"
+    col_list = ", ".join(columns)
+    update_cols = [c for c in columns if c not in pk_cols]
+
+    buf = io.StringIO()
+    for row in rows:
+        buf.write(",".join(_copy_value(row.get(c)) for c in columns))
+        buf.write("\n")
+    buf.seek(0)
+
+    cursor = db.connection().connection.cursor()
+    try:
+        # 제약조건 없이 컬럼 타입만 복제 (부분 컬럼 행도 staging에 들어가도록)
+        cursor.execute(f"DROP TABLE IF EXISTS {stage}")
+        cursor.execute(f"CREATE TEMP TABLE {stage} ON COMMIT DROP AS SELECT {col_list} FROM {table} WITH NO DATA")
+        # CSV 형식 기본 NULL = 따옴표 없는 빈 칸 (_copy_value는 문자열을 항상 따옴표로 감쌈)
+        cursor.copy_expert(f"COPY {stage} ({col_list}) FROM STDIN WITH (FORMAT csv)", buf)
+        if update_cols:
+            conflict = "DO UPDATE SET " + ", ".join(f"{c} = EXCLUDED.{c}" for c in update_cols)
+        else:
+            conflict = "DO NOTHING"
+        cursor.execute(
+            f"INSERT INTO {table} ({col_list}) SELECT {col_list} FROM {stage} "
+            f"ON CONFLICT ({', '.join(pk_cols)}) {conflict} RETURNING {', '.join(pk_cols)}"
+        )
+        returned = cursor.fetchall()
+        cursor.execute(f"DROP TABLE IF EXISTS {stage}")
+    finally:
+        cursor.close()
+    return [r[0] if len(r) == 1 else tuple(r) for r in returned]
+
+
+def bulk_upsert(
+    model_class: type,
+    data: List[Dict[str, Any]],
+    db: Session,
+    chunk_size: int = 500,
+) -> List[Any]:
+    """
+    COPY + ON CONFLICT 기반 배치 upsert. 영향받은 PK 리스트 반환 (DO NOTHING으로 건너뛴 행 제외).
+    PK 없는 행은 기존처럼 db.merge. 세션의 현재 트랜잭션에서 실행 (commit은 호출자).
+    """
+    # ORM에 쌓인 변경을 먼저 반영해 raw COPY와 순서가 섞이지 않게 함
+    db.flush()
+    ids: List[Any] = []
+    for i in range(0, len(data), chunk_size):
+        rows, without_pk = _collapse_by_pk(model_class, data[i : i + chunk_size])
+        # 입력 컬럼 집합이 같은 행끼리 한 번에 (없는 컬럼을 NULL로 덮어쓰지 않도록)
+        groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        for row in rows:
+            groups.setdefault(tuple(sorted(row.keys())), []).append(row)
+        for columns, group in groups.items():
+            ids.extend(_copy_upsert_group(db, model_class, list(columns), group))
+        for attrs in without_pk:
+            db.merge(model_class(**attrs))
+        if without_pk:
+            db.flush()
+    return ids
+
+
 # -----------------------------------------------------------------------------
 # Player
 # -----------------------------------------------------------------------------
@@ -45,8 +162,11 @@ class PlayerRepository:
         data: List[Dict[str, Any]],
         db: Session,
         chunk_size: int = 500,
+        bulk: bool = False,
     ) -> int:
-        """배치 저장. chunk_size 단위로 flush."""
+        """배치 저장. chunk_size 단위로 flush. bulk=True면 COPY + ON CONFLICT (upsert_batch)."""
+        if bulk:
+            return len(self.upsert_batch(data, db, chunk_size=chunk_size))
         saved = 0
         for i in range(0, len(data), chunk_size):
             chunk = data[i : i + chunk_size]
@@ -56,6 +176,15 @@ class PlayerRepository:
             db.flush()
         return saved
 
+    def upsert_batch(
+        self,
+        data: List[Dict[str, Any]],
+        db: Session,
+        chunk_size: int = 500,
+    ) -> List[Any]:
+        """COPY + ON CONFLICT 배치 upsert. 영향받은 id 리스트 반환."""
+        return bulk_upsert(Player, data, db, chunk_size=chunk_size)
+
 
 # -----------------------------------------------------------------------------
 # Schedule
@@ -78,7 +207,10 @@ class ScheduleRepository:
         data: List[Dict[str, Any]],
         db: Session,
         chunk_size: int = 500,
+        bulk: bool = False,
     ) -> int:
+        if bulk:
+            return len(self.upsert_batch(data, db, chunk_size=chunk_size))
         saved = 0
         for i in range(0, len(data), chunk_size):
             chunk = data[i : i + chunk_size]
@@ -88,6 +220,15 @@ class ScheduleRepository:
             db.flush()
         return saved
 
+    def upsert_batch(
+        self,
+        data: List[Dict[str, Any]],
+        db: Session,
+        chunk_size: int = 500,
+    ) -> List[Any]:
+        """COPY + ON CONFLICT 배치 upsert. 영향받은 id 리스트 반환."""
+        return bulk_upsert(Schedule, data, db, chunk_size=chunk_size)
+
 
 # -----------------------------------------------------------------------------
 # Stadium
@@ -110,7 +251,10 @@ class StadiumRepository:
         data: List[Dict[str, Any]],
         db: Session,
         chunk_size: int = 500,
+        bulk: bool = False,
     ) -> int:
+        if bulk:
+            return len(self.upsert_batch(data, db, chunk_size=chunk_size))
         saved = 0
         for i in range(0, len(data), chunk_size):
             chunk = data[i : i + chunk_size]
@@ -120,6 +264,15 @@ class StadiumRepository:
             db.flush()
         return saved
 
+    def upsert_batch(
+        self,
+        data: List[Dict[str, Any]],
+        db: Session,
+        chunk_size: int = 500,
+    ) -> List[Any]:
+        """COPY + ON CONFLICT 배치 upsert. 영향받은 id 리스트 반환."""
+        return bulk_upsert(Stadium, data, db, chunk_size=chunk_size)
+
 
 # -----------------------------------------------------------------------------
 # Team
@@ -142,7 +295,10 @@ class TeamRepository:
         data: List[Dict[str, Any]],
         db: Session,
         chunk_size: int = 500,
+        bulk: bool = False,
     ) -> int:
+        if bulk:
+            return len(self.upsert_batch(data, db, chunk_size=chunk_size))
         saved = 0
         for i in range(0, len(data), chunk_size):
             chunk = data[i : i + chunk_size]
@@ -151,3 +307,12 @@ class TeamRepository:
                     saved += 1
             db.flush()
         return saved
+
+    def upsert_batch(
+        self,
+        data: List[Dict[str, Any]],
+        db: Session,
+        chunk_size: int = 500,
+    ) -> List[Any]:
+        """COPY + ON CONFLICT 배치 upsert. 영향받은 id 리스트 반환."""
+        return bulk_upsert(Team, data, db, chunk_size=chunk_size)
@@ -0,0 +1,174 @@
+"""
+pgvector 공통 검색 레이어 — disclosures·competency_anchors 공용.
+
+- HNSW 인덱스(vector_cosine_ops, 004·006 마이그레이션)와 같은 연산자 `<=>`로 정렬해야 인덱스를 탄다.
+  `<->`(L2)로 정렬하면 플래너가 인덱스를 쓰지 못해 매 RAG 턴마다 Seq Scan.
+- 쿼리 벡터는 pgvector Vector 타입 파라미터로 바인딩 (문자열 조립·CAST 없음).
+- 반환 거리: 코사인 거리(1 - cosine similarity, 0~2, 작을수록 유사). rag_node 임계값과 같은 단위.
+- SearchProfile: 트랜잭션 단위로 hnsw.ef_search·hnsw.iterative_scan(SET LOCAL) 설정.
+  필터(standard_type, category/level) 검색에서 k건 미만이면 정확 검색(인덱스 스캔 off)으로 재조회.
+  docs/vector-index-hnsw.md §5 참고.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Literal, Optional, Sequence, Union
+
+from pgvector.sqlalchemy import Vector  # type: ignore[import-untyped]
+from sqlalchemy import bindparam, text as sql_text  # type: ignore[import-untyped]
+from sqlalchemy.orm import Session  # type: ignore[import-untyped]
+
+from domain.shared.embedding import BGE_M3_DENSE_DIM  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+# HNSW 인덱스 opclass(vector_cosine_ops)와 짝이 되는 연산자
+COSINE_DISTANCE_OP = "<=>"
+QUERY_VECTOR_PARAM = "vec"
+
+IterativeScan = Literal["off", "strict_order", "relaxed_order"]
+
+
+@dataclass(frozen=True)
+class SearchProfile:
+    """HNSW 검색 프로파일 (recall ↔ latency).
+
+    ef_search: 후보 리스트 크기. 실제 값은 max(ef_search, k).
+    iterative_scan: pgvector 0.8+ 반복 인덱스 스캔. 필터로 후보가 걸러져도 k건 채울 때까지 계속 탐색.
+      relaxed_order는 순서가 약간 어긋날 수 있어 strict_order만 프로파일에 사용.
+    max_scan_tuples: 반복 스캔 상한 (None이면 pgvector 기본값 20000).
+    exact_fallback: ANN 결과가 k건 미만이면 인덱스 스캔 off로 정확 검색 재조회.
+    """
+
+    ef_search: int = 40
+    iterative_scan: IterativeScan = "off"
+    max_scan_tuples: Optional[int] = None
+    exact_fallback: bool = False
+
+
+# 호출자가 이름으로 고르는 기본 프로파일
+SEARCH_PROFILES: Dict[str, SearchProfile] = {
+    # 지연 우선 (pgvector 기본값과 동일, 필터 시 k건 미보장)
+    "fast": SearchProfile(ef_search=40),
+    # RAG 기본: 필터 검색도 k건 보장
+    "balanced": SearchProfile(ef_search=100, iterative_scan="strict_order", exact_fallback=True),
+    # 정확도 우선 (보고서·공시 점검)
+    "high_recall": SearchProfile(
+        ef_search=200, iterative_scan="strict_order", max_scan_tuples=40000, exact_fallback=True
+    ),
+}
+DEFAULT_SEARCH_PROFILE = "balanced"
+
+# hnsw.iterative_scan 지원 여부 (pgvector < 0.8이면 False). 첫 설정 시 한 번만 확인.
+_iterative_scan_supported: Optional[bool] = None
+
+
+def _vector_param(dim: int = BGE_M3_DENSE_DIM) -> Any:
+    """:vec 파라미터를 pgvector Vector 타입으로 바인딩."""
+    return bindparam(QUERY_VECTOR_PARAM, type_=Vector(dim))
+
+
+def build_vector_search_sql(
+    table: str,
+    columns: Sequence[str],
+    conditions: Optional[Sequence[str]] = None,
+) -> str:
+    """
+    코사인 거리 정렬 SELECT 문. 마지막 컬럼으로 distance 포함.
+    conditions는 AND로 결합 (embedding IS NOT NULL은 항상 포함).
+    """
+    where = ["embedding IS NOT NULL", *(conditions or [])]
+    distance_expr = f"embedding {COSINE_DISTANCE_OP} :{QUERY_VECTOR_PARAM}"
+    return (
+        f"SELECT {', '.join(columns)}, ({distance_expr}) AS distance "
+        f"FROM {table} WHERE {' AND '.join(where)} "
+        f"ORDER BY {distance_expr} LIMIT :k"
+    )
+
+
+def resolve_search_profile(profile: Union[str, SearchProfile, None] = None) -> SearchProfile:
+    """이름/인스턴스/None → SearchProfile. None이면 DEFAULT_SEARCH_PROFILE."""
+    if isinstance(profile, SearchProfile):
+        return profile
+    name = profile or DEFAULT_SEARCH_PROFILE
+    if name not in SEARCH_PROFILES:
+        raise ValueError(f"알 수 없는 검색 프로파일: {name} (가능: {', '.join(SEARCH_PROFILES)})")
+    return SEARCH_PROFILES[name]
+
+
+def _set_local(db: Session, name: str, value: Any) -> None:
+    """SET LOCAL과 동일 (set_config is_local=true). 현재 트랜잭션 종료 시 원복."""
+    db.execute(sql_text("SELECT set_config(:name, :value, true)"), {"name": name, "value": str(value)})
+
+
+def apply_search_profile(db: Session, profile: SearchProfile, k: int = 0) -> None:
+    """현재 트랜잭션에 hnsw.ef_search·iterative_scan 설정."""
+    global _iterative_scan_supported
+    _set_local(db, "hnsw.ef_search", max(profile.ef_search, k))
+    if profile.iterative_scan == "off" or _iterative_scan_supported is False:
+        return
+    try:
+        # 미지원 GUC면 트랜잭션 전체가 abort 되지 않도록 savepoint 안에서 설정
+        with db.begin_nested():
+            _set_local(db, "hnsw.iterative_scan", profile.iterative_scan)
+            if profile.max_scan_tuples is not None:
+                _set_local(db, "hnsw.max_scan_tuples", profile.max_scan_tuples)
+        _iterative_scan_supported = True
+    except Exception as e:
+        _iterative_scan_supported = False
+        logger.warning("hnsw.iterative_scan 미지원 (pgvector < 0.8?), exact_fallback만 사용: %s", e)
+
+
+def _execute(db: Session, sql: str, query_embedding: Sequence[float], params: Dict[str, Any]) -> List[Any]:
+    stmt = sql_text(sql).bindparams(_vector_param(len(query_embedding)))
+    bound = dict(params)
+    bound[QUERY_VECTOR_PARAM] = list(query_embedding)
+    return list(db.execute(stmt, bound))
+
+
+def run_vector_search(
+    db: Session,
+    sql: str,
+    query_embedding: Sequence[float],
+    params: Optional[Dict[str, Any]] = None,
+    profile: Union[str, SearchProfile, None] = None,
+) -> List[Any]:
+    """
+    build_vector_search_sql 결과를 실행. 쿼리 벡터는 Vector 타입으로 바인딩.
+    profile 설정을 현재 트랜잭션에 적용한 뒤 실행하고, exact_fallback이면 k건 미만 시 정확 검색으로 재조회
+    (조건을 만족하는 행이 k건 이상 있으면 항상 k건 반환).
+    """
+    resolved = resolve_search_profile(profile)
+    bound: Dict[str, Any] = dict(params or {})
+    k = int(bound.get("k") or 0)
+    apply_search_profile(db, resolved, k)
+    rows = _execute(db, sql, query_embedding, bound)
+    if resolved.exact_fallback and len(rows) < k:
+        # 인덱스 스캔만 끔: btree 필터는 bitmap scan으로 계속 사용
+        _set_local(db, "enable_indexscan", "off")
+        rows = _execute(db, sql, query_embedding, bound)
+        _set_local(db, "enable_indexscan", "on")
+    return rows
+
+
+def cosine_distance_to_similarity(distance: float) -> float:
+    """코사인 거리 → 코사인 유사도 (1 - distance)."""
+    return 1.0 - float(distance)
+
+
+def explain_vector_search(
+    db: Session,
+    sql: str,
+    query_embedding: Sequence[float],
+    params: Optional[Dict[str, Any]] = None,
+    profile: Union[str, SearchProfile, None] = None,
+) -> str:
+    """EXPLAIN 결과(플랜 텍스트). 인덱스 사용 여부 확인용 (실행하지 않음)."""
+    apply_search_profile(db, resolve_search_profile(profile), int((params or {}).get("k") or 0))
+    rows = _execute(db, f"EXPLAIN {sql}", query_embedding, dict(params or {}))
+    return "\n".join(str(row[0]) for row in rows)
+
+
+def plan_uses_index(plan: str, index_name: str) -> bool:
+    """EXPLAIN 플랜 텍스트에 해당 인덱스 스캔이 포함되어 있는지."""
+    return f"using {index_name}".lower() in plan.lower()
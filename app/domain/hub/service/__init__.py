@@ -5,7 +5,7 @@ Hub 공통 서비스
 Soccer Rule 서비스는 domain.spokes.soccer.services 에서 re-export.
 """
 
-from .semantic_classifier import classify, is_classifier_available
+from .semantic_classifier import classify, classify_batch, is_classifier_available, score_labels
 from domain.spokes.soccer.services import (  # type: ignore
     PlayerService,
     ScheduleService,
@@ -15,7 +15,9 @@ from domain.spokes.soccer.services import (  # type: ignore
 
 __all__ = [
     "classify",
+    "classify_batch",
     "is_classifier_available",
+    "score_labels",
     "PlayerService",
     "ScheduleService",
     "StadiumService",
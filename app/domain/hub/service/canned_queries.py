@@ -0,0 +1,178 @@
+"""
+고정(canned) 검색 쿼리 레지스트리 — 쿼리 임베딩과 top-k 검색 결과를 미리 계산·캐시.
+
+공시 확인(_run_disclosure_check)은 매번 같은 상수 쿼리를 BGE-m3로 임베딩하고 HNSW 검색을 다시 함.
+- 임베딩: 임베딩 모델 버전(get_embedding_model_version)별로 한 번 계산해 JSON 파일에 저장,
+  서버 기동 시 로드. 버전·쿼리 문장이 바뀐 항목만 다시 계산.
+- top-k: (쿼리, k)별 결과를 disclosures 적재 세대(행 수, 최대 id)와 함께 메모리에 보관,
+  세대가 바뀌면(적재·재적재·임베딩 채움) 다시 검색.
+→ 반복 확인에서는 인코더와 ANN 검색을 모두 건너뜀 (세대 조회 쿼리 1회만).
+"""
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 이름 → 쿼리 문장. 문장을 바꾸면 해당 항목만 다시 임베딩됨
+CANNED_QUERIES: Dict[str, str] = {
+    "iso30414_reporting": (
+        "ISO 30414 human capital reporting requirements. "
+        "What indicators and categories are required for internal and external reporting?"
+    ),
+}
+
+Generation = Tuple[int, int]
+EmbedderFactory = Callable[[], Any]
+
+
+class CannedQueryRegistry:
+    """이름 → (쿼리 임베딩, 세대별 top-k 결과). 스레드 안전."""
+
+    def __init__(self, path: Optional[Path], queries: Mapping[str, str]) -> None:
+        self.path = path
+        self.queries = dict(queries)
+        self.version: Optional[str] = None
+        self._vectors: Dict[str, List[float]] = {}
+        self._topk: Dict[Tuple[str, int], Tuple[Generation, List[str]]] = {}
+        self._lock = threading.Lock()
+        self.encoded = 0
+        self.topk_hits = 0
+        self.topk_misses = 0
+
+    def load(self, version: str) -> int:
+        """파일에서 같은 버전·같은 문장의 벡터만 로드. 로드한 개수 반환."""
+        with self._lock:
+            if self.version != version:
+                self.version = version
+                self._vectors.clear()
+                self._topk.clear()
+            if self.path is None or not self.path.exists():
+                return 0
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError) as e:
+                logger.warning("[canned_queries] 파일 로드 실패 %s: %s", self.path, e)
+                return 0
+            if data.get("version") != version:
+                logger.info("[canned_queries] 임베딩 모델 버전 변경 → 다시 계산 (%s)", self.path)
+                return 0
+            for name, entry in (data.get("queries") or {}).items():
+                if self.queries.get(name) == entry.get("text") and entry.get("vector"):
+                    self._vectors[name] = entry["vector"]
+            return len(self._vectors)
+
+    def ensure(self, embedder: Any, version: str) -> int:
+        """버전에 맞는 벡터가 없는 쿼리만 한 번에 임베딩하고 파일에 저장. 새로 계산한 개수 반환."""
+        if self.version != version:
+            self.load(version)
+        with self._lock:
+            missing = [name for name in self.queries if name not in self._vectors]
+            if not missing:
+                return 0
+            texts = [self.queries[name] for name in missing]
+            if hasattr(embedder, "embed_queries"):
+                vectors = embedder.embed_queries(texts)
+            else:
+                vectors = [embedder.embed_query(text) for text in texts]
+            for name, vector in zip(missing, vectors):
+                self._vectors[name] = [float(x) for x in vector]
+            self.encoded += len(missing)
+            self._save()
+            return len(missing)
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        data = {
+            "version": self.version,
+            "queries": {
+                name: {"text": self.queries[name], "vector": vector} for name, vector in self._vectors.items()
+            },
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(tmp, self.path)  # 여러 프로세스가 동시에 써도 깨진 파일은 남지 않음
+        except OSError as e:
+            logger.warning("[canned_queries] 파일 저장 실패 %s: %s", self.path, e)
+
+    def vector(self, name: str, embedder_factory: EmbedderFactory, version: str) -> List[float]:
+        """쿼리 임베딩 (없을 때만 embedder_factory()로 인코더를 가져와 계산)."""
+        if self.version == version:
+            vector = self._vectors.get(name)
+            if vector is not None:
+                return vector
+        self.ensure(embedder_factory(), version)
+        return self._vectors[name]
+
+    def search(
+        self,
+        name: str,
+        k: int,
+        generation: Generation,
+        search_fn: Callable[[List[float], int], List[str]],
+        embedder_factory: EmbedderFactory,
+        version: str,
+    ) -> List[str]:
+        """캐시된 top-k (세대가 같을 때), 아니면 벡터 검색 후 캐시."""
+        key = (name, k)
+        with self._lock:
+            cached = self._topk.get(key) if self.version == version else None
+            if cached is not None and cached[0] == generation:
+                self.topk_hits += 1
+                return list(cached[1])
+            self.topk_misses += 1
+        results = search_fn(self.vector(name, embedder_factory, version), k)
+        with self._lock:
+            if self.version == version:
+                self._topk[key] = (generation, list(results))
+        return results
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "version": self.version,
+                "queries": len(self.queries),
+                "vectors": len(self._vectors),
+                "encoded": self.encoded,
+                "topk_cached": len(self._topk),
+                "topk_hits": self.topk_hits,
+                "topk_misses": self.topk_misses,
+            }
+
+
+_registry: Optional[CannedQueryRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_canned_query_registry() -> CannedQueryRegistry:
+    """설정 경로(DISCLOSURE_CANNED_QUERY_PATH, 없으면 artifacts/)의 레지스트리 싱글톤."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                from core.config import get_settings  # type: ignore
+                from core.paths import get_artifacts_dir  # type: ignore
+
+                configured = get_settings().disclosure_canned_query_path
+                path = Path(configured) if configured else get_artifacts_dir() / "canned_query_embeddings.json"
+                _registry = CannedQueryRegistry(path, CANNED_QUERIES)
+    return _registry
+
+
+def preload_canned_queries(embedder: Any = None) -> int:
+    """서버 기동 시 호출: 저장된 벡터 로드, embedder가 있으면 빠진 항목 계산. 사용 가능한 벡터 수 반환."""
+    from domain.shared.embedding import get_embedding_model_version  # type: ignore
+
+    registry = get_canned_query_registry()
+    version = get_embedding_model_version()
+    registry.load(version)
+    if embedder is not None:
+        registry.ensure(embedder, version)
+    return registry.stats()["vectors"]
@@ -3,10 +3,18 @@
 
 학습된 Llama 3.2B 어댑터로 사용자 질문을 BLOCK / RULE_BASED / POLICY_BASED 로 분류합니다.
 규칙 기반(DB)·정책 기반(LLM)·차단(서비스 밖) 라우팅에 사용합니다.
+
+분류 방식 (core.config SEMANTIC_CLASSIFIER_MODE):
+- score (기본): 프롬프트 + "액션:" 뒤 다음 토큰 logit을 라벨별 첫 토큰(" RULE"처럼 앞 공백 포함)에서 읽어
+  1회 forward로 분류. 라벨 확률(softmax(logit / T), 기본 T=1.0)을 함께 반환하고, 여러 문장을 배치로 처리 (score_labels, classify_batch).
+- generate: 최대 64토큰 생성 후 텍스트에서 라벨 파싱 (기존 방식). score 실패 시 폴백으로도 사용.
 """
 
+import logging
 from pathlib import Path
-from typing import Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
 
 # app 디렉터리: domain/hub/service -> app
 _APP_DIR = Path(__file__).resolve().parent.parent.parent.parent
@@ -19,6 +27,15 @@ _SYSTEM = (
     "질문의 의도와 복잡성을 분석하여 정확한 액션과 그 이유를 답변하세요."
 )
 
+# 학습 응답은 "액션: <LABEL>" 으로 시작. BPE에서 라벨 앞 공백은 라벨 토큰에 붙으므로(" RULE")
+# 프롬프트는 "액션:"에서 끝내고 공백 포함 라벨 첫 토큰을 점수화 (공백을 따로 붙이면 학습에 없던 토큰열)
+_ANSWER_PREFIX = "액션:"
+_LABEL_SEPARATOR = " "
+# 프롬프트 최대 토큰 수. 넘으면 사용자 메시지 뒤쪽을 잘라 "액션:"까지의 끝부분은 항상 남김
+_MAX_PROMPT_TOKENS = 512
+# 점수 계산 대상 라벨 (ChatPolicy 값과 동일 순서)
+LABELS: Tuple[str, ...] = ("BLOCK", "RULE_BASED", "POLICY_BASED")
+
 
 def _get_adapter_dir() -> Optional[Path]:
     """어댑터 디렉터리 반환. 루트에 없으면 최신 checkpoint-* 사용."""
@@ -94,71 +111,227 @@ _load_model_once._model = None  # type: ignore
 _load_model_once._tokenizer = None  # type: ignore
 
 
-def classify(user_message: str) -> str:
-    """사용자 메시지를 분류합니다. ChatPolicy.*.value 반환."""
-    from domain.models.enums import ChatPolicy  # type: ignore
-
-    model, tokenizer = _load_model_once()
-    if model is None or tokenizer is None:
-        return ChatPolicy.POLICY_BASED.value
-
-    try:
-        import torch
-
-        user_text = (
-            f"질문: {user_message.strip()}\n"
-            "이 질문은 규칙 기반입니까, 정책 기반입니까, 아니면 차단 대상입니까?"
-        )
+def _build_prompt(tokenizer: Any, user_message: str) -> str:
+    """학습과 동일한 채팅 프롬프트 (chat_template 없는 토크나이저는 평문 연결)."""
+    user_text = (
+        f"질문: {user_message.strip()}\n"
+        "이 질문은 규칙 기반입니까, 정책 기반입니까, 아니면 차단 대상입니까?"
+    )
+    if getattr(tokenizer, "chat_template", None):
         messages = [
             {"role": "system", "content": _SYSTEM},
             {"role": "user", "content": user_text},
         ]
-        prompt = tokenizer.apply_chat_template(
-            messages,
-            tokenize=False,
-            add_generation_prompt=True,
-        )
-        inputs = tokenizer(
-            prompt,
-            return_tensors="pt",
-            truncation=True,
-            max_length=512,
+        return tokenizer.apply_chat_template(messages, tokenize=False, add_generation_prompt=True)
+    return f"{_SYSTEM}\n\n{user_text}\n\n"
+
+
+def _fit_message(tokenizer: Any, user_message: str, suffix: str = "") -> str:
+    """
+    프롬프트(+suffix)가 _MAX_PROMPT_TOKENS를 넘지 않도록 사용자 메시지 뒤쪽을 자름.
+    tokenizer의 truncation은 끝을 자르므로 긴 메시지에서는 "액션:"이 사라져 마지막 logit이 무의미해짐.
+    """
+    ids = tokenizer.encode(user_message.strip(), add_special_tokens=False)
+    overhead = len(
+        tokenizer.encode(
+            _build_prompt(tokenizer, "") + suffix,
+            add_special_tokens=not getattr(tokenizer, "chat_template", None),
         )
-        inputs = {k: v.to(model.device) for k, v in inputs.items()}
-
-        with torch.no_grad():
-            out = model.generate(
-                **inputs,
-                max_new_tokens=64,
-                do_sample=False,
-                pad_token_id=tokenizer.pad_token_id,
-                eos_token_id=tokenizer.eos_token_id,
+    )
+    # 여유 4토큰: 잘린 메시지를 다시 토크나이즈할 때 경계 토큰이 달라지거나 BOS가 더해지는 경우
+    budget = max(_MAX_PROMPT_TOKENS - overhead - 4, 1)
+    if len(ids) <= budget:
+        return user_message
+    return tokenizer.decode(ids[:budget], skip_special_tokens=True)
+
+
+def _label_token_ids(tokenizer: Any) -> List[int]:
+    """
+    라벨별 "액션:" 다음 첫 토큰 id (" RULE"처럼 앞 공백 포함). 학습 응답과 같이 "액션: <LABEL>"을
+    통째로 토크나이즈해 경계 병합을 반영.
+    라벨끼리 첫 토큰이 겹치면 한 번의 forward로 구분할 수 없으므로 ValueError.
+    """
+    cached = getattr(tokenizer, "_semantic_label_token_ids", None)
+    if cached is not None:
+        return cached
+    prefix_ids = tokenizer.encode(_ANSWER_PREFIX, add_special_tokens=False)
+    ids: List[int] = []
+    for label in LABELS:
+        full = tokenizer.encode(_ANSWER_PREFIX + _LABEL_SEPARATOR + label, add_special_tokens=False)
+        if full[: len(prefix_ids)] != prefix_ids or len(full) <= len(prefix_ids):
+            # 접두어와 라벨 경계에서 토큰이 병합되면 공백 포함 라벨 단독 첫 토큰 사용
+            full = prefix_ids + tokenizer.encode(_LABEL_SEPARATOR + label, add_special_tokens=False)
+        ids.append(full[len(prefix_ids)])
+    if len(set(ids)) != len(ids):
+        raise ValueError(f"라벨 첫 토큰이 겹침: {dict(zip(LABELS, ids))}")
+    try:
+        tokenizer._semantic_label_token_ids = ids
+    except Exception:
+        pass
+    return ids
+
+
+def score_labels(
+    user_messages: Sequence[str],
+    *,
+    model: Any = None,
+    tokenizer: Any = None,
+    batch_size: Optional[int] = None,
+    temperature: Optional[float] = None,
+) -> List[Dict[str, float]]:
+    """
+    문장별 라벨 확률 {BLOCK, RULE_BASED, POLICY_BASED} 반환 (입력 순서 유지).
+    batch_size개씩 패딩해 한 번의 forward로 다음 토큰 logit만 읽음 (generate 없음).
+    model/tokenizer를 넘기지 않으면 학습된 어댑터 사용. 모델 없음·라벨 토큰 충돌 시 예외.
+    """
+    import torch
+
+    if model is None or tokenizer is None:
+        model, tokenizer = _load_model_once()
+        if model is None or tokenizer is None:
+            raise RuntimeError("시멘틱 분류기 어댑터를 로드할 수 없습니다.")
+    if batch_size is None or temperature is None:
+        from core.config import get_settings  # type: ignore
+
+        settings = get_settings()
+        if batch_size is None:
+            batch_size = settings.semantic_classifier_batch_size
+        if temperature is None:
+            temperature = settings.semantic_classifier_temperature
+
+    label_ids = torch.tensor(_label_token_ids(tokenizer))
+    prompts = [_build_prompt(tokenizer, _fit_message(tokenizer, m, _ANSWER_PREFIX)) + _ANSWER_PREFIX for m in user_messages]
+    # 왼쪽 패딩: 모든 행의 마지막 위치(-1)가 실제 마지막 토큰.
+    # 왼쪽 자르기: 재토크나이즈로 몇 토큰 넘쳐도 끝("액션:")은 남김 (앞쪽 시스템 문구가 잘림)
+    padding_side = tokenizer.padding_side
+    truncation_side = tokenizer.truncation_side
+    tokenizer.padding_side = "left"
+    tokenizer.truncation_side = "left"
+    results: List[Dict[str, float]] = []
+    try:
+        for i in range(0, len(prompts), batch_size):
+            inputs = tokenizer(
+                prompts[i : i + batch_size],
+                return_tensors="pt",
+                padding=True,
+                truncation=True,
+                max_length=_MAX_PROMPT_TOKENS,
+                add_special_tokens=not getattr(tokenizer, "chat_template", None),
             )
+            inputs = {k: v.to(model.device) for k, v in inputs.items()}
+            with torch.no_grad():
+                logits = model(**inputs).logits[:, -1, :]
+            label_logits = logits.float().index_select(1, label_ids.to(logits.device))
+            probs = torch.softmax(label_logits / temperature, dim=-1).cpu().tolist()
+            results.extend(dict(zip(LABELS, row)) for row in probs)
+    finally:
+        tokenizer.padding_side = padding_side
+        tokenizer.truncation_side = truncation_side
+    return results
+
+
+def _classify_generate(user_message: str, model: Any, tokenizer: Any) -> str:
+    """텍스트 생성(최대 64토큰) 후 라벨 파싱 — score 모드 폴백."""
+    from domain.models.enums import ChatPolicy  # type: ignore
+
+    import torch
+
+    prompt = _build_prompt(tokenizer, _fit_message(tokenizer, user_message))
+    inputs = tokenizer(
+        prompt,
+        return_tensors="pt",
+        truncation=True,
+        max_length=_MAX_PROMPT_TOKENS,
+    )
+    inputs = {k: v.to(model.device) for k, v in inputs.items()}
+
+    with torch.no_grad():
+        out = model.generate(
+            **inputs,
+            max_new_tokens=64,
+            do_sample=False,
+            pad_token_id=tokenizer.pad_token_id,
+            eos_token_id=tokenizer.eos_token_id,
+        )
+
+    reply = tokenizer.decode(
+        out[0][inputs["input_ids"].shape[1] :],
+        skip_special_tokens=True,
+    ).strip()
 
-        reply = tokenizer.decode(
-            out[0][inputs["input_ids"].shape[1] :],
-            skip_special_tokens=True,
-        ).strip()
-
-        reply_upper = reply.upper()
-        if "액션:" in reply or "ACTION:" in reply_upper:
-            if "BLOCK" in reply_upper:
-                return ChatPolicy.BLOCK.value
-            if "RULE_BASED" in reply_upper or "RULE" in reply_upper:
-                return ChatPolicy.RULE_BASED.value
-            if "POLICY_BASED" in reply_upper or "POLICY" in reply_upper:
-                return ChatPolicy.POLICY_BASED.value
+    reply_upper = reply.upper()
+    if "액션:" in reply or "ACTION:" in reply_upper:
         if "BLOCK" in reply_upper:
             return ChatPolicy.BLOCK.value
         if "RULE_BASED" in reply_upper or "RULE" in reply_upper:
             return ChatPolicy.RULE_BASED.value
         if "POLICY_BASED" in reply_upper or "POLICY" in reply_upper:
             return ChatPolicy.POLICY_BASED.value
-
-        return ChatPolicy.POLICY_BASED.value
-    except Exception:
+    if "BLOCK" in reply_upper:
+        return ChatPolicy.BLOCK.value
+    if "RULE_BASED" in reply_upper or "RULE" in reply_upper:
+        return ChatPolicy.RULE_BASED.value
+    if "POLICY_BASED" in reply_upper or "POLICY" in reply_upper:
         return ChatPolicy.POLICY_BASED.value
 
+    return ChatPolicy.POLICY_BASED.value
+
+
+def _use_score_mode() -> bool:
+    from core.config import get_settings  # type: ignore
+
+    return get_settings().semantic_classifier_mode.strip().lower() != "generate"
+
+
+def classify_batch(user_messages: Sequence[str], *, strict: bool = False) -> List[str]:
+    """
+    여러 메시지를 분류 (score 모드면 배치 forward, 실패 시 문장별 generate 폴백).
+    strict=True면 모델 로드·추론 실패 시 POLICY_BASED로 대신하지 않고 예외 (응답 캐시에 폴백이 저장되지 않도록).
+    """
+    from domain.models.enums import ChatPolicy  # type: ignore
+
+    if not user_messages:
+        return []
+    model, tokenizer = _load_model_once()
+    if model is None or tokenizer is None:
+        if strict:
+            raise RuntimeError("시멘틱 분류기 어댑터를 로드할 수 없습니다.")
+        return [ChatPolicy.POLICY_BASED.value] * len(user_messages)
+
+    if _use_score_mode():
+        try:
+            scores = score_labels(user_messages, model=model, tokenizer=tokenizer)
+            return [max(row, key=row.get) for row in scores]
+        except Exception as e:
+            logger.warning("[SemanticClassifier] score 모드 실패, generate 폴백: %s", e)
+
+    out: List[str] = []
+    for message in user_messages:
+        try:
+            out.append(_classify_generate(message, model, tokenizer))
+        except Exception:
+            if strict:
+                raise
+            out.append(ChatPolicy.POLICY_BASED.value)
+    return out
+
+
+def classify(user_message: str, *, strict: bool = False) -> str:
+    """사용자 메시지를 분류합니다. ChatPolicy.*.value 반환. strict는 classify_batch 참고."""
+    return classify_batch([user_message], strict=strict)[0]
+
+
+def get_model_version() -> str:
+    """응답 캐시 키용 버전 (어댑터 경로·가중치 mtime + 분류 방식). 어댑터 없으면 'none'."""
+    from domain.hub.llm.response_cache import file_fingerprint  # type: ignore
+
+    mode = "score" if _use_score_mode() else "generate"
+    adapter = file_fingerprint(
+        _get_adapter_dir(),
+        ("adapter_config.json", "adapter_model.safetensors", "adapter_model.bin"),
+    )
+    return f"{mode}|{adapter}"
+
 
 def is_classifier_available() -> bool:
     """학습된 어댑터가 있어 분류기가 사용 가능한지 여부."""
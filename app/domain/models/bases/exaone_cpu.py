@@ -0,0 +1,88 @@
+"""
+ExaOne CPU 추론 백엔드 헬퍼.
+
+GPU 없는 레플리카·CI에서도 ExaoneLLM(invoke / _stream / 스케줄러)을 그대로 쓰도록
+CPU 로드 시 필요한 설정만 모아 둠.
+
+- resolve_device: "auto" | "cuda" | "cpu" → 실제 디바이스 ("auto"는 CUDA 없으면 cpu).
+- configure_cpu_threads: intra-op 스레드 = 물리 코어 수 (컨테이너 CPU affinity 반영).
+  하이퍼스레드까지 쓰면 GEMM이 오히려 느려지는 경우가 많아 논리 코어가 아닌 물리 코어 기준.
+- resolve_cpu_dtype: bfloat16은 CPU가 지원할 때만 (AVX512-BF16/AMX), 아니면 float32.
+- quantize_linear_int8: nn.Linear 동적 int8 양자화 (가중치 int8, 활성값은 실행 시 양자화).
+  quantize_dynamic은 float32 Linear만 변환하므로 int8 사용 시 float32로 로드.
+"""
+
+import os
+from typing import Any, Optional
+
+import torch
+
+
+def resolve_device(preference: Optional[str]) -> str:
+    """설정 디바이스 → "cuda" | "cpu". "cuda"인데 CUDA가 없으면 RuntimeError."""
+    preference = (preference or "cuda").strip().lower()
+    if preference == "cpu":
+        return "cpu"
+    if torch.cuda.is_available():
+        return "cuda"
+    if preference == "auto":
+        return "cpu"
+    raise RuntimeError(
+        "CUDA가 사용 불가능합니다. GPU가 필요합니다.\n"
+        "torch.cuda.is_available()이 False입니다. CPU 추론은 EXAONE_DEVICE=cpu 또는 auto."
+    )
+
+
+def cpu_thread_count(requested: int = 0) -> int:
+    """requested > 0이면 그대로, 아니면 이 프로세스가 쓸 수 있는 물리 코어 수."""
+    if requested > 0:
+        return requested
+    try:
+        available = len(os.sched_getaffinity(0))
+    except AttributeError:
+        available = os.cpu_count() or 1
+    try:
+        import psutil
+
+        physical = psutil.cpu_count(logical=False) or available
+        logical = psutil.cpu_count(logical=True) or available
+        # affinity로 제한된 논리 코어 중 물리 코어 비율만큼
+        available = max(1, available * physical // max(1, logical))
+    except ImportError:
+        pass
+    return max(1, available)
+
+
+def configure_cpu_threads(requested: int = 0) -> int:
+    """torch intra-op 스레드 설정, 적용한 스레드 수 반환."""
+    threads = cpu_thread_count(requested)
+    torch.set_num_threads(threads)
+    try:
+        # generate는 연산 간 병렬성이 거의 없어 inter-op는 작게. 병렬 작업 시작 후엔 변경 불가
+        torch.set_num_interop_threads(min(2, threads))
+    except RuntimeError:
+        pass
+    return threads
+
+
+def _cpu_supports_bf16() -> bool:
+    try:
+        return bool(torch.ops.mkldnn._is_mkldnn_bf16_supported())
+    except Exception:
+        return False
+
+
+def resolve_cpu_dtype(name: str) -> torch.dtype:
+    """"bfloat16" | "float32" → torch.dtype. bf16 미지원 CPU면 float32."""
+    if name.strip().lower() in ("bfloat16", "bf16") and _cpu_supports_bf16():
+        return torch.bfloat16
+    return torch.float32
+
+
+def quantize_linear_int8(model: Any) -> Any:
+    """nn.Linear 동적 int8 양자화 (in-place, 모델 복사 없이). float32가 아니면 먼저 float32로."""
+    if next(model.parameters()).dtype != torch.float32:
+        model = model.float()
+    return torch.ao.quantization.quantize_dynamic(
+        model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+    )
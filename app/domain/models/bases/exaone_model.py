@@ -3,8 +3,10 @@
 EXAONE 3.5는 LG AI Research에서 개발한 한국어 특화 LLM입니다.
 JSON Tool Calling을 프롬프트 기반으로 지원합니다.
 bitsandbytes 4-bit 양자화로 GPU 메모리 효율적 사용을 지원합니다.
+GPU가 없으면 EXAONE_DEVICE=cpu|auto로 CPU 백엔드 (bf16/fp32 + Linear 동적 int8, exaone_cpu).
 """
 
+import contextlib
 import json
 import os
 import re
@@ -179,8 +181,83 @@ def get_adaptive_max_length(input_length: int, max_new_tokens: int = 2048) -> in
         return min(4096, total_needed)
 
 
+def _autocast(model: Any) -> Any:
+    """CUDA 모델이면 autocast("cuda"), CPU 모델이면 no-op (CPU는 로드 dtype 그대로 연산)."""
+    device = getattr(model, "device", None)
+    if device is not None and getattr(device, "type", None) == "cuda":
+        return torch.amp.autocast("cuda")
+    return contextlib.nullcontext()
+
+
+def _iter_streamer(model: Any, generation_kwargs: Dict[str, Any], streamer: Any) -> Iterator[str]:
+    """
+    별도 스레드에서 model.generate(streamer=...) 실행, 디코딩된 텍스트 조각을 생성되는 대로 yield.
+    생성 중 예외는 스트리머를 닫아 소비 측이 멈추지 않게 하고, 스트림 끝에서 다시 발생.
+    """
+    error: List[BaseException] = []
+
+    def generate_in_thread():
+        try:
+            with torch.no_grad(), _autocast(model):
+                model.generate(**generation_kwargs)
+        except BaseException as e:  # noqa: BLE001 - 소비 스레드로 전달
+            error.append(e)
+            streamer.end()
+
+    thread = threading.Thread(target=generate_in_thread, daemon=True)
+    thread.start()
+    for new_text in streamer:
+        if new_text:
+            yield new_text
+    thread.join()
+    if error:
+        raise RuntimeError(f"텍스트 생성 실패: {error[0]}") from error[0]
+
+
+def _attach_prefix_cache(generation_kwargs: Dict[str, Any], prefix_cache: Optional[Any]) -> None:
+    """등록 접두사와 겹치면 generate()에 past_key_values를 넘겨 그 부분 prefill 생략."""
+    if prefix_cache is None:
+        return
+    hit = prefix_cache.lookup(generation_kwargs["input_ids"][0].tolist())
+    if hit is not None:
+        generation_kwargs["past_key_values"] = hit[1]
+
+
+def _scheduler_kwargs(generation_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """generate() kwargs → ContinuousBatchScheduler.submit kwargs (max_length 상한은 max_new_tokens로 반영)."""
+    input_length = generation_kwargs["input_ids"].shape[1]
+    max_new_tokens = min(
+        generation_kwargs["max_new_tokens"],
+        max(1, generation_kwargs.get("max_length", input_length + generation_kwargs["max_new_tokens"]) - input_length),
+    )
+    return {
+        "max_new_tokens": max_new_tokens,
+        "eos_token_id": generation_kwargs.get("eos_token_id"),
+        "do_sample": bool(generation_kwargs.get("do_sample")),
+        "temperature": generation_kwargs.get("temperature") or 1.0,
+    }
+
+
+def resolve_model_dir(model_dir: Optional[str] = None) -> Optional[Path]:
+    """EXAONE_MODEL_DIR(또는 model_dir) → 절대 경로. 상대 경로는 app/domain 기준. 미설정이면 None.
+
+    ExaoneLLM 로드 경로와 응답 캐시 버전(exaone_adapter._get_model_version)이 같은 디렉터리를 보도록 공유.
+    """
+    if model_dir is None:
+        from core.config import settings  # type: ignore
+
+        model_dir = settings.exaone_model_dir
+    if not model_dir:
+        return None
+    path = Path(model_dir)
+    if not path.is_absolute():
+        # __file__ = app/domain/models/bases/exaone_model.py → parents[2] = app/domain
+        path = (Path(__file__).resolve().parents[2] / path).resolve()
+    return path
+
+
 class ExaoneLLM(BaseLLM):
-    """EXAONE 3.5 LLM 모델 구현체 (bitsandbytes 4-bit 양자화 GPU 지원)."""
+    """EXAONE 3.5 LLM 모델 구현체 (bitsandbytes 4-bit 양자화 GPU 지원, CPU 백엔드 선택 가능)."""
 
     def __init__(
         self,
@@ -190,6 +267,7 @@ class ExaoneLLM(BaseLLM):
         dtype: str = "auto",
         trust_remote_code: bool = True,
         use_4bit: Optional[bool] = None,
+        device: Optional[str] = None,
     ):
         """EXAONE 모델 초기화.
 
@@ -200,6 +278,7 @@ class ExaoneLLM(BaseLLM):
             dtype: 토치 데이터 타입 ("auto", "float16", "bfloat16", "float32")
             trust_remote_code: 원격 코드 신뢰 여부
             use_4bit: 4-bit 양자화 사용 여부 (None이면 환경변수 EXAONE_USE_4BIT 확인, 기본 True)
+            device: "cuda" | "cpu" | "auto" (None이면 EXAONE_DEVICE, 기본 cuda)
         """
         self.model_path = model_path
         self.model_id = model_id
@@ -207,6 +286,12 @@ class ExaoneLLM(BaseLLM):
         self.dtype = dtype
         self.trust_remote_code = trust_remote_code
 
+        if device is None:
+            from core.config import settings  # type: ignore
+
+            device = settings.exaone_device
+        self.device = device
+
         # 4-bit 양자화 설정 (Settings에서 확인, 기본값 True)
         if use_4bit is None:
             from core.config import settings  # type: ignore
@@ -220,20 +305,8 @@ class ExaoneLLM(BaseLLM):
             self._load_path = model_path
         else:
             # EXAONE_MODEL_DIR 설정 확인 (메인 경로)
-            from core.config import settings  # type: ignore
-
-            env_model_dir = settings.exaone_model_dir
-            if env_model_dir:
-                env_path = Path(env_model_dir)
-                # 상대 경로인 경우 프로젝트 루트 기준으로 해석
-                if not env_path.is_absolute():
-                    # __file__ = app/models/exaone_model.py
-                    # parent.parent = app/ 디렉토리
-                    # parent.parent.parent = 프로젝트 루트 (RAG/)
-                    app_dir = Path(__file__).parent.parent  # models -> app
-                    project_root = app_dir.parent  # app -> 프로젝트 루트
-                    env_path = (project_root / env_path).resolve()
-
+            env_path = resolve_model_dir()
+            if env_path is not None:
                 # app/artifacts 경로만 확인
                 if env_path.exists() and (env_path / "config.json").exists():
                     self._load_path = str(env_path)
@@ -250,6 +323,9 @@ class ExaoneLLM(BaseLLM):
         self.model: Optional[Any] = None
         self.tokenizer: Optional[Any] = None
         self._langchain_model: Optional[BaseChatModel] = None
+        self._scheduler: Optional[Any] = None
+        self._scheduler_lock = threading.Lock()
+        self._prefix_cache: Optional[Any] = None
 
         # 모델 로드
         self._load_model()
@@ -268,12 +344,12 @@ class ExaoneLLM(BaseLLM):
                     f"[INFO] CUDA 메모리: {torch.cuda.get_device_properties(0).total_memory / 1024**3:.1f}GB"
                 )
 
-            # CUDA 필수 확인 (GPU 강제 사용)
-            if not cuda_available:
-                raise RuntimeError(
-                    "CUDA가 사용 불가능합니다. GPU가 필요합니다.\n"
-                    "torch.cuda.is_available()이 False입니다."
-                )
+            from domain.models.bases.exaone_cpu import resolve_device  # type: ignore
+
+            # device=cuda(기본)면 CUDA 필수, cpu/auto면 CPU 백엔드로 로드
+            if resolve_device(self.device) == "cpu":
+                self._load_cpu_model()
+                return
 
             dtype = torch.float16
 
@@ -317,22 +393,7 @@ class ExaoneLLM(BaseLLM):
                 self.model = torch.compile(self.model, mode="reduce-overhead")
                 print("[OK] torch.compile() 적용 완료")
 
-            try:
-                self.tokenizer = AutoTokenizer.from_pretrained(
-                    self._load_path,
-                    trust_remote_code=self.trust_remote_code,
-                    use_fast=True,
-                    local_files_only=True,
-                )
-            except Exception:
-                self.tokenizer = AutoTokenizer.from_pretrained(
-                    self._load_path,
-                    trust_remote_code=self.trust_remote_code,
-                    local_files_only=True,
-                )
-            if self.tokenizer.pad_token is None:
-                self.tokenizer.pad_token = self.tokenizer.eos_token
-                self.tokenizer.pad_token_id = self.tokenizer.eos_token_id
+            self._load_tokenizer()
 
             # 디바이스 정보 확인 및 출력
             if hasattr(self.model, "device"):
@@ -361,60 +422,169 @@ class ExaoneLLM(BaseLLM):
             print(f"[ERROR] {error_msg}")
             raise RuntimeError(error_msg) from e
 
+    def _load_tokenizer(self) -> None:
+        """토크나이저 로드 (fast 우선, pad_token 없으면 eos로)."""
+        try:
+            self.tokenizer = AutoTokenizer.from_pretrained(
+                self._load_path,
+                trust_remote_code=self.trust_remote_code,
+                use_fast=True,
+                local_files_only=True,
+            )
+        except Exception:
+            self.tokenizer = AutoTokenizer.from_pretrained(
+                self._load_path,
+                trust_remote_code=self.trust_remote_code,
+                local_files_only=True,
+            )
+        if self.tokenizer.pad_token is None:
+            self.tokenizer.pad_token = self.tokenizer.eos_token
+            self.tokenizer.pad_token_id = self.tokenizer.eos_token_id
+
+    def _load_cpu_model(self) -> None:
+        """CPU 백엔드: bf16/fp32 로드 + (선택) Linear 동적 int8 양자화, 스레드 수는 물리 코어 기준."""
+        from core.config import settings  # type: ignore
+        from domain.models.bases.exaone_cpu import (  # type: ignore
+            configure_cpu_threads,
+            quantize_linear_int8,
+            resolve_cpu_dtype,
+        )
+
+        threads = configure_cpu_threads(settings.exaone_cpu_threads)
+        use_int8 = settings.exaone_cpu_int8
+        # quantize_dynamic은 float32 Linear만 변환 → int8이면 float32로 로드
+        dtype = torch.float32 if use_int8 else resolve_cpu_dtype(settings.exaone_cpu_dtype)
+        if self.use_4bit:
+            print("[INFO] CPU 백엔드: bitsandbytes 4-bit는 GPU 전용이라 적용하지 않음")
+
+        self.model = AutoModelForCausalLM.from_pretrained(
+            self._load_path,
+            dtype=dtype,
+            trust_remote_code=self.trust_remote_code,
+            low_cpu_mem_usage=True,
+            attn_implementation="sdpa",
+            use_safetensors=True,
+            local_files_only=True,
+        )
+        self.model.eval()
+        if use_int8:
+            quantize_linear_int8(self.model)
+        self._load_tokenizer()
+
+        print("[OK] EXAONE 모델 로드 완료 (CPU)")
+        print(f"[INFO] 데이터 타입: {dtype}")
+        print(f"[INFO] 양자화: {'동적 int8 (nn.Linear)' if use_int8 else '없음'}")
+        print(f"[INFO] CPU 스레드: {threads}")
+
     def get_langchain_model(self) -> BaseChatModel:
         """LangChain 호환 모델 반환."""
         if self._langchain_model is None:
-            self._langchain_model = ExaoneLangChainWrapper(self.model, self.tokenizer)
+            self._langchain_model = ExaoneLangChainWrapper(
+                self.model,
+                self.tokenizer,
+                scheduler=self.get_scheduler(),
+                prefix_cache=self.get_prefix_cache(),
+            )
         return self._langchain_model
 
+    def get_scheduler(self) -> Optional[Any]:
+        """연속 배칭 스케줄러 (settings.exaone_continuous_batching=True일 때만, 싱글톤)."""
+        from core.config import settings  # type: ignore
+
+        if not settings.exaone_continuous_batching or self.model is None:
+            return None
+        if self._scheduler is None:
+            with self._scheduler_lock:
+                if self._scheduler is None:
+                    from domain.models.bases.exaone_scheduler import ContinuousBatchScheduler  # type: ignore
+
+                    self._scheduler = ContinuousBatchScheduler(
+                        self.model,
+                        max_batch_size=settings.exaone_max_batch_size,
+                        kv_cache_budget_mb=settings.exaone_kv_cache_budget_mb,
+                        eos_token_id=self.tokenizer.eos_token_id if self.tokenizer else None,
+                        prefix_cache=self.get_prefix_cache(),
+                    )
+        return self._scheduler
+
+    def get_prefix_cache(self) -> Optional[Any]:
+        """프롬프트 접두사 KV 캐시 (settings.exaone_prefix_cache=True일 때만, 싱글톤)."""
+        from core.config import settings  # type: ignore
+
+        if not settings.exaone_prefix_cache or self.model is None:
+            return None
+        if self._prefix_cache is None:
+            with self._scheduler_lock:
+                if self._prefix_cache is None:
+                    from domain.models.bases.exaone_prefix_cache import PrefixKVCache  # type: ignore
+
+                    self._prefix_cache = PrefixKVCache(self.model, max_mb=settings.exaone_prefix_cache_mb)
+        return self._prefix_cache
+
+    def _prepare_generation(self, prompt: str, **kwargs) -> Dict[str, Any]:
+        """프롬프트 → generate() kwargs (invoke·stream 공용)."""
+        # EXAONE 채팅 템플릿 사용
+        messages = [{"role": "user", "content": prompt}]
+        input_ids = self.tokenizer.apply_chat_template(
+            messages,
+            tokenize=True,
+            add_generation_prompt=True,
+            return_tensors="pt",
+        ).to(self.model.device)
+
+        # 생성 파라미터
+        max_new_tokens = kwargs.get("max_new_tokens", 2048)
+        temperature = kwargs.get("temperature", 0.7)
+        do_sample = kwargs.get("do_sample", True)
+
+        # 동적 KV 캐시 최적화: 입력 길이에 따라 max_length 조정 (메모리 절약)
+        input_length = input_ids.shape[1]
+        max_length = kwargs.get("max_length", None)
+        if max_length is None:
+            # 동적 조정: 입력 길이에 따라 KV 캐시 크기 결정
+            max_length = get_adaptive_max_length(input_length, max_new_tokens)
+        else:
+            # 사용자가 지정한 경우, 동적 조정과 비교하여 작은 값 사용
+            adaptive_max = get_adaptive_max_length(input_length, max_new_tokens)
+            max_length = min(max_length, adaptive_max)
+
+        return {
+            "input_ids": input_ids,
+            "max_new_tokens": max_new_tokens,
+            "max_length": max_length,  # 동적 KV 캐시 최적화
+            "temperature": temperature if do_sample else None,
+            "do_sample": do_sample,
+            "pad_token_id": self.tokenizer.pad_token_id,
+            "eos_token_id": self.tokenizer.eos_token_id,
+            "use_cache": True,  # KV 캐시 활성화 (속도 향상)
+            "num_beams": 1,  # 그리디 디코딩 (빠른 생성)
+            # 메모리 효율 옵션 추가
+            "output_attentions": False,  # Attention 출력 비활성화 (메모리 절약)
+            "output_hidden_states": False,  # Hidden states 출력 비활성화 (메모리 절약)
+            "return_dict_in_generate": False,  # Dict 대신 Tensor 반환 (메모리 절약)
+        }
+
     def invoke(self, prompt: str, **kwargs) -> str:
         """프롬프트 실행 및 응답 반환."""
         if not self.model or not self.tokenizer:
             raise RuntimeError("모델이 로드되지 않았습니다.")
 
         try:
-            # EXAONE 채팅 템플릿 사용
-            messages = [{"role": "user", "content": prompt}]
-            input_ids = self.tokenizer.apply_chat_template(
-                messages,
-                tokenize=True,
-                add_generation_prompt=True,
-                return_tensors="pt",
-            ).to(self.model.device)
-
-            # 생성 파라미터
-            max_new_tokens = kwargs.get("max_new_tokens", 2048)
-            temperature = kwargs.get("temperature", 0.7)
-            do_sample = kwargs.get("do_sample", True)
-
-            # 동적 KV 캐시 최적화: 입력 길이에 따라 max_length 조정 (메모리 절약)
-            input_length = input_ids.shape[1]
-            max_length = kwargs.get("max_length", None)
-            if max_length is None:
-                # 동적 조정: 입력 길이에 따라 KV 캐시 크기 결정
-                max_length = get_adaptive_max_length(input_length, max_new_tokens)
-            else:
-                # 사용자가 지정한 경우, 동적 조정과 비교하여 작은 값 사용
-                adaptive_max = get_adaptive_max_length(input_length, max_new_tokens)
-                max_length = min(max_length, adaptive_max)
+            generation_kwargs = self._prepare_generation(prompt, **kwargs)
+            input_length = generation_kwargs["input_ids"].shape[1]
+
+            scheduler = self.get_scheduler()
+            if scheduler is not None:
+                # 연속 배칭: 다른 요청과 같은 디코드 배치에서 생성
+                new_ids = scheduler.generate(
+                    generation_kwargs["input_ids"][0].tolist(), **_scheduler_kwargs(generation_kwargs)
+                )
+                return self.tokenizer.decode(new_ids, skip_special_tokens=True).strip()
 
+            _attach_prefix_cache(generation_kwargs, self.get_prefix_cache())
             # 생성 (메모리 효율적인 옵션 적용)
-            with torch.no_grad(), torch.amp.autocast("cuda"):
-                outputs = self.model.generate(
-                    input_ids,
-                    max_new_tokens=max_new_tokens,
-                    max_length=max_length,  # 동적 KV 캐시 최적화
-                    temperature=temperature if do_sample else None,
-                    do_sample=do_sample,
-                    pad_token_id=self.tokenizer.pad_token_id,
-                    eos_token_id=self.tokenizer.eos_token_id,
-                    use_cache=True,  # KV 캐시 활성화 (속도 향상)
-                    num_beams=1,  # 그리디 디코딩 (빠른 생성)
-                    # 메모리 효율 옵션 추가
-                    output_attentions=False,  # Attention 출력 비활성화 (메모리 절약)
-                    output_hidden_states=False,  # Hidden states 출력 비활성화 (메모리 절약)
-                    return_dict_in_generate=False,  # Dict 대신 Tensor 반환 (메모리 절약)
-                )
+            with torch.no_grad(), _autocast(self.model):
+                outputs = self.model.generate(**generation_kwargs)
 
             # 디코딩 (입력 부분 제외)
             generated_text = self.tokenizer.decode(
@@ -427,10 +597,29 @@ class ExaoneLLM(BaseLLM):
             raise RuntimeError(error_msg) from e
 
     def stream(self, prompt: str, **kwargs):
-        """스트리밍 응답 생성."""
-        response = self.invoke(prompt, **kwargs)
-        for chunk in response.split():
-            yield chunk + " "
+        """스트리밍 응답 생성. 생성 스레드의 TextIteratorStreamer에서 나오는 대로 yield (완료 대기 없음)."""
+        if not self.model or not self.tokenizer:
+            raise RuntimeError("모델이 로드되지 않았습니다.")
+
+        generation_kwargs = self._prepare_generation(prompt, **kwargs)
+        scheduler = self.get_scheduler()
+        if scheduler is not None:
+            handle = scheduler.submit(
+                generation_kwargs["input_ids"][0].tolist(), **_scheduler_kwargs(generation_kwargs)
+            )
+            try:
+                yield from handle.iter_text(self.tokenizer)
+            finally:
+                handle.cancel()  # 소비자가 중간에 멈추면 시퀀스 은퇴 (완료 후에는 no-op)
+            return
+        streamer = TextIteratorStreamer(
+            self.tokenizer,
+            skip_prompt=True,
+            skip_special_tokens=True,
+        )
+        generation_kwargs["streamer"] = streamer
+        _attach_prefix_cache(generation_kwargs, self.get_prefix_cache())
+        yield from _iter_streamer(self.model, generation_kwargs, streamer)
 
     def get_model_info(self) -> Dict[str, Any]:
         """모델 정보 반환."""
@@ -450,6 +639,8 @@ class ExaoneLangChainWrapper(BaseChatModel):
     _tokenizer: Any = None
     _tools: List[BaseTool] = []
     _tool_choice: Optional[str] = None
+    _scheduler: Any = None
+    _prefix_cache: Any = None
 
     def __init__(
         self,
@@ -457,12 +648,18 @@ class ExaoneLangChainWrapper(BaseChatModel):
         tokenizer: Any,
         tools: Optional[List[BaseTool]] = None,
         tool_choice: Optional[str] = None,
+        scheduler: Any = None,
+        prefix_cache: Any = None,
     ):
         super().__init__()
         object.__setattr__(self, "_model", model)
         object.__setattr__(self, "_tokenizer", tokenizer)
         object.__setattr__(self, "_tools", tools or [])
         object.__setattr__(self, "_tool_choice", tool_choice)
+        # ContinuousBatchScheduler (없으면 요청마다 model.generate)
+        object.__setattr__(self, "_scheduler", scheduler)
+        # PrefixKVCache (없으면 매번 전체 prefill)
+        object.__setattr__(self, "_prefix_cache", prefix_cache)
 
     def bind_tools(
         self,
@@ -483,12 +680,36 @@ class ExaoneLangChainWrapper(BaseChatModel):
         # BaseTool만 필터링 (dict 형식은 지원하지 않음)
         base_tools = [t for t in tools if isinstance(t, BaseTool)]
 
-        return ExaoneLangChainWrapper(
+        wrapper = ExaoneLangChainWrapper(
             model=self._model,
             tokenizer=self._tokenizer,
             tools=base_tools,
             tool_choice=tool_choice,
+            scheduler=self._scheduler,
+            prefix_cache=self._prefix_cache,
         )
+        # 도구 설명 시스템 프롬프트는 도구 조합별로 고정 → 접두사 KV 등록
+        if base_tools:
+            wrapper.register_prefix(wrapper._create_tool_system_prompt(), role="system")
+        return wrapper
+
+    def register_prefix(self, text: str, role: str = "user") -> bool:
+        """
+        고정 프롬프트 앞부분을 접두사 KV 캐시에 등록. 채팅 템플릿을 적용한 토큰 기준이라
+        같은 role 메시지가 text로 시작하는 요청에서 재사용됨. 캐시가 없거나 실패하면 False.
+        """
+        if self._prefix_cache is None or not text:
+            return False
+        try:
+            token_ids = self._tokenizer.apply_chat_template(
+                [{"role": role, "content": text}], tokenize=True, add_generation_prompt=False
+            )
+            if hasattr(token_ids, "tolist"):
+                token_ids = token_ids.tolist()
+            return self._prefix_cache.register(list(token_ids))
+        except Exception as e:
+            print(f"[WARNING] EXAONE 접두사 캐시 등록 실패: {e}")
+            return False
 
     def _create_tool_system_prompt(self) -> str:
         """도구 설명이 포함된 시스템 프롬프트 생성."""
@@ -518,7 +739,8 @@ class ExaoneLangChainWrapper(BaseChatModel):
                 new_messages = []
                 for msg in messages:
                     if isinstance(msg, SystemMessage):
-                        combined_content = f"{msg.content}\n\n{tool_prompt}"
+                        # 도구 프롬프트를 앞에 두어 요청 간 고정 접두사로 (접두사 KV 캐시 재사용)
+                        combined_content = f"{tool_prompt}\n\n{msg.content}"
                         new_messages.append(SystemMessage(content=combined_content))
                     else:
                         new_messages.append(msg)
@@ -554,29 +776,48 @@ class ExaoneLangChainWrapper(BaseChatModel):
             adaptive_max = get_adaptive_max_length(input_length, max_new_tokens)
             max_length = min(max_length, adaptive_max)
 
-        # 생성 (메모리 효율적인 옵션 적용)
-        with torch.no_grad(), torch.amp.autocast("cuda"):
-            outputs = self._model.generate(
-                input_ids,
-                max_new_tokens=max_new_tokens,
-                max_length=max_length,  # 동적 KV 캐시 최적화
-                temperature=temperature if do_sample else None,
-                do_sample=do_sample,
-                pad_token_id=self._tokenizer.pad_token_id,
-                eos_token_id=self._tokenizer.eos_token_id,
-                use_cache=True,  # KV 캐시 활성화 (속도 향상)
-                num_beams=1,  # 그리디 디코딩 (빠른 생성)
-                # 메모리 효율 옵션 추가
-                output_attentions=False,  # Attention 출력 비활성화 (메모리 절약)
-                output_hidden_states=False,  # Hidden states 출력 비활성화 (메모리 절약)
-                return_dict_in_generate=False,  # Dict 대신 Tensor 반환 (메모리 절약)
+        if self._scheduler is not None:
+            # 연속 배칭: 다른 요청과 같은 디코드 배치에서 생성
+            new_ids = self._scheduler.generate(
+                input_ids[0].tolist(),
+                **_scheduler_kwargs(
+                    {
+                        "input_ids": input_ids,
+                        "max_new_tokens": max_new_tokens,
+                        "max_length": max_length,
+                        "temperature": temperature if do_sample else None,
+                        "do_sample": do_sample,
+                        "eos_token_id": self._tokenizer.eos_token_id,
+                    }
+                ),
             )
+            generated_text = self._tokenizer.decode(new_ids, skip_special_tokens=True).strip()
+        else:
+            # 생성 (메모리 효율적인 옵션 적용)
+            prefix_hit = self._prefix_cache.lookup(input_ids[0].tolist()) if self._prefix_cache else None
+            with torch.no_grad(), _autocast(self._model):
+                outputs = self._model.generate(
+                    input_ids,
+                    past_key_values=prefix_hit[1] if prefix_hit else None,  # 등록 접두사 KV 재사용
+                    max_new_tokens=max_new_tokens,
+                    max_length=max_length,  # 동적 KV 캐시 최적화
+                    temperature=temperature if do_sample else None,
+                    do_sample=do_sample,
+                    pad_token_id=self._tokenizer.pad_token_id,
+                    eos_token_id=self._tokenizer.eos_token_id,
+                    use_cache=True,  # KV 캐시 활성화 (속도 향상)
+                    num_beams=1,  # 그리디 디코딩 (빠른 생성)
+                    # 메모리 효율 옵션 추가
+                    output_attentions=False,  # Attention 출력 비활성화 (메모리 절약)
+                    output_hidden_states=False,  # Hidden states 출력 비활성화 (메모리 절약)
+                    return_dict_in_generate=False,  # Dict 대신 Tensor 반환 (메모리 절약)
+                )
 
-        # 디코딩 (입력 부분 제외)
-        generated_text = self._tokenizer.decode(
-            outputs[0][input_length:], skip_special_tokens=True
-        )
-        generated_text = generated_text.strip()
+            # 디코딩 (입력 부분 제외)
+            generated_text = self._tokenizer.decode(
+                outputs[0][input_length:], skip_special_tokens=True
+            )
+            generated_text = generated_text.strip()
 
         # 도구가 바인딩되어 있으면 JSON 파싱 시도
         tool_calls = []
@@ -650,7 +891,8 @@ class ExaoneLangChainWrapper(BaseChatModel):
                 new_messages = []
                 for msg in messages:
                     if isinstance(msg, SystemMessage):
-                        combined_content = f"{msg.content}\n\n{tool_prompt}"
+                        # 도구 프롬프트를 앞에 두어 요청 간 고정 접두사로 (접두사 KV 캐시 재사용)
+                        combined_content = f"{tool_prompt}\n\n{msg.content}"
                         new_messages.append(SystemMessage(content=combined_content))
                     else:
                         new_messages.append(msg)
@@ -710,25 +952,25 @@ class ExaoneLangChainWrapper(BaseChatModel):
             "return_dict_in_generate": False,  # Dict 대신 Tensor 반환 (메모리 절약)
         }
 
-        # 별도 스레드에서 생성 실행
-        def generate_in_thread():
-            with torch.no_grad(), torch.amp.autocast("cuda"):
-                self._model.generate(**generation_kwargs)
-
-        thread = threading.Thread(target=generate_in_thread)
-        thread.start()
-
-        # 스트리머에서 토큰 읽어서 yield
+        # 별도 스레드(또는 연속 배칭 스케줄러)에서 생성, 토큰 조각을 나오는 대로 yield
+        handle = None
+        if self._scheduler is not None:
+            handle = self._scheduler.submit(input_ids[0].tolist(), **_scheduler_kwargs(generation_kwargs))
+            pieces = handle.iter_text(self._tokenizer)
+        else:
+            _attach_prefix_cache(generation_kwargs, self._prefix_cache)
+            pieces = _iter_streamer(self._model, generation_kwargs, streamer)
         generated_text = ""
-        for new_text in streamer:
-            if new_text:
+        try:
+            for new_text in pieces:
                 generated_text += new_text
                 chunk = ChatGenerationChunk(message=AIMessageChunk(content=new_text))
                 if run_manager:
                     run_manager.on_llm_new_token(new_text, chunk=chunk)
                 yield chunk
-
-        thread.join()
+        finally:
+            if handle is not None:
+                handle.cancel()  # SSE 연결 끊김 등으로 중간 종료 시 배치 자리·KV 예산 반납
 
         # 도구 호출 파싱 (스트리밍 완료 후)
         if self._tools and generated_text:
@@ -0,0 +1,135 @@
+"""
+ExaOne 프롬프트 접두사 KV 캐시.
+
+도구 호출 시스템 프롬프트, analyze_email 템플릿, soccer 요약 프롬프트처럼 매번 같은 앞부분을
+요청마다 다시 prefill 하지 않도록, 등록된 접두사(토큰 id)의 past_key_values를 보관해 재사용.
+
+- register(token_ids): 접두사 prefill 1회 → 레이어별 (k, v) 저장 (이미 있으면 LRU 갱신만).
+- lookup(input_ids): 등록 접두사와 입력의 최장 공통 접두사(LCP) 길이 m만큼 캐시를 잘라 반환.
+  causal attention이라 앞 m토큰의 KV는 뒤 토큰과 무관 → 채팅 템플릿 경계에서 토큰이 달라져도 안전.
+  마지막 입력 토큰은 logits가 필요하므로 항상 남김 (m <= len(input_ids) - 1).
+- max_bytes 초과 시 가장 오래 안 쓴 접두사부터 제거 (LRU).
+
+반환 캐시는 model.generate(past_key_values=...) 또는 forward에 그대로 넘김. 저장 텐서는 수정되지 않음
+(DynamicCache.update는 cat으로 새 텐서를 만듦). 정합성: scripts/exaone_prefix_cache_check.py.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import torch
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_MB = 512.0
+# 이보다 짧게 겹치면 재사용 이득보다 캐시 조립 비용이 큼
+DEFAULT_MIN_REUSE_TOKENS = 16
+
+_KV = Tuple[torch.Tensor, torch.Tensor]
+
+
+def _common_prefix_len(key: torch.Tensor, ids: torch.Tensor) -> int:
+    n = min(key.shape[0], ids.shape[0])
+    if n == 0:
+        return 0
+    return int((key[:n] == ids[:n]).to(torch.int64).cumprod(0).sum())
+
+
+class PrefixKVCache:
+    """등록 접두사 → past_key_values (LRU, 바이트 상한)."""
+
+    def __init__(
+        self,
+        model: Any,
+        *,
+        max_mb: float = DEFAULT_MAX_MB,
+        min_reuse_tokens: int = DEFAULT_MIN_REUSE_TOKENS,
+    ) -> None:
+        self.model = model
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.min_reuse_tokens = max(1, min_reuse_tokens)
+        self._device = getattr(model, "device", torch.device("cpu"))
+        self._lock = threading.Lock()
+        # key(토큰 id 튜플) → (CPU id 텐서, 레이어별 KV, 바이트)
+        self._entries: "OrderedDict[Tuple[int, ...], Tuple[torch.Tensor, List[_KV], int]]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.reused_tokens = 0
+        self.evictions = 0
+
+    def register(self, token_ids: List[int]) -> bool:
+        """접두사 등록 (prefill 1회). 상한보다 크면 등록하지 않고 False."""
+        key = tuple(int(t) for t in token_ids)
+        if len(key) < self.min_reuse_tokens:
+            return False
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return True
+        from domain.models.bases.exaone_scheduler import _cache_layers  # type: ignore
+
+        with torch.no_grad():
+            out = self.model(input_ids=torch.tensor([key], dtype=torch.long, device=self._device), use_cache=True)
+        layers = _cache_layers(out.past_key_values)
+        nbytes = sum(k.numel() * k.element_size() + v.numel() * v.element_size() for k, v in layers)
+        if nbytes > self.max_bytes:
+            logger.warning("[prefix-cache] 접두사 %s토큰(%sB)이 상한을 넘어 등록 생략", len(key), nbytes)
+            return False
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = (torch.tensor(key, dtype=torch.long), layers, nbytes)
+                self._bytes += nbytes
+                self._evict_locked()
+        logger.info("[prefix-cache] 접두사 등록: %s토큰, %.1fMB", len(key), nbytes / (1024 * 1024))
+        return True
+
+    def lookup(self, input_ids: List[int]) -> Optional[Tuple[int, Any]]:
+        """
+        입력과 가장 길게 겹치는 등록 접두사의 KV → (재사용 토큰 수 m, DynamicCache).
+        m < min_reuse_tokens면 None.
+        """
+        from domain.models.bases.exaone_scheduler import _to_model_cache  # type: ignore
+
+        ids = torch.tensor(input_ids, dtype=torch.long)
+        limit = ids.shape[0] - 1
+        best_key = None
+        best_len = 0
+        with self._lock:
+            for key, (key_ids, _layers, _nbytes) in self._entries.items():
+                m = min(_common_prefix_len(key_ids, ids), limit)
+                if m > best_len:
+                    best_key, best_len = key, m
+            if best_key is None or best_len < self.min_reuse_tokens:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(best_key)
+            layers = self._entries[best_key][1]
+            self.hits += 1
+            self.reused_tokens += best_len
+        return best_len, _to_model_cache([(k[:, :, :best_len, :], v[:, :, :best_len, :]) for k, v in layers])
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "prefixes": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "reused_tokens": self.reused_tokens,
+                "evictions": self.evictions,
+            }
+
+    def _evict_locked(self) -> None:
+        while self._bytes > self.max_bytes and self._entries:
+            _key, (_ids, _layers, nbytes) = self._entries.popitem(last=False)
+            self._bytes -= nbytes
+            self.evictions += 1
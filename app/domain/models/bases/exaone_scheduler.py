@@ -0,0 +1,449 @@
+"""
+ExaOne 연속 배칭(continuous batching) 스케줄러.
+
+model.generate는 요청 하나를 끝까지 디코딩하므로 채팅·analyze_email·soccer 요약이 한 GPU에서 줄을 섬.
+ContinuousBatchScheduler는 모델 앞에서 디코드 루프 하나를 돌리며 토큰 경계마다:
+- 대기 중인 시퀀스를 prefill 후 실행 중인 배치에 합류 (max_batch_size, KV 캐시 메모리 예산 안에서)
+- 배치 전체를 한 번의 forward로 1토큰씩 디코딩, 시퀀스별로 토큰을 스트리밍
+- EOS·max_new_tokens·취소로 끝난 시퀀스를 배치에서 제거
+
+배치 KV 캐시는 레이어별 (k, v) [B, H, T, D]를 왼쪽 패딩으로 맞추고 attention_mask로 가림.
+position_ids는 시퀀스별 실제 길이로 넘겨 단일 시퀀스 디코딩과 같은 위치 인코딩을 사용.
+greedy(do_sample=False) 출력은 시퀀스를 혼자 generate 한 결과와 같음 (scripts/exaone_scheduler_check.py).
+"""
+
+import logging
+import queue
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+import torch
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BATCH_SIZE = 8
+DEFAULT_KV_CACHE_BUDGET_MB = 2048.0
+
+_KV = Tuple[torch.Tensor, torch.Tensor]
+
+
+def kv_bytes_per_token(model: Any) -> int:
+    """토큰 1개당 KV 캐시 바이트 (전체 레이어 k+v). EXAONE(num_layers)·Llama(num_hidden_layers) 설정 모두 지원."""
+    config = model.config
+    layers = getattr(config, "num_hidden_layers", None) or getattr(config, "num_layers")
+    heads = config.num_attention_heads
+    kv_heads = getattr(config, "num_key_value_heads", None) or heads
+    head_dim = getattr(config, "head_dim", None) or config.hidden_size // heads
+    dtype = getattr(model, "dtype", torch.float16)
+    if not dtype.is_floating_point:
+        dtype = torch.float16  # 양자화 가중치여도 KV 캐시는 compute dtype
+    element = torch.tensor([], dtype=dtype).element_size()
+    return 2 * layers * kv_heads * head_dim * element
+
+
+def _cache_layers(past: Any) -> List[_KV]:
+    """모델 past_key_values(Cache 또는 레거시 튜플) → 레이어별 (k, v) 리스트."""
+    if hasattr(past, "layers"):  # transformers >= 4.56 Cache
+        return [(layer.keys, layer.values) for layer in past.layers]
+    if hasattr(past, "key_cache"):  # 이전 DynamicCache
+        return list(zip(past.key_cache, past.value_cache))
+    return [(past[i][0], past[i][1]) for i in range(len(past))]
+
+
+def _to_model_cache(layers: List[_KV]) -> Any:
+    """레이어별 (k, v) → DynamicCache (update()는 transformers 버전 간 공통 API)."""
+    from transformers import DynamicCache
+
+    cache = DynamicCache()
+    for i, (k, v) in enumerate(layers):
+        cache.update(k, v, i)
+    return cache
+
+
+def _left_pad(t: torch.Tensor, length: int) -> torch.Tensor:
+    """[B, H, T, D]의 T 앞쪽에 0을 채워 length로."""
+    pad = length - t.shape[2]
+    if pad <= 0:
+        return t
+    zeros = t.new_zeros(t.shape[0], t.shape[1], pad, t.shape[3])
+    return torch.cat([zeros, t], dim=2)
+
+
+class SequenceHandle:
+    """
+    제출한 시퀀스 하나. 반복하면 생성된 토큰 id를 나오는 대로 yield,
+    result()는 완료까지 기다려 전체 생성 토큰 반환. cancel()은 다음 토큰 경계에서 배치에서 제거.
+    """
+
+    def __init__(
+        self,
+        prompt_ids: List[int],
+        max_new_tokens: int,
+        eos_token_ids: Set[int],
+        do_sample: bool,
+        temperature: float,
+    ) -> None:
+        self.prompt_ids = prompt_ids
+        self.max_new_tokens = max_new_tokens
+        self.eos_token_ids = eos_token_ids
+        self.do_sample = do_sample
+        self.temperature = temperature
+        self.generated: List[int] = []
+        self.error: Optional[BaseException] = None
+        self.cancelled = False
+        self._tokens: "queue.Queue[Optional[int]]" = queue.Queue()
+        self._done = threading.Event()
+        # 스케줄러 내부 상태: 캐시에 들어간 토큰 수, 다음 forward 입력 토큰
+        self.cache_len = 0
+        self.last_token: Optional[int] = None
+
+    @property
+    def reserved_tokens(self) -> int:
+        """KV 예산 계산용 최대 길이 (프롬프트 + 최대 생성)."""
+        return len(self.prompt_ids) + self.max_new_tokens
+
+    def cancel(self) -> None:
+        """다음 토큰 경계에서 은퇴 (배치 자리·KV 예산 반납). 이미 끝났으면 아무것도 안 함."""
+        if not self._done.is_set():
+            self.cancelled = True
+
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def result(self, timeout: Optional[float] = None) -> List[int]:
+        """완료까지 대기 후 생성 토큰 id 리스트 (프롬프트 제외)."""
+        if not self._done.wait(timeout):
+            raise TimeoutError("생성 대기 시간 초과")
+        if self.error is not None:
+            raise self.error
+        return list(self.generated)
+
+    def __iter__(self) -> Iterator[int]:
+        # 소비자가 중간에 멈추면(SSE 연결 끊김·제너레이터 close) 아무도 안 읽는 토큰을 계속 만들지 않도록 취소
+        try:
+            while True:
+                token = self._tokens.get()
+                if token is None:
+                    break
+                yield token
+        finally:
+            self.cancel()
+        if self.error is not None:
+            raise self.error
+
+    def iter_text(self, tokenizer: Any, skip_special_tokens: bool = True) -> Iterator[str]:
+        """토큰 스트림 → 텍스트 조각 (누적 디코딩 차이만, 미완성 UTF-8 조각은 다음 토큰까지 보류)."""
+        ids: List[int] = []
+        emitted = ""
+        tokens = iter(self)
+        try:
+            for token in tokens:
+                ids.append(token)
+                text = tokenizer.decode(ids, skip_special_tokens=skip_special_tokens)
+                if text.endswith("�"):
+                    continue
+                if len(text) > len(emitted):
+                    yield text[len(emitted):]
+                    emitted = text
+        finally:
+            tokens.close()  # 중간 종료 시 __iter__의 finally → cancel
+        text = tokenizer.decode(ids, skip_special_tokens=skip_special_tokens)
+        if len(text) > len(emitted):
+            yield text[len(emitted):]
+
+    # --- 스케줄러 전용 ---
+
+    def _emit(self, token: int) -> None:
+        self.generated.append(token)
+        self.last_token = token
+        self._tokens.put(token)
+
+    def _finished(self) -> bool:
+        return (
+            self.cancelled
+            or len(self.generated) >= self.max_new_tokens
+            or (bool(self.generated) and self.generated[-1] in self.eos_token_ids)
+        )
+
+    def _close(self, error: Optional[BaseException] = None) -> None:
+        if self._done.is_set():
+            return
+        self.error = error
+        self._tokens.put(None)
+        self._done.set()
+
+
+class ContinuousBatchScheduler:
+    """토큰 경계에서 시퀀스를 합류·제거하는 디코드 루프 (백그라운드 스레드 1개)."""
+
+    def __init__(
+        self,
+        model: Any,
+        *,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        kv_cache_budget_mb: float = DEFAULT_KV_CACHE_BUDGET_MB,
+        eos_token_id: Union[int, Iterable[int], None] = None,
+        prefix_cache: Optional[Any] = None,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size는 1 이상이어야 합니다.")
+        self.model = model
+        # PrefixKVCache: prefill 시 등록 접두사 KV 재사용
+        self.prefix_cache = prefix_cache
+        self.max_batch_size = max_batch_size
+        self.kv_cache_budget_bytes = int(kv_cache_budget_mb * 1024 * 1024)
+        self.bytes_per_token = kv_bytes_per_token(model)
+        self.default_eos = self._eos_set(
+            eos_token_id if eos_token_id is not None else getattr(model.generation_config, "eos_token_id", None)
+        )
+        self._device = getattr(model, "device", torch.device("cpu"))
+        self._cv = threading.Condition()
+        self._waiting: Deque[SequenceHandle] = deque()
+        self._active: List[SequenceHandle] = []
+        self._cache: Optional[List[_KV]] = None
+        self._mask: Optional[torch.Tensor] = None
+        self._stopped = False
+        self._thread: Optional[threading.Thread] = None
+        self.steps = 0
+        self.completed = 0
+        self.max_observed_batch = 0
+
+    # --- 공개 API ---
+
+    def submit(
+        self,
+        input_ids: List[int],
+        max_new_tokens: int = 256,
+        eos_token_id: Union[int, Iterable[int], None] = None,
+        do_sample: bool = False,
+        temperature: float = 1.0,
+    ) -> SequenceHandle:
+        """시퀀스 제출. 반환된 핸들로 토큰 스트리밍(iter)·완료 대기(result)."""
+        if not input_ids:
+            raise ValueError("input_ids가 비어 있습니다.")
+        eos = self._eos_set(eos_token_id) if eos_token_id is not None else self.default_eos
+        handle = SequenceHandle(list(input_ids), max(1, max_new_tokens), eos, do_sample, temperature)
+        if handle.reserved_tokens * self.bytes_per_token > self.kv_cache_budget_bytes:
+            raise ValueError(
+                f"시퀀스 하나가 KV 캐시 예산을 초과합니다 ({handle.reserved_tokens} tokens, "
+                f"budget={self.kv_cache_budget_bytes // (1024 * 1024)}MB)"
+            )
+        with self._cv:
+            if self._stopped:
+                raise RuntimeError("스케줄러가 종료되었습니다.")
+            self._waiting.append(handle)
+            self._ensure_thread()
+            self._cv.notify()
+        return handle
+
+    def generate(self, input_ids: List[int], **kwargs: Any) -> List[int]:
+        """submit 후 완료까지 대기 (model.generate 대체, 생성 토큰만 반환)."""
+        return self.submit(input_ids, **kwargs).result()
+
+    def close(self) -> None:
+        """루프 종료. 대기·실행 중 시퀀스는 오류로 종료."""
+        with self._cv:
+            self._stopped = True
+            self._cv.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cv:
+            return {
+                "active": len(self._active),
+                "waiting": len(self._waiting),
+                "cache_tokens": 0 if self._mask is None else int(self._mask.shape[1]),
+                "steps": self.steps,
+                "completed": self.completed,
+                "max_observed_batch": self.max_observed_batch,
+                "max_batch_size": self.max_batch_size,
+                "kv_cache_budget_mb": self.kv_cache_budget_bytes / (1024 * 1024),
+            }
+
+    # --- 루프 ---
+
+    @staticmethod
+    def _eos_set(eos: Union[int, Iterable[int], None]) -> Set[int]:
+        if eos is None:
+            return set()
+        if isinstance(eos, int):
+            return {eos}
+        return {int(e) for e in eos}
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._loop, name="exaone-batch", daemon=True)
+            self._thread.start()
+
+    def _fits_locked(self, pending: List[SequenceHandle], candidate: SequenceHandle) -> bool:
+        """왼쪽 패딩 배치이므로 (시퀀스 수 × 최장 예약 길이)로 예산 확인."""
+        seqs = self._active + pending + [candidate]
+        if len(seqs) > self.max_batch_size:
+            return False
+        longest = max(s.reserved_tokens for s in seqs)
+        return len(seqs) * longest * self.bytes_per_token <= self.kv_cache_budget_bytes
+
+    def _admit_locked(self) -> List[SequenceHandle]:
+        admitted: List[SequenceHandle] = []
+        while self._waiting:
+            head = self._waiting[0]
+            if head.cancelled:
+                self._waiting.popleft()._close()
+                continue
+            # FIFO: 앞 시퀀스가 안 들어가면 뒤도 기다림 (긴 요청 기아 방지)
+            if not self._fits_locked(admitted, head):
+                break
+            admitted.append(self._waiting.popleft())
+        return admitted
+
+    def _loop(self) -> None:
+        while True:
+            with self._cv:
+                while not self._stopped and not self._waiting and not self._active:
+                    self._cv.wait()
+                if self._stopped:
+                    self._fail_all_locked(RuntimeError("스케줄러가 종료되었습니다."))
+                    return
+                admitted = self._admit_locked()
+            try:
+                with torch.no_grad():
+                    for handle in admitted:
+                        self._prefill(handle)
+                    if self._active:
+                        self._decode_step()
+            except Exception as e:
+                logger.exception("[ExaOne batch] 디코드 실패: %s", e)
+                with self._cv:
+                    for handle in admitted:
+                        handle._close(e)
+                    for handle in self._active:
+                        handle._close(e)
+                    self._active = []
+                    self._cache = None
+                    self._mask = None
+
+    def _fail_all_locked(self, error: BaseException) -> None:
+        for handle in list(self._waiting) + self._active:
+            handle._close(error)
+        self._waiting.clear()
+        self._active = []
+        self._cache = None
+        self._mask = None
+
+    def _next_tokens(self, logits: torch.Tensor, handles: List[SequenceHandle]) -> List[int]:
+        """[B, V] 마지막 위치 logits → 시퀀스별 다음 토큰 (greedy 또는 temperature·top-k/p 샘플링)."""
+        tokens: List[int] = []
+        for row, handle in zip(logits, handles):
+            if not handle.do_sample or handle.temperature <= 0:
+                tokens.append(int(torch.argmax(row)))
+                continue
+            scores = self._warp(row.float().unsqueeze(0) / handle.temperature)
+            probs = torch.softmax(scores, dim=-1)
+            tokens.append(int(torch.multinomial(probs, 1)[0, 0]))
+        return tokens
+
+    def _warp(self, scores: torch.Tensor) -> torch.Tensor:
+        """generation_config의 top_k·top_p 적용 (model.generate 샘플링과 같은 기준)."""
+        from transformers.generation.logits_process import TopKLogitsWarper, TopPLogitsWarper
+
+        config = self.model.generation_config
+        top_k = getattr(config, "top_k", None)
+        top_p = getattr(config, "top_p", None)
+        if top_k:
+            scores = TopKLogitsWarper(top_k=top_k)(None, scores)
+        if top_p is not None and top_p < 1.0:
+            scores = TopPLogitsWarper(top_p=top_p)(None, scores)
+        return scores
+
+    def _prefill(self, handle: SequenceHandle) -> None:
+        """프롬프트 인코딩 → 첫 토큰 생성 → 끝나지 않았으면 배치 캐시에 합류."""
+        input_ids = torch.tensor([handle.prompt_ids], dtype=torch.long, device=self._device)
+        hit = self.prefix_cache.lookup(handle.prompt_ids) if self.prefix_cache is not None else None
+        if hit is not None:
+            reused, past = hit
+            out = self.model(input_ids=input_ids[:, reused:], past_key_values=past, use_cache=True)
+        else:
+            out = self.model(input_ids=input_ids, use_cache=True)
+        handle.cache_len = len(handle.prompt_ids)
+        handle._emit(self._next_tokens(out.logits[:, -1, :], [handle])[0])
+        if handle._finished():
+            self._retire(handle)
+            return
+        self._join(handle, _cache_layers(out.past_key_values))
+
+    def _join(self, handle: SequenceHandle, layers: List[_KV]) -> None:
+        """새 시퀀스 캐시 [1, H, L, D]를 배치 캐시 [B, H, T, D]에 합침 (짧은 쪽 왼쪽 패딩)."""
+        length = layers[0][0].shape[2]
+        row_mask = torch.ones(1, length, dtype=torch.long, device=self._device)
+        with self._cv:
+            if self._cache is None or self._mask is None:
+                self._cache, self._mask = layers, row_mask
+            else:
+                total = max(length, self._mask.shape[1])
+                self._cache = [
+                    (
+                        torch.cat([_left_pad(bk, total), _left_pad(k, total)], dim=0),
+                        torch.cat([_left_pad(bv, total), _left_pad(v, total)], dim=0),
+                    )
+                    for (bk, bv), (k, v) in zip(self._cache, layers)
+                ]
+                self._mask = torch.cat(
+                    [
+                        torch.nn.functional.pad(self._mask, (total - self._mask.shape[1], 0)),
+                        torch.nn.functional.pad(row_mask, (total - length, 0)),
+                    ],
+                    dim=0,
+                )
+            self._active.append(handle)
+            self.max_observed_batch = max(self.max_observed_batch, len(self._active))
+
+    def _decode_step(self) -> None:
+        """실행 중인 모든 시퀀스를 1토큰씩 (forward 1회), 끝난 시퀀스 제거."""
+        active = list(self._active)
+        assert self._cache is not None and self._mask is not None
+        input_ids = torch.tensor([[h.last_token] for h in active], dtype=torch.long, device=self._device)
+        position_ids = torch.tensor([[h.cache_len] for h in active], dtype=torch.long, device=self._device)
+        mask = torch.cat([self._mask, self._mask.new_ones(len(active), 1)], dim=1)
+        out = self.model(
+            input_ids=input_ids,
+            attention_mask=mask,
+            position_ids=position_ids,
+            past_key_values=_to_model_cache(self._cache),
+            use_cache=True,
+        )
+        self.steps += 1
+        tokens = self._next_tokens(out.logits[:, -1, :], active)
+        keep: List[int] = []
+        for i, (handle, token) in enumerate(zip(active, tokens)):
+            handle.cache_len += 1
+            if handle.cancelled:
+                self._retire(handle)
+                continue
+            handle._emit(token)
+            if handle._finished():
+                self._retire(handle)
+            else:
+                keep.append(i)
+
+        layers = _cache_layers(out.past_key_values)
+        with self._cv:
+            if not keep:
+                self._active, self._cache, self._mask = [], None, None
+                return
+            if len(keep) < len(active):
+                index = torch.tensor(keep, device=self._device)
+                layers = [(k.index_select(0, index), v.index_select(0, index)) for k, v in layers]
+                mask = mask.index_select(0, index)
+                # 제거된 최장 시퀀스 때문에 남은 앞쪽 전부-패딩 열 제거
+                start = int(torch.nonzero(mask.sum(dim=0))[0])
+                if start > 0:
+                    layers = [(k[:, :, start:, :], v[:, :, start:, :]) for k, v in layers]
+                    mask = mask[:, start:]
+            self._active = [active[i] for i in keep]
+            self._cache, self._mask = layers, mask
+
+    def _retire(self, handle: SequenceHandle) -> None:
+        handle._close()
+        self.completed += 1
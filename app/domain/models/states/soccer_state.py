@@ -35,6 +35,8 @@ class SoccerDataState(TypedDict, total=False):
     validated_data: Optional[List[Dict[str, Any]]]  # 검증된 데이터
     transformed_data: Optional[List[Dict[str, Any]]]  # 변환된 데이터
     saved_count: Optional[int]  # DB 저장된 개수
+    write_plan: Optional[List[List[Dict[str, Any]]]]  # 저장할 chunk 목록 (Process 노드가 생성, Save 노드만 DB 쓰기)
+    pending_chunks: Optional[List[int]]  # 아직 저장되지 않은 write_plan 인덱스 (재시도 대상)
 
     # 메타데이터
     data_type: str  # 데이터 타입 ("players", "teams", "stadiums", "schedules")
@@ -117,3 +119,6 @@ class EmbeddingSyncState(TypedDict, total=False):
     current_entity_index: int
     processing_path: str
     errors: Optional[List[Dict[str, Any]]]
+    on_entity_done: Any  # Optional[Callable[[str, Dict[str, Any]], None]] - 엔티티별 진행률 보고
+    parallel: bool  # True면 ProcessParallel (엔티티 동시 + 공유 인코더)
+    session_factory: Any  # 파이프라인 모드에서 엔티티 스레드별 세션 생성 (기본 SessionLocal)
@@ -2,6 +2,7 @@
 도메인 공통 인프라 (Soccer·Disclosure 등 여러 spoke에서 사용).
 
 - embedding: FlagEmbedding BGE-m3 래퍼 및 get_embedding_model
+- query_batcher: 동시 embed_query 마이크로 배칭 (get_query_embedder)
 """
 
 from .embedding import (
@@ -9,9 +10,15 @@ from .embedding import (
     FlagEmbeddingWrapper,
     get_embedding_model,
 )
+from .query_batcher import (
+    BatchingQueryEmbedder,
+    get_query_embedder,
+)
 
 __all__ = [
     "BGE_M3_DENSE_DIM",
+    "BatchingQueryEmbedder",
     "FlagEmbeddingWrapper",
     "get_embedding_model",
+    "get_query_embedder",
 ]
@@ -6,7 +6,8 @@ LangChain Embeddings 인터페이스(embed_documents, embed_query) 제공.
 """
 
 import warnings
-from typing import Dict, List, Optional, Tuple
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
 # BGE-m3 Dense 출력 차원 (1024)
 BGE_M3_DENSE_DIM = 1024
@@ -78,22 +79,29 @@ class FlagEmbeddingWrapper:
             return [row.tolist() for row in dense]
         return [list(row) for row in dense]
 
-    def embed_query(self, text: str) -> List[float]:
-        """단일 쿼리를 Dense 1024차원 벡터로 임베딩."""
+    def embed_queries(self, texts: List[str]) -> List[List[float]]:
+        """쿼리 리스트를 encode_queries 한 번으로 Dense 1024차원 벡터로 임베딩 (입력 순서 유지)."""
+        if not texts:
+            return []
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", UserWarning)
             warnings.simplefilter("ignore", FutureWarning)
-            result = self._model.encode_queries([text], return_dense=True, return_sparse=False)
+            result = self._model.encode_queries(texts, return_dense=True, return_sparse=False)
         dense = result.get("dense_vecs")
         if dense is None:
             return []
         import numpy as np
 
         if isinstance(dense, np.ndarray):
-            if dense.ndim == 2:
-                return dense[0].tolist()
-            return dense.tolist()
-        return list(dense[0]) if dense else []
+            if dense.ndim == 1:
+                return [dense.tolist()]
+            return [row.tolist() for row in dense]
+        return [list(row) for row in dense]
+
+    def embed_query(self, text: str) -> List[float]:
+        """단일 쿼리를 Dense 1024차원 벡터로 임베딩."""
+        vectors = self.embed_queries([text])
+        return vectors[0] if vectors else []
 
 
 # (model_name, use_fp16) → 인스턴스 캐시 (재로딩 방지)
@@ -149,6 +157,31 @@ def get_disclosure_embedding_model() -> Optional["FlagEmbeddingWrapper"]:
         return None
 
 
+# 로컬 체크포인트일 때 버전에 반영할 파일 (바뀌면 저장된 쿼리 임베딩 무효)
+_MODEL_VERSION_FILES = ("config.json", "model.safetensors", "pytorch_model.bin", "tokenizer.json")
+
+
+def get_embedding_model_version(model_name: Optional[str] = None) -> str:
+    """
+    임베딩 모델 버전 문자열 (미리 계산한 벡터의 유효성 판단용, 모델 로드 없음).
+    모델 이름 + Dense 차원, 로컬 디렉터리면 주요 파일 mtime·크기까지 포함.
+    """
+    if model_name is None:
+        from core.config import get_settings  # type: ignore
+
+        model_name = get_settings().default_embedding_model
+    parts = [model_name, f"dense{BGE_M3_DENSE_DIM}"]
+    base = Path(model_name)
+    if base.is_dir():
+        for name in _MODEL_VERSION_FILES:
+            try:
+                st = (base / name).stat()
+            except OSError:
+                continue
+            parts.append(f"{name}:{st.st_mtime_ns}:{st.st_size}")
+    return "|".join(parts)
+
+
 def preload_disclosure_embedding_model() -> bool:
     """서버 기동 시 disclosure용 BGE를 미리 로드. 성공 여부 반환."""
     model = get_disclosure_embedding_model()
@@ -0,0 +1,181 @@
+"""
+쿼리 임베딩 마이크로 배칭 — 동시 embed_query 호출을 모아 encode_queries 한 번으로 처리.
+
+채팅 RAG·공시 확인·anchor 검색이 동시에 들어오면 각각 BGE-m3 forward를 한 번씩 돌던 것을,
+max_wait_ms 동안(또는 max_batch_size가 찰 때까지) 모아서 한 배치로 인코딩하고 호출자별 벡터를 돌려줌.
+
+- 동기 호출자(LangGraph 노드·BackgroundTasks 스레드): embed_query (결과 나올 때까지 블록).
+- 비동기 호출자(async 핸들러): await aembed_query (이벤트 루프 블록 없음).
+- 인코더: embed_queries(List[str]) → List[vector] (FlagEmbeddingWrapper). 없으면 embed_query 반복.
+"""
+
+import asyncio
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BATCH_SIZE = 32
+DEFAULT_MAX_WAIT_MS = 5.0
+
+_Item = Tuple[str, "Future[List[float]]"]
+# 워커 종료 신호
+_STOP = None
+
+
+class BatchingQueryEmbedder:
+    """embed_query 마이크로 배처. 워커 스레드 1개가 큐에서 요청을 모아 인코더를 호출."""
+
+    def __init__(
+        self,
+        encoder: Any,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_ms: float = DEFAULT_MAX_WAIT_MS,
+    ):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size는 1 이상이어야 합니다.")
+        self._encoder = encoder
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self._queue: "queue.Queue[Optional[_Item]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        self._closed = False
+        # 통계: 요청 수, encode 호출(배치) 수, 최대 배치 크기
+        self.requests = 0
+        self.batches = 0
+        self.max_observed_batch = 0
+
+    # --- 공개 API ---
+
+    def submit(self, text: str) -> "Future[List[float]]":
+        """쿼리 하나를 큐에 넣고 Future 반환."""
+        fut: "Future[List[float]]" = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("BatchingQueryEmbedder가 이미 종료되었습니다.")
+            self._ensure_worker()
+            self.requests += 1
+            self._queue.put((text, fut))
+        return fut
+
+    def embed_query(self, text: str) -> List[float]:
+        """동기 호출: 배치 처리 결과를 기다려 벡터 반환."""
+        return self.submit(text).result()
+
+    async def aembed_query(self, text: str) -> List[float]:
+        """비동기 호출: 이벤트 루프를 막지 않고 벡터 반환."""
+        return await asyncio.wrap_future(self.submit(text))
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """문서 임베딩은 이미 배치 입력이므로 인코더에 그대로 위임 (LangChain Embeddings 호환)."""
+        return self._encoder.embed_documents(texts)
+
+    def stats(self) -> Dict[str, Any]:
+        """요청 수·배치 수·평균/최대 배치 크기."""
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "avg_batch_size": (self.requests / self.batches) if self.batches else 0.0,
+            "max_batch_size": self.max_observed_batch,
+        }
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """남은 요청 처리 후 워커 종료."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            worker = self._worker
+            self._queue.put(_STOP)
+        if worker is not None:
+            worker.join(timeout)
+
+    # --- 내부 ---
+
+    def _ensure_worker(self) -> None:
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._run, name="query-embed-batcher", daemon=True)
+            self._worker.start()
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is _STOP:
+                return
+            batch: List[_Item] = [first]
+            stop = False
+            deadline = time.monotonic() + self.max_wait_ms / 1000.0
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+                batch.append(item)
+            self._flush(batch)
+            if stop:
+                return
+
+    def _encode(self, texts: List[str]) -> List[List[float]]:
+        if hasattr(self._encoder, "embed_queries"):
+            return self._encoder.embed_queries(texts)
+        return [self._encoder.embed_query(t) for t in texts]
+
+    def _flush(self, batch: List[_Item]) -> None:
+        # 취소된 Future는 제외
+        live = [(text, fut) for text, fut in batch if fut.set_running_or_notify_cancel()]
+        if not live:
+            return
+        self.batches += 1
+        self.max_observed_batch = max(self.max_observed_batch, len(live))
+        try:
+            vectors = self._encode([text for text, _ in live])
+            if len(vectors) != len(live):
+                raise RuntimeError(f"인코더 출력 개수 불일치: 입력 {len(live)}, 출력 {len(vectors)}")
+        except Exception as e:
+            logger.warning("[QueryBatcher] 배치(%s건) 인코딩 실패: %s", len(live), e)
+            for _, fut in live:
+                fut.set_exception(e)
+            return
+        for (_, fut), vec in zip(live, vectors):
+            fut.set_result(vec)
+
+
+_query_embedder: Optional[BatchingQueryEmbedder] = None
+_query_embedder_lock = threading.Lock()
+
+
+def get_query_embedder() -> Optional[BatchingQueryEmbedder]:
+    """
+    서버 공용 쿼리 임베더 (disclosure용 BGE-m3 위에 마이크로 배칭). 모델 로드 실패 시 None.
+    배치 크기·대기 시간은 core.config(EMBEDDING_QUERY_BATCH_SIZE, EMBEDDING_QUERY_MAX_WAIT_MS).
+    """
+    global _query_embedder
+    if _query_embedder is not None:
+        return _query_embedder
+    with _query_embedder_lock:
+        if _query_embedder is not None:
+            return _query_embedder
+        from core.config import get_settings  # type: ignore
+        from domain.shared.embedding import get_disclosure_embedding_model  # type: ignore
+
+        model = get_disclosure_embedding_model()
+        if model is None:
+            return None
+        settings = get_settings()
+        _query_embedder = BatchingQueryEmbedder(
+            model,
+            max_batch_size=settings.embedding_query_batch_size,
+            max_wait_ms=settings.embedding_query_max_wait_ms,
+        )
+        return _query_embedder
@@ -1,15 +1,20 @@
 """Soccer Spokes Services 모듈
 
 - Rule 기반 엔티티 처리: PlayerService, ScheduleService, StadiumService, TeamService.
-- 임베딩: embedding_service.fill_embeddings_for_entity / run_embedding_sync_single_entity (단일 테이블 베이스 컬럼 채움).
+- 쓰기 계획(오케스트레이터 단일 저장 노드용): build_write_plan, save_write_plan_chunk, fill_embeddings_after_save.
+- 임베딩: embedding_service.fill_embeddings_for_entity / run_embedding_sync_single_entity (단일 테이블 베이스 컬럼 채움),
+  fill_embeddings_pipelined (여러 엔티티 동시 + 공유 인코더 혼합 배치).
 """
 
-from .embedding_service import run_embedding_sync_single_entity  # type: ignore
+from .embedding_service import fill_embeddings_pipelined, run_embedding_sync_single_entity  # type: ignore
 from .soccer_service import (  # type: ignore
     PlayerService,
     ScheduleService,
     StadiumService,
     TeamService,
+    build_write_plan,
+    fill_embeddings_after_save,
+    save_write_plan_chunk,
 )
 
 __all__ = [
@@ -17,5 +22,9 @@ __all__ = [
     "ScheduleService",
     "StadiumService",
     "TeamService",
+    "build_write_plan",
+    "fill_embeddings_after_save",
+    "fill_embeddings_pipelined",
     "run_embedding_sync_single_entity",
+    "save_write_plan_chunk",
 ]
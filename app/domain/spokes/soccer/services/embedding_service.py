@@ -7,8 +7,10 @@ BGE-m3 임베딩을 채움. 업로드 직후 또는 수동 동기화 시 호출.
 
 import json
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Any, Dict, List, Optional
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from sqlalchemy.orm import Session  # type: ignore[import-untyped]
 
@@ -58,11 +60,18 @@ def _get_to_embedding_text():
         return _fallback
 
 
+# 고정 지시문을 앞에 두어 엔터티 종류와 무관한 공통 접두사로 (ExaOne 접두사 KV 캐시 재사용)
+_EXAONE_SUMMARY_PREFIX = (
+    "다음 데이터를 RAG와 벡터 검색에 쓸 한 줄 한국어 문장으로 요약해줘. "
+    "다른 설명 없이 해당 문장만 출력해줘.\n"
+)
+
+
 def _to_embedding_text_exaone(record: Dict[str, Any], entity_type: str) -> Optional[str]:
     label = _ENTITY_LABELS.get(entity_type, entity_type)
     prompt = (
-        f"다음 {label} 데이터를 RAG와 벡터 검색에 쓸 한 줄 한국어 문장으로 요약해줘. "
-        "다른 설명 없이 해당 문장만 출력해줘.\n"
+        f"{_EXAONE_SUMMARY_PREFIX}"
+        f"종류: {label}\n"
         f"데이터: {json.dumps(record, ensure_ascii=False)}"
     )
     try:
@@ -77,6 +86,80 @@ def _to_embedding_text_exaone(record: Dict[str, Any], entity_type: str) -> Optio
         return None
 
 
+def _register_summary_prefix() -> None:
+    try:
+        from domain.hub.llm import register_prompt_prefix  # type: ignore
+
+        register_prompt_prefix(_EXAONE_SUMMARY_PREFIX)
+    except Exception:
+        pass
+
+
+def _build_row_contents(row_data: List[Tuple[Dict[str, Any], str, Any]], to_embedding_text: Any) -> List[Tuple[Any, str]]:
+    """(record, entity_type, row) 목록 → (row, content). ExaOne 요약을 병렬 생성, 실패 시 규칙 기반 텍스트."""
+
+    def _content_for_row(rec: Dict[str, Any], entity_type: str) -> tuple:
+        content = _to_embedding_text_exaone(rec, entity_type)
+        if not content:
+            content = to_embedding_text(rec, entity_type)
+        return (content,)
+
+    row_refs: List[Tuple[Any, str]] = []
+    with ThreadPoolExecutor(max_workers=EXAONE_CONTENT_MAX_WORKERS) as executor:
+        future_to_idx = {}
+        for i, (rec, et, row) in enumerate(row_data):
+            future_to_idx[executor.submit(_content_for_row, rec, et)] = (i, row)
+        results: List[Optional[tuple]] = [None] * len(row_data)
+        for future in as_completed(future_to_idx):
+            idx, row = future_to_idx[future]
+            try:
+                results[idx] = future.result()
+            except Exception as e:
+                rec, et, _ = row_data[idx]
+                logger.warning("[embedding] ExaOne/폴백 실패 idx=%s: %s", idx, e)
+                results[idx] = (to_embedding_text(rec, et),)
+        for i, r in enumerate(results):
+            if r:
+                row_refs.append((row_data[i][2], r[0]))
+    return row_refs
+
+
+def _embed_texts(embeddings_model: Any, texts: List[str]) -> Optional[List[Any]]:
+    """embed_documents, 실패 시 embed_query 반복. 둘 다 불가하면 None."""
+    try:
+        return embeddings_model.embed_documents(texts)
+    except Exception as e:
+        logger.warning("[embedding] embed_documents 실패: %s", e)
+        if hasattr(embeddings_model, "embed_query"):
+            return [embeddings_model.embed_query(t) for t in texts]
+        return None
+
+
+def _write_vectors(db: Session, refs: List[Tuple[Any, str]], vectors: List[Any]) -> Tuple[int, int, Optional[str]]:
+    """(row, content)와 벡터를 같은 행에 기록. (processed, failed, 첫 행 오류) 반환."""
+    processed = 0
+    failed = 0
+    first_row_error: Optional[str] = None
+    n = min(len(refs), len(vectors))
+    if n < len(refs):
+        failed += len(refs) - n
+    for (row, content), vec in zip(refs[:n], vectors[:n]):
+        if vec is None:
+            failed += 1
+            continue
+        try:
+            row.embedding_content = content
+            row.embedding = vec
+            db.merge(row)
+            processed += 1
+        except Exception as e:
+            if first_row_error is None:
+                first_row_error = str(e)
+            logger.warning("[embedding] row 저장 실패 id=%s: %s", getattr(row, "id", None), e)
+            failed += 1
+    return processed, failed, first_row_error
+
+
 def fill_embeddings_for_entity(
     db: Session,
     embeddings_model: Any,
@@ -97,67 +180,156 @@ def fill_embeddings_for_entity(
         if not rows:
             return {"processed": 0, "failed": 0}
         row_data = [(_record_to_dict(row), entity_type, row) for row in rows]
+        _register_summary_prefix()
+        row_refs = _build_row_contents(row_data, to_embedding_text)
+        processed = 0
+        failed = 0
+        first_row_error: Optional[str] = None
+        for i in range(0, len(row_refs), batch_size):
+            batch_refs = row_refs[i : i + batch_size]
+            vectors = _embed_texts(embeddings_model, [content for _, content in batch_refs])
+            if vectors is None:
+                failed += len(batch_refs)
+                continue
+            p, f, err = _write_vectors(db, batch_refs, vectors)
+            processed += p
+            failed += f
+            first_row_error = first_row_error or err
+        db.commit()
+        out: Dict[str, Any] = {"processed": processed, "failed": failed}
+        if first_row_error:
+            out["error"] = first_row_error
+        return out
+    except Exception as e:
+        db.rollback()
+        logger.exception("[embedding] %s 처리 중 오류: %s", table_key, e)
+        return {"processed": 0, "failed": 0, "error": str(e)}
+
 
-        def _content_for_row(rec: Dict[str, Any], entity_type: str) -> tuple:
-            content = _to_embedding_text_exaone(rec, entity_type)
-            if not content:
-                content = to_embedding_text(rec, entity_type)
-            return (content,)
-
-        texts = []
-        row_refs = []
-        with ThreadPoolExecutor(max_workers=EXAONE_CONTENT_MAX_WORKERS) as executor:
-            future_to_idx = {}
-            for i, (rec, et, row) in enumerate(row_data):
-                future_to_idx[executor.submit(_content_for_row, rec, et)] = (i, row)
-            results: List[Optional[tuple]] = [None] * len(row_data)
-            for future in as_completed(future_to_idx):
-                idx, row = future_to_idx[future]
+# ---------------------------------------------------------------------------
+# 파이프라인 모드: 엔티티별 스레드(DB 읽기·텍스트 생성·기록) + 공유 인코더(혼합 배치)
+# ---------------------------------------------------------------------------
+
+# 공유 인코더 한 번에 인코딩할 최대 텍스트 수 (여러 엔티티의 청크를 섞어서 채움)
+PIPELINE_ENCODE_BATCH_SIZE = 128
+
+# (엔티티 태그, 텍스트 청크, 결과 Future)
+_EncodeItem = Tuple[str, List[str], "Future[Optional[List[Any]]]"]
+
+
+class SharedBatchEncoder:
+    """
+    엔티티 스레드들이 제출한 텍스트 청크를 모아 embed_documents 한 번으로 인코딩 (워커 스레드 1개).
+    첫 청크를 기다린 뒤 큐에 쌓인 청크를 max_batch_size까지 더 모음 → 엔티티가 섞인 큰 배치.
+    """
+
+    def __init__(self, embeddings_model: Any, max_batch_size: int = PIPELINE_ENCODE_BATCH_SIZE) -> None:
+        self._model = embeddings_model
+        self.max_batch_size = max_batch_size
+        self._queue: "queue.Queue[Optional[_EncodeItem]]" = queue.Queue()
+        # 통계: 인코더 호출 수, 인코딩한 텍스트 수, 여러 엔티티가 섞인 배치 수
+        self.batches = 0
+        self.texts = 0
+        self.mixed_batches = 0
+        self._thread = threading.Thread(target=self._run, name="embedding-sync-encoder", daemon=True)
+        self._thread.start()
+
+    def submit(self, texts: List[str], tag: str = "") -> "Future[Optional[List[Any]]]":
+        fut: "Future[Optional[List[Any]]]" = Future()
+        self._queue.put((tag, texts, fut))
+        return fut
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        carry: Optional[_EncodeItem] = None
+        while True:
+            item = carry if carry is not None else self._queue.get()
+            carry = None
+            if item is None:
+                return
+            batch = [item]
+            size = len(item[1])
+            stop = False
+            while size < self.max_batch_size:
                 try:
-                    results[idx] = future.result()
-                except Exception as e:
-                    rec, et, _ = row_data[idx]
-                    logger.warning("[embedding] ExaOne/폴백 실패 idx=%s: %s", idx, e)
-                    results[idx] = (to_embedding_text(rec, et),)
-            for i, r in enumerate(results):
-                if r:
-                    content = r[0]
-                    row = row_data[i][2]
-                    row_refs.append((row, content))
-                    texts.append(content)
+                    nxt = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if nxt is None:
+                    stop = True
+                    break
+                if size + len(nxt[1]) > self.max_batch_size:
+                    carry = nxt
+                    break
+                batch.append(nxt)
+                size += len(nxt[1])
+            self._encode(batch)
+            if stop:
+                return
+
+    def _encode(self, batch: List[_EncodeItem]) -> None:
+        texts = [t for _, chunk, _ in batch for t in chunk]
+        self.batches += 1
+        self.texts += len(texts)
+        if len({tag for tag, _, _ in batch}) > 1:
+            self.mixed_batches += 1
+        try:
+            vectors = _embed_texts(self._model, texts)
+        except Exception as e:
+            for _, _, fut in batch:
+                fut.set_exception(e)
+            return
+        offset = 0
+        for _, chunk, fut in batch:
+            fut.set_result(None if vectors is None else vectors[offset : offset + len(chunk)])
+            offset += len(chunk)
+
+    def stats(self) -> Dict[str, int]:
+        return {"batches": self.batches, "texts": self.texts, "mixed_batches": self.mixed_batches}
+
+
+def _fill_entity_pipelined(
+    session_factory: Callable[[], Session],
+    encoder: SharedBatchEncoder,
+    table_key: str,
+    chunk_size: int,
+    to_embedding_text: Any,
+) -> Dict[str, Any]:
+    """엔티티 하나: 자기 세션으로 NULL 행 읽기 → 청크별 텍스트 생성·인코더 제출 → 순서대로 기록·커밋."""
+    if table_key not in _ENTITY_MAP:
+        return {"processed": 0, "failed": 0, "error": f"알 수 없는 엔티티: {table_key}"}
+    BaseModel, entity_type = _ENTITY_MAP[table_key]
+    db = session_factory()  # Session은 스레드 간 공유 불가 → 엔티티마다 별도 세션
+    try:
+        rows = db.query(BaseModel).filter(BaseModel.embedding.is_(None)).all()
+        if not rows:
+            return {"processed": 0, "failed": 0}
+        # 다음 청크 텍스트를 만드는 동안 앞 청크는 인코더에서 처리됨
+        submitted = []
+        for i in range(0, len(rows), chunk_size):
+            row_data = [(_record_to_dict(row), entity_type, row) for row in rows[i : i + chunk_size]]
+            refs = _build_row_contents(row_data, to_embedding_text)
+            submitted.append((refs, encoder.submit([content for _, content in refs], tag=table_key)))
         processed = 0
         failed = 0
         first_row_error: Optional[str] = None
-        for i in range(0, len(texts), batch_size):
-            batch_texts = texts[i : i + batch_size]
-            batch_refs = row_refs[i : i + batch_size]
+        for refs, fut in submitted:
             try:
-                vectors = embeddings_model.embed_documents(batch_texts)
+                vectors = fut.result()
             except Exception as e:
-                logger.warning("[embedding] embed_documents 실패: %s", e)
-                if hasattr(embeddings_model, "embed_query"):
-                    vectors = [embeddings_model.embed_query(t) for t in batch_texts]
-                else:
-                    failed += len(batch_texts)
-                    continue
-            n = min(len(batch_refs), len(vectors))
-            if n < len(batch_refs):
-                failed += len(batch_refs) - n
-            for (row, content), vec in zip(batch_refs[:n], vectors[:n]):
-                if vec is None:
-                    failed += 1
-                    continue
-                try:
-                    row.embedding_content = content
-                    row.embedding = vec
-                    db.merge(row)
-                    processed += 1
-                except Exception as e:
-                    if first_row_error is None:
-                        first_row_error = str(e)
-                    logger.warning("[embedding] row 저장 실패 id=%s: %s", getattr(row, "id", None), e)
-                    failed += 1
-        db.commit()
+                logger.warning("[embedding] %s 인코딩 실패: %s", table_key, e)
+                vectors = None
+            if vectors is None:
+                failed += len(refs)
+                continue
+            p, f, err = _write_vectors(db, refs, vectors)
+            processed += p
+            failed += f
+            first_row_error = first_row_error or err
+            db.commit()  # 청크마다 커밋 → 중단돼도 다음 실행은 남은 NULL 행부터
         out: Dict[str, Any] = {"processed": processed, "failed": failed}
         if first_row_error:
             out["error"] = first_row_error
@@ -166,6 +338,42 @@ def fill_embeddings_for_entity(
         db.rollback()
         logger.exception("[embedding] %s 처리 중 오류: %s", table_key, e)
         return {"processed": 0, "failed": 0, "error": str(e)}
+    finally:
+        db.close()
+
+
+def fill_embeddings_pipelined(
+    session_factory: Callable[[], Session],
+    embeddings_model: Any,
+    table_keys: List[str],
+    chunk_size: int = 32,
+    encode_batch_size: int = PIPELINE_ENCODE_BATCH_SIZE,
+    on_entity_done: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    여러 엔티티를 동시에 동기화. 엔티티별 스레드가 DB 읽기·텍스트 생성·기록을 하고,
+    인코딩은 SharedBatchEncoder 하나가 엔티티를 섞은 배치(encode_batch_size)로 처리.
+    on_entity_done(table_key, result)은 엔티티가 끝나는 순서대로 호출 스레드에서 호출.
+    """
+    to_embedding_text = _get_to_embedding_text()
+    _register_summary_prefix()
+    encoder = SharedBatchEncoder(embeddings_model, max_batch_size=encode_batch_size)
+    results: Dict[str, Dict[str, Any]] = {}
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, len(table_keys)), thread_name_prefix="embedding-sync") as pool:
+            futures = {
+                pool.submit(_fill_entity_pipelined, session_factory, encoder, key, chunk_size, to_embedding_text): key
+                for key in table_keys
+            }
+            for future in as_completed(futures):
+                key = futures[future]
+                results[key] = future.result()
+                if on_entity_done is not None:
+                    on_entity_done(key, results[key])
+    finally:
+        encoder.close()
+    logger.info("[embedding] 파이프라인 동기화 완료 encoder=%s", encoder.stats())
+    return {key: results[key] for key in table_keys if key in results}
 
 
 def run_embedding_sync_single_entity(
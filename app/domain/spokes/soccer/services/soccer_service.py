@@ -8,9 +8,13 @@
 
 명확한 규칙에 따라 검증된 데이터를 관계형 DB에 저장합니다. Hub의 Repository를 사용합니다.
 가이드: 업로드 직후 베이스 테이블의 embedding 컬럼을 채움 (단일 테이블).
+
+오케스트레이터 그래프용 쓰기 계획:
+- build_write_plan: 행을 chunk 리스트로 분할 (DB 접근 없음).
+- save_write_plan_chunk: chunk 하나를 SAVEPOINT 안에서 저장 → 실패한 chunk만 롤백·재시도 가능.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from sqlalchemy.orm import Session
 
@@ -23,7 +27,7 @@ from domain.hub.repositories import (  # type: ignore
 )
 
 
-def _fill_embeddings_after_save(db: Session, table_key: str) -> Dict[str, Any]:
+def fill_embeddings_after_save(db: Session, table_key: str) -> Dict[str, Any]:
     """저장 직후 embedding이 null인 행만 채움."""
     try:
         from domain.shared.embedding import get_embedding_model  # type: ignore
@@ -34,6 +38,38 @@ def _fill_embeddings_after_save(db: Session, table_key: str) -> Dict[str, Any]:
         return {"processed": 0, "failed": 0, "error": str(e)}
 
 
+_REPOSITORIES: Dict[str, Any] = {
+    "players": PlayerRepository,
+    "schedules": ScheduleRepository,
+    "stadiums": StadiumRepository,
+    "teams": TeamRepository,
+}
+
+
+def build_write_plan(
+    data: List[Dict[str, Any]],
+    chunk_size: Optional[int] = None,
+) -> List[List[Dict[str, Any]]]:
+    """저장할 행을 chunk 단위 쓰기 계획으로 분할. chunk_size 기본값은 db_batch_chunk_size."""
+    size = chunk_size or get_settings().db_batch_chunk_size
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+def save_write_plan_chunk(table_key: str, chunk: List[Dict[str, Any]], db: Session) -> int:
+    """
+    쓰기 계획 chunk 하나를 SAVEPOINT 안에서 저장하고 저장 행 수 반환.
+    실패 시 이 chunk만 롤백되고 예외 전파 (앞서 저장한 chunk는 트랜잭션에 유지). commit은 호출자.
+    """
+    repo_cls = _REPOSITORIES.get(table_key)
+    if repo_cls is None:
+        raise ValueError(f"알 수 없는 table_key: {table_key}")
+    if not chunk:
+        return 0
+    settings = get_settings()
+    with db.begin_nested():
+        return repo_cls().save_batch(chunk, db, chunk_size=len(chunk), bulk=settings.db_bulk_upsert)
+
+
 class PlayerService:
     """선수 데이터 Rule 기반 처리 Service.
 
@@ -50,13 +86,15 @@ class PlayerService:
         """검증된 선수 데이터를 관계형 DB에 저장합니다."""
         if not db or not data:
             return {"db": 0, "vector": 0}
-        chunk_size = get_settings().db_batch_chunk_size
+        settings = get_settings()
         repo = PlayerRepository()
-        saved = repo.save_batch(data, db, chunk_size=chunk_size)
+        saved = repo.save_batch(
+            data, db, chunk_size=settings.db_batch_chunk_size, bulk=settings.db_bulk_upsert
+        )
         if auto_commit:
             try:
                 db.commit()
-                fill_result = _fill_embeddings_after_save(db, "players")
+                fill_result = fill_embeddings_after_save(db, "players")
                 return {"db": saved, "vector": fill_result.get("processed", 0)}
             except Exception:
                 db.rollback()
@@ -80,13 +118,15 @@ class ScheduleService:
         """검증된 경기 일정 데이터를 관계형 DB에 저장합니다."""
         if not db or not data:
             return {"db": 0, "vector": 0}
-        chunk_size = get_settings().db_batch_chunk_size
+        settings = get_settings()
         repo = ScheduleRepository()
-        saved = repo.save_batch(data, db, chunk_size=chunk_size)
+        saved = repo.save_batch(
+            data, db, chunk_size=settings.db_batch_chunk_size, bulk=settings.db_bulk_upsert
+        )
         if auto_commit:
             try:
                 db.commit()
-                fill_result = _fill_embeddings_after_save(db, "schedules")
+                fill_result = fill_embeddings_after_save(db, "schedules")
                 return {"db": saved, "vector": fill_result.get("processed", 0)}
             except Exception:
                 db.rollback()
@@ -110,13 +150,15 @@ class StadiumService:
         """검증된 경기장 데이터를 관계형 DB에 저장합니다."""
         if not db or not data:
             return {"db": 0, "vector": 0}
-        chunk_size = get_settings().db_batch_chunk_size
+        settings = get_settings()
         repo = StadiumRepository()
-        saved = repo.save_batch(data, db, chunk_size=chunk_size)
+        saved = repo.save_batch(
+            data, db, chunk_size=settings.db_batch_chunk_size, bulk=settings.db_bulk_upsert
+        )
         if auto_commit:
             try:
                 db.commit()
-                fill_result = _fill_embeddings_after_save(db, "stadiums")
+                fill_result = fill_embeddings_after_save(db, "stadiums")
                 return {"db": saved, "vector": fill_result.get("processed", 0)}
             except Exception:
                 db.rollback()
@@ -140,13 +182,15 @@ class TeamService:
         """검증된 팀 데이터를 관계형 DB에 저장합니다."""
         if not db or not data:
             return {"db": 0, "vector": 0}
-        chunk_size = get_settings().db_batch_chunk_size
+        settings = get_settings()
         repo = TeamRepository()
-        saved = repo.save_batch(data, db, chunk_size=chunk_size)
+        saved = repo.save_batch(
+            data, db, chunk_size=settings.db_batch_chunk_size, bulk=settings.db_bulk_upsert
+        )
         if auto_commit:
             try:
                 db.commit()
-                fill_result = _fill_embeddings_after_save(db, "teams")
+                fill_result = fill_embeddings_after_save(db, "teams")
                 return {"db": saved, "vector": fill_result.get("processed", 0)}
             except Exception:
                 db.rollback()
@@ -13,6 +13,9 @@ import torch
 from domain.hub.shared.utils import format_email_text  # type: ignore
 from transformers import AutoModelForSequenceClassification, AutoTokenizer
 
+# 토크나이즈 최대 길이 (predict·predict_batch 공통)
+MAX_LENGTH = 512
+
 
 class LLaMAClassifier:
     """LLaMA 기반 스팸 분류기."""
@@ -174,43 +177,49 @@ class LLaMAClassifier:
 
         # 토크나이징
         inputs = self.tokenizer(
-            text, return_tensors="pt", truncation=True, max_length=512, padding=True
+            text, return_tensors="pt", truncation=True, max_length=MAX_LENGTH, padding=True
         )
         inputs = {k: v.to(self.device) for k, v in inputs.items()}
 
         # 예측
+        logits = self._forward_logits(inputs)
+        return self._logits_to_result(logits[0], return_confidence)
+
+    def _forward_logits(self, inputs: Dict[str, Any]) -> torch.Tensor:
+        """토크나이즈된 배치 → [batch, num_labels] logits."""
         with torch.no_grad():
             outputs = self.model(**inputs)
 
             # 출력 형태 확인
             if hasattr(outputs, "logits"):
-                logits = outputs.logits
-            elif hasattr(outputs, "last_hidden_state"):
+                return outputs.logits
+            if hasattr(outputs, "last_hidden_state"):
                 # AutoModel인 경우 마지막 hidden state 사용
                 last_hidden = outputs.last_hidden_state
-                # [CLS] 토큰 사용 (첫 번째 토큰)
-                cls_embedding = last_hidden[0, 0, :]  # [batch, seq, hidden] -> [hidden]
+                # [CLS] 토큰 사용 (첫 번째 토큰, 오른쪽 패딩이라 배치에서도 위치 동일)
+                cls_embedding = last_hidden[:, 0, :]  # [batch, seq, hidden] -> [batch, hidden]
                 # 분류 헤드가 있으면 사용
                 if hasattr(self.model, "classifier"):
-                    logits = self.model.classifier(cls_embedding.unsqueeze(0))
-                else:
-                    # 간단한 선형 변환으로 스팸 확률 추정
-                    # (임시 방법 - 실제로는 분류 헤드가 필요)
-                    logits = torch.tensor([[0.0, 0.0]])  # 기본값
-            else:
-                raise ValueError("모델 출력 형식을 확인할 수 없습니다.")
-
+                    return self.model.classifier(cls_embedding)
+                # 간단한 선형 변환으로 스팸 확률 추정
+                # (임시 방법 - 실제로는 분류 헤드가 필요)
+                return torch.zeros(last_hidden.shape[0], 2)  # 기본값
+            raise ValueError("모델 출력 형식을 확인할 수 없습니다.")
+
+    @staticmethod
+    def _logits_to_result(logits: torch.Tensor, return_confidence: bool = True) -> Dict[str, Any]:
+        """한 건의 logits [num_labels] → 분류 결과."""
         # 확률 계산 (이진 분류)
-        if logits.shape[1] == 2:
+        if logits.shape[0] == 2:
             # [ham, spam] 형태
             probs = torch.softmax(logits, dim=-1)
-            spam_prob = probs[0][1].item()  # spam 클래스 확률
-        elif logits.shape[1] == 1:
+            spam_prob = probs[1].item()  # spam 클래스 확률
+        elif logits.shape[0] == 1:
             # 단일 출력인 경우 sigmoid 적용
-            spam_prob = torch.sigmoid(logits[0][0]).item()
+            spam_prob = torch.sigmoid(logits[0]).item()
         else:
             # 예상치 못한 형태 - 기본값 반환
-            print(f"[WARNING] 예상치 못한 logits shape: {logits.shape}")
+            print(f"[WARNING] 예상치 못한 logits shape: {tuple(logits.shape)}")
             spam_prob = 0.5  # 중립값
 
         # 라벨 결정
@@ -239,19 +248,69 @@ class LLaMAClassifier:
 
         return result
 
+    def _can_pad_batch(self) -> bool:
+        """배치 패딩 가능 여부 (토크나이저 pad 토큰, 시퀀스 분류 헤드의 pad_token_id)."""
+        if self.tokenizer.pad_token_id is None:
+            return False
+        config = getattr(self.model, "config", None)
+        if hasattr(self.model, "score") and getattr(config, "pad_token_id", None) is None:
+            # LlamaForSequenceClassification은 pad_token_id로 마지막 토큰 위치를 찾음
+            return False
+        return True
+
     def predict_batch(
-        self, email_metadata_list: List[Dict[str, Any]]
+        self,
+        email_metadata_list: List[Dict[str, Any]],
+        return_confidence: bool = True,
+        max_batch_tokens: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """배치 예측.
 
+        길이순으로 정렬해 비슷한 길이끼리 묶고(동적 패딩, 오른쪽), 배치마다
+        (건수 × 최장 토큰 수) <= max_batch_tokens 가 되도록 나눠 한 번의 forward로 점수 계산.
+        결과는 입력 순서대로 반환하며 predict()와 같은 값.
+
         Args:
             email_metadata_list: 이메일 메타데이터 리스트
+            return_confidence: 신뢰도 반환 여부
+            max_batch_tokens: 배치당 토큰 예산 (None이면 settings.spam_classifier_batch_tokens)
 
         Returns:
             분류 결과 리스트
         """
-        results = []
-        for email_metadata in email_metadata_list:
-            result = self.predict(email_metadata)
-            results.append(result)
-        return results
+        if self.model is None or self.tokenizer is None:
+            raise ValueError("먼저 load_model()을 호출하세요.")
+        if not email_metadata_list:
+            return []
+        if not self._can_pad_batch():
+            print("[WARNING] pad 토큰이 없어 건별 예측으로 처리합니다.")
+            return [self.predict(m, return_confidence) for m in email_metadata_list]
+        if max_batch_tokens is None:
+            from core.config import settings  # type: ignore
+
+            max_batch_tokens = settings.spam_classifier_batch_tokens
+
+        texts = [format_email_text(m) for m in email_metadata_list]
+        encoded = self.tokenizer(texts, truncation=True, max_length=MAX_LENGTH)["input_ids"]
+        order = sorted(range(len(texts)), key=lambda i: len(encoded[i]), reverse=True)
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(texts)
+        start = 0
+        while start < len(order):
+            # 내림차순이므로 첫 항목이 배치 최장 → 예산 안에서 최대한 담음 (최소 1건)
+            longest = len(encoded[order[start]])
+            size = max(1, max_batch_tokens // max(longest, 1))
+            batch_idx = order[start : start + size]
+            start += len(batch_idx)
+
+            inputs = self.tokenizer.pad(
+                {"input_ids": [encoded[i] for i in batch_idx]},
+                padding=True,
+                padding_side="right",
+                return_tensors="pt",
+            )
+            inputs = {k: v.to(self.device) for k, v in inputs.items()}
+            logits = self._forward_logits(inputs)
+            for row, i in zip(logits, batch_idx):
+                results[i] = self._logits_to_result(row, return_confidence)
+        return results  # type: ignore[return-value]
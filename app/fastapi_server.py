@@ -75,6 +75,10 @@ async def _app_lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         nonlocal init_error
         try:
             await asyncio.to_thread(init_v1)
+            # 채팅 에이전트 그래프 미리 컴파일 (첫 요청의 그래프 구성 비용 제거)
+            from domain.hub.orchestrators.graph_orchestrator import warm_agent_graphs  # type: ignore
+
+            await asyncio.to_thread(warm_agent_graphs)
             print("\n" + "=" * 50)
             print("DB·마이그레이션 초기화 중...")
             print("=" * 50)
@@ -98,6 +102,11 @@ async def _app_lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     if init_error:
         logging.warning("백엔드 초기화 중 오류가 있었습니다: %s", init_error)
     print("\n[INFO] 서버 종료 중...")
+    from api.shared.executors import shutdown_executors  # type: ignore
+    from domain.hub.mcp.http_client import close_http_clients  # type: ignore
+
+    shutdown_executors()
+    await close_http_clients()
 
 
 app = FastAPI(
@@ -419,6 +428,15 @@ def ensure_rag_initialized() -> None:
                 print("[WARNING] RAG 임베딩 준비 실패")
         except Exception as e:
             print(f"[WARNING] RAG 임베딩 준비 예외: {e}")
+        # 공시 확인 고정 쿼리 임베딩: 저장 파일 로드, 모델 버전이 바뀌었으면 다시 계산해 저장
+        try:
+            from domain.hub.service.canned_queries import preload_canned_queries  # type: ignore
+            from domain.shared.embedding import get_disclosure_embedding_model  # type: ignore
+
+            loaded = preload_canned_queries(get_disclosure_embedding_model())
+            print(f"[OK] 고정 쿼리 임베딩 {loaded}건 준비")
+        except Exception as e:
+            print(f"[WARNING] 고정 쿼리 임베딩 준비 예외: {e}")
         _rag_initialized = True
 
 
@@ -453,9 +471,15 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    """헬스 체크 엔드포인트."""
+    """헬스 체크 엔드포인트 (모델·DB 작업은 워크로드 실행기에서 돌아 이벤트 루프를 막지 않음)."""
+    from api.shared.executors import executor_stats  # type: ignore
+    from api.shared.job_queue import get_job_queue  # type: ignore
+
+    queue = get_job_queue()
     return {
         "status": "healthy",
         "vector_store": "initialized" if vector_store else "lazy (not loaded yet)",
         "local_embeddings": "initialized" if local_embeddings else "lazy (not loaded yet)",
+        "executors": executor_stats(),
+        "job_queue": queue.stats() if queue is not None else "disabled (in-process executors)",
     }
@@ -0,0 +1,82 @@
+"""
+작업 큐 워커 진입점 - soccer 임베딩 동기화·공시 확인 작업 실행.
+
+API 서버(main.py)와 별도 프로세스로 실행. 같은 JOB_QUEUE_PATH(SQLite)에서 작업을 임대해 실행하고,
+워커가 중단되면 임대 만료 후 다른 워커가 진행률부터 이어서 실행합니다.
+
+실행: app 디렉터리에서 JOB_QUEUE_PATH=... python job_worker.py [--kinds soccer_embedding disclosure_check]
+"""
+
+import argparse
+import logging
+import signal
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Dict
+
+current_dir = Path(__file__).parent
+if str(current_dir) not in sys.path:
+    sys.path.insert(0, str(current_dir))
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    handlers=[logging.StreamHandler()],
+)
+
+from api.shared.job_queue import (  # type: ignore  # noqa: E402
+    JOB_DISCLOSURE_CHECK,
+    JOB_SOCCER_EMBEDDING,
+    JobContext,
+    JobHandler,
+    get_job_queue,
+    run_worker,
+)
+from core.config import get_settings  # type: ignore  # noqa: E402
+
+
+def _soccer_embedding(ctx: JobContext) -> Dict[str, Any]:
+    from api.shared.embedding_sync import run_embedding_sync_task  # type: ignore
+
+    return run_embedding_sync_task(ctx.id, ctx.payload.get("entities"), ctx=ctx)
+
+
+def _disclosure_check(ctx: JobContext) -> Dict[str, Any]:
+    from api.routers.disclosure_router import DisclosureCheckRequest, _run_disclosure_check  # type: ignore
+
+    return _run_disclosure_check(DisclosureCheckRequest(**ctx.payload)).model_dump()
+
+
+HANDLERS: Dict[str, JobHandler] = {
+    JOB_SOCCER_EMBEDDING: _soccer_embedding,
+    JOB_DISCLOSURE_CHECK: _disclosure_check,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--kinds", nargs="+", choices=sorted(HANDLERS), default=sorted(HANDLERS))
+    parser.add_argument("--max-jobs", type=int, default=None, help="처리 후 종료할 작업 수 (기본: 무한)")
+    args = parser.parse_args()
+
+    queue = get_job_queue()
+    if queue is None:
+        raise SystemExit("JOB_QUEUE_PATH가 설정되지 않았습니다.")
+
+    stop = threading.Event()
+    # SIGTERM/SIGINT: 실행 중 작업은 끝까지 진행 후 종료 (강제 종료되면 임대 만료 후 재실행)
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
+
+    run_worker(
+        queue,
+        {kind: HANDLERS[kind] for kind in args.kinds},
+        poll_interval=get_settings().job_poll_interval,
+        stop=stop,
+        max_jobs=args.max_jobs,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""채팅 에이전트 그래프 준비 비용 벤치마크: 요청마다 build_agent_graph vs get_agent_graph 캐시.
+
+그래프를 invoke 하지 않고 준비(노드 연결·컴파일)만 N번 측정하므로 모델·DB 없이 실행됨.
+register_tool 후 캐시가 무효화되어 새 그래프가 컴파일되는지도 확인.
+
+실행: app 디렉터리에서 python -m scripts.agent_graph_bench [--calls 200]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+APP_ROOT = Path(__file__).resolve().parent.parent
+if str(APP_ROOT) not in sys.path:
+    sys.path.insert(0, str(APP_ROOT))
+
+PROVIDER = "exaone"
+
+
+def _time_ms(fn: Callable[[], Any], calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) * 1000.0 / calls
+
+
+def main() -> None:
+    from langchain_core.tools import tool
+
+    from domain.hub.orchestrators import graph_orchestrator as go  # type: ignore
+
+    parser = argparse.ArgumentParser(description="에이전트 그래프 준비 비용 벤치마크")
+    parser.add_argument("--calls", type=int, default=200, help="측정 요청 수")
+    args = parser.parse_args()
+
+    before = _time_ms(lambda: go.build_agent_graph(use_checkpointer=False), args.calls)
+    go.warm_agent_graphs(provider=PROVIDER)
+    after = _time_ms(lambda: go.get_agent_graph(provider=PROVIDER, use_checkpointer=False), args.calls)
+    print(f"{'build per request':<20} {before:>10.3f} ms/request")
+    print(f"{'cached graph':<20} {after:>10.3f} ms/request  ({before / after if after else float('inf'):.0f}x)")
+
+    @tool
+    def _bench_echo(text: str) -> str:
+        """입력 문자열을 그대로 반환 (벤치마크용)."""
+        return text
+
+    cached = go.get_agent_graph(provider=PROVIDER, use_checkpointer=False)
+    go.register_tool(_bench_echo)
+    try:
+        rebuilt = go.get_agent_graph(provider=PROVIDER, use_checkpointer=False)
+    finally:
+        go.unregister_tool(_bench_echo.name)
+    if rebuilt is cached:
+        print("[FAIL] 도구 등록 후에도 이전 그래프가 반환됨.", file=sys.stderr)
+        sys.exit(1)
+    print("[OK] 도구 등록 변경 시 캐시 무효화 확인.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""고정 쿼리 레지스트리 확인 - 반복 공시 확인에서 인코더·벡터 검색을 건너뛰는지.
+
+CannedQueryRegistry(domain.hub.service.canned_queries)에 호출 횟수를 세는 가짜 인코더·검색 함수를 붙여:
+1. 첫 확인       : 인코딩 1회 + 검색 1회, 벡터를 파일에 저장
+2. 반복 확인 N회 : 인코딩 0회 + 검색 0회 (top-k 캐시)
+3. 재시작(새 레지스트리 + 파일 로드) : 인코딩 0회, 검색 1회
+4. 적재 세대 변경 : 인코딩 0회, 검색 1회
+5. 임베딩 모델 버전 변경 : 인코딩 1회 + 검색 1회
+--encode-ms / --search-ms로 실제 지연을 흉내 내 반복 확인의 시간 차이도 출력.
+
+실행: app 디렉터리에서 python -m scripts.canned_query_check [--repeats 100]
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+APP_ROOT = Path(__file__).resolve().parent.parent
+if str(APP_ROOT) not in sys.path:
+    sys.path.insert(0, str(APP_ROOT))
+
+from domain.hub.service.canned_queries import CANNED_QUERIES, CannedQueryRegistry  # type: ignore  # noqa: E402
+
+NAME = "iso30414_reporting"
+
+
+class FakeEncoder:
+    def __init__(self, delay_s: float) -> None:
+        self.delay_s = delay_s
+        self.calls = 0
+
+    def embed_queries(self, texts: List[str]) -> List[List[float]]:
+        self.calls += 1
+        time.sleep(self.delay_s)
+        return [[float(len(t)), 1.0, 0.0] for t in texts]
+
+
+class FakeSearch:
+    def __init__(self, delay_s: float) -> None:
+        self.delay_s = delay_s
+        self.calls = 0
+
+    def __call__(self, vector: List[float], k: int) -> List[str]:
+        self.calls += 1
+        time.sleep(self.delay_s)
+        return [f"chunk-{i}" for i in range(k)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeats", type=int, default=100)
+    parser.add_argument("--encode-ms", type=float, default=30.0)
+    parser.add_argument("--search-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    encoder = FakeEncoder(args.encode_ms / 1000)
+    search = FakeSearch(args.search_ms / 1000)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "canned.json"
+
+        def check(registry: CannedQueryRegistry, generation, version: str) -> List[str]:
+            return registry.search(NAME, 5, generation, search, lambda: encoder, version)
+
+        def step(label: str, fn, expect_encode: int, expect_search: int) -> None:
+            enc0, s0 = encoder.calls, search.calls
+            start = time.perf_counter()
+            fn()
+            elapsed = time.perf_counter() - start
+            enc, s = encoder.calls - enc0, search.calls - s0
+            print(f"{label:<34} encode={enc} search={s} {elapsed * 1000:9.1f} ms")
+            assert (enc, s) == (expect_encode, expect_search), (label, enc, s)
+
+        registry = CannedQueryRegistry(path, CANNED_QUERIES)
+        step("first check", lambda: check(registry, (100, 100), "v1"), 1, 1)
+        assert path.exists()
+        step(f"{args.repeats} repeated checks", lambda: [check(registry, (100, 100), "v1") for _ in range(args.repeats)], 0, 0)
+
+        restarted = CannedQueryRegistry(path, CANNED_QUERIES)
+        assert restarted.load("v1") == len(CANNED_QUERIES)
+        step("after restart (file load)", lambda: check(restarted, (100, 100), "v1"), 0, 1)
+        step("ingest generation changed", lambda: check(restarted, (120, 140), "v1"), 0, 1)
+        step("embedding model version changed", lambda: check(restarted, (120, 140), "v2"), 1, 1)
+
+        baseline = args.repeats * (args.encode_ms + args.search_ms)
+        print(f"uncached {args.repeats} checks would spend ~{baseline:.0f} ms in encoder + ANN")
+        print("stats:", restarted.stats())
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
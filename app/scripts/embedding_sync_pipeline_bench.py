@@ -0,0 +1,166 @@
+"""Soccer 임베딩 동기화 - 순차 그래프 vs 파이프라인 모드(엔티티 동시 + 공유 인코더) 벽시계 시간 비교.
+
+임시 SQLite DB에 players/teams/stadiums/schedules 행을 만들고(embedding NULL) 같은 데이터로 두 모드를 실행:
+- 가짜 인코더: 호출당 --call-ms + 텍스트당 --per-text-ms 만큼 sleep 후 1024차원 벡터 반환 (호출 수 집계)
+- 텍스트 생성: ExaOne 요약 대신 --content-ms sleep 후 규칙 기반 텍스트 (ExaOne 로드 없음)
+두 모드 모두 모든 행이 채워졌는지, 엔티티별 진행 콜백(on_entity_done)이 4번 호출됐는지 확인하고
+인코더 호출 수·섞인 배치·소요 시간을 출력.
+
+실행: app 디렉터리에서 python -m scripts.embedding_sync_pipeline_bench [--players 600 --encode-batch 128]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+APP_ROOT = Path(__file__).resolve().parent.parent
+if str(APP_ROOT) not in sys.path:
+    sys.path.insert(0, str(APP_ROOT))
+
+ENTITIES = ["players", "teams", "schedules", "stadiums"]
+
+
+class FakeEncoder:
+    def __init__(self, call_ms: float, per_text_ms: float, dim: int) -> None:
+        self.call_s = call_ms / 1000
+        self.per_text_s = per_text_ms / 1000
+        self.dim = dim
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        with self._lock:  # GPU 하나처럼 한 번에 한 배치만
+            self.calls += 1
+            time.sleep(self.call_s + self.per_text_s * len(texts))
+        return [[(len(t) % 7) / 7.0] * self.dim for t in texts]
+
+
+def _seed(session_factory: Any, args: argparse.Namespace) -> None:
+    from domain.models.bases.soccer import Player, Schedule, Stadium, Team  # type: ignore
+
+    db = session_factory()
+    stadiums = [Stadium(id=i + 1, stadium_code=f"S{i:03d}", statdium_name=f"경기장{i}") for i in range(args.stadiums)]
+    teams = [Team(id=i + 1, team_code=f"K{i:03d}", team_name=f"팀{i}") for i in range(args.teams)]
+    db.add_all(stadiums + teams)
+    db.flush()
+    db.add_all(
+        Player(id=i + 1, team_id=(i % args.teams) + 1, player_name=f"선수{i}", position="MF", back_no=i % 99)
+        for i in range(args.players)
+    )
+    db.add_all(
+        Schedule(
+            id=i + 1,
+            stadium_id=(i % args.stadiums) + 1,
+            hometeam_id=(i % args.teams) + 1,
+            awayteam_id=((i + 1) % args.teams) + 1,
+            stadium_code=f"S{i % args.stadiums:03d}",
+            sche_date=f"2024{(i % 12) + 1:02d}{(i % 28) + 1:02d}",
+            gubun="Y",
+            hometeam_code=f"K{i % args.teams:03d}",
+            awayteam_code=f"K{(i + 1) % args.teams:03d}",
+        )
+        for i in range(args.schedules)
+    )
+    db.commit()
+    db.close()
+
+
+def _reset(session_factory: Any) -> None:
+    from domain.models.bases.soccer import Player, Schedule, Stadium, Team  # type: ignore
+
+    db = session_factory()
+    for model in (Player, Team, Schedule, Stadium):
+        db.query(model).update({model.embedding: None, model.embedding_content: None})
+    db.commit()
+    db.close()
+
+
+def _remaining(session_factory: Any) -> int:
+    from domain.models.bases.soccer import Player, Schedule, Stadium, Team  # type: ignore
+
+    db = session_factory()
+    try:
+        return sum(db.query(m).filter(m.embedding.is_(None)).count() for m in (Player, Team, Schedule, Stadium))
+    finally:
+        db.close()
+
+
+def _run(label: str, session_factory: Any, encoder: FakeEncoder, parallel: bool) -> Dict[str, Any]:
+    from domain.hub.orchestrators.soccer_orchestrator import run_embedding_sync_orchestrate  # type: ignore
+
+    _reset(session_factory)
+    progress: List[str] = []
+    encoder.calls = 0
+    db = session_factory()
+    start = time.perf_counter()
+    try:
+        out = run_embedding_sync_orchestrate(
+            db,
+            encoder,
+            entities=ENTITIES,
+            on_entity_done=lambda key, _result: progress.append(key),
+            parallel=parallel,
+            session_factory=session_factory,
+        )
+    finally:
+        db.close()
+    elapsed = time.perf_counter() - start
+    processed = sum(r.get("processed", 0) for r in out["results"].values())
+    print(f"{label:<12} {elapsed:7.2f}s  encoder calls={encoder.calls:>4}  processed={processed}  progress order={progress}")
+    assert _remaining(session_factory) == 0, f"{label}: embedding NULL 행이 남음"
+    assert sorted(progress) == sorted(ENTITIES), progress
+    return {"elapsed": elapsed, "processed": processed, "calls": encoder.calls}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--players", type=int, default=600)
+    parser.add_argument("--teams", type=int, default=40)
+    parser.add_argument("--stadiums", type=int, default=40)
+    parser.add_argument("--schedules", type=int, default=400)
+    parser.add_argument("--call-ms", type=float, default=25.0)
+    parser.add_argument("--per-text-ms", type=float, default=0.3)
+    parser.add_argument("--content-ms", type=float, default=2.0)
+    parser.add_argument("--encode-batch", type=int, default=128)
+    args = parser.parse_args()
+
+    os.environ["SOCCER_EMBEDDING_SYNC_ENCODE_BATCH"] = str(args.encode_batch)
+
+    from sqlalchemy import create_engine  # type: ignore[import-untyped]
+    from sqlalchemy.orm import sessionmaker  # type: ignore[import-untyped]
+
+    from core.database import Base  # type: ignore
+    from domain.models.bases.soccer import VECTOR_DIM, Player, Schedule, Stadium, Team  # type: ignore
+    from domain.spokes.soccer.services import embedding_service  # type: ignore
+
+    def fake_content(record: Dict[str, Any], entity_type: str) -> None:
+        time.sleep(args.content_ms / 1000)  # ExaOne 요약 대신 지연만 흉내 → 규칙 기반 텍스트 사용
+        return None
+
+    embedding_service._to_embedding_text_exaone = fake_content
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(
+            f"sqlite:///{Path(tmp) / 'soccer.sqlite3'}",
+            connect_args={"check_same_thread": False, "timeout": 30},
+        )
+        Base.metadata.create_all(engine, tables=[m.__table__ for m in (Stadium, Team, Player, Schedule)])
+        session_factory = sessionmaker(bind=engine)
+        _seed(session_factory, args)
+        encoder = FakeEncoder(args.call_ms, args.per_text_ms, VECTOR_DIM)
+
+        sequential = _run("sequential", session_factory, encoder, parallel=False)
+        pipelined = _run("pipelined", session_factory, encoder, parallel=True)
+        engine.dispose()
+
+    assert sequential["processed"] == pipelined["processed"]
+    print(f"speedup: {sequential['elapsed'] / pipelined['elapsed']:.2f}x, encoder calls {sequential['calls']} → {pipelined['calls']}")
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""ExaOne CPU 백엔드 처리량 비교 (작은 랜덤 초기화 Llama 모델, greedy 생성).
+
+경로별 tokens/s와 reference 대비 greedy 토큰 일치율을 출력:
+- reference : float32 (CUDA 있으면 float16 GPU도 함께)
+- cpu-bf16  : bfloat16 로드 (CPU가 bf16 지원할 때만)
+- cpu-int8  : float32 로드 + nn.Linear 동적 int8 (EXAONE_CPU_INT8 기본 경로)
+스레드는 configure_cpu_threads (EXAONE_CPU_THREADS, 0이면 물리 코어 수).
+
+--model-path를 주면 실제 체크포인트로 ExaoneLLM(device="cpu")의 invoke / stream도 측정.
+
+실행: app 디렉터리에서 python -m scripts.exaone_cpu_bench [--hidden 1024 --layers 8 --new-tokens 64]
+"""
+import argparse
+import copy
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+APP_ROOT = Path(__file__).resolve().parent.parent
+if str(APP_ROOT) not in sys.path:
+    sys.path.insert(0, str(APP_ROOT))
+
+
+def _small_model(hidden: int, layers: int, vocab: int):
+    import torch
+    from transformers import LlamaConfig, LlamaForCausalLM
+
+    torch.manual_seed(0)
+    config = LlamaConfig(
+        vocab_size=vocab,
+        hidden_size=hidden,
+        intermediate_size=hidden * 4,
+        num_hidden_layers=layers,
+        num_attention_heads=max(1, hidden // 64),
+        num_key_value_heads=max(1, hidden // 128),
+        max_position_embeddings=2048,
+        eos_token_id=vocab + 1,  # 도달 불가 → 항상 new_tokens만큼 생성
+        pad_token_id=0,
+    )
+    model = LlamaForCausalLM(config).eval()
+    model.generation_config.pad_token_id = 0
+    return model
+
+
+def _generate(model: Any, prompt: Any, new_tokens: int) -> List[int]:
+    import torch
+
+    from domain.models.bases.exaone_model import _autocast  # type: ignore
+
+    with torch.no_grad(), _autocast(model):
+        out = model.generate(
+            prompt.to(model.device),
+            max_new_tokens=new_tokens,
+            min_new_tokens=new_tokens,
+            do_sample=False,
+            use_cache=True,
+            num_beams=1,
+        )
+    return out[0, prompt.shape[1] :].tolist()
+
+
+def _measure(name: str, model: Any, prompt: Any, new_tokens: int, repeats: int, ref: Optional[List[int]]) -> Dict[str, Any]:
+    _generate(model, prompt, 4)  # 워밍업
+    start = time.perf_counter()
+    for _ in range(repeats):
+        tokens = _generate(model, prompt, new_tokens)
+    elapsed = (time.perf_counter() - start) / repeats
+    agree = None
+    if ref is not None:
+        agree = sum(a == b for a, b in zip(tokens, ref)) / len(ref)
+    return {"name": name, "tok_s": new_tokens / elapsed, "latency_ms": elapsed * 1000, "tokens": tokens, "agree": agree}
+
+
+def _bench_paths(args: argparse.Namespace) -> None:
+    import torch
+
+    from domain.models.bases.exaone_cpu import (  # type: ignore
+        _cpu_supports_bf16,
+        configure_cpu_threads,
+        quantize_linear_int8,
+    )
+
+    threads = configure_cpu_threads(args.threads)
+    base = _small_model(args.hidden, args.layers, args.vocab)
+    params = sum(p.numel() for p in base.parameters()) / 1e6
+    prompt = torch.randint(3, args.vocab, (1, args.prompt_tokens))
+    print(f"model: {params:.1f}M params, prompt={args.prompt_tokens}, new_tokens={args.new_tokens}, threads={threads}")
+
+    rows = [_measure("reference-fp32", base, prompt, args.new_tokens, args.repeats, None)]
+    ref = rows[0]["tokens"]
+    if torch.cuda.is_available():
+        gpu = copy.deepcopy(base).half().to("cuda")
+        rows.append(_measure("reference-cuda-fp16", gpu, prompt, args.new_tokens, args.repeats, ref))
+        del gpu
+    if _cpu_supports_bf16():
+        rows.append(_measure("cpu-bf16", copy.deepcopy(base).to(torch.bfloat16), prompt, args.new_tokens, args.repeats, ref))
+    else:
+        print("cpu-bf16: 이 CPU는 bf16 미지원 (EXAONE_CPU_DTYPE=bfloat16이어도 float32로 로드)")
+    rows.append(_measure("cpu-int8", quantize_linear_int8(copy.deepcopy(base)), prompt, args.new_tokens, args.repeats, ref))
+
+    print(f"{'path':<22}{'tok/s':>10}{'ms/gen':>10}{'speedup':>9}{'agree':>8}")
+    for row in rows:
+        agree = "-" if row["agree"] is None else f"{row['agree']:.2f}"
+        print(
+            f"{row['name']:<22}{row['tok_s']:>10.1f}{row['latency_ms']:>10.1f}"
+            f"{row['tok_s'] / rows[0]['tok_s']:>8.2f}x{agree:>8}"
+        )
+
+
+def _bench_exaone(model_path: str, new_tokens: int) -> None:
+    """실제 체크포인트: ExaoneLLM(device="cpu")의 invoke 처리량과 stream 첫 조각 지연."""
+    from domain.models.bases.exaone_model import ExaoneLLM  # type: ignore
+
+    llm = ExaoneLLM(model_path=model_path, device="cpu")
+    prompt = "대한민국의 수도와 그 도시의 특징을 간단히 설명해 주세요."
+    start = time.perf_counter()
+    text = llm.invoke(prompt, max_new_tokens=new_tokens, do_sample=False)
+    elapsed = time.perf_counter() - start
+    n = len(llm.tokenizer.encode(text, add_special_tokens=False))
+    print(f"ExaoneLLM.invoke (cpu): {n} tokens in {elapsed:.2f}s → {n / elapsed:.1f} tok/s")
+
+    start = time.perf_counter()
+    first = None
+    for _chunk in llm.stream(prompt, max_new_tokens=new_tokens, do_sample=False):
+        if first is None:
+            first = time.perf_counter() - start
+    print(f"ExaoneLLM.stream (cpu): first chunk {first * 1000:.0f} ms, total {time.perf_counter() - start:.2f}s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--hidden", type=int, default=1024)
+    parser.add_argument("--layers", type=int, default=8)
+    parser.add_argument("--vocab", type=int, default=8000)
+    parser.add_argument("--prompt-tokens", type=int, default=128)
+    parser.add_argument("--new-tokens", type=int, default=64)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--threads", type=int, default=0)
+    parser.add_argument("--model-path", type=str, default=None, help="실제 EXAONE 체크포인트 (선택)")
+    args = parser.parse_args()
+
+    _bench_paths(args)
+    if args.model_path:
+        _bench_exaone(args.model_path, args.new_tokens)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""PrefixKVCache 정합성 확인 (CPU, 작은 랜덤 초기화 LlamaForCausalLM).
+
+고정 접두사 + 가변 꼬리 프롬프트들에 대해
+- model.generate(greedy) 전체 prefill vs 접두사 KV 재사용(past_key_values) 출력 비교
+- ContinuousBatchScheduler(prefix_cache 사용) 출력 비교
+- 접두사와 일부만 겹치는 프롬프트(LCP 재사용), 상한 초과 시 LRU 제거, 제거 후 재등록 확인
+
+실행: app 디렉터리에서 python -m scripts.exaone_prefix_cache_check
+"""
+import random
+import sys
+from pathlib import Path
+from typing import List
+
+APP_ROOT = Path(__file__).resolve().parent.parent
+if str(APP_ROOT) not in sys.path:
+    sys.path.insert(0, str(APP_ROOT))
+
+VOCAB = 128
+EOS = 2
+PREFIX_LEN = 48
+
+
+def _greedy(model, prompt: List[int], max_new_tokens: int, past=None) -> List[int]:
+    import torch
+
+    with torch.no_grad():
+        out = model.generate(
+            torch.tensor([prompt]),
+            past_key_values=past,
+            max_new_tokens=max_new_tokens,
+            do_sample=False,
+            eos_token_id=EOS,
+            pad_token_id=0,
+        )
+    return out[0][len(prompt):].tolist()
+
+
+def main() -> None:
+    from scripts.exaone_scheduler_check import _tiny_model  # type: ignore
+
+    from domain.models.bases.exaone_prefix_cache import PrefixKVCache  # type: ignore
+    from domain.models.bases.exaone_scheduler import ContinuousBatchScheduler  # type: ignore
+
+    rng = random.Random(1)
+    model = _tiny_model()
+    prefix = [rng.randrange(3, VOCAB) for _ in range(PREFIX_LEN)]
+    prompts = [prefix + [rng.randrange(3, VOCAB) for _ in range(rng.randint(1, 20))] for _ in range(6)]
+    # 접두사 중간에서 갈라지는 프롬프트 (LCP 재사용)
+    prompts.append(prefix[:30] + [rng.randrange(3, VOCAB) for _ in range(10)])
+    expected = [_greedy(model, p, 20) for p in prompts]
+
+    cache = PrefixKVCache(model, max_mb=64.0, min_reuse_tokens=8)
+    assert cache.register(prefix)
+
+    ok = True
+    for i, p in enumerate(prompts):
+        hit = cache.lookup(p)
+        got = _greedy(model, p, 20, past=hit[1] if hit else None)
+        same = got == expected[i]
+        ok = ok and same and hit is not None
+        print(f"generate #{i}: reused={hit[0] if hit else 0:>3} tokens  {'OK' if same else 'DIFF'}")
+
+    scheduler = ContinuousBatchScheduler(model, max_batch_size=4, kv_cache_budget_mb=64.0, eos_token_id=EOS, prefix_cache=cache)
+    try:
+        outputs = [h.result(timeout=120) for h in [scheduler.submit(p, max_new_tokens=20) for p in prompts]]
+    finally:
+        scheduler.close()
+    sched_same = outputs == expected
+    ok = ok and sched_same
+    print(f"scheduler + prefix cache: {'OK' if sched_same else 'DIFF'}  stats={cache.stats()}")
+
+    # LRU: 접두사 하나 크기만큼 상한 → 두 번째 등록 시 첫 번째 제거
+    one_mb = cache.stats()["bytes"] / (1024 * 1024)
+    small = PrefixKVCache(model, max_mb=one_mb * 1.5, min_reuse_tokens=8)
+    small.register(prefix)
+    small.register(prompts[0])
+    lru_ok = small.stats()["prefixes"] == 1 and small.stats()["evictions"] == 1
+    ok = ok and lru_ok
+    print(f"LRU cap: {'OK' if lru_ok else 'FAIL'}  stats={small.stats()}")
+
+    # 제거된 접두사를 다시 register하면 prefill 후 재등록 (register_prompt_prefix가 매번 위임하는 이유)
+    re_ok = small.register(prefix) and small.stats()["evictions"] == 2
+    hit = small.lookup(prompts[1])
+    re_ok = re_ok and hit is not None and hit[0] == PREFIX_LEN
+    ok = ok and re_ok
+    print(f"re-register after eviction: {'OK' if re_ok else 'FAIL'}  stats={small.stats()}")
+
+    if not ok:
+        print("[FAIL] 접두사 캐시 사용 시 출력이 다르거나 재사용/제거가 기대와 다릅니다.", file=sys.stderr)
+        sys.exit(1)
+    print("[OK] 캐시 사용/미사용 greedy 출력 동일.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""ContinuousBatchScheduler 정합성 확인 (CPU, 작은 랜덤 초기화 LlamaForCausalLM).
+
+길이·max_new_tokens가 다른 프롬프트들을 동시에 제출해 배치 합류·제거가 일어나게 하고,
+각 시퀀스의 greedy 출력이 model.generate(do_sample=False) 단독 실행 결과와 같은지 확인.
+KV 예산을 작게 잡은 경우에도(배치가 줄어듦) 결과가 같은지 함께 확인.
+스트림 소비자가 중간에 멈추면(iter_text 제너레이터 close) 시퀀스가 max_new_tokens까지 가지 않고 은퇴하는지도 확인.
+
+실행: app 디렉터리에서 python -m scripts.exaone_scheduler_check [--seqs 10] [--max-batch 3]
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+APP_ROOT = Path(__file__).resolve().parent.parent
+if str(APP_ROOT) not in sys.path:
+    sys.path.insert(0, str(APP_ROOT))
+
+VOCAB = 128
+EOS = 2
+
+
+def _tiny_model():
+    import torch
+    from transformers import LlamaConfig, LlamaForCausalLM
+
+    torch.manual_seed(0)
+    config = LlamaConfig(
+        vocab_size=VOCAB,
+        hidden_size=64,
+        intermediate_size=128,
+        num_hidden_layers=2,
+        num_attention_heads=4,
+        num_key_value_heads=2,
+        max_position_embeddings=512,
+        eos_token_id=EOS,
+        pad_token_id=0,
+    )
+    model = LlamaForCausalLM(config).eval()
+    model.generation_config.pad_token_id = 0
+    return model
+
+
+def _reference(model, prompt: List[int], max_new_tokens: int) -> List[int]:
+    import torch
+
+    with torch.no_grad():
+        out = model.generate(
+            torch.tensor([prompt]), max_new_tokens=max_new_tokens, do_sample=False, eos_token_id=EOS, pad_token_id=0
+        )
+    return out[0][len(prompt):].tolist()
+
+
+def _run(model, cases: List[Tuple[List[int], int]], max_batch: int, budget_mb: float) -> Tuple[List[List[int]], dict, float]:
+    from domain.models.bases.exaone_scheduler import ContinuousBatchScheduler  # type: ignore
+
+    scheduler = ContinuousBatchScheduler(model, max_batch_size=max_batch, kv_cache_budget_mb=budget_mb, eos_token_id=EOS)
+    start = time.perf_counter()
+    try:
+        handles = [scheduler.submit(p, max_new_tokens=n) for p, n in cases]
+        outputs = [h.result(timeout=120) for h in handles]
+        elapsed = time.perf_counter() - start
+        return outputs, scheduler.stats(), elapsed
+    finally:
+        scheduler.close()
+
+
+def _early_stop(model, max_new_tokens: int = 2000) -> bool:
+    """토큰 몇 개만 읽고 스트림을 닫으면 시퀀스가 바로 은퇴해 다음 요청이 들어오는지."""
+    from domain.models.bases.exaone_scheduler import ContinuousBatchScheduler  # type: ignore
+
+    class _IdTokenizer:
+        def decode(self, ids, skip_special_tokens=True):
+            return " ".join(str(i) for i in ids)
+
+    # eos 없음(-1) + 배치 1자리 → 취소되지 않으면 첫 시퀀스가 2000토큰을 다 만들 때까지 다음 요청이 대기
+    scheduler = ContinuousBatchScheduler(model, max_batch_size=1, kv_cache_budget_mb=1024.0, eos_token_id=-1)
+    try:
+        first = scheduler.submit([5, 6, 7, 8], max_new_tokens=max_new_tokens)
+        stream = first.iter_text(_IdTokenizer())
+        for _ in range(3):
+            next(stream)
+        stream.close()
+        start = time.perf_counter()
+        second = scheduler.submit([9, 10, 11], max_new_tokens=4).result(timeout=60)
+        waited = time.perf_counter() - start
+        first.result(timeout=5)
+        retired = first.done() and len(first.generated) < max_new_tokens // 10
+    finally:
+        scheduler.close()
+    ok = retired and len(second) == 4
+    print(
+        f"early stop     {'OK' if ok else 'FAIL'}  cancelled stream generated {len(first.generated)}/{max_new_tokens} tokens, "
+        f"next request admitted after {waited:.2f}s"
+    )
+    return ok
+
+
+def main() -> None:
+    from domain.models.bases.exaone_scheduler import kv_bytes_per_token  # type: ignore
+
+    parser = argparse.ArgumentParser(description="연속 배칭 스케줄러 정합성 확인")
+    parser.add_argument("--seqs", type=int, default=10)
+    parser.add_argument("--max-batch", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    model = _tiny_model()
+    cases = [
+        ([rng.randrange(3, VOCAB) for _ in range(rng.randint(3, 40))], rng.randint(1, 30)) for _ in range(args.seqs)
+    ]
+    start = time.perf_counter()
+    expected = [_reference(model, p, n) for p, n in cases]
+    sequential = time.perf_counter() - start
+
+    # 최장 시퀀스 2개만 들어가는 예산 → 합류가 예산에 막히는 경로도 확인
+    longest = max(len(p) + n for p, n in cases)
+    tight_mb = 2 * longest * kv_bytes_per_token(model) / (1024 * 1024)
+
+    ok = True
+    for label, budget in (("budget=large", 1024.0), ("budget=2 seqs", tight_mb)):
+        outputs, stats, elapsed = _run(model, cases, args.max_batch, budget)
+        mismatches = [i for i, (a, b) in enumerate(zip(outputs, expected)) if a != b]
+        ok = ok and not mismatches
+        print(
+            f"{label:<14} {'OK' if not mismatches else f'DIFF {mismatches}'}  steps={stats['steps']} "
+            f"max_batch={stats['max_observed_batch']}  {elapsed:.2f}s (sequential generate {sequential:.2f}s)"
+        )
+
+    early_ok = _early_stop(model)
+    ok = ok and early_ok
+
+    if not ok:
+        print("[FAIL] 스케줄러 출력이 단독 greedy 디코딩과 다르거나 중단된 스트림이 은퇴하지 않습니다.", file=sys.stderr)
+        sys.exit(1)
+    print("[OK] 모든 시퀀스가 단독 greedy 디코딩과 동일.")
+
+
+if __name__ == "__main__":
+    main()
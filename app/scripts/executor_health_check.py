@@ -0,0 +1,121 @@
+"""워크로드 실행기 확인 - 느린 모델 호출 중에도 /health가 응답하는지, 대기열 초과 시 503인지.
+
+작은 FastAPI 앱(ASGI in-process, httpx.ASGITransport)에 세 엔드포인트를 두고 비교:
+- /blocking  : async def 안에서 블로킹 스텁 직접 호출 (기존 핸들러 방식)
+- /dispatched: run_in("model", 스텁) (api.shared.executors)
+- /health    : 즉시 응답
+
+각 방식으로 느린 호출(--block-s초)을 띄운 뒤 /health 지연을 측정.
+model 실행기는 workers=1, queue=1로 두어 동시 3번째 요청이 503(Retry-After)인지 확인.
+마지막으로 /orchestrate(orchestration 풀)가 내부 HTTP로 /dispatched(model 풀)를 다시 호출하는
+에이전트·스팸 파이프라인 구조를 동시 2건으로 흉내 내 교착 없이 끝나는지 확인.
+
+실행: app 디렉터리에서 python -m scripts.executor_health_check [--block-s 2]
+"""
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+APP_ROOT = Path(__file__).resolve().parent.parent
+if str(APP_ROOT) not in sys.path:
+    sys.path.insert(0, str(APP_ROOT))
+
+
+def _build_app(block_s: float, inner_call):
+    from fastapi import FastAPI
+
+    from api.shared.executors import run_in  # type: ignore
+
+    def slow_model_call() -> str:
+        time.sleep(block_s)
+        return "done"
+
+    app = FastAPI()
+
+    @app.get("/health")
+    async def health():
+        return {"status": "healthy"}
+
+    @app.post("/blocking")
+    async def blocking():
+        return {"result": slow_model_call()}
+
+    @app.post("/dispatched")
+    async def dispatched():
+        return {"result": await run_in("model", slow_model_call)}
+
+    def orchestration() -> str:
+        # run_agent / run_spam_detection처럼 워커 스레드에서 허브 모델 엔드포인트를 동기 HTTP 호출
+        return inner_call("/dispatched")
+
+    @app.post("/orchestrate")
+    async def orchestrate():
+        return {"result": await run_in("orchestration", orchestration)}
+
+    return app
+
+
+async def _health_latency_during(client, path: str, block_s: float) -> float:
+    slow = asyncio.create_task(client.post(path))
+    await asyncio.sleep(0.1)  # 느린 요청이 먼저 핸들러에 들어가도록
+    start = time.perf_counter()
+    response = await client.get("/health")
+    latency = time.perf_counter() - start
+    assert response.status_code == 200
+    await slow
+    return latency
+
+
+async def _main(block_s: float) -> None:
+    import httpx
+
+    from api.shared import executors  # type: ignore
+
+    # 검증용으로 model 실행기를 작게 고정 (실서비스는 EXECUTOR_MODEL_* 설정)
+    executors._executors["model"] = executors.WorkloadExecutor("model", max_workers=1, max_queue=1)
+    executors._executors["orchestration"] = executors.WorkloadExecutor("orchestration", max_workers=2, max_queue=0)
+    loop = asyncio.get_running_loop()
+    holder = {}
+
+    def inner_call(path: str) -> str:
+        response = asyncio.run_coroutine_threadsafe(holder["client"].post(path), loop).result(timeout=block_s * 10)
+        return response.json()["result"]
+
+    app = _build_app(block_s, inner_call)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test", timeout=block_s * 10) as client:
+        holder["client"] = client
+        blocked = await _health_latency_during(client, "/blocking", block_s)
+        dispatched = await _health_latency_during(client, "/dispatched", block_s)
+        print(f"/health latency while /blocking runs  : {blocked * 1000:8.1f} ms")
+        print(f"/health latency while /dispatched runs: {dispatched * 1000:8.1f} ms")
+        assert dispatched < 0.2 < blocked, "실행기 경로에서는 /health가 막히지 않아야 함"
+
+        responses = await asyncio.gather(*(client.post("/dispatched") for _ in range(3)))
+        codes = sorted(r.status_code for r in responses)
+        print(f"3 concurrent /dispatched (workers=1, queue=1): {codes}")
+        rejected = [r for r in responses if r.status_code == 503]
+        assert codes == [200, 200, 503], codes
+        assert rejected[0].headers.get("retry-after"), "503에는 Retry-After가 있어야 함"
+
+        # 오케스트레이션 2건이 동시에 들어와도 안쪽 model 호출(1 worker + 1 queue)이 막히지 않아야 함
+        start = time.perf_counter()
+        responses = await asyncio.gather(*(client.post("/orchestrate") for _ in range(2)))
+        codes = [r.status_code for r in responses]
+        print(f"2 concurrent /orchestrate → inner /dispatched: {codes} in {time.perf_counter() - start:.1f}s")
+        assert codes == [200, 200], codes
+        print("executor stats:", executors.executor_stats())
+    print("OK")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--block-s", type=float, default=2.0)
+    args = parser.parse_args()
+    asyncio.run(_main(args.block_s))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Hub HTTP 호출 오버헤드 벤치마크: 호출마다 새 httpx.Client vs HttpClientManager 공유 풀.
+
+로컬 스텁 서버(127.0.0.1, HTTP/1.1 keep-alive, 즉시 {"result": "ok"} 응답)를 띄우고
+같은 POST를 N번 보내 호출당 평균 지연(ms)을 비교. 모델·DB 없이 연결 수립/해제 비용만 측정.
+
+실행: app 디렉터리에서 python -m scripts.http_client_bench [--calls 500]
+"""
+import argparse
+import asyncio
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable
+
+APP_ROOT = Path(__file__).resolve().parent.parent
+if str(APP_ROOT) not in sys.path:
+    sys.path.insert(0, str(APP_ROOT))
+
+PATH = "/internal/llama/classify"
+PAYLOAD = {"text": "bench"}
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:  # noqa: N802
+        length = int(self.headers.get("Content-Length") or 0)
+        self.rfile.read(length)
+        body = json.dumps({"result": "ok"}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:  # noqa: A002
+        pass
+
+
+def _start_stub() -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _time_ms(fn: Callable[[], None], calls: int) -> float:
+    fn()  # 워밍업 (풀 경로는 첫 연결 수립)
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) * 1000.0 / calls
+
+
+async def _atime_ms(fn, calls: int) -> float:
+    await fn()
+    start = time.perf_counter()
+    for _ in range(calls):
+        await fn()
+    return (time.perf_counter() - start) * 1000.0 / calls
+
+
+def main() -> None:
+    import httpx
+
+    from domain.hub.mcp.http_client import HttpClientManager  # type: ignore
+
+    parser = argparse.ArgumentParser(description="Hub HTTP 클라이언트 풀 벤치마크")
+    parser.add_argument("--calls", type=int, default=500, help="측정 호출 수")
+    args = parser.parse_args()
+
+    server = _start_stub()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    url = base + PATH
+    manager = HttpClientManager()
+
+    def per_call_sync() -> None:
+        with httpx.Client(timeout=10.0) as client:
+            client.post(url, json=PAYLOAD).raise_for_status()
+
+    def pooled_sync() -> None:
+        manager.get(base).post(url, json=PAYLOAD, timeout=manager.timeout(base, 10.0)).raise_for_status()
+
+    async def per_call_async() -> None:
+        async with httpx.AsyncClient(timeout=10.0) as client:
+            (await client.post(url, json=PAYLOAD)).raise_for_status()
+
+    async def pooled_async() -> None:
+        (await manager.aget(base).post(url, json=PAYLOAD, timeout=manager.timeout(base, 10.0))).raise_for_status()
+
+    async def run_async() -> tuple:
+        before = await _atime_ms(per_call_async, args.calls)
+        after = await _atime_ms(pooled_async, args.calls)
+        await manager.aclose()
+        return before, after
+
+    try:
+        sync_before = _time_ms(per_call_sync, args.calls)
+        sync_after = _time_ms(pooled_sync, args.calls)
+        async_before, async_after = asyncio.run(run_async())
+    finally:
+        manager.close()
+        server.shutdown()
+
+    print(f"{'mode':<8} {'per-call Client':>16} {'pooled':>10} {'speedup':>8}  (ms/call, {args.calls} calls)")
+    print(f"{'sync':<8} {sync_before:>16.3f} {sync_after:>10.3f} {sync_before / sync_after:>7.1f}x")
+    print(f"{'async':<8} {async_before:>16.3f} {async_after:>10.3f} {async_before / async_after:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
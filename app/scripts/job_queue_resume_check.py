@@ -0,0 +1,115 @@
+"""작업 큐 확인 - 실행 중인 워커를 강제 종료(SIGKILL)해도 작업이 진행률부터 이어서 완료되는지.
+
+임시 SQLite 큐에 스텁 작업(--steps 단계, 단계마다 진행률 저장) 하나를 넣고:
+1. 워커 프로세스 A 실행 → 진행률이 --kill-after 단계 이상이 되면 kill -9
+2. 임대 만료 전에는 다른 워커가 claim하지 못하는지 확인
+3. 워커 프로세스 B 실행 → 임대 만료 후 작업을 이어받아 완료
+4. attempts == 2, 결과 단계 수 == --steps, 실제 실행된 단계 수 <= steps + 1 (중단된 단계만 재실행) 확인
+
+실제 핸들러(soccer_embedding, disclosure_check)는 job_worker.py에서 같은 run_worker로 실행됨.
+
+실행: app 디렉터리에서 python -m scripts.job_queue_resume_check [--steps 10 --lease-s 1.5]
+"""
+import argparse
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+APP_ROOT = Path(__file__).resolve().parent.parent
+if str(APP_ROOT) not in sys.path:
+    sys.path.insert(0, str(APP_ROOT))
+
+from api.shared.job_queue import JobContext, SQLiteJobQueue, run_worker  # type: ignore  # noqa: E402
+
+KIND = "resume_stub"
+
+
+def _stub_handler(ctx: JobContext):
+    """진행률(done)부터 steps까지 한 단계씩 실행. 실행한 단계는 log 파일에 기록."""
+    start = int(ctx.progress.get("done", 0))
+    with open(ctx.payload["log"], "a") as log:
+        for step in range(start, ctx.payload["steps"]):
+            time.sleep(ctx.payload["step_s"])
+            log.write(f"{os.getpid()} {step}\n")
+            log.flush()
+            ctx.report_progress({"done": step + 1})
+    return {"steps": ctx.payload["steps"], "resumed_from": start}
+
+
+def _worker(db: str, lease_s: float) -> None:
+    queue = SQLiteJobQueue(db, lease_seconds=lease_s)
+    run_worker(queue, {KIND: _stub_handler}, poll_interval=0.1, max_jobs=1)
+
+
+def _spawn(db: str, lease_s: float) -> subprocess.Popen:
+    return subprocess.Popen(
+        [sys.executable, "-m", "scripts.job_queue_resume_check", "--worker", db, "--lease-s", str(lease_s)],
+        cwd=str(APP_ROOT),
+    )
+
+
+def _wait(queue: SQLiteJobQueue, job_id: str, predicate, timeout: float) -> dict:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = queue.get(job_id)
+        if predicate(job):
+            return job
+        time.sleep(0.05)
+    raise TimeoutError(f"대기 시간 초과: {queue.get(job_id)}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--steps", type=int, default=10)
+    parser.add_argument("--step-s", type=float, default=0.2)
+    parser.add_argument("--kill-after", type=int, default=4)
+    parser.add_argument("--lease-s", type=float, default=1.5)
+    parser.add_argument("--worker", type=str, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        _worker(args.worker, args.lease_s)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = str(Path(tmp) / "jobs.sqlite3")
+        log = str(Path(tmp) / "steps.log")
+        queue = SQLiteJobQueue(db, lease_seconds=args.lease_s)
+        job_id = queue.enqueue(KIND, {"steps": args.steps, "step_s": args.step_s, "log": log})
+
+        a = _spawn(db, args.lease_s)
+        _wait(queue, job_id, lambda j: (j["progress"] or {}).get("done", 0) >= args.kill_after, timeout=30)
+        os.kill(a.pid, signal.SIGKILL)
+        a.wait()
+        killed_at = queue.get(job_id)
+        print(f"worker A (pid {a.pid}) killed: status={killed_at['status']} progress={killed_at['progress']}")
+        assert killed_at["status"] == "running"
+
+        assert queue.claim("probe", [KIND]) is None, "임대 만료 전에는 다른 워커가 가져가면 안 됨"
+
+        b = _spawn(db, args.lease_s)
+        start = time.monotonic()
+        job = _wait(queue, job_id, lambda j: j["status"] in ("completed", "failed"), timeout=60)
+        b.wait(timeout=30)
+        print(f"worker B (pid {b.pid}) finished in {time.monotonic() - start:.1f}s: status={job['status']}")
+        print(f"attempts={job['attempts']} result={job['result']}")
+
+        executed = [line.split() for line in Path(log).read_text().splitlines()]
+        steps_done = sorted({int(step) for _, step in executed})
+        print(f"step executions: {len(executed)} (unique {len(steps_done)}) across pids {sorted({p for p, _ in executed})}")
+
+        assert job["status"] == "completed", job
+        assert job["attempts"] == 2, job["attempts"]
+        assert job["result"]["resumed_from"] >= args.kill_after, job["result"]
+        assert steps_done == list(range(args.steps)), steps_done
+        assert len(executed) <= args.steps + 1, "중단된 단계 외에는 다시 실행하지 않아야 함"
+        print("queue stats:", queue.stats())
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""공시 확인 작업 레지스트리 확인 - 작업이 계속 들어와도 메모리가 상한 안에 머무는지.
+
+기존 방식(모듈 전역 dict)과 BoundedJobRegistry에 같은 부하를 걸고 비교:
+- 스레드 --threads개가 create → (실행기 스레드처럼) set_result를 --jobs건 반복
+- 결과는 --result-kb 크기 문자열 (레지스트리 쪽은 _cap_result와 같은 방식으로 --max-chars까지 잘라 저장)
+- tracemalloc 피크, 상주 작업 수, evicted/expired 지표 출력
+- 마지막에 TTL 경과 후 완료 작업이 조회되지 않는지 확인
+
+실행: app 디렉터리에서 python -m scripts.job_registry_check [--jobs 20000 --max-entries 500]
+"""
+import argparse
+import sys
+import threading
+import time
+import tracemalloc
+import uuid
+from pathlib import Path
+
+APP_ROOT = Path(__file__).resolve().parent.parent
+if str(APP_ROOT) not in sys.path:
+    sys.path.insert(0, str(APP_ROOT))
+
+from api.shared.job_registry import BoundedJobRegistry  # type: ignore  # noqa: E402
+
+
+def _load(create, finish, jobs: int, threads: int) -> float:
+    per_thread = jobs // threads
+
+    def worker() -> None:
+        for _ in range(per_thread):
+            job_id = str(uuid.uuid4())
+            create(job_id)
+            finish(job_id)
+
+    tracemalloc.start()
+    pool = [threading.Thread(target=worker) for _ in range(threads)]
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--jobs", type=int, default=20000)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--max-entries", type=int, default=500)
+    parser.add_argument("--ttl-s", type=float, default=1.5)
+    parser.add_argument("--result-kb", type=int, default=8)
+    parser.add_argument("--max-chars", type=int, default=4000)
+    args = parser.parse_args()
+
+    payload = "가" * (args.result_kb * 1024)
+
+    plain: dict = {}
+    lock = threading.Lock()
+
+    def plain_create(job_id: str) -> None:
+        with lock:
+            plain[job_id] = {"status": "pending", "result": None, "error": None}
+
+    def plain_finish(job_id: str) -> None:
+        with lock:
+            plain[job_id] = {"status": "completed", "result": payload + job_id, "error": None}
+
+    registry = BoundedJobRegistry(max_entries=args.max_entries, ttl_seconds=args.ttl_s)
+
+    def bounded_finish(job_id: str) -> None:
+        registry.set_result(job_id, "completed", result=(payload + job_id)[: args.max_chars])
+
+    plain_peak = _load(plain_create, plain_finish, args.jobs, args.threads)
+    bounded_peak = _load(registry.create, bounded_finish, args.jobs, args.threads)
+    stats = registry.stats()
+    print(f"plain dict : resident={len(plain):>6}  peak={plain_peak:8.1f} MB")
+    print(f"registry   : resident={stats['resident']:>6}  peak={bounded_peak:8.1f} MB  stats={stats}")
+
+    assert stats["resident"] <= args.max_entries
+    assert stats["created"] == stats["resident"] + stats["evicted"] + stats["expired"]
+    assert bounded_peak < plain_peak
+
+    last = str(uuid.uuid4())
+    registry.create(last)
+    registry.set_result(last, "completed", result="done")
+    assert registry.get(last)["status"] == "completed"
+    time.sleep(args.ttl_s + 1.1)
+    assert registry.get(last) is None, "TTL이 지난 완료 작업은 조회되지 않아야 함"
+    print(f"after TTL  : resident={len(registry)}  stats={registry.stats()}")
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Hub LLM 응답 캐시(ResponseCache) 동작 확인 (모델 없음, 느린 가짜 compute).
+
+- 같은 입력·버전·결정적 파라미터 → 두 번째부터 메모리 적중, compute 1회
+- dict 입력은 키 순서가 달라도 같은 키, 버전/파라미터가 다르면 다른 키
+- 샘플링 파라미터(do_sample=True, temperature>0) → 항상 우회
+- compute 예외는 저장하지 않음, 반환 dict를 수정해도 캐시 값은 그대로
+- 디스크 계층: 새 인스턴스(=재시작)에서 디스크 적중
+- 중복 비율 50% 트래픽에서 캐시 유/무 소요 시간 비교
+
+실행: app 디렉터리에서 python -m scripts.llm_response_cache_check [--requests 200 --latency-ms 5]
+"""
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+APP_ROOT = Path(__file__).resolve().parent.parent
+if str(APP_ROOT) not in sys.path:
+    sys.path.insert(0, str(APP_ROOT))
+
+GREEDY = {"max_new_tokens": 256, "do_sample": False}
+SAMPLED = {"max_new_tokens": 256, "temperature": 0.7, "do_sample": True}
+
+
+def _check_semantics(cache_cls) -> None:
+    calls = {"n": 0}
+
+    def compute():
+        calls["n"] += 1
+        return {"label": "SPAM", "n": calls["n"]}
+
+    cache = cache_cls(max_entries=16)
+    a = cache.get_or_compute("ns", {"subject": "s", "sender": "x"}, compute, version="v1", params=GREEDY)
+    b = cache.get_or_compute("ns", {"sender": "x", "subject": "s"}, compute, version="v1", params=GREEDY)
+    assert a == b and calls["n"] == 1, "키 순서만 다른 dict 입력은 같은 키여야 함"
+    b["label"] = "HAM"
+    c = cache.get_or_compute("ns", {"subject": "s", "sender": "x"}, compute, version="v1", params=GREEDY)
+    assert c["label"] == "SPAM", "반환값 수정이 캐시에 반영되면 안 됨"
+    cache.get_or_compute("ns", {"subject": "s", "sender": "x"}, compute, version="v2", params=GREEDY)
+    assert calls["n"] == 2, "모델 버전이 다르면 미스여야 함"
+    cache.get_or_compute("ns", "p", compute, params=SAMPLED)
+    cache.get_or_compute("ns", "p", compute, params=SAMPLED)
+    assert calls["n"] == 4, "샘플링 생성은 우회해야 함"
+
+    def failing():
+        raise RuntimeError("boom")
+
+    for _ in range(2):
+        try:
+            cache.get_or_compute("ns", "err", failing, params=GREEDY)
+        except RuntimeError:
+            pass
+    stats = cache.stats()
+    assert stats["bypassed"] == 2 and stats["memory_hits"] == 2, stats
+    print("semantics OK:", stats)
+
+
+def _check_disk(cache_cls) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "llm_cache.sqlite3")
+        first = cache_cls(max_entries=4, disk_path=path)
+        first.get_or_compute("ns", "hello", lambda: "world", params=GREEDY)
+        second = cache_cls(max_entries=4, disk_path=path)
+        value = second.get_or_compute("ns", "hello", lambda: "recomputed", params=GREEDY)
+        assert value == "world", value
+        assert second.stats()["disk_hits"] == 1
+        print("disk tier OK:", second.stats())
+
+
+def _bench(cache_cls, requests: int, latency_ms: float) -> None:
+    rng = random.Random(0)
+    # 절반은 이전 입력 재사용 (중복 메일·재시도)
+    inputs = []
+    for i in range(requests):
+        inputs.append(rng.choice(inputs) if inputs and rng.random() < 0.5 else f"email-{i}")
+
+    def compute():
+        time.sleep(latency_ms / 1000)
+        return "result"
+
+    for label, enabled in (("no cache", False), ("cache", True)):
+        cache = cache_cls(max_entries=4096, enabled=enabled)
+        start = time.perf_counter()
+        for text in inputs:
+            cache.get_or_compute("exaone.analyze_email", text, compute, params=GREEDY)
+        elapsed = time.perf_counter() - start
+        print(f"{label:>9}: {elapsed * 1000:8.1f} ms  hit_rate={cache.stats()['hit_rate']}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    from domain.hub.llm.response_cache import ResponseCache  # type: ignore
+
+    _check_semantics(ResponseCache)
+    _check_disk(ResponseCache)
+    _bench(ResponseCache, args.requests, args.latency_ms)
+
+
+if __name__ == "__main__":
+    main()
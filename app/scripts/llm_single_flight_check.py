@@ -0,0 +1,101 @@
+"""동시 동일 요청 병합(single-flight) 확인 - 카운팅 스텁에 N개 동시 호출.
+
+- SingleFlight.do: N 스레드가 같은 키로 동시에 호출 → 스텁 실행 1회, N개 모두 같은 결과
+- 예외: leader 예외가 같은 키의 모든 호출자에게 전달, 실행은 1회
+- 키가 다르면 병합하지 않음
+- ResponseCache(캐시 끔 + 병합 켬)로도 동일 (classify_spam / analyze_email 어댑터 경로)
+
+실행: app 디렉터리에서 python -m scripts.llm_single_flight_check [--callers 32 --latency-ms 200]
+"""
+import argparse
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, List
+
+APP_ROOT = Path(__file__).resolve().parent.parent
+if str(APP_ROOT) not in sys.path:
+    sys.path.insert(0, str(APP_ROOT))
+
+
+class CountingStub:
+    """호출 횟수를 세고 latency만큼 막히는 가짜 모델."""
+
+    def __init__(self, latency_s: float, fail: bool = False) -> None:
+        self.latency_s = latency_s
+        self.fail = fail
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self) -> Any:
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.latency_s)
+        if self.fail:
+            raise RuntimeError("stub failure")
+        return {"spam_prob": 0.9, "confidence": "high", "label": "SPAM"}
+
+
+def _fire(n: int, call: Callable[[int], Any]) -> List[Any]:
+    """n개 스레드를 barrier로 맞춰 동시에 call(i) 실행, 결과 또는 예외 목록 반환."""
+    barrier = threading.Barrier(n)
+
+    def run(i: int) -> Any:
+        barrier.wait()
+        try:
+            return call(i)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=n) as pool:
+        return list(pool.map(run, range(n)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--callers", type=int, default=32)
+    parser.add_argument("--latency-ms", type=float, default=200.0)
+    args = parser.parse_args()
+    n, latency = args.callers, args.latency_ms / 1000
+
+    from domain.hub.llm.response_cache import ResponseCache  # type: ignore
+    from domain.hub.llm.single_flight import SingleFlight  # type: ignore
+
+    flight = SingleFlight()
+    stub = CountingStub(latency)
+    start = time.perf_counter()
+    results = _fire(n, lambda i: flight.do("same-email", stub))
+    elapsed = time.perf_counter() - start
+    assert stub.calls == 1, f"실행 {stub.calls}회 (1회여야 함)"
+    assert all(r == results[0] for r in results), "모든 호출자가 같은 결과를 받아야 함"
+    assert len({id(r) for r in results}) == n, "호출자마다 별도 객체여야 함"
+    print(f"same key   : {n} callers, executions={stub.calls}, {elapsed * 1000:.0f} ms, {flight.stats()}")
+
+    failing = CountingStub(latency, fail=True)
+    results = _fire(n, lambda i: flight.do("bad-email", failing))
+    assert failing.calls == 1 and all(isinstance(r, RuntimeError) for r in results), results
+    print(f"error      : {n} callers, executions={failing.calls}, all raised RuntimeError")
+
+    distinct = CountingStub(latency)
+    _fire(4, lambda i: flight.do(f"email-{i}", distinct))
+    assert distinct.calls == 4, distinct.calls
+    print(f"distinct   : 4 keys, executions={distinct.calls}")
+
+    cache = ResponseCache(enabled=False, coalesce=True)
+    stub = CountingStub(latency)
+    greedy = {"max_new_tokens": 256, "do_sample": False}
+    results = _fire(
+        n,
+        lambda i: cache.get_or_compute(
+            "llama.classify_spam", {"subject": "newsletter", "sender": "a@b.c"}, stub, params=greedy
+        ),
+    )
+    assert stub.calls == 1 and all(r == results[0] for r in results)
+    print(f"via cache  : executions={stub.calls}, coalesced={cache.stats()['coalesced']}")
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""BatchingQueryEmbedder 동작 확인 (가짜 인코더, 모델 로드 없음).
+
+1. 순서    : 여러 스레드·asyncio 호출자가 동시에 요청해도 각자 자기 텍스트의 벡터를 받는지
+2. 병합    : 인코더가 바쁜 동안 쌓인 요청이 max_batch_size씩 한 번의 encode로 묶이는지 (초과 없음)
+3. 예외    : 배치 인코딩 실패·출력 개수 불일치 시 그 배치의 Future마다 예외, 워커는 계속 동작
+4. 취소    : 대기 중 취소된 Future는 인코딩에서 빠지는지
+5. close() : 큐에 남은 요청을 모두 처리한 뒤 워커 종료, 이후 submit은 RuntimeError
+
+실행: app 디렉터리에서 python -m scripts.query_batcher_check [--callers 200 --max-batch-size 8]
+"""
+import argparse
+import asyncio
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List
+
+APP_ROOT = Path(__file__).resolve().parent.parent
+if str(APP_ROOT) not in sys.path:
+    sys.path.insert(0, str(APP_ROOT))
+
+from domain.shared.query_batcher import BatchingQueryEmbedder  # type: ignore  # noqa: E402
+
+
+class FakeEncoder:
+    """텍스트 "q-<n>" → [n, len]. gate가 닫혀 있으면 encode에서 대기, "boom"이 있으면 예외."""
+
+    def __init__(self) -> None:
+        self.batches: List[List[str]] = []
+        self.gate = threading.Event()
+        self.gate.set()
+        self.entered = threading.Event()
+        self.short_by_one = False
+
+    def embed_queries(self, texts: List[str]) -> List[List[float]]:
+        self.batches.append(list(texts))
+        self.entered.set()
+        self.gate.wait()
+        if any(t == "boom" for t in texts):
+            raise ValueError("fake encoder failure")
+        vectors = [[float(t.split("-")[1]) if "-" in t else -1.0, float(len(t))] for t in texts]
+        return vectors[:-1] if self.short_by_one else vectors
+
+
+def _hold(encoder: FakeEncoder, batcher: BatchingQueryEmbedder) -> None:
+    """인코더를 막아 두고 워커가 첫 배치(1건)를 잡을 때까지 대기."""
+    encoder.gate.clear()
+    encoder.entered.clear()
+    batcher.submit("q-0")
+    assert encoder.entered.wait(5), "워커가 첫 배치를 잡지 못함"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--callers", type=int, default=200)
+    parser.add_argument("--max-batch-size", type=int, default=8)
+    parser.add_argument("--max-wait-ms", type=float, default=5.0)
+    args = parser.parse_args()
+    if args.max_wait_ms <= 0:
+        parser.error("--max-wait-ms는 0보다 커야 합니다 (0이면 배처가 요청을 모으지 않음)")
+    size = args.max_batch_size
+    failures: List[str] = []
+
+    # 1. 순서: 동시 호출자마다 자기 벡터
+    encoder = FakeEncoder()
+    batcher = BatchingQueryEmbedder(encoder, max_batch_size=size, max_wait_ms=args.max_wait_ms)
+    with ThreadPoolExecutor(max_workers=32) as pool:
+        got = list(pool.map(lambda i: batcher.embed_query(f"q-{i}"), range(args.callers)))
+
+    async def _async_callers() -> List[List[float]]:
+        return await asyncio.gather(*(batcher.aembed_query(f"q-{i}") for i in range(args.callers)))
+
+    got_async = asyncio.run(_async_callers())
+    wrong = [i for i, v in enumerate(got) if v[0] != float(i)] + [i for i, v in enumerate(got_async) if v[0] != float(i)]
+    sizes = [len(b) for b in encoder.batches]
+    print(f"ordering   : {2 * args.callers} calls → {len(sizes)} encodes, max batch {max(sizes)}  stats={batcher.stats()}")
+    if wrong:
+        failures.append(f"다른 호출자의 벡터를 받음: {wrong[:5]}")
+    if max(sizes) > size:
+        failures.append(f"max_batch_size 초과 배치: {max(sizes)}")
+
+    # 2. 병합: 인코더가 바쁜 동안 쌓인 2*size+3건 → size씩 (기본 [8, 8, 3])
+    encoder.batches.clear()
+    _hold(encoder, batcher)
+    futures = [batcher.submit(f"q-{i}") for i in range(1, 2 * size + 4)]
+    encoder.gate.set()
+    vectors = [f.result(5) for f in futures]
+    sizes = [len(b) for b in encoder.batches]
+    expected = [1] + [min(size, len(futures) - i) for i in range(0, len(futures), size)]
+    print(f"merging    : queued {len(futures)} while busy → batches {sizes}")
+    if sizes != expected:
+        failures.append(f"대기 요청이 max_batch_size씩 병합되지 않음: {sizes}")
+    if [v[0] for v in vectors] != [float(i) for i in range(1, 2 * size + 4)]:
+        failures.append("병합 배치의 결과 순서가 제출 순서와 다름")
+
+    # 3. 예외: 실패한 배치의 Future마다 예외, 다음 배치는 정상
+    _hold(encoder, batcher)
+    doomed = [batcher.submit("boom")] + [batcher.submit(f"q-{i}") for i in range(1, size)]
+    encoder.gate.set()
+    errors = [f.exception(5) for f in doomed]
+    after = batcher.embed_query("q-7")
+    encoder.short_by_one = True
+    mismatch = batcher.submit("q-9").exception(5)
+    encoder.short_by_one = False
+    print(f"exception  : {sum(isinstance(e, ValueError) for e in errors)}/{len(doomed)} futures failed, "
+          f"next call {after}, count mismatch → {type(mismatch).__name__}")
+    if not all(isinstance(e, ValueError) for e in errors):
+        failures.append(f"실패 배치의 Future가 모두 예외를 받지 않음: {errors}")
+    if after[0] != 7.0:
+        failures.append("인코딩 실패 후 워커가 다음 요청을 처리하지 못함")
+    if not isinstance(mismatch, RuntimeError):
+        failures.append(f"출력 개수 불일치가 Future 예외로 전달되지 않음: {mismatch!r}")
+
+    # 4. 취소: 대기 중 취소된 요청은 인코딩하지 않음
+    encoder.batches.clear()
+    _hold(encoder, batcher)
+    cancelled = batcher.submit("q-100")
+    kept = batcher.submit("q-101")
+    cancelled.cancel()
+    encoder.gate.set()
+    kept.result(5)
+    encoded = [t for b in encoder.batches for t in b]
+    print(f"cancel     : encoded {encoded}")
+    if "q-100" in encoded:
+        failures.append("취소된 요청이 인코딩됨")
+
+    # 5. close(): 남은 요청 처리 후 종료
+    _hold(encoder, batcher)
+    pending = [batcher.submit(f"q-{i}") for i in range(1, 3 * size)]
+    closer = threading.Thread(target=batcher.close, kwargs={"timeout": 10})
+    closer.start()
+    encoder.gate.set()
+    closer.join(10)
+    done = [f.done() and f.exception() is None for f in pending]
+    worker_alive = batcher._worker is not None and batcher._worker.is_alive()
+    try:
+        batcher.submit("q-1")
+        rejected = False
+    except RuntimeError:
+        rejected = True
+    print(f"close      : {sum(done)}/{len(pending)} queued requests answered, worker alive={worker_alive}, "
+          f"submit after close rejected={rejected}")
+    if not all(done):
+        failures.append("close()가 큐에 남은 요청을 처리하지 않고 종료")
+    if worker_alive:
+        failures.append("close() 후에도 워커가 살아 있음")
+    if not rejected:
+        failures.append("close() 후 submit이 거부되지 않음")
+
+    if failures:
+        for f in failures:
+            print(f"[FAIL] {f}", file=sys.stderr)
+        sys.exit(1)
+    print("[OK] 순서·병합·예외·취소·close 동작 확인.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""RAG 저장소 병렬 검색 확인: 순차 실행(합) vs graph_orchestrator._run_retrievals(최대값).
+
+DB·모델 없이 sleep 하는 가짜 저장소 3개(main/disclosure/anchors)로 지연을 재고,
+타임아웃 저장소는 결과 없이(None) 건너뛰는지 확인.
+
+실행: app 디렉터리에서 python -m scripts.rag_fanout_bench [--delays 0.3 0.5 0.2]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+APP_ROOT = Path(__file__).resolve().parent.parent
+if str(APP_ROOT) not in sys.path:
+    sys.path.insert(0, str(APP_ROOT))
+
+STORES = ("main", "disclosure", "anchors")
+
+
+def _fake_store(name: str, delay: float) -> Callable[[], Any]:
+    def search() -> Any:
+        time.sleep(delay)
+        return [(f"{name}-doc", 0.1)]
+
+    return search
+
+
+def main() -> None:
+    from domain.hub.orchestrators import graph_orchestrator as go  # type: ignore
+
+    parser = argparse.ArgumentParser(description="RAG 저장소 fan-out 지연 확인")
+    parser.add_argument("--delays", type=float, nargs=3, default=[0.3, 0.5, 0.2], help="main disclosure anchors 지연(초)")
+    args = parser.parse_args()
+    delays = dict(zip(STORES, args.delays))
+    tasks: Dict[str, Callable[[], Any]] = {name: _fake_store(name, d) for name, d in delays.items()}
+
+    start = time.perf_counter()
+    for fn in tasks.values():
+        fn()
+    sequential = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = go._run_retrievals(tasks)
+    fanout = time.perf_counter() - start
+
+    print(f"sequential={sequential:.3f}s  fan-out={fanout:.3f}s  (slowest={max(delays.values()):.3f}s, sum={sum(delays.values()):.3f}s)")
+    ok = all(results[name] for name in STORES) and fanout < max(delays.values()) + 0.1
+
+    # 가장 느린 저장소만 타임아웃 → 나머지 결과는 유지 (부분 결과)
+    slowest = max(delays, key=delays.get)
+    saved = dict(go.RAG_STORE_TIMEOUTS)
+    go.RAG_STORE_TIMEOUTS[slowest] = delays[slowest] / 2
+    try:
+        partial = go._run_retrievals(tasks)
+    finally:
+        go.RAG_STORE_TIMEOUTS.clear()
+        go.RAG_STORE_TIMEOUTS.update(saved)
+    ok = ok and partial[slowest] is None and all(partial[n] for n in STORES if n != slowest)
+    print(f"timeout({slowest}) → {[n for n in STORES if partial[n]]} 유지")
+
+    if not ok:
+        print("[FAIL] fan-out 지연 또는 부분 결과가 기대와 다릅니다.", file=sys.stderr)
+        sys.exit(1)
+    print("[OK] 지연 ≈ 가장 느린 저장소, 타임아웃 저장소만 제외.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""시멘틱 분류기 score 모드 확인 (CPU, 작은 랜덤 초기화 causal LM + 학습한 바이트 BPE 토크나이저).
+
+score_labels(domain.hub.service.semantic_classifier)를 tiny LlamaForCausalLM으로 실행해:
+1. 라벨 토큰 : 프롬프트("...액션:") + 학습 응답("액션: RULE_BASED")을 통째로 토크나이즈했을 때
+   프롬프트 토큰 뒤 첫 토큰이 _label_token_ids와 같은지 (앞 공백이 라벨 토큰에 붙는 " RULE")
+2. 온도 T=1.0 : 건별 결과가 라벨 logit을 직접 softmax한 값과 같은지
+3. 라벨 순서 : 결과 키가 LABELS 순서, 행 합이 1, 입력을 섞으면 결과도 같은 순서로 섞이는지
+4. 배치 : batch_size 1 / 3 / 전체(왼쪽 패딩)의 확률 차이가 1e-4 이하인지
+5. 긴 메시지 : 512토큰을 넘는 메시지도 입력이 "액션:"으로 끝나고(메시지 뒤쪽만 잘림),
+   결과가 잘린 프롬프트를 직접 forward한 softmax와 같으며 짧은 메시지와 한 배치여도 같은지
+
+실행: app 디렉터리에서 python -m scripts.semantic_classifier_score_check [--messages 24]
+"""
+import argparse
+import random
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+APP_ROOT = Path(__file__).resolve().parent.parent
+if str(APP_ROOT) not in sys.path:
+    sys.path.insert(0, str(APP_ROOT))
+
+WORDS = ["선수", "팀", "경기", "일정", "규정", "정책", "해킹", "비밀번호", "몇", "명", "알려줘", "왜", "어떻게", "2024년"]
+ANSWERS = ["액션: BLOCK", "액션: RULE_BASED", "액션: POLICY_BASED"]
+
+
+def _messages(n: int) -> List[str]:
+    rng = random.Random(0)
+    return [" ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 25))) + "?" for _ in range(n)]
+
+
+def _tiny_lm():
+    import torch
+    from tokenizers import Tokenizer, decoders, models, pre_tokenizers, trainers
+    from transformers import LlamaConfig, LlamaForCausalLM, PreTrainedTokenizerFast
+
+    from domain.hub.service.semantic_classifier import _build_prompt  # type: ignore
+
+    # Llama-3처럼 바이트 수준 BPE: 학습 응답에서 " RULE" 같은 공백 포함 토큰이 생김
+    backend = Tokenizer(models.BPE())
+    backend.pre_tokenizer = pre_tokenizers.ByteLevel(add_prefix_space=False)
+    backend.decoder = decoders.ByteLevel()
+    corpus = [_build_prompt(object(), m) + a for m in _messages(64) for a in ANSWERS]
+    trainer = trainers.BpeTrainer(
+        vocab_size=600,
+        special_tokens=["<pad>"],
+        initial_alphabet=pre_tokenizers.ByteLevel.alphabet(),
+    )
+    backend.train_from_iterator(corpus, trainer)
+    tokenizer = PreTrainedTokenizerFast(tokenizer_object=backend, pad_token="<pad>")
+
+    torch.manual_seed(0)
+    config = LlamaConfig(
+        vocab_size=backend.get_vocab_size(),
+        hidden_size=64,
+        intermediate_size=128,
+        num_hidden_layers=2,
+        num_attention_heads=4,
+        num_key_value_heads=2,
+        max_position_embeddings=1024,
+        pad_token_id=tokenizer.pad_token_id,
+    )
+    return LlamaForCausalLM(config).eval(), tokenizer
+
+
+def _max_delta(a: List[Dict[str, float]], b: List[Dict[str, float]]) -> float:
+    return max(abs(x[k] - y[k]) for x, y in zip(a, b) for k in x)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="score_labels 라벨 토큰·순서·배치 확인")
+    parser.add_argument("--messages", type=int, default=24)
+    args = parser.parse_args()
+
+    import torch
+
+    from domain.hub.service.semantic_classifier import (  # type: ignore
+        _ANSWER_PREFIX,
+        _MAX_PROMPT_TOKENS,
+        LABELS,
+        _build_prompt,
+        _fit_message,
+        _label_token_ids,
+        score_labels,
+    )
+
+    model, tokenizer = _tiny_lm()
+    messages = _messages(args.messages)
+    failures: List[str] = []
+
+    # 1. 라벨 토큰 = 학습 응답 토크나이즈에서 프롬프트 바로 뒤 토큰
+    label_ids = _label_token_ids(tokenizer)
+    prompt = _build_prompt(tokenizer, messages[0]) + _ANSWER_PREFIX
+    prompt_ids = tokenizer.encode(prompt)
+    for label, label_id, answer in zip(LABELS, label_ids, ANSWERS):
+        full = tokenizer.encode(_build_prompt(tokenizer, messages[0]) + answer)
+        piece = tokenizer.convert_ids_to_tokens(label_id)
+        print(f"{label:<13} token={piece!r:<10} id={label_id}")
+        if full[: len(prompt_ids)] != prompt_ids or full[len(prompt_ids)] != label_id:
+            failures.append(f"{label}: 학습 응답의 라벨 토큰({full[len(prompt_ids):][:1]})과 점수 토큰({label_id})이 다름")
+        if not piece.startswith("Ġ"):
+            failures.append(f"{label}: 라벨 토큰에 앞 공백이 없음 ({piece!r})")
+
+    # 2. T=1.0 → 라벨 logit의 softmax 그대로
+    single = [score_labels([m], model=model, tokenizer=tokenizer, batch_size=1, temperature=1.0)[0] for m in messages]
+    with torch.no_grad():
+        logits = model(**tokenizer(_build_prompt(tokenizer, messages[0]) + _ANSWER_PREFIX, return_tensors="pt")).logits
+    direct = torch.softmax(logits[0, -1, label_ids].float(), dim=-1).tolist()
+    if max(abs(single[0][k] - p) for k, p in zip(LABELS, direct)) > 1e-5:
+        failures.append(f"T=1.0 확률이 직접 softmax와 다름: {single[0]} vs {direct}")
+
+    # 3. 라벨 순서·입력 순서
+    for row in single:
+        if tuple(row) != LABELS or abs(sum(row.values()) - 1.0) > 1e-5:
+            failures.append(f"라벨 키 순서/합 오류: {row}")
+            break
+    order = list(range(len(messages)))
+    random.Random(1).shuffle(order)
+    shuffled = score_labels([messages[i] for i in order], model=model, tokenizer=tokenizer, batch_size=8, temperature=1.0)
+    delta = _max_delta([single[i] for i in order], shuffled)
+    print(f"shuffled input     max|Δp|={delta:.2e}")
+    if delta > 1e-4:
+        failures.append("입력을 섞었을 때 결과가 같은 순서로 섞이지 않음")
+
+    # 4. 배치 크기와 무관 (왼쪽 패딩)
+    for batch_size in (3, len(messages)):
+        got = score_labels(messages, model=model, tokenizer=tokenizer, batch_size=batch_size, temperature=1.0)
+        delta = _max_delta(single, got)
+        print(f"batch_size={batch_size:<6} max|Δp|={delta:.2e}")
+        if len(got) != len(messages) or delta > 1e-4:
+            failures.append(f"batch_size={batch_size} 결과가 건별 결과와 다름")
+    if tokenizer.padding_side != "right" or tokenizer.truncation_side != "right":
+        failures.append(f"padding/truncation_side가 복원되지 않음: {tokenizer.padding_side}/{tokenizer.truncation_side}")
+
+    # 5. 긴 메시지: 끝("액션:")이 잘리지 않아야 마지막 logit이 라벨 자리
+    long_message = " ".join(WORDS[i % len(WORDS)] for i in range(4 * _MAX_PROMPT_TOKENS))
+    fitted = _build_prompt(tokenizer, _fit_message(tokenizer, long_message, _ANSWER_PREFIX)) + _ANSWER_PREFIX
+    fitted_ids = tokenizer.encode(fitted)
+    suffix_ids = tokenizer.encode(_ANSWER_PREFIX)
+    with torch.no_grad():
+        logits = model(input_ids=torch.tensor([fitted_ids])).logits
+    direct = torch.softmax(logits[0, -1, label_ids].float(), dim=-1).tolist()
+    long_single = score_labels([long_message], model=model, tokenizer=tokenizer, batch_size=1, temperature=1.0)[0]
+    mixed = score_labels([messages[0], long_message], model=model, tokenizer=tokenizer, batch_size=2, temperature=1.0)
+    delta = max(abs(long_single[k] - p) for k, p in zip(LABELS, direct))
+    print(
+        f"long message       {len(tokenizer.encode(long_message))} tokens → prompt {len(fitted_ids)} tokens, "
+        f"max|Δp|={delta:.2e}"
+    )
+    if len(fitted_ids) > _MAX_PROMPT_TOKENS or fitted_ids[-len(suffix_ids):] != suffix_ids:
+        failures.append("긴 메시지 프롬프트가 상한을 넘거나 \"액션:\"으로 끝나지 않음")
+    if delta > 1e-5:
+        failures.append("긴 메시지 결과가 잘린 프롬프트의 직접 softmax와 다름")
+    if _max_delta([single[0], long_single], mixed) > 1e-4:
+        failures.append("긴 메시지와 짧은 메시지를 한 배치로 처리하면 결과가 달라짐")
+
+    if failures:
+        for f in failures:
+            print(f"[FAIL] {f}", file=sys.stderr)
+        sys.exit(1)
+    print("[OK] 라벨 토큰·T=1.0·순서·배치·긴 메시지 결과 일치.")
+
+
+if __name__ == "__main__":
+    main()
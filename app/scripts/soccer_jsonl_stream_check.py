@@ -0,0 +1,168 @@
+"""Soccer JSONL 업로드 스트리밍 확인 - 수백 MB 파일을 RSS 상한 안에서 처리하는지.
+
+임시 디렉터리에 --size-mb 크기의 선수 JSONL을 스트리밍으로 생성(깨진 JSON 행·UPLOAD_MAX_LINE_BYTES 초과 행 포함)하고
+_process_jsonl_upload(api.routers.soccer_router)에 UploadFile로 넘겨 처리:
+- 오케스트레이터(_inprocess_process)는 배치 행 수만 세고 버리는 가짜로 교체 (DB·모델 없음)
+- 샘플러 스레드가 /proc/self/statm으로 RSS를 주기적으로 읽어 처리 중 최대 증가량 측정 (ru_maxrss도 함께)
+- 증가량이 --max-rss-mb 이하인지, 행 수·배치 수·파싱 오류 수·배치별 최대 행 수가 기대와 같은지 확인
+
+실행: app 디렉터리에서 python -m scripts.soccer_jsonl_stream_check [--size-mb 300 --max-rss-mb 96]
+"""
+import argparse
+import asyncio
+import json
+import os
+import resource
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+APP_ROOT = Path(__file__).resolve().parent.parent
+if str(APP_ROOT) not in sys.path:
+    sys.path.insert(0, str(APP_ROOT))
+
+_PAGE = os.sysconf("SC_PAGE_SIZE")
+
+
+def _rss_bytes() -> int:
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * _PAGE
+
+
+class RssSampler:
+    def __init__(self, interval_s: float = 0.01) -> None:
+        self.interval_s = interval_s
+        self.peak = _rss_bytes()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.peak = max(self.peak, _rss_bytes())
+            time.sleep(self.interval_s)
+
+    def __enter__(self) -> "RssSampler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, _rss_bytes())
+
+
+def _write_jsonl(path: Path, size_mb: int, bad_every: int, long_line_bytes: int) -> Dict[str, int]:
+    """크기에 도달할 때까지 선수 행을 씀. bad_every행마다 깨진 JSON, 중간에 긴 행 1개."""
+    target = size_mb * 1024 * 1024
+    rows = bad = written = 0
+    long_written = False
+    with open(path, "w", encoding="utf-8") as f:
+        i = 0
+        while written < target:
+            i += 1
+            if bad_every and i % bad_every == 0:
+                line = '{"id": ' + str(i) + ', "player_name": "깨진 행"\n'
+                bad += 1
+            elif not long_written and written > target // 2:
+                line = json.dumps({"id": i, "player_name": "x" * long_line_bytes}) + "\n"
+                long_written = True
+                bad += 1
+            else:
+                line = json.dumps(
+                    {
+                        "id": i,
+                        "team_id": i % 40 + 1,
+                        "player_name": f"선수{i}",
+                        "e_player_name": f"Player {i}",
+                        "position": ("GK", "DF", "MF", "FW")[i % 4],
+                        "back_no": i % 99,
+                        "nation": "대한민국",
+                        "birth_date": f"19{90 + i % 10}-0{i % 9 + 1}-1{i % 9}",
+                        "height": 170 + i % 25,
+                        "weight": 60 + i % 30,
+                    },
+                    ensure_ascii=False,
+                ) + "\n"
+                rows += 1
+            f.write(line)
+            written += len(line.encode("utf-8"))
+    return {"rows": rows, "bad": bad, "bytes": written}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size-mb", type=int, default=300)
+    parser.add_argument("--max-rss-mb", type=float, default=96.0)
+    parser.add_argument("--batch-rows", type=int, default=2000)
+    parser.add_argument("--bad-every", type=int, default=50000)
+    args = parser.parse_args()
+
+    os.environ["SOCCER_UPLOAD_BATCH_ROWS"] = str(args.batch_rows)
+
+    from fastapi import UploadFile
+
+    from api.routers import soccer_router  # type: ignore
+
+    batch_sizes: List[int] = []
+
+    def fake_process(data_type: str, all_data: List[Dict[str, Any]], preview_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        batch_sizes.append(len(all_data))
+        n = len(all_data)
+        return {"success": True, "decided_strategy": "rule", "result": {"processed": n, "db": n, "vector": 0, "total": n}}
+
+    soccer_router._inprocess_process = fake_process
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "players.jsonl"
+        start = time.perf_counter()
+        expected = _write_jsonl(path, args.size_mb, args.bad_every, soccer_router.UPLOAD_MAX_LINE_BYTES + 1024)
+        print(
+            f"generated {expected['bytes'] / 1e6:.0f} MB: {expected['rows']} rows + {expected['bad']} bad lines "
+            f"({time.perf_counter() - start:.1f}s)"
+        )
+
+        baseline = _rss_bytes()
+        maxrss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+        start = time.perf_counter()
+        with open(path, "rb") as fh, RssSampler() as sampler:
+            upload = UploadFile(file=fh, filename="players.jsonl")
+            out = asyncio.run(soccer_router._process_jsonl_upload(upload, "players", "ok"))
+        elapsed = time.perf_counter() - start
+        maxrss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+    growth_mb = (sampler.peak - baseline) / 1e6
+    maxrss_growth_mb = max(0, maxrss_after - maxrss_before) / 1e6
+    expected_batches = -(-expected["rows"] // args.batch_rows)
+    print(
+        f"processed {out['total_rows']} rows in {out['batches']} batches, parse errors {out['parse_error_count']} "
+        f"({elapsed:.1f}s, {expected['bytes'] / 1e6 / elapsed:.0f} MB/s)"
+    )
+    print(
+        f"RSS baseline {baseline / 1e6:.0f} MB, peak +{growth_mb:.1f} MB (ru_maxrss +{maxrss_growth_mb:.1f} MB), "
+        f"limit +{args.max_rss_mb:.0f} MB"
+    )
+
+    failures: List[str] = []
+    if out["total_rows"] != expected["rows"] or out["results"].get("processed") != expected["rows"]:
+        failures.append(f"행 수 불일치: {out['total_rows']} / {out['results'].get('processed')} (기대 {expected['rows']})")
+    if out["parse_error_count"] != expected["bad"]:
+        failures.append(f"파싱 오류 수 불일치: {out['parse_error_count']} (기대 {expected['bad']})")
+    if out["batches"] != expected_batches or max(batch_sizes) > args.batch_rows:
+        failures.append(f"배치 수/크기 불일치: {out['batches']}개, 최대 {max(batch_sizes)}행")
+    if len(out["parse_errors"]) > soccer_router.UPLOAD_MAX_REPORTED_ERRORS:
+        failures.append(f"보고된 파싱 오류가 상한 초과: {len(out['parse_errors'])}")
+    if max(growth_mb, maxrss_growth_mb) > args.max_rss_mb:
+        failures.append(f"RSS 증가 {max(growth_mb, maxrss_growth_mb):.1f} MB > 상한 {args.max_rss_mb:.0f} MB")
+
+    if failures:
+        for f in failures:
+            print(f"[FAIL] {f}", file=sys.stderr)
+        sys.exit(1)
+    print("[OK] 파일 크기와 무관한 메모리로 스트리밍 처리.")
+
+
+if __name__ == "__main__":
+    main()
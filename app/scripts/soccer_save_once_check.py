@@ -0,0 +1,165 @@
+"""Soccer 업로드 그래프 저장 확인 - 행마다 repository 쓰기가 정확히 한 번 commit되는지.
+
+Stadium 그래프(Validate → RuleProcess → Save → RetrySave → Finalize)를 가짜 세션·repository로 실행:
+- 가짜 repository: save_batch 호출(chunk)·행 id를 세고, 지정한 chunk는 첫 시도에서 일부만 쓰고 예외
+- 가짜 세션: begin_nested(SAVEPOINT) 예외 시 그 블록의 쓰기만 취소, commit 시 트랜잭션 쓰기를 확정,
+  rollback 시 취소, 지정 횟수만큼 commit 실패
+시나리오별 repository 호출 수와 "commit된 행마다 정확히 1회"를 확인:
+1. 정상 (auto_commit=False, 호출 측 commit)   : 호출 = chunk 수
+2. chunk 하나 첫 시도 실패                      : 호출 = chunk 수 + 1, 재시도 후 성공
+3. auto_commit, commit 1회 실패                 : 전체 chunk 재저장 후 성공 (호출 = chunk 수 × 2)
+4. auto_commit, commit 계속 실패                : 성공처럼 보이지 않음 (failed_chunks 전체, commit된 행 0)
+
+실행: app 디렉터리에서 python -m scripts.soccer_save_once_check [--rows 1200 --chunk-size 250]
+"""
+import argparse
+import os
+import sys
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Set
+
+APP_ROOT = Path(__file__).resolve().parent.parent
+if str(APP_ROOT) not in sys.path:
+    sys.path.insert(0, str(APP_ROOT))
+
+
+class FakeSession:
+    def __init__(self, commit_failures: int = 0) -> None:
+        self.commit_failures = commit_failures
+        self.committed: Counter = Counter()
+        self.commits = 0
+        self._tx: List[Any] = []
+
+    @contextmanager
+    def begin_nested(self) -> Iterator[None]:
+        mark = len(self._tx)
+        try:
+            yield
+        except Exception:
+            del self._tx[mark:]
+            raise
+
+    def write(self, ids: List[Any]) -> None:
+        self._tx.extend(ids)
+
+    def commit(self) -> None:
+        if self.commit_failures > 0:
+            self.commit_failures -= 1
+            raise RuntimeError("fake commit failure")
+        self.committed.update(self._tx)
+        self._tx = []
+        self.commits += 1
+
+    def rollback(self) -> None:
+        self._tx = []
+
+    def close(self) -> None:
+        pass
+
+
+class CountingRepository:
+    calls: List[int] = []
+    fail_first: Set[Any] = set()
+
+    def save_batch(self, chunk: List[Dict[str, Any]], db: FakeSession, chunk_size: int = 0, bulk: bool = True) -> int:
+        ids = [row["id"] for row in chunk]
+        CountingRepository.calls.append(len(ids))
+        if ids[0] in CountingRepository.fail_first:
+            CountingRepository.fail_first.discard(ids[0])
+            db.write(ids[:1])  # 일부 쓴 뒤 실패 → SAVEPOINT로 취소돼야 함
+            raise RuntimeError(f"fake chunk failure at id={ids[0]}")
+        db.write(ids)
+        return len(ids)
+
+
+def _rows(n: int) -> List[Dict[str, Any]]:
+    return [{"id": i + 1, "stadium_code": f"S{i:05d}", "statdium_name": f"경기장{i}"} for i in range(n)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1200)
+    parser.add_argument("--chunk-size", type=int, default=250)
+    args = parser.parse_args()
+
+    os.environ["DB_BATCH_CHUNK_SIZE"] = str(args.chunk_size)
+
+    from domain.hub.orchestrators import soccer_orchestrator  # type: ignore
+    from domain.hub.orchestrators.soccer_orchestrator import SAVE_MAX_RETRIES, StadiumOrchestrator  # type: ignore
+    from domain.spokes.soccer.services import soccer_service  # type: ignore
+
+    soccer_service._REPOSITORIES["stadiums"] = CountingRepository
+    fills: List[str] = []
+    soccer_orchestrator.fill_embeddings_after_save = lambda db, key: fills.append(key) or {"processed": 0}
+
+    rows = _rows(args.rows)
+    ids = [row["id"] for row in rows]
+    chunks = -(-args.rows // args.chunk_size)
+    failures: List[str] = []
+
+    def run_orchestrator(db: FakeSession) -> Dict[str, Any]:
+        return StadiumOrchestrator().process(rows, rows[:5], db=db)
+
+    def run_auto_commit(db: FakeSession) -> Dict[str, Any]:
+        state = {
+            "data": rows,
+            "preview_data": rows[:5],
+            "data_type": "stadiums",
+            "pending_chunks": None,
+            "processing_path": "Start",
+            "db": db,
+            "save_retry_count": 0,
+            "save_failed": False,
+            "auto_commit": True,
+        }
+        out = soccer_orchestrator.get_stadium_graph().invoke(state)
+        result = out.get("result") or {}
+        return {"success": not result.get("failed_chunks"), "result": result, "processing_path": out.get("processing_path", "")}
+
+    scenarios = [
+        ("clean", run_orchestrator, 0, set(), chunks, True),
+        ("chunk fails once", run_orchestrator, 0, {ids[args.chunk_size] if args.rows > args.chunk_size else ids[0]}, chunks + 1, True),
+        ("commit fails once", run_auto_commit, 1, set(), chunks * 2, True),
+        ("commit always fails", run_auto_commit, 99, set(), chunks * (SAVE_MAX_RETRIES + 1), False),
+    ]
+    for label, run, commit_failures, fail_first, expect_calls, expect_success in scenarios:
+        CountingRepository.calls = []
+        CountingRepository.fail_first = set(fail_first)
+        fills.clear()
+        db = FakeSession(commit_failures=commit_failures)
+        out = run(db)
+        calls = len(CountingRepository.calls)
+        once = expect_success and sorted(db.committed) == ids and set(db.committed.values()) == {1}
+        print(
+            f"{label:<20} success={out['success']!s:<5} repo calls={calls:>3} (expect {expect_calls})  "
+            f"committed rows={sum(db.committed.values()):>5}  commits={db.commits}  fills={len(fills)}"
+        )
+        print(f"{'':<20} path={out.get('processing_path')}")
+        if calls != expect_calls:
+            failures.append(f"{label}: repository 호출 {calls}회 (기대 {expect_calls})")
+        if out["success"] != expect_success:
+            failures.append(f"{label}: success={out['success']} (기대 {expect_success})")
+        if expect_success and not once:
+            dup = [k for k, v in db.committed.items() if v != 1][:5]
+            failures.append(f"{label}: 행마다 정확히 1회 commit되지 않음 (누락/중복 예: {dup})")
+        if not expect_success:
+            if db.committed:
+                failures.append(f"{label}: commit 실패인데 commit된 행이 있음")
+            if out["result"].get("failed_chunks") != list(range(chunks)):
+                failures.append(f"{label}: failed_chunks가 전체 chunk가 아님 ({out['result'].get('failed_chunks')})")
+            if not out["result"].get("errors"):
+                failures.append(f"{label}: commit 오류가 result.errors에 없음")
+        if run is run_auto_commit and len(fills) != (1 if expect_success else 0):
+            failures.append(f"{label}: 임베딩 채우기 {len(fills)}회 (commit 성공 시 1회여야 함)")
+
+    if failures:
+        for f in failures:
+            print(f"[FAIL] {f}", file=sys.stderr)
+        sys.exit(1)
+    print("[OK] 행마다 repository 쓰기 1회 commit, commit 실패는 실패로 보고.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""LLaMAClassifier.predict_batch 정합성·속도 확인 (CPU, 작은 랜덤 초기화 시퀀스 분류 모델).
+
+글자 단위 토크나이저 + LlamaForSequenceClassification(랜덤 가중치)로
+길이가 제각각인 이메일을 predict() 건별 결과와 predict_batch() 결과(토큰 예산 작게/크게)로 비교.
+label·confidence는 같아야 하고 spam_prob 차이는 1e-5 이하, 결과 순서는 입력 순서.
+
+실행: app 디렉터리에서 python -m scripts.spam_classifier_batch_check [--emails 64]
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+APP_ROOT = Path(__file__).resolve().parent.parent
+if str(APP_ROOT) not in sys.path:
+    sys.path.insert(0, str(APP_ROOT))
+
+WORDS = ["회의", "일정", "무료", "당첨", "클릭", "계좌", "확인", "안내", "보고서", "이벤트", "대출", "첨부"]
+
+
+def _emails(n: int) -> List[Dict[str, Any]]:
+    rng = random.Random(0)
+    return [
+        {
+            "subject": " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 40))),
+            "sender": f"user{i}@example.com",
+            "attachments": [f"file{j}.pdf" for j in range(rng.randint(0, 3))],
+            "received_at": "2025-01-01 09:00",
+        }
+        for i in range(n)
+    ]
+
+
+def _tiny_classifier():
+    import torch
+    from tokenizers import Tokenizer, models, pre_tokenizers
+    from transformers import LlamaConfig, LlamaForSequenceClassification, PreTrainedTokenizerFast
+
+    from domain.hub.shared.utils import format_email_text  # type: ignore
+    from domain.spokes.spam.services.semantic_classifier import LLaMAClassifier  # type: ignore
+
+    chars = sorted({c for e in _emails(256) for c in format_email_text(e)})
+    vocab = {"[PAD]": 0, "[UNK]": 1, **{c: i + 2 for i, c in enumerate(chars)}}
+    backend = Tokenizer(models.WordLevel(vocab=vocab, unk_token="[UNK]"))
+    backend.pre_tokenizer = pre_tokenizers.Split("", "isolated")
+    tokenizer = PreTrainedTokenizerFast(tokenizer_object=backend, pad_token="[PAD]", unk_token="[UNK]")
+
+    torch.manual_seed(0)
+    config = LlamaConfig(
+        vocab_size=len(vocab),
+        hidden_size=64,
+        intermediate_size=128,
+        num_hidden_layers=2,
+        num_attention_heads=4,
+        num_key_value_heads=2,
+        max_position_embeddings=1024,
+        num_labels=2,
+        pad_token_id=0,
+    )
+    clf = LLaMAClassifier(model_path="tiny-random", device="cpu")
+    clf.tokenizer = tokenizer
+    clf.model = LlamaForSequenceClassification(config).eval()
+    return clf
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="predict_batch 정합성·속도 확인")
+    parser.add_argument("--emails", type=int, default=64)
+    args = parser.parse_args()
+
+    clf = _tiny_classifier()
+    emails = _emails(args.emails)
+
+    start = time.perf_counter()
+    expected = [clf.predict(e) for e in emails]
+    per_item = time.perf_counter() - start
+
+    ok = True
+    for budget in (256, 8192):
+        start = time.perf_counter()
+        got = clf.predict_batch(emails, max_batch_tokens=budget)
+        elapsed = time.perf_counter() - start
+        diffs = [
+            i
+            for i, (a, b) in enumerate(zip(expected, got))
+            if a["label"] != b["label"] or a["confidence"] != b["confidence"] or abs(a["spam_prob"] - b["spam_prob"]) > 1e-5
+        ]
+        max_delta = max(abs(a["spam_prob"] - b["spam_prob"]) for a, b in zip(expected, got))
+        ok = ok and not diffs and len(got) == len(emails)
+        print(
+            f"budget={budget:<5} {'OK' if not diffs else f'DIFF {diffs[:5]}'}  max|Δp|={max_delta:.2e}  "
+            f"{elapsed:.2f}s (per-item {per_item:.2f}s)"
+        )
+
+    if not ok:
+        print("[FAIL] predict_batch 결과가 건별 predict와 다릅니다.", file=sys.stderr)
+        sys.exit(1)
+    print("[OK] predict_batch == predict (입력 순서 유지).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""채팅 스트리밍 TTFT 확인: 토큰마다 지연이 있는 가짜 스트리밍 모델로 run_agent_stream 실행.
+
+graph_orchestrator의 LLM을 가짜 모델로 바꾸고(RAG는 fastapi_server 미로드라 생략),
+chat_router와 같은 SSE 문자열로 변환하면서 첫 content 이벤트가 생성 완료 전에 나가는지 확인.
+
+실행: app 디렉터리에서 python -m scripts.stream_ttft_bench [--tokens 20] [--delay 0.05]
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Iterator, List, Optional
+
+APP_ROOT = Path(__file__).resolve().parent.parent
+if str(APP_ROOT) not in sys.path:
+    sys.path.insert(0, str(APP_ROOT))
+
+
+def _fake_model_class():
+    from langchain_core.language_models import BaseChatModel
+    from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+    from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+    class FakeStreamingChatModel(BaseChatModel):
+        """토큰마다 delay초 쉬며 스트리밍. finished_at에 생성 완료 시각 기록."""
+
+        tokens: int = 20
+        delay: float = 0.05
+        finished_at: Optional[float] = None
+
+        def _stream(self, messages: List[BaseMessage], stop=None, run_manager=None, **kwargs: Any) -> Iterator[ChatGenerationChunk]:
+            for i in range(self.tokens):
+                time.sleep(self.delay)
+                chunk = ChatGenerationChunk(message=AIMessageChunk(content=f"tok{i} "))
+                if run_manager:
+                    run_manager.on_llm_new_token(chunk.text, chunk=chunk)
+                yield chunk
+            self.finished_at = time.perf_counter()
+
+        def _generate(self, messages: List[BaseMessage], stop=None, run_manager=None, **kwargs: Any) -> ChatResult:
+            text = "".join(c.text for c in self._stream(messages))
+            return ChatResult(generations=[ChatGeneration(message=AIMessage(content=text))])
+
+        @property
+        def _llm_type(self) -> str:
+            return "fake-streaming"
+
+    return FakeStreamingChatModel
+
+
+async def _run(fake: Any) -> tuple:
+    from domain.hub.orchestrators.chat_orchestrator import run_agent_stream  # type: ignore
+
+    start = time.perf_counter()
+    first_sse_at = None
+    final = {}
+    async for chunk in run_agent_stream(user_text="스트리밍 테스트", provider="exaone"):
+        if isinstance(chunk, dict):
+            event = f"data: {json.dumps(chunk)}\n\n"
+            final = chunk
+        else:
+            event = f"data: {json.dumps({'content': chunk})}\n\n"
+            if first_sse_at is None and chunk:
+                first_sse_at = time.perf_counter()
+        assert event.startswith("data: ")
+    return start, first_sse_at, final
+
+
+def main() -> None:
+    from domain.hub.orchestrators import graph_orchestrator as go  # type: ignore
+
+    parser = argparse.ArgumentParser(description="스트리밍 TTFT 확인")
+    parser.add_argument("--tokens", type=int, default=20)
+    parser.add_argument("--delay", type=float, default=0.05)
+    args = parser.parse_args()
+
+    fake = _fake_model_class()(tokens=args.tokens, delay=args.delay)
+    saved = (go._get_llm, go._supports_tool_calling)
+    go._get_llm = lambda provider=None, **kwargs: fake
+    go._supports_tool_calling = lambda provider=None: False
+    go.invalidate_agent_graphs()
+    try:
+        start, first_sse_at, final = asyncio.run(_run(fake))
+    finally:
+        go._get_llm, go._supports_tool_calling = saved
+        go.invalidate_agent_graphs()
+
+    if first_sse_at is None or fake.finished_at is None:
+        print("[FAIL] content 이벤트 또는 생성 완료 기록 없음.", file=sys.stderr)
+        sys.exit(1)
+    print(
+        f"first SSE={(first_sse_at - start) * 1000:.0f}ms, generation done={(fake.finished_at - start) * 1000:.0f}ms, "
+        f"reported ttft_ms={final.get('ttft_ms')}"
+    )
+    if first_sse_at >= fake.finished_at:
+        print("[FAIL] 첫 SSE 이벤트가 생성 완료 후에 나갔습니다.", file=sys.stderr)
+        sys.exit(1)
+    print("[OK] 첫 토큰이 생성 완료 전에 SSE로 전달됨.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""tool_node 동시 실행 확인: 지연이 다른 스텁 도구 3개를 한 턴에 호출.
+
+TOOL_MAP을 잠시 스텁으로 바꿔 ToolMessage 순서가 tool_calls 순서와 같은지,
+전체 시간이 지연의 합이 아니라 최대값에 가까운지, 타임아웃 도구만 오류 메시지가 되는지 확인.
+도구 1건만 호출할 때도 같은 타임아웃으로 끊기는지(호출자가 지연만큼 막히지 않는지) 확인.
+멈춘(끝나지 않는) 도구가 TOOL_MAX_WORKERS개 타임아웃된 뒤에도 다음 호출이 빈 워커를 받아 정상 처리되는지 확인.
+
+실행: app 디렉터리에서 python -m scripts.tool_node_bench
+"""
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+APP_ROOT = Path(__file__).resolve().parent.parent
+if str(APP_ROOT) not in sys.path:
+    sys.path.insert(0, str(APP_ROOT))
+
+DELAYS: Dict[str, float] = {"stub_slow": 0.5, "stub_fast": 0.1, "stub_mid": 0.3}
+
+
+class _StubTool:
+    def __init__(self, name: str, delay: float) -> None:
+        self.name = name
+        self.delay = delay
+
+    def invoke(self, args: Dict[str, Any]) -> str:
+        time.sleep(self.delay)
+        return f"{self.name}:{args.get('q')}"
+
+
+class _HungTool:
+    """release가 set될 때까지 반환하지 않는 도구 (자체 타임아웃 없는 외부 호출 흉내)."""
+
+    def __init__(self, name: str, release: threading.Event) -> None:
+        self.name = name
+        self.release = release
+
+    def invoke(self, args: Dict[str, Any]) -> str:
+        self.release.wait()
+        return f"{self.name}:{args.get('q')}"
+
+
+def main() -> None:
+    from langchain_core.messages import AIMessage
+
+    from domain.hub.orchestrators import graph_orchestrator as go  # type: ignore
+
+    calls = [{"name": n, "args": {"q": i}, "id": f"call_{i}"} for i, n in enumerate(DELAYS)]
+    state = {"messages": [AIMessage(content="", tool_calls=calls)]}
+    saved_map = dict(go.TOOL_MAP)
+    saved_timeouts = dict(go.TOOL_TIMEOUTS)
+    go.TOOL_MAP.update({n: _StubTool(n, d) for n, d in DELAYS.items()})
+    release = threading.Event()
+    go.TOOL_MAP["stub_hung"] = _HungTool("stub_hung", release)
+    try:
+        start = time.perf_counter()
+        out = go.tool_node(state)["messages"]
+        elapsed = time.perf_counter() - start
+        order_ok = [m.tool_call_id for m in out] == [c["id"] for c in calls]
+        print(f"elapsed={elapsed:.3f}s (sum={sum(DELAYS.values()):.3f}s, max={max(DELAYS.values()):.3f}s) order={'OK' if order_ok else 'DIFF'}")
+        ok = order_ok and elapsed < max(DELAYS.values()) + 0.1
+
+        go.TOOL_TIMEOUTS["stub_slow"] = 0.2
+        out = go.tool_node(state)["messages"]
+        timed_out = [m.name for m in out if "시간 초과" in str(m.content)]
+        print(f"timeout → {timed_out}")
+        ok = ok and timed_out == ["stub_slow"]
+
+        single = {"messages": [AIMessage(content="", tool_calls=calls[:1])]}
+        start = time.perf_counter()
+        out = go.tool_node(single)["messages"]
+        elapsed = time.perf_counter() - start
+        single_ok = len(out) == 1 and "시간 초과" in str(out[0].content) and elapsed < DELAYS["stub_slow"]
+        print(f"single-call timeout → {out[0].content!r} in {elapsed:.3f}s")
+        ok = ok and single_ok
+
+        # 멈춘 도구가 워커를 모두 붙잡아도 다음 호출은 새 풀에서 바로 실행
+        go.TOOL_TIMEOUTS["stub_hung"] = 0.1
+        hung = [{"name": "stub_hung", "args": {"q": i}, "id": f"hung_{i}"} for i in range(go.TOOL_MAX_WORKERS)]
+        out = go.tool_node({"messages": [AIMessage(content="", tool_calls=hung)]})["messages"]
+        hung_ok = all("시간 초과" in str(m.content) for m in out)
+        fast = {"messages": [AIMessage(content="", tool_calls=[{"name": "stub_fast", "args": {"q": 0}, "id": "after_hung"}])]}
+        start = time.perf_counter()
+        out = go.tool_node(fast)["messages"]
+        elapsed = time.perf_counter() - start
+        hung_ok = hung_ok and out[0].content == "stub_fast:0" and elapsed < DELAYS["stub_fast"] + 0.1
+        print(f"after {len(hung)} hung tools → {out[0].content!r} in {elapsed:.3f}s")
+        ok = ok and hung_ok
+    finally:
+        release.set()
+        go.TOOL_MAP.clear()
+        go.TOOL_MAP.update(saved_map)
+        go.TOOL_TIMEOUTS.clear()
+        go.TOOL_TIMEOUTS.update(saved_timeouts)
+
+    if not ok:
+        print("[FAIL] 순서·지연·타임아웃 결과가 기대와 다릅니다.", file=sys.stderr)
+        sys.exit(1)
+    print("[OK] 호출 순서 유지, 지연 ≈ 가장 느린 도구, 멈춘 도구 뒤에도 호출 처리.")
+
+
+if __name__ == "__main__":
+    main()